@@ -0,0 +1,34 @@
+"""add_keyset_pagination_indexes
+
+Composite indexes matching the keyset sort orders of the laws list,
+law search and section search, so cursor pages are index range scans.
+
+Revision ID: 7c3e1f0a9b21
+Revises: e1749da6ffc4
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "7c3e1f0a9b21"
+down_revision: str | None = "e1749da6ffc4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create composite keyset indexes."""
+    op.create_index("idx_law_enacted_keyset", "public_law", ["enacted_date", "law_id"])
+    op.create_index(
+        "idx_section_title_sort_keyset",
+        "us_code_section",
+        ["title_number", "sort_order", "section_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop composite keyset indexes."""
+    op.drop_index("idx_section_title_sort_keyset", table_name="us_code_section")
+    op.drop_index("idx_law_enacted_keyset", table_name="public_law")
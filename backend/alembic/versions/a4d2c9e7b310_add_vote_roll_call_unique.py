@@ -0,0 +1,35 @@
+"""add_vote_roll_call_unique
+
+Unique key on (chamber, congress, session, vote_number) so roll call
+ingestion can upsert votes with INSERT ... ON CONFLICT. Ingestion already
+checked for an existing row before inserting, so the data satisfies it.
+
+Revision ID: a4d2c9e7b310
+Revises: 7c3e1f0a9b21
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "a4d2c9e7b310"
+down_revision: str | None = "7c3e1f0a9b21"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the roll call unique constraint."""
+    op.create_unique_constraint(
+        "uq_vote_chamber_congress_session_number",
+        "vote",
+        ["chamber", "congress", "session", "vote_number"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the roll call unique constraint."""
+    op.drop_constraint(
+        "uq_vote_chamber_congress_session_number", "vote", type_="unique"
+    )
@@ -0,0 +1,51 @@
+"""add_section_snapshot_dates
+
+Stores enacted_date and last_modified_date on section_snapshot, derived
+from normalized_notes when a snapshot is written, and indexes
+last_modified_date there and on us_code_section.
+
+Existing snapshots are filled by the backfill, not this migration:
+
+    uv run python -m pipeline.backfill_section_dates --apply
+
+Revision ID: b8e5f3a1c2d4
+Revises: a4d2c9e7b310
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "b8e5f3a1c2d4"
+down_revision: str | None = "a4d2c9e7b310"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the snapshot date columns and last-modified indexes."""
+    op.add_column(
+        "section_snapshot", sa.Column("enacted_date", sa.Date(), nullable=True)
+    )
+    op.add_column(
+        "section_snapshot", sa.Column("last_modified_date", sa.Date(), nullable=True)
+    )
+    op.create_index(
+        "idx_section_snapshot_last_modified",
+        "section_snapshot",
+        ["last_modified_date"],
+    )
+    op.create_index(
+        "idx_section_last_modified", "us_code_section", ["last_modified_date"]
+    )
+
+
+def downgrade() -> None:
+    """Drop the last-modified indexes and snapshot date columns."""
+    op.drop_index("idx_section_last_modified", table_name="us_code_section")
+    op.drop_index("idx_section_snapshot_last_modified", table_name="section_snapshot")
+    op.drop_column("section_snapshot", "last_modified_date")
+    op.drop_column("section_snapshot", "enacted_date")
@@ -3,8 +3,11 @@
 from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import InvalidCursorError, TotalMode
+from app.core.responses import model_json_response
 from app.crud.public_law import (
     compute_law_diffs,
     get_law_history,
@@ -30,11 +33,29 @@ router = APIRouter()
 @router.get("")
 async def list_laws(
     limit: int = Query(50, ge=1, le=500, description="Max results to return"),
-    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    offset: int = Query(
+        0,
+        ge=0,
+        deprecated=True,
+        description="Number of results to skip (deprecated: use cursor)",
+    ),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    total: TotalMode = Query(
+        "exact", description="Total count mode: exact (cached), estimate or none"
+    ),
     session: AsyncSession = Depends(get_async_session),
 ) -> PaginatedLawsResponse:
-    """List public laws in the database (paginated)."""
-    return await get_laws_list(session, limit=limit, offset=offset)
+    """List public laws in the database (paginated).
+
+    Prefer cursor pagination: pass the ``next_cursor`` of the previous page
+    as ``cursor``. Offset pagination is kept during a deprecation window.
+    """
+    try:
+        return await get_laws_list(
+            session, limit=limit, offset=offset, cursor=cursor, total_mode=total
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 @router.get("/{congress}/{law_number}/text")
@@ -82,14 +103,14 @@ async def read_law_amendments(
     return await parse_law_amendments(session, congress, law_number)
 
 
-@router.get("/{congress}/{law_number}/diffs")
+@router.get("/{congress}/{law_number}/diffs", response_model=LawDiffsResponse)
 async def read_law_diffs(
     congress: int,
     law_number: int,
     session: AsyncSession = Depends(get_async_session),
-) -> LawDiffsResponse:
+) -> Response:
     """Compute per-section unified diffs for a law's amendments."""
-    return await compute_law_diffs(session, congress, law_number)
+    return model_json_response(await compute_law_diffs(session, congress, law_number))
 
 
 @router.get("/{congress}/{law_number}/standalone-provisions")
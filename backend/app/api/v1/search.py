@@ -1,8 +1,11 @@
 """Search endpoints for sections and public laws."""
 
-from fastapi import APIRouter, Depends, Query
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import InvalidCursorError, TotalMode
 from app.crud.search import search_laws, search_sections
 from app.models.base import get_async_session
 from app.schemas.search import LawSearchResponse, SectionSearchResponse
@@ -17,11 +20,28 @@ async def search_sections_endpoint(
     q: str = Query(..., min_length=2, description="Search query"),
     title: int | None = Query(None, description="Filter by title number"),
     limit: int = Query(20, ge=1, le=_MAX_LIMIT),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True, description="Use cursor instead"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    total: TotalMode = Query("exact", description="Total count mode"),
+    modified_since: date | None = Query(
+        None, description="Only sections last modified on or after this date"
+    ),
     session: AsyncSession = Depends(get_async_session),
 ) -> SectionSearchResponse:
     """Search US Code sections by heading or text content."""
-    return await search_sections(session, q, title=title, limit=limit, offset=offset)
+    try:
+        return await search_sections(
+            session,
+            q,
+            title=title,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            total_mode=total,
+            modified_since=modified_since,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 @router.get("/laws")
@@ -29,8 +49,21 @@ async def search_laws_endpoint(
     q: str = Query(..., min_length=2, description="Search query"),
     congress: int | None = Query(None, description="Filter by congress number"),
     limit: int = Query(20, ge=1, le=_MAX_LIMIT),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, deprecated=True, description="Use cursor instead"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    total: TotalMode = Query("exact", description="Total count mode"),
     session: AsyncSession = Depends(get_async_session),
 ) -> LawSearchResponse:
     """Search public laws by name, title, or number."""
-    return await search_laws(session, q, congress=congress, limit=limit, offset=offset)
+    try:
+        return await search_laws(
+            session,
+            q,
+            congress=congress,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            total_mode=total,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
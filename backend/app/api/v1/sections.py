@@ -1,30 +1,114 @@
 """Section endpoints for viewing US Code section content."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import uuid
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud.us_code import get_section
+from app.core.responses import model_json_response
+from app.core.static_export import section_key, static_export_response
+from app.crud.us_code import get_group_section_keys, get_section, get_sections_batch
 from app.models.base import get_async_session
-from app.schemas.us_code import SectionViewerSchema
+from app.schemas.us_code import SectionBatchResponse, SectionViewerSchema
 
 router = APIRouter()
 
+MAX_BATCH_KEYS = 100  # explicit keys per request; also the streaming chunk size
+
+
+def _parse_section_key(key: str) -> tuple[int, str]:
+    """Parse a ``title:section`` key such as ``17:106``."""
+    title, sep, section = key.partition(":")
+    if not sep or not section or not title.isdigit():
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid section key {key!r}; expected 'title:section'",
+        )
+    return int(title), section
+
+
+@router.get("/batch", response_model=SectionBatchResponse)
+async def read_sections_batch(
+    key: list[str] = Query(
+        [], description="Section keys as 'title:section', e.g. 17:106"
+    ),
+    group: uuid.UUID | None = Query(
+        None, description="Section group ID; returns every section beneath it"
+    ),
+    revision: int | None = Query(None, description="Revision ID (default: HEAD)"),
+    stream: bool = Query(False, description="Stream one section per line as NDJSON"),
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    """Get the full content of many sections in one request.
+
+    Accepts up to ``MAX_BATCH_KEYS`` explicit keys, or a group ID (e.g. a
+    chapter) whose sections are returned in display order. Each chunk of
+    ``MAX_BATCH_KEYS`` sections costs a fixed number of queries.
+    """
+    if bool(key) == (group is not None):
+        raise HTTPException(
+            status_code=400, detail="Provide either 'key' parameters or 'group'"
+        )
+    if len(key) > MAX_BATCH_KEYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_KEYS} section keys per request",
+        )
+
+    if group is not None:
+        keys = await get_group_section_keys(session, group, revision)
+        if keys is None:
+            raise HTTPException(status_code=404, detail=f"Group {group} not found")
+    else:
+        keys = list(dict.fromkeys(_parse_section_key(k) for k in key))
+
+    if stream:
+
+        async def _lines() -> AsyncIterator[bytes]:
+            for i in range(0, len(keys), MAX_BATCH_KEYS):
+                chunk = keys[i : i + MAX_BATCH_KEYS]
+                for viewer in await get_sections_batch(session, chunk, revision):
+                    yield viewer.model_dump_json().encode() + b"\n"
+
+        return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+    sections: list[SectionViewerSchema] = []
+    for i in range(0, len(keys), MAX_BATCH_KEYS):
+        sections.extend(
+            await get_sections_batch(session, keys[i : i + MAX_BATCH_KEYS], revision)
+        )
+    found = {(s.title_number, s.section_number) for s in sections}
+    return model_json_response(
+        SectionBatchResponse(
+            sections=sections,
+            missing=[f"{t}:{s}" for t, s in keys if (t, s) not in found],
+        )
+    )
+
 
-@router.get("/{title_number}/{section_number}")
+@router.get("/{title_number}/{section_number}", response_model=SectionViewerSchema)
 async def read_section(
+    request: Request,
     title_number: int,
     section_number: str,
     revision: int | None = Query(None, description="Revision ID (default: HEAD)"),
     session: AsyncSession = Depends(get_async_session),
-) -> SectionViewerSchema:
+) -> Response:
     """Get the full content of a US Code section."""
+    exported = static_export_response(
+        request, section_key(title_number, section_number), revision
+    )
+    if exported is not None:
+        return exported
     result = await get_section(session, title_number, section_number, revision)
     if result is None:
         raise HTTPException(
             status_code=404,
             detail=f"Section {title_number} USC § {section_number} not found",
         )
-    return result
+    return model_json_response(result)
 
 
 @router.get("/{title_number}/{section_number}/blame")
@@ -1,8 +1,15 @@
 """Title endpoints for browsing the US Code hierarchy."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.responses import model_json_response
+from app.core.static_export import (
+    static_export_response,
+    title_structure_key,
+    titles_key,
+)
 from app.crud.us_code import get_all_titles, get_title_structure
 from app.models.base import get_async_session
 from app.schemas.us_code import TitleStructureSchema, TitleSummarySchema
@@ -10,23 +17,33 @@ from app.schemas.us_code import TitleStructureSchema, TitleSummarySchema
 router = APIRouter()
 
 
-@router.get("")
+@router.get("", response_model=list[TitleSummarySchema])
 async def list_titles(
+    request: Request,
     revision: int | None = Query(None, description="Revision ID (default: HEAD)"),
     session: AsyncSession = Depends(get_async_session),
-) -> list[TitleSummarySchema]:
+) -> list[TitleSummarySchema] | Response:
     """List all US Code titles with chapter and section counts."""
+    exported = static_export_response(request, titles_key(), revision)
+    if exported is not None:
+        return exported
     return await get_all_titles(session, revision)
 
 
-@router.get("/{title_number}/structure")
+@router.get("/{title_number}/structure", response_model=TitleStructureSchema)
 async def get_structure(
+    request: Request,
     title_number: int,
     revision: int | None = Query(None, description="Revision ID (default: HEAD)"),
     session: AsyncSession = Depends(get_async_session),
-) -> TitleStructureSchema:
+) -> Response:
     """Get the group/section tree for a title."""
+    exported = static_export_response(
+        request, title_structure_key(title_number), revision
+    )
+    if exported is not None:
+        return exported
     result = await get_title_structure(session, title_number, revision)
     if result is None:
         raise HTTPException(status_code=404, detail=f"Title {title_number} not found")
-    return result
+    return model_json_response(result)
@@ -74,6 +74,27 @@ class Settings(BaseSettings):
         default=None,
         description="GCS bucket name for pipeline cache (e.g., 'cwlb-pipeline-cache')",
     )
+    # Byte budget for the local (data/) tier of the pipeline cache. When
+    # set, least recently used entries and extracted OLRC directories are
+    # deleted once the budget is exceeded; GCS stays authoritative.
+    pipeline_cache_max_bytes: int | None = Field(
+        default=None,
+        description="Local pipeline cache size limit in bytes (unbounded if unset)",
+    )
+
+    # =========================================================================
+    # Static export
+    # =========================================================================
+    # Local directory produced by ``pipeline.cli export-static``. When set,
+    # HEAD title and section reads are served from the pre-rendered export
+    # without touching the database (see app/core/static_export.py).
+    # Re-exporting after new revisions is operator-managed; until then HEAD
+    # reads fall back to the database once the cached HEAD moves past the
+    # exported revision.
+    static_export_dir: str | None = Field(
+        default=None,
+        description="Directory of a static pre-rendered export to serve reads from",
+    )
 
     # =========================================================================
     # Deploy metadata
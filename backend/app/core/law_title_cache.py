@@ -0,0 +1,210 @@
+"""In-memory cache of Public Law titles keyed by (congress, law_number).
+
+Section views enrich every citation and amendment with the citing law's
+short and official title. Heavily amended sections cite hundreds of laws
+and the same titles recur across almost every view, so looking them up in
+``public_law`` per request is wasted work.
+
+The cache is warmed at startup with a single query over ``public_law``,
+so lookups of known laws cost no database work at all. If the table
+outgrows ``MAX_ENTRIES`` the least recently used titles are evicted.
+
+A miss is never taken to mean the law does not exist: another process may
+have ingested it since the cache was loaded. Misses are looked up in one
+batched query, and keys still not found are remembered as absent for
+``ABSENT_SECONDS`` so sections citing laws outside ``public_law`` do not
+query on every view.
+
+Writers (``GovInfoIngestionService``) push updated titles with ``put``.
+Other processes reload the table after ``REFRESH_SECONDS``. Lookups never
+pay for that reload: once expired, the stale entries keep being served
+while one background task reloads the table in its own session (see
+``configure``). The first load is serialized by a lock, so concurrent
+cold requests share a single query.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from contextlib import AbstractAsyncContextManager
+from typing import Any, ClassVar
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.public_law import PublicLaw
+
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = 100_000  # ~all public laws since 1789 fit with headroom
+REFRESH_SECONDS = 3600  # reload to pick up laws written by other processes
+ABSENT_SECONDS = 60  # how long a key not found in public_law stays unqueried
+
+LawKey = tuple[int, str]
+LawTitles = tuple[str | None, str | None]  # (short_title, official_title)
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+class _LawTitleCache:
+    """Process-level LRU cache of (short_title, official_title) per law."""
+
+    _entries: ClassVar[OrderedDict[LawKey, LawTitles]] = OrderedDict()
+    # Keys not found in public_law -> monotonic time they may be queried again
+    _absent: ClassVar[dict[LawKey, float]] = {}
+    _loaded_at: ClassVar[float] = 0.0
+    _session_factory: ClassVar[SessionFactory | None] = None
+    _load_lock: ClassVar[asyncio.Lock | None] = None
+    _refresh_task: ClassVar[asyncio.Task[None] | None] = None
+    hits: ClassVar[int] = 0
+    misses: ClassVar[int] = 0
+
+    @classmethod
+    def configure(cls, session_factory: SessionFactory) -> None:
+        """Set the session factory used for background refreshes."""
+        cls._session_factory = session_factory
+
+    @classmethod
+    async def warm(cls, session: AsyncSession) -> int:
+        """Load every law's titles in one query. Returns the entry count."""
+        result = await session.execute(
+            select(
+                PublicLaw.congress,
+                PublicLaw.law_number,
+                PublicLaw.short_title,
+                PublicLaw.official_title,
+            ).order_by(PublicLaw.congress.desc())
+        )
+        entries: OrderedDict[LawKey, LawTitles] = OrderedDict()
+        complete = True
+        for congress, law_number, short_title, official_title in result:
+            if len(entries) >= MAX_ENTRIES:
+                complete = False
+                break
+            entries[(congress, str(law_number))] = (short_title, official_title)
+        # Newest congresses are cited most; keep them at the MRU end
+        entries = OrderedDict(reversed(entries.items()))
+        cls._entries = entries
+        cls._absent = {}
+        cls._loaded_at = time.monotonic()
+        logger.info(
+            "Law title cache warmed: %d laws (%s)",
+            len(entries),
+            "complete" if complete else "partial",
+        )
+        return len(entries)
+
+    @classmethod
+    async def get_many(
+        cls, session: AsyncSession, keys: Iterable[LawKey]
+    ) -> dict[LawKey, LawTitles]:
+        """Return titles for the laws in ``keys`` that exist.
+
+        Warms the cache on first use. Only keys the cache cannot answer
+        are queried, in a single batched lookup; keys recently found absent
+        are not queried again until ``ABSENT_SECONDS`` have passed.
+        """
+        if cls._loaded_at == 0.0:
+            await cls._warm_once(session)
+        elif time.monotonic() - cls._loaded_at > REFRESH_SECONDS:
+            cls._schedule_refresh()
+
+        now = time.monotonic()
+        found: dict[LawKey, LawTitles] = {}
+        missing: list[LawKey] = []
+        for key in keys:
+            entry = cls._entries.get(key)
+            if entry is not None:
+                cls._entries.move_to_end(key)
+                found[key] = entry
+            elif cls._absent.get(key, 0.0) <= now and key not in missing:
+                missing.append(key)
+        cls.hits += len(found)
+        cls.misses += len(missing)
+
+        if missing:
+            result = await session.execute(
+                select(
+                    PublicLaw.congress,
+                    PublicLaw.law_number,
+                    PublicLaw.short_title,
+                    PublicLaw.official_title,
+                ).where(tuple_(PublicLaw.congress, PublicLaw.law_number).in_(missing))
+            )
+            for congress, law_number, short_title, official_title in result:
+                key = (congress, str(law_number))
+                found[key] = (short_title, official_title)
+                cls._store(key, found[key])
+            for key in missing:
+                if key not in found:
+                    cls._absent[key] = now + ABSENT_SECONDS
+        return found
+
+    @classmethod
+    async def _warm_once(cls, session: AsyncSession) -> None:
+        """Warm an empty cache; concurrent callers wait for one load."""
+        if cls._load_lock is None:
+            cls._load_lock = asyncio.Lock()
+        async with cls._load_lock:
+            if cls._loaded_at == 0.0:
+                await cls.warm(session)
+
+    @classmethod
+    def _schedule_refresh(cls) -> None:
+        """Reload the table in the background unless a reload is running."""
+        if cls._refresh_task is not None and not cls._refresh_task.done():
+            return
+        if cls._session_factory is None:
+            # Nothing to refresh with outside the API; keep serving entries
+            cls._loaded_at = time.monotonic()
+            return
+        cls._refresh_task = asyncio.create_task(cls._refresh(cls._session_factory))
+
+    @classmethod
+    async def _refresh(cls, session_factory: SessionFactory) -> None:
+        try:
+            async with session_factory() as session:
+                await cls.warm(session)
+        except Exception as e:
+            logger.warning(f"Law title cache refresh failed: {e}")
+            # Retry after another interval rather than on every lookup
+            cls._loaded_at = time.monotonic()
+
+    @classmethod
+    def put(
+        cls,
+        congress: int,
+        law_number: str | int,
+        short_title: str | None,
+        official_title: str | None,
+    ) -> None:
+        """Record the current titles of a law (call when a law is written)."""
+        cls._store((congress, str(law_number)), (short_title, official_title))
+
+    @classmethod
+    def put_laws(cls, laws: Iterable[Any]) -> None:
+        """Record titles from already-loaded PublicLaw rows."""
+        for law in laws:
+            cls.put(law.congress, law.law_number, law.short_title, law.official_title)
+
+    @classmethod
+    def _store(cls, key: LawKey, titles: LawTitles) -> None:
+        cls._entries[key] = titles
+        cls._entries.move_to_end(key)
+        cls._absent.pop(key, None)
+        if len(cls._entries) > MAX_ENTRIES:
+            cls._entries.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Clear the cache; the next lookup reloads it."""
+        cls._entries = OrderedDict()
+        cls._absent = {}
+        cls._loaded_at = 0.0
+        cls._load_lock = None
+
+
+law_title_cache = _LawTitleCache
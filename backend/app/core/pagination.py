@@ -0,0 +1,176 @@
+"""Keyset (cursor) pagination helpers and cached/estimated totals.
+
+List endpoints historically paginated with ``LIMIT/OFFSET`` plus a
+separate ``count(*)``, so deep pages got linearly slower and every page
+paid the full count. Cursor pagination instead filters on the sort key of
+the last row returned (``WHERE (a, b) < (:a, :b)``), which an index on the
+sort columns serves in constant time per page.
+
+Cursor tokens are opaque to clients: a URL-safe base64 encoding of the sort
+key values of the last row. Totals are optional:
+
+- ``exact``: ``count(*)``, memoized per HEAD revision (see ``count_cache``)
+- ``estimate``: the planner's row estimate from ``EXPLAIN`` (Postgres only)
+- ``none``: skipped entirely
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import time
+from datetime import date
+from typing import Any, ClassVar, Literal
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.revision_cache import revision_cache
+
+logger = logging.getLogger(__name__)
+
+TotalMode = Literal["exact", "estimate", "none"]
+
+COUNT_TTL_SECONDS = 300  # safety TTL, matches the revision cache
+COUNT_CACHE_MAX_ENTRIES = 1024  # search counts are keyed by free-text query
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor token cannot be decoded."""
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode sort-key values of the last row into an opaque cursor token."""
+    payload = [v.isoformat() if isinstance(v, date) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str, *types: type) -> list[Any]:
+    """Decode a cursor token into sort-key values of the given types.
+
+    ``types`` gives the expected type of each value in order; ``date``
+    values are parsed from their ISO form.
+
+    Raises:
+        InvalidCursorError: If the token is malformed or does not match
+            ``types``.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw, list) or len(raw) != len(types):
+            raise ValueError("wrong arity")
+        values: list[Any] = []
+        for value, expected in zip(raw, types, strict=True):
+            if expected is date:
+                values.append(date.fromisoformat(value))
+            elif isinstance(value, expected) and not isinstance(value, bool):
+                values.append(value)
+            else:
+                raise ValueError(f"expected {expected.__name__}")
+        return values
+    except (ValueError, TypeError, UnicodeDecodeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {token!r}") from e
+
+
+class _CountCache:
+    """Process-level cache of ``count(*)`` results keyed by HEAD revision.
+
+    Counts only change when data is ingested, which also moves HEAD, so
+    the HEAD revision ID (from ``revision_cache``) is part of the key.
+    ``COUNT_TTL_SECONDS`` bounds staleness for ingestions that do not
+    create a revision (e.g. new Public Law rows). The oldest entry is
+    evicted once ``COUNT_CACHE_MAX_ENTRIES`` is reached.
+    """
+
+    _entries: ClassVar[dict[tuple[int | None, str], tuple[int, float]]] = {}
+
+    @classmethod
+    def get(cls, key: str) -> int | None:
+        head_id, _ = revision_cache.get()
+        entry = cls._entries.get((head_id, key))
+        if entry is None:
+            return None
+        value, cached_at = entry
+        if time.monotonic() - cached_at > COUNT_TTL_SECONDS:
+            cls._entries.pop((head_id, key), None)
+            return None
+        return value
+
+    @classmethod
+    def set(cls, key: str, value: int) -> None:
+        head_id, _ = revision_cache.get()
+        if len(cls._entries) >= COUNT_CACHE_MAX_ENTRIES:
+            cls._entries.pop(next(iter(cls._entries)))
+        cls._entries[(head_id, key)] = (value, time.monotonic())
+
+    @classmethod
+    def invalidate(cls) -> None:
+        cls._entries.clear()
+
+
+count_cache = _CountCache
+
+
+async def estimate_count(session: AsyncSession, stmt: Select[Any]) -> int | None:
+    """Return the planner's row estimate for ``stmt``, or None if unavailable.
+
+    Runs ``EXPLAIN (FORMAT JSON)`` on the statement, which costs one
+    planning pass and no execution. Only supported on PostgreSQL.
+
+    Filter values (including user-supplied search text) stay bound
+    parameters; they are never rendered into the SQL string.
+    """
+    bind = session.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+    try:
+        compiled = stmt.compile(dialect=bind.dialect)
+        params: tuple[Any, ...] | dict[str, Any] = compiled.params
+        if compiled.positional and compiled.positiontup is not None:
+            params = tuple(compiled.params[name] for name in compiled.positiontup)
+        conn = await session.connection()
+        result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        logger.warning(f"Planner row estimate failed, falling back to count: {e}")
+        return None
+
+
+async def resolve_total(
+    session: AsyncSession,
+    stmt: Select[Any],
+    cache_key: str,
+    mode: TotalMode = "exact",
+) -> tuple[int | None, bool]:
+    """Compute the total row count for a filtered listing.
+
+    Args:
+        session: Database session.
+        stmt: The filtered (unpaginated, unordered) select.
+        cache_key: Identifies the filter set for the count cache.
+        mode: ``exact``, ``estimate`` or ``none``.
+
+    Returns:
+        (total, is_estimate). ``total`` is None when mode is ``none``.
+    """
+    if mode == "none":
+        return None, False
+    if mode == "estimate":
+        estimate = await estimate_count(session, stmt)
+        if estimate is not None:
+            return estimate, True
+
+    cached = count_cache.get(cache_key)
+    if cached is not None:
+        return cached, False
+    total = (
+        await session.scalar(select(func.count()).select_from(stmt.subquery()))
+    ) or 0
+    count_cache.set(cache_key, total)
+    return total, False
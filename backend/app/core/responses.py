@@ -0,0 +1,26 @@
+"""Fast JSON responses for large, already-validated response schemas.
+
+When an endpoint returns a Pydantic model, FastAPI validates it again
+against the response model, dumps it to Python primitives and encodes
+those with the stdlib ``json`` module. For the largest payloads (section
+viewers with hundreds of provision lines, Title 42's structure tree, law
+diffs) that is several times the cost of serializing the model once with
+pydantic-core's Rust encoder, which is what ``model_json_response`` does.
+
+Endpoints keep their schema return annotation so the OpenAPI document is
+unchanged; returning a ``Response`` makes FastAPI send it as-is.
+"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+from starlette.responses import Response
+
+
+def model_json_response(model: BaseModel, status_code: int = 200) -> Response:
+    """Serialize ``model`` straight to a JSON response, skipping revalidation."""
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
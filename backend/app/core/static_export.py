@@ -0,0 +1,189 @@
+"""Read side of the static pre-rendered export.
+
+``pipeline.static_export`` renders the titles list, every title structure
+and every section viewer payload at a revision into gzip-compressed,
+content-addressed JSON objects plus a ``manifest.json`` that maps logical
+keys (``sections/17/106``) to object hashes. The same directory can be
+synced to object storage and served from a CDN.
+
+When ``STATIC_EXPORT_DIR`` is set, API instances serve matching GET
+requests straight from that directory with zero database queries. Only
+requests for the exported revision (or HEAD) are served; everything else
+falls through to the database. HEAD requests are served from the export
+unless the cached HEAD revision (``revision_cache``) is known to differ
+from the exported one, e.g. after ``chrono-advance`` or an RP ingest; the
+export must then be re-run by the operator to take effect again.
+
+Layout::
+
+    manifest.json
+    objects/ab/abcdef....json.gz
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.config import settings
+from app.core.revision_cache import revision_cache
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+OBJECTS_DIR = "objects"
+
+
+def titles_key() -> str:
+    """Logical key for the titles list payload."""
+    return "titles"
+
+
+def title_structure_key(title_number: int) -> str:
+    """Logical key for a title structure payload."""
+    return f"titles/{title_number}/structure"
+
+
+def section_key(title_number: int, section_number: str) -> str:
+    """Logical key for a section viewer payload."""
+    return f"sections/{title_number}/{section_number}"
+
+
+def object_relpath(content_hash: str) -> str:
+    """Relative path of the compressed object for a content hash."""
+    return f"{OBJECTS_DIR}/{content_hash[:2]}/{content_hash}.json.gz"
+
+
+@dataclass
+class ExportManifest:
+    """Parsed ``manifest.json`` of a static export."""
+
+    revision_id: int
+    generated_at: str
+    entries: dict[str, dict[str, Any]]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ExportManifest:
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(
+                f"Unsupported static export manifest version: {data.get('version')}"
+            )
+        return cls(
+            revision_id=int(data["revision_id"]),
+            generated_at=str(data.get("generated_at", "")),
+            entries=dict(data.get("entries", {})),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": MANIFEST_VERSION,
+            "revision_id": self.revision_id,
+            "generated_at": self.generated_at,
+            "entries": self.entries,
+        }
+
+
+class StaticExportStore:
+    """Serves compressed payloads from a local export directory.
+
+    The manifest is reloaded whenever its mtime changes, so a fresh export
+    (which replaces ``manifest.json`` atomically) is picked up without a
+    restart.
+    """
+
+    def __init__(self, root: Path | str) -> None:
+        self.root = Path(root)
+        self._manifest: ExportManifest | None = None
+        self._manifest_mtime: float | None = None
+
+    def manifest(self) -> ExportManifest | None:
+        """Return the current manifest, or None if no export exists."""
+        path = self.root / MANIFEST_NAME
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            self._manifest = None
+            self._manifest_mtime = None
+            return None
+
+        if self._manifest is None or mtime != self._manifest_mtime:
+            try:
+                self._manifest = ExportManifest.from_dict(json.loads(path.read_text()))
+                self._manifest_mtime = mtime
+                logger.info(
+                    "Loaded static export manifest: revision %d, %d entries",
+                    self._manifest.revision_id,
+                    len(self._manifest.entries),
+                )
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Invalid static export manifest at {path}: {e}")
+                self._manifest = None
+                self._manifest_mtime = None
+        return self._manifest
+
+    def get(self, key: str, revision_id: int | None = None) -> bytes | None:
+        """Return the gzip-compressed payload for a logical key.
+
+        Returns None when there is no export, the key is not exported, the
+        requested revision (or the cached HEAD, for HEAD requests) differs
+        from the exported one, or the object file is missing.
+        """
+        manifest = self.manifest()
+        if manifest is None:
+            return None
+        if revision_id is None:
+            # No query: only a HEAD already cached by an earlier DB read counts
+            revision_id, _ = revision_cache.get()
+        if revision_id is not None and revision_id != manifest.revision_id:
+            return None
+        entry = manifest.entries.get(key)
+        if entry is None:
+            return None
+        try:
+            return (self.root / object_relpath(entry["hash"])).read_bytes()
+        except OSError:
+            return None
+
+
+_store: StaticExportStore | None = None
+
+
+def get_static_export_store() -> StaticExportStore | None:
+    """Return the process-wide store, or None if serving is disabled."""
+    global _store
+    if not settings.static_export_dir:
+        return None
+    if _store is None or _store.root != Path(settings.static_export_dir):
+        _store = StaticExportStore(settings.static_export_dir)
+    return _store
+
+
+def static_export_response(
+    request: Request, key: str, revision_id: int | None = None
+) -> Response | None:
+    """Build a response for ``key`` from the static export, if available.
+
+    Sends the stored gzip bytes as-is when the client accepts gzip and
+    decompresses otherwise.
+    """
+    store = get_static_export_store()
+    if store is None:
+        return None
+    compressed = store.get(key, revision_id)
+    if compressed is None:
+        return None
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=compressed,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(content=gzip.decompress(compressed), media_type="application/json")
@@ -5,10 +5,11 @@ from __future__ import annotations
 import importlib
 import logging
 import re
+from datetime import date
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import Integer, cast, func, select
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -18,6 +19,13 @@ from app.core.law_history_helpers import (
     compose_sponsor_name,
     parse_vote_tally,
 )
+from app.core.law_title_cache import law_title_cache
+from app.core.pagination import (
+    TotalMode,
+    decode_cursor,
+    encode_cursor,
+    resolve_total,
+)
 from app.models.public_law import Bill, LawBillAction, LawSponsor, PublicLaw
 from app.schemas.law_history import (
     AmendmentSchema,
@@ -41,6 +49,7 @@ from app.schemas.law_viewer import (
     SectionReferenceSchema,
     StandaloneProvisionSchema,
 )
+from pipeline.chrono.provision_document import ProvisionDocument, provision_lines
 
 logger = logging.getLogger(__name__)
 
@@ -49,26 +58,44 @@ async def get_laws_list(
     session: AsyncSession,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
+    total_mode: TotalMode = "exact",
 ) -> PaginatedLawsResponse:
-    """Return public laws ordered by congress desc, law_number desc.
+    """Return public laws ordered by enacted_date desc, law_id desc.
+
+    Pass the previous page's ``next_cursor`` as ``cursor`` for keyset
+    pagination, which costs the same on every page. ``offset`` still works
+    (and is ignored when a cursor is given) but deep offsets scan every
+    skipped row.
 
-    Paginated with limit/offset. Includes a total count for building page controls.
+    Raises:
+        InvalidCursorError: If ``cursor`` cannot be decoded.
     """
-    count_result = await session.execute(select(func.count()).select_from(PublicLaw))
-    total = count_result.scalar_one()
+    total, total_is_estimate = await resolve_total(
+        session, select(PublicLaw.law_id), "laws", total_mode
+    )
 
-    stmt = (
-        select(PublicLaw)
-        .order_by(
-            PublicLaw.congress.desc(),
-            cast(PublicLaw.law_number, Integer).desc(),
-        )
-        .limit(limit)
-        .offset(offset)
+    stmt = select(PublicLaw).order_by(
+        PublicLaw.enacted_date.desc(), PublicLaw.law_id.desc()
     )
-    result = await session.execute(stmt)
+    if cursor is not None:
+        enacted, law_id = decode_cursor(cursor, date, int)
+        stmt = stmt.where(
+            tuple_(PublicLaw.enacted_date, PublicLaw.law_id) < tuple_(enacted, law_id)
+        )
+        offset = 0
+    else:
+        stmt = stmt.offset(offset)
+    # Fetch one extra row to know whether a next page exists
+    result = await session.execute(stmt.limit(limit + 1))
     laws = result.scalars().all()
 
+    next_cursor = None
+    if len(laws) > limit:
+        laws = laws[:limit]
+        next_cursor = encode_cursor(laws[-1].enacted_date, laws[-1].law_id)
+    law_title_cache.put_laws(laws)
+
     items = [
         LawSummarySchema(
             congress=law.congress,
@@ -80,7 +107,14 @@ async def get_laws_list(
         )
         for law in laws
     ]
-    return PaginatedLawsResponse(total=total, items=items, limit=limit, offset=offset)
+    return PaginatedLawsResponse(
+        total=total,
+        items=items,
+        limit=limit,
+        offset=offset,
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
+    )
 
 
 def _date_str(d: Any) -> str | None:
@@ -366,11 +400,14 @@ async def parse_law_amendments(
     amendments: list[Any] = []
 
     # Dynamic imports to keep pipeline/ out of mypy's module graph
+    parse_cache = importlib.import_module("pipeline.legal_parser.parse_cache")
     if law_text.xml_content:
         try:
             xml_mod = importlib.import_module("pipeline.legal_parser.xml_parser")
             xml_parser = xml_mod.XMLAmendmentParser()
-            amendments = xml_parser.parse(law_text.xml_content)
+            amendments = await parse_cache.aparse_with_cache(
+                xml_parser, law_text.xml_content
+            )
         except Exception:
             logger.exception(
                 "XML parsing failed for PL %d-%d, falling back to text parser",
@@ -383,7 +420,9 @@ async def parse_law_amendments(
     if not amendments and law_text.htm_content:
         text_mod = importlib.import_module("pipeline.legal_parser.amendment_parser")
         text_parser = text_mod.AmendmentParser()
-        amendments = text_parser.parse(law_text.htm_content)
+        amendments = await parse_cache.aparse_with_cache(
+            text_parser, law_text.htm_content
+        )
 
     schemas = [_amendment_to_schema(a) for a in amendments]
     await _enrich_start_lines(session, schemas, congress, law_number)
@@ -481,47 +520,6 @@ def _parse_struck_subsections(full_match: str) -> list[str] | None:
     return markers if markers else None
 
 
-def _find_subsection_range(
-    provisions: list[dict[str, Any]], markers: list[str]
-) -> tuple[int, int] | None:
-    """Find the contiguous index range of provision lines belonging to given subsection markers.
-
-    Returns (start_index, end_index) inclusive, stopping at the next
-    same-level marker that is NOT in the target set.  "Same-level" means
-    the same marker style as the struck markers (e.g. lowercase letters).
-    """
-
-    marker_set = {f"({m})" for m in markers}
-
-    # Determine boundary pattern from the marker style being struck.
-    sample = markers[0]
-    if sample.isdigit():
-        boundary_re = re.compile(r"^\([0-9]+\)$")
-    elif sample.isupper():
-        boundary_re = re.compile(r"^\([A-Z]+\)$")
-    else:
-        boundary_re = re.compile(r"^\([a-z]+\)$")
-
-    start_idx: int | None = None
-    end_idx: int | None = None
-
-    for i, line in enumerate(provisions):
-        line_marker = line.get("marker", "")
-        if line_marker in marker_set:
-            if start_idx is None:
-                start_idx = i
-            end_idx = i
-        elif start_idx is not None:
-            if line_marker and boundary_re.match(line_marker):
-                break
-            end_idx = i
-
-    if start_idx is None:
-        return None
-    assert end_idx is not None
-    return (start_idx, end_idx)
-
-
 def _prev_marker(marker: str) -> str | None:
     """Return the marker that logically precedes *marker*.
 
@@ -552,10 +550,10 @@ def _apply_amendments_to_provisions(
        subsections to strike (e.g., "striking subsections (a) and (b) and
        inserting the following"). Identifies the provision lines belonging
        to those subsections and replaces them with new_text lines.
-    """
-    import copy
 
-    patched = copy.deepcopy(provisions)
+    Unchanged lines in the result are shared with ``provisions``.
+    """
+    doc = ProvisionDocument(provisions)
 
     # Process redesignations first so markers exist for subsequent ADD anchoring
     for amendment in amendments:
@@ -565,12 +563,7 @@ def _apply_amendments_to_provisions(
         if not mapping:
             continue
         for idx, new_marker in mapping:
-            if 0 <= idx < len(patched):
-                patched[idx]["marker"] = new_marker
-                content = patched[idx].get("content", "")
-                # Prepend marker to content if not already present
-                if not content.startswith(new_marker):
-                    patched[idx]["content"] = f"{new_marker} {content}"
+            doc.redesignate(idx, new_marker)
 
     for amendment in amendments:
         if amendment.change_type not in ("Modify", "Delete", "Add"):
@@ -578,8 +571,7 @@ def _apply_amendments_to_provisions(
 
         # Case 3: ADD — insert new provisions at the correct position
         if amendment.change_type == "Add" and amendment.new_text:
-            new_lines_text = amendment.new_text.split("\n")
-            insert_idx = len(patched)  # default: append at end
+            insert_idx = len(doc)  # default: append at end
 
             # Determine insertion point from position_qualifier
             if (
@@ -587,95 +579,40 @@ def _apply_amendments_to_provisions(
                 and amendment.position_qualifier.type == "after"
                 and amendment.position_qualifier.anchor_text
             ):
-                anchor = amendment.position_qualifier.anchor_text
+                anchor_text = amendment.position_qualifier.anchor_text
                 # anchor is a marker like "(a)" — find end of that subsection
-                marker_letter = re.match(r"\(([a-zA-Z0-9]+)\)", anchor)
+                marker_letter = re.match(r"\(([a-zA-Z0-9]+)\)", anchor_text)
                 if marker_letter:
-                    span = _find_subsection_range(patched, [marker_letter.group(1)])
+                    span = doc.subsection_range([marker_letter.group(1)])
                     if span:
                         insert_idx = span[1] + 1
             else:
                 # Try to infer from the new_text marker (e.g. "(b)" → insert after "(a)")
-                first_line = new_lines_text[0].strip()
+                first_line = amendment.new_text.split("\n")[0].strip()
                 marker_match = re.match(r"^\(([a-zA-Z0-9]+)\)", first_line)
                 if marker_match:
-                    marker_val = marker_match.group(1)
-                    prev_marker = _prev_marker(marker_val)
+                    prev_marker = _prev_marker(marker_match.group(1))
                     if prev_marker:
-                        span = _find_subsection_range(patched, [prev_marker])
+                        span = doc.subsection_range([prev_marker])
                         if span:
                             insert_idx = span[1] + 1
 
-            # Build provision dicts
-            base_line_number = (
-                int(patched[insert_idx - 1].get("line_number", insert_idx)) + 1
-                if insert_idx > 0 and patched
-                else 1
-            )
-            base_char = (
-                int(patched[insert_idx - 1].get("end_char", 0))
-                if insert_idx > 0 and patched
-                else 0
+            if insert_idx > 0 and len(doc):
+                anchor = doc[insert_idx - 1]
+                line_number = int(anchor.get("line_number", insert_idx)) + 1
+                start_char = int(anchor.get("end_char", 0))
+            else:
+                line_number, start_char = 1, 0
+            doc.splice(
+                insert_idx,
+                insert_idx,
+                provision_lines(amendment.new_text, line_number, start_char),
             )
-            char_offset = base_char
-            line_num = base_line_number
-            new_provisions: list[dict[str, Any]] = []
-            for text in new_lines_text:
-                text = text.strip()
-                if not text:
-                    continue
-                marker_match = re.match(r"^(\([a-zA-Z0-9]+\)(?:\([A-Z0-9]+\))?)", text)
-                marker = marker_match.group(1) if marker_match else None
-                new_provisions.append(
-                    {
-                        "line_number": line_num,
-                        "content": text,
-                        "indent_level": 0,
-                        "marker": marker,
-                        "is_header": False,
-                        "start_char": char_offset,
-                        "end_char": char_offset + len(text),
-                    }
-                )
-                line_num += 1
-                char_offset += len(text) + 1
-
-            patched[insert_idx:insert_idx] = new_provisions
             continue
 
         # Case 1: Simple text replacement (old_text present)
         if amendment.old_text is not None:
-            replacement = amendment.new_text or ""
-            for line in patched:
-                content = line.get("content", "")
-                if not content:
-                    continue
-
-                # Exact match
-                if amendment.old_text in content:
-                    line["content"] = content.replace(amendment.old_text, replacement)
-                    continue
-
-                # Whitespace-normalised match
-                parts = amendment.old_text.split()
-                if not parts:
-                    continue
-                ws_pattern = r"\s+".join(re.escape(part) for part in parts)
-                ws_re = re.compile(ws_pattern)
-                match = ws_re.search(content)
-                if match:
-                    line["content"] = (
-                        content[: match.start()] + replacement + content[match.end() :]
-                    )
-                    continue
-
-                # Case-insensitive fallback
-                ci_re = re.compile(ws_pattern, re.IGNORECASE)
-                match = ci_re.search(content)
-                if match:
-                    line["content"] = (
-                        content[: match.start()] + replacement + content[match.end() :]
-                    )
+            doc.replace_text(amendment.old_text, amendment.new_text or "")
             continue
 
         # Case 2: Structural replacement (old_text is None, new_text present)
@@ -686,50 +623,25 @@ def _apply_amendments_to_provisions(
         if not struck:
             continue
 
-        span = _find_subsection_range(patched, struck)
+        span = doc.subsection_range(struck)
         if not span:
             continue
 
         start_idx, end_idx = span
-
-        # Build replacement lines with basic marker detection.
-        # Indent inference is unreliable without XML structure; the next
-        # release-point ingestion will supply proper formatting.
-        new_lines_text = amendment.new_text.split("\n")
-        base_line_number = int(patched[start_idx].get("line_number", start_idx + 1))
-        base_char = int(patched[start_idx].get("start_char", 0))
-        char_offset = base_char
-        line_num = base_line_number
-        replacement_provisions: list[dict[str, Any]] = []
-        for text in new_lines_text:
-            text = text.strip()
-            if not text:
-                continue
-            marker_match = re.match(r"^(\([a-zA-Z0-9]+\)(?:\([A-Z0-9]+\))?)", text)
-            marker = marker_match.group(1) if marker_match else None
-            replacement_provisions.append(
-                {
-                    "line_number": line_num,
-                    "content": text,
-                    "indent_level": 0,
-                    "marker": marker,
-                    "is_header": False,
-                    "start_char": char_offset,
-                    "end_char": char_offset + len(text),
-                }
-            )
-            line_num += 1
-            char_offset += len(text) + 1
-
-        # Replace the struck range with new provisions
-        patched[start_idx : end_idx + 1] = replacement_provisions
+        first = doc[start_idx]
+        doc.splice(
+            start_idx,
+            end_idx + 1,
+            provision_lines(
+                amendment.new_text,
+                int(first.get("line_number", start_idx + 1)),
+                int(first.get("start_char", 0)),
+            ),
+        )
 
     # Renumber all lines sequentially so replacements that change the
     # line count don't leave gaps or duplicates.
-    for i, line in enumerate(patched):
-        line["line_number"] = i + 1
-
-    return patched
+    return doc.to_list()
 
 
 def _strip_leading_marker(content: str) -> str:
@@ -1446,6 +1358,7 @@ async def get_law_history(
     law: PublicLaw | None = result.scalar_one_or_none()
     if law is None:
         return None
+    law_title_cache.put_laws([law])
 
     # --- Try DB cache first --------------------------------------------------
     timeline_events: list[TimelineEventSchema] = []
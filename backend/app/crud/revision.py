@@ -106,7 +106,7 @@ _LAST_CHANGED_CTE = """
     ),
     per_section AS (
         SELECT DISTINCT ON (title_number, section_number)
-            revision_id
+            revision_id, title_number, section_number
         FROM changed
         ORDER BY title_number, section_number,
             array_position(:chain, revision_id)
@@ -186,3 +186,51 @@ async def get_last_changed_revision_for_section(
     if row is None:
         return None
     return _row_to_schema(row)
+
+
+async def get_last_changed_revisions_for_sections(
+    session: AsyncSession,
+    keys: list[tuple[int, str]],
+    *,
+    chain: list[int] | None = None,
+) -> dict[tuple[int, str], HeadRevisionSchema]:
+    """Batch variant of ``get_last_changed_revision_for_section``.
+
+    Resolves the last-changing revision for every (title_number,
+    section_number) key in one query. Keys with no snapshot in the chain
+    are omitted from the result.
+    """
+    if not keys:
+        return {}
+    if chain is None:
+        chain = await _get_chain(session)
+    if not chain:
+        return {}
+
+    sql = (
+        _LAST_CHANGED_CTE.format(
+            filter="""AND (title_number, section_number) IN (
+                SELECT * FROM unnest(
+                    CAST(:titles AS int[]), CAST(:sections AS text[])
+                )
+            )"""
+        )
+        + """
+        SELECT ps.title_number, ps.section_number,
+               cr.revision_id, cr.revision_type, cr.effective_date,
+               cr.summary, cr.sequence_number
+        FROM per_section ps
+        JOIN code_revision cr ON cr.revision_id = ps.revision_id
+    """
+    )
+    result = await session.execute(
+        text(sql),
+        {
+            "chain": chain,
+            "titles": [k[0] for k in keys],
+            "sections": [k[1] for k in keys],
+        },
+    )
+    return {
+        (row.title_number, row.section_number): _row_to_schema(row) for row in result
+    }
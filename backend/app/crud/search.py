@@ -1,8 +1,11 @@
 """CRUD operations for full-text search across sections and laws."""
 
-from sqlalchemy import func, or_, select
+from datetime import date
+
+from sqlalchemy import or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import TotalMode, decode_cursor, encode_cursor, resolve_total
 from app.models.public_law import PublicLaw
 from app.models.us_code import USCodeSection
 from app.schemas.search import (
@@ -42,7 +45,22 @@ async def search_sections(
     title: int | None = None,
     limit: int = 20,
     offset: int = 0,
+    cursor: str | None = None,
+    total_mode: TotalMode = "exact",
+    modified_since: date | None = None,
 ) -> SectionSearchResponse:
+    """Search sections by heading or text, ordered by title then sort order.
+
+    ``modified_since`` keeps sections last modified on or after that date
+    (the stored ``last_modified_date``, indexed).
+
+    ``cursor`` (the previous page's ``next_cursor``) selects keyset
+    pagination on (title_number, sort_order, section_id); ``offset`` is
+    ignored when it is given.
+
+    Raises:
+        InvalidCursorError: If ``cursor`` cannot be decoded.
+    """
     pattern = f"%{q}%"
     conditions = [
         or_(
@@ -52,12 +70,19 @@ async def search_sections(
     ]
     if title is not None:
         conditions.append(USCodeSection.title_number == title)
+    if modified_since is not None:
+        conditions.append(USCodeSection.last_modified_date >= modified_since)
 
-    count_stmt = select(func.count()).select_from(USCodeSection).where(*conditions)
-    total = (await session.scalar(count_stmt)) or 0
+    total, total_is_estimate = await resolve_total(
+        session,
+        select(USCodeSection.section_id).where(*conditions),
+        f"search_sections:{title}:{modified_since}:{q.lower()}",
+        total_mode,
+    )
 
     stmt = (
         select(
+            USCodeSection.section_id,
             USCodeSection.title_number,
             USCodeSection.section_number,
             USCodeSection.heading,
@@ -65,13 +90,36 @@ async def search_sections(
             USCodeSection.text_content,
             USCodeSection.is_repealed,
             USCodeSection.last_modified_date,
+            USCodeSection.sort_order,
         )
         .where(*conditions)
-        .order_by(USCodeSection.title_number, USCodeSection.sort_order)
-        .limit(limit)
-        .offset(offset)
+        .order_by(
+            USCodeSection.title_number,
+            USCodeSection.sort_order,
+            USCodeSection.section_id,
+        )
     )
-    rows = (await session.execute(stmt)).all()
+    if cursor is not None:
+        key = decode_cursor(cursor, int, int, int)
+        stmt = stmt.where(
+            tuple_(
+                USCodeSection.title_number,
+                USCodeSection.sort_order,
+                USCodeSection.section_id,
+            )
+            > tuple_(*key)
+        )
+        offset = 0
+    else:
+        stmt = stmt.offset(offset)
+    rows = (await session.execute(stmt.limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.title_number, last.sort_order, last.section_id)
+
     results = [
         SectionSearchResult(
             title_number=r.title_number,
@@ -85,7 +133,12 @@ async def search_sections(
         for r in rows
     ]
     return SectionSearchResponse(
-        results=results, total=total, limit=limit, offset=offset
+        results=results,
+        total=total,
+        limit=limit,
+        offset=offset,
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
     )
 
 
@@ -95,7 +148,18 @@ async def search_laws(
     congress: int | None = None,
     limit: int = 20,
     offset: int = 0,
+    cursor: str | None = None,
+    total_mode: TotalMode = "exact",
 ) -> LawSearchResponse:
+    """Search public laws by name, title or number, newest first.
+
+    ``cursor`` (the previous page's ``next_cursor``) selects keyset
+    pagination on (enacted_date, law_id); ``offset`` is ignored when it is
+    given.
+
+    Raises:
+        InvalidCursorError: If ``cursor`` cannot be decoded.
+    """
     pattern = f"%{q}%"
     conditions = [
         or_(
@@ -107,11 +171,16 @@ async def search_laws(
     if congress is not None:
         conditions.append(PublicLaw.congress == congress)
 
-    count_stmt = select(func.count()).select_from(PublicLaw).where(*conditions)
-    total = (await session.scalar(count_stmt)) or 0
+    total, total_is_estimate = await resolve_total(
+        session,
+        select(PublicLaw.law_id).where(*conditions),
+        f"search_laws:{congress}:{q.lower()}",
+        total_mode,
+    )
 
     stmt = (
         select(
+            PublicLaw.law_id,
             PublicLaw.congress,
             PublicLaw.law_number,
             PublicLaw.short_title,
@@ -119,11 +188,23 @@ async def search_laws(
             PublicLaw.enacted_date,
         )
         .where(*conditions)
-        .order_by(PublicLaw.enacted_date.desc())
-        .limit(limit)
-        .offset(offset)
+        .order_by(PublicLaw.enacted_date.desc(), PublicLaw.law_id.desc())
     )
-    rows = (await session.execute(stmt)).all()
+    if cursor is not None:
+        enacted, law_id = decode_cursor(cursor, date, int)
+        stmt = stmt.where(
+            tuple_(PublicLaw.enacted_date, PublicLaw.law_id) < tuple_(enacted, law_id)
+        )
+        offset = 0
+    else:
+        stmt = stmt.offset(offset)
+    rows = (await session.execute(stmt.limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].enacted_date, rows[-1].law_id)
+
     results = [
         LawSearchResult(
             congress=r.congress,
@@ -134,4 +215,11 @@ async def search_laws(
         )
         for r in rows
     ]
-    return LawSearchResponse(results=results, total=total, limit=limit, offset=offset)
+    return LawSearchResponse(
+        results=results,
+        total=total,
+        limit=limit,
+        offset=offset,
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
+    )
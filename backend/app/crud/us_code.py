@@ -5,17 +5,23 @@ revision parameter for time-travel queries. Group hierarchy comes from
 SectionGroup (populated by both ingestion and bootstrap).
 """
 
+import re
 import uuid
 from typing import Any
 
-from sqlalchemy import func, select, text, tuple_
+from pydantic import TypeAdapter
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import attributes
 
+from app.core.law_title_cache import law_title_cache
 from app.core.revision_cache import revision_cache
-from app.crud.revision import get_last_changed_revision_for_section
-from app.models.public_law import PublicLaw
+from app.crud.revision import (
+    get_last_changed_revision_for_section,
+    get_last_changed_revisions_for_sections,
+)
 from app.models.us_code import SectionGroup
+from app.schemas.revision import HeadRevisionSchema
 from app.schemas.us_code import (
     CodeLineSchema,
     GroupAncestorSchema,
@@ -26,8 +32,16 @@ from app.schemas.us_code import (
     TitleStructureSchema,
     TitleSummarySchema,
 )
+from pipeline.olrc.section_dates import derive_section_dates
 from pipeline.olrc.snapshot_service import SectionState, SnapshotService
 
+# Validates a whole provisions list in one pydantic-core call, which is
+# markedly cheaper than model_validate per line for long sections
+_CODE_LINES_ADAPTER = TypeAdapter(list[CodeLineSchema])
+
+# "Pub. L. 94-553" in OLRC short-title notes
+_PUB_L_RE = re.compile(r"Pub\.\s*L\.\s*(\d+)[–-](\d+)")
+
 
 def _extract_last_amendment(
     notes: dict[str, Any] | None,
@@ -101,13 +115,20 @@ def _build_group_tree(
 
 
 async def _resolve_head_and_chain(
-    session: AsyncSession, revision_id: int | None
+    session: AsyncSession,
+    revision_id: int | None,
+    chain: list[int] | None = None,
 ) -> tuple[int | None, list[int]]:
     """Resolve HEAD revision and its chain, using the in-memory cache.
 
-    Returns (head_id, chain). The chain is ordered newest-first.
+    A caller that already holds the chain for an explicit ``revision_id``
+    (e.g. the static exporter rendering thousands of sections) can pass it
+    to skip the CTE. Returns (head_id, chain). The chain is ordered
+    newest-first.
     """
     if revision_id is not None:
+        if chain is not None:
+            return revision_id, chain
         svc = SnapshotService(session)
         chain = await svc.get_revision_chain(revision_id)
         return revision_id, chain
@@ -317,83 +338,114 @@ async def get_title_structure(
 async def _enrich_notes_with_titles(
     session: AsyncSession, notes: SectionNotesSchema
 ) -> None:
-    """Populate law titles on citations and amendments.
+    """Populate law titles on citations and amendments of one section."""
+    await _enrich_notes_batch(session, [notes])
+
+
+async def _enrich_notes_batch(
+    session: AsyncSession, notes_list: list[SectionNotesSchema]
+) -> None:
+    """Populate law titles on citations and amendments for many sections.
 
     Three-tier lookup (no API calls — all local):
-    1. Batch query the public_law table (short_title + official_title)
+    1. The public_law table (short_title + official_title) via law_title_cache
     2. Hardcoded titles for major historical laws (title_lookup.py)
-    3. OLRC short_titles from statutory notes on this section
-    """
-    import re
+    3. OLRC short_titles from statutory notes on each section
 
+    Tier 1 runs at most one query covering every section in ``notes_list``.
+    Tier 3 only applies a section's own short-title notes to that section.
+    """
     from pipeline.olrc.title_lookup import HARDCODED_TITLES
 
     # Collect all (congress, law_number) pairs that need enrichment
     pairs: set[tuple[int, str]] = set()
-    for c in notes.citations:
-        if c.law and not c.law.short_title:
-            pairs.add((c.law.congress, str(c.law.law_number)))
-    for a in notes.amendments:
-        if a.law and not a.law.short_title:
-            pairs.add((a.law.congress, str(a.law.law_number)))
+    for notes in notes_list:
+        for c in notes.citations:
+            if c.law and not c.law.short_title:
+                pairs.add((c.law.congress, str(c.law.law_number)))
+        for a in notes.amendments:
+            if a.law and not a.law.short_title:
+                pairs.add((a.law.congress, str(a.law.law_number)))
 
     if not pairs:
         return
 
-    # Tier 1: batch query public_law table (short_title + official_title)
-    stmt = select(
-        PublicLaw.congress,
-        PublicLaw.law_number,
-        PublicLaw.short_title,
-        PublicLaw.official_title,
-    ).where(tuple_(PublicLaw.congress, PublicLaw.law_number).in_(list(pairs)))
-    result = await session.execute(stmt)
-    # Store (short_title, official_title) per PL key
-    db_lookup: dict[str, tuple[str | None, str | None]] = {}
-    for row in result:
-        db_lookup[f"PL {row[0]}-{row[1]}"] = (row[2], row[3])
+    # Tier 1: public_law titles (short_title + official_title), served from
+    # the process-wide cache so hot section views cost no database work
+    titles = await law_title_cache.get_many(session, pairs)
+    db_lookup: dict[str, tuple[str | None, str | None]] = {
+        f"PL {congress}-{law_number}": entry
+        for (congress, law_number), entry in titles.items()
+    }
 
     # Tier 2: hardcoded titles for major historical laws
-    short_title_lookup: dict[str, str] = {}
+    shared_short_titles: dict[str, str] = {}
     for congress, law_num_str in pairs:
         key = f"PL {congress}-{law_num_str}"
         db_entry = db_lookup.get(key)
         if db_entry and db_entry[0]:
-            short_title_lookup[key] = db_entry[0]
+            shared_short_titles[key] = db_entry[0]
         else:
             info = HARDCODED_TITLES.get((congress, int(law_num_str)))
             if info and info.short_title:
-                short_title_lookup[key] = info.short_title
-
-    # Tier 3: OLRC short_titles from statutory notes
-    for st in notes.short_titles:
-        if st.public_law and st.title:
-            m = re.match(r"Pub\.\s*L\.\s*(\d+)[–-](\d+)", st.public_law)
-            if m:
-                key = f"PL {m.group(1)}-{m.group(2)}"
-                if key not in short_title_lookup:
-                    short_title_lookup[key] = st.title
-
-    def _apply(law: Any, pl_key: str) -> None:
-        """Set short_title and official_title on a PublicLawSchema."""
-        if not law.short_title:
-            st = short_title_lookup.get(pl_key)
-            if st:
-                law.short_title = st
-        if not law.official_title:
-            db_entry = db_lookup.get(pl_key)
-            if db_entry and db_entry[1]:
-                law.official_title = db_entry[1]
-
-    # Enrich citations
-    for c in notes.citations:
-        if c.law:
-            _apply(c.law, c.law.public_law_id)
-
-    # Enrich amendments (skip pre-1957 Acts that have no PL reference)
-    for a in notes.amendments:
-        if a.law:
-            _apply(a.law, a.law.public_law_id)
+                shared_short_titles[key] = info.short_title
+
+    for notes in notes_list:
+        # Tier 3: OLRC short_titles from this section's statutory notes
+        short_title_lookup = shared_short_titles
+        if notes.short_titles:
+            short_title_lookup = dict(shared_short_titles)
+            for st in notes.short_titles:
+                if st.public_law and st.title:
+                    m = _PUB_L_RE.match(st.public_law)
+                    if m:
+                        key = f"PL {m.group(1)}-{m.group(2)}"
+                        if key not in short_title_lookup:
+                            short_title_lookup[key] = st.title
+
+        def _apply(
+            law: Any, pl_key: str, lookup: dict[str, str] = short_title_lookup
+        ) -> None:
+            """Set short_title and official_title on a PublicLawSchema."""
+            if not law.short_title:
+                st = lookup.get(pl_key)
+                if st:
+                    law.short_title = st
+            if not law.official_title:
+                db_entry = db_lookup.get(pl_key)
+                if db_entry and db_entry[1]:
+                    law.official_title = db_entry[1]
+
+        # Enrich citations
+        for c in notes.citations:
+            if c.law:
+                _apply(c.law, c.law.public_law_id)
+
+        # Enrich amendments (skip pre-1957 Acts that have no PL reference)
+        for a in notes.amendments:
+            if a.law:
+                _apply(a.law, a.law.public_law_id)
+
+
+_GROUP_ANCESTORS_SQL = """
+    WITH RECURSIVE ancestors AS (
+        SELECT group_id AS origin_id, group_id, parent_id, group_type,
+               number, 0 AS depth
+        FROM section_group
+        WHERE group_id = ANY(:group_ids)
+
+        UNION ALL
+
+        SELECT a.origin_id, sg.group_id, sg.parent_id, sg.group_type,
+               sg.number, a.depth + 1
+        FROM section_group sg
+        JOIN ancestors a ON sg.group_id = a.parent_id
+        WHERE sg.group_type != 'title'
+    )
+    SELECT origin_id, group_type, number FROM ancestors
+    WHERE group_type != 'title'
+    ORDER BY origin_id, depth DESC
+"""
 
 
 async def _get_group_ancestors(
@@ -405,29 +457,70 @@ async def _get_group_ancestors(
     Walks up the section_group parent chain from group_id to (but not
     including) the title node, using a recursive CTE.
     """
+    ancestors = await _get_group_ancestors_batch(session, [group_id])
+    return ancestors.get(group_id, [])
+
+
+async def _get_group_ancestors_batch(
+    session: AsyncSession,
+    group_ids: list[uuid.UUID],
+) -> dict[uuid.UUID, list[GroupAncestorSchema]]:
+    """Return ancestor paths for several groups with one recursive CTE."""
+    if not group_ids:
+        return {}
     result = await session.execute(
-        text("""
-            WITH RECURSIVE ancestors AS (
-                SELECT group_id, parent_id, group_type, number, 0 AS depth
-                FROM section_group
-                WHERE group_id = :group_id
+        text(_GROUP_ANCESTORS_SQL), {"group_ids": list(group_ids)}
+    )
+    ancestors: dict[uuid.UUID, list[GroupAncestorSchema]] = {}
+    for row in result:
+        ancestors.setdefault(row.origin_id, []).append(
+            GroupAncestorSchema(type=row.group_type, number=row.number)
+        )
+    return ancestors
+
+
+def _build_section_viewer(
+    state: SectionState,
+    notes: SectionNotesSchema | None,
+    *,
+    is_positive_law: bool,
+    last_revision: HeadRevisionSchema | None,
+    group_ancestors: list[GroupAncestorSchema],
+) -> SectionViewerSchema:
+    """Assemble a SectionViewerSchema from a state and its looked-up context."""
+    provisions = None
+    if state.normalized_provisions is not None:
+        provisions = _CODE_LINES_ADAPTER.validate_python(state.normalized_provisions)
 
-                UNION ALL
+    # Extract source_credit from normalized_notes JSONB or notes schema
+    source_credit: str | None = None
+    if notes is not None and notes.source_credit:
+        source_credit = notes.source_credit
+    elif state.normalized_notes:
+        source_credit = state.normalized_notes.get("source_credit")
 
-                SELECT sg.group_id, sg.parent_id, sg.group_type, sg.number, a.depth + 1
-                FROM section_group sg
-                JOIN ancestors a ON sg.group_id = a.parent_id
-                WHERE sg.group_type != 'title'
-            )
-            SELECT group_type, number FROM ancestors
-            WHERE group_type != 'title'
-            ORDER BY depth DESC
-        """),
-        {"group_id": group_id},
+    enacted_date, last_modified_date = state.enacted_date, state.last_modified_date
+    if enacted_date is None and last_modified_date is None:
+        # Snapshot written before the columns existed and not yet backfilled
+        enacted_date, last_modified_date = derive_section_dates(state.normalized_notes)
+
+    return SectionViewerSchema(
+        title_number=state.title_number,
+        section_number=state.section_number,
+        heading=state.heading or "",
+        full_citation=state.full_citation
+        or f"{state.title_number} USC {state.section_number}",
+        text_content=state.text_content,
+        provisions=provisions,
+        enacted_date=enacted_date,
+        last_modified_date=last_modified_date,
+        is_positive_law=is_positive_law,
+        is_repealed=state.is_deleted,
+        notes=notes,
+        source_credit=source_credit,
+        last_revision=last_revision,
+        group_ancestors=group_ancestors,
     )
-    return [
-        GroupAncestorSchema(type=row.group_type, number=row.number) for row in result
-    ]
 
 
 async def get_section(
@@ -435,13 +528,16 @@ async def get_section(
     title_number: int,
     section_number: str,
     revision_id: int | None = None,
+    *,
+    chain: list[int] | None = None,
 ) -> SectionViewerSchema | None:
     """Return full section content for the viewer page.
 
-    Reads from SectionSnapshot at HEAD (or specified revision).
-    Returns None if the section is not found.
+    Reads from SectionSnapshot at HEAD (or specified revision). ``chain``
+    may be supplied alongside ``revision_id`` to reuse a pre-built
+    revision chain. Returns None if the section is not found.
     """
-    head_id, chain = await _resolve_head_and_chain(session, revision_id)
+    head_id, chain = await _resolve_head_and_chain(session, revision_id, chain)
     if head_id is None:
         return None
 
@@ -458,12 +554,6 @@ async def get_section(
         notes = SectionNotesSchema.model_validate(state.normalized_notes)
         await _enrich_notes_with_titles(session, notes)
 
-    provisions = None
-    if state.normalized_provisions is not None:
-        provisions = [
-            CodeLineSchema.model_validate(line) for line in state.normalized_provisions
-        ]
-
     # Read is_positive_law from the title-level SectionGroup (USCodeSection.is_positive_law
     # is never populated by the pipeline; the flag lives on the title SectionGroup).
     is_positive_law_stmt = select(SectionGroup.is_positive_law).where(
@@ -472,56 +562,6 @@ async def get_section(
     )
     is_positive_law = await session.scalar(is_positive_law_stmt) or False
 
-    # Derive enacted_date and last_modified_date from notes when available
-    enacted_date = None
-    last_modified_date = None
-
-    if state.normalized_notes:
-        # Extract enacted_date from first citation
-        citations = state.normalized_notes.get("citations", [])
-        if citations:
-            first = citations[0]
-            law_data = first.get("law") or first.get("act")
-            if law_data and law_data.get("date"):
-                from pipeline.olrc.group_service import _parse_citation_date
-
-                enacted_date = _parse_citation_date(law_data["date"])
-
-        # Extract last_modified_date from the most recent non-Framework citation.
-        # Including Enactment citations covers sections that were enacted by a
-        # single law and never subsequently amended — in that case the enactment
-        # date IS the last-modified date.  Original Framework citations (pre-1957
-        # Acts providing structural context only) are excluded because their
-        # dates pre-date the section's actual creation/modification. Non-original
-        # Framework citations (e.g. chapter acts, issue #563) are still included
-        # since they represent an actual amendment to the section.
-        if citations:
-            from pipeline.olrc.group_service import _parse_citation_date
-
-            modification_dates = []
-            for c in citations:
-                is_original_framework = c.get("relationship") == "Framework" and c.get(
-                    "is_original", True
-                )
-                if is_original_framework:
-                    continue
-                law_data = c.get("law") or c.get("act")
-                if law_data and law_data.get("date"):
-                    parsed = _parse_citation_date(law_data["date"])
-                    if parsed is not None:
-                        modification_dates.append(parsed)
-            if modification_dates:
-                last_modified_date = max(modification_dates)
-
-        # Fallback: use year-only from amendments when citation dates are unavailable
-        if last_modified_date is None:
-            amendments = state.normalized_notes.get("amendments", [])
-            if amendments:
-                from datetime import date
-
-                max_year = max(a["year"] for a in amendments if "year" in a)
-                last_modified_date = date(max_year, 1, 1)
-
     # Find the revision that last *changed* this section's content.
     # Reuse the same chain to avoid re-fetching HEAD + CTE.
     last_revision = await get_last_changed_revision_for_section(
@@ -532,26 +572,128 @@ async def get_section(
     if state.group_id is not None:
         group_ancestors = await _get_group_ancestors(session, state.group_id)
 
-    # Extract source_credit from normalized_notes JSONB or notes schema
-    source_credit: str | None = None
-    if notes is not None and notes.source_credit:
-        source_credit = notes.source_credit
-    elif state.normalized_notes:
-        source_credit = state.normalized_notes.get("source_credit")
-
-    return SectionViewerSchema(
-        title_number=title_number,
-        section_number=state.section_number,
-        heading=state.heading or "",
-        full_citation=state.full_citation or f"{title_number} USC {section_number}",
-        text_content=state.text_content,
-        provisions=provisions,
-        enacted_date=enacted_date,
-        last_modified_date=last_modified_date,
+    return _build_section_viewer(
+        state,
+        notes,
         is_positive_law=is_positive_law,
-        is_repealed=state.is_deleted,
-        notes=notes,
-        source_credit=source_credit,
         last_revision=last_revision,
         group_ancestors=group_ancestors,
     )
+
+
+async def get_sections_batch(
+    session: AsyncSession,
+    keys: list[tuple[int, str]],
+    revision_id: int | None = None,
+) -> list[SectionViewerSchema]:
+    """Return viewer payloads for many sections with a fixed number of queries.
+
+    Resolves the revision chain once, fetches every snapshot with one
+    ``get_sections_at_revision`` query, and batches note enrichment,
+    positive-law flags, last-changed revisions and group ancestors into
+    one query each, regardless of how many sections are requested.
+
+    Results follow the order of ``keys``; missing or deleted sections are
+    omitted.
+    """
+    head_id, chain = await _resolve_head_and_chain(session, revision_id)
+    if head_id is None or not keys:
+        return []
+
+    keys = list(dict.fromkeys(keys))
+    svc = SnapshotService(session)
+    states = await svc.get_sections_at_revision(keys, head_id, chain=chain)
+    if not states:
+        return []
+
+    notes_by_key: dict[tuple[int, str], SectionNotesSchema] = {}
+    for key, state in states.items():
+        if state.normalized_notes is not None:
+            notes_by_key[key] = SectionNotesSchema.model_validate(
+                state.normalized_notes
+            )
+    await _enrich_notes_batch(session, list(notes_by_key.values()))
+
+    title_numbers = {k[0] for k in states}
+    positive_law_result = await session.execute(
+        select(SectionGroup.number, SectionGroup.is_positive_law).where(
+            SectionGroup.group_type == "title",
+            SectionGroup.number.in_([str(t) for t in title_numbers]),
+        )
+    )
+    positive_law = {int(row[0]): bool(row[1]) for row in positive_law_result}
+
+    last_revisions = await get_last_changed_revisions_for_sections(
+        session, list(states), chain=chain
+    )
+    group_ids = {s.group_id for s in states.values() if s.group_id is not None}
+    ancestors = await _get_group_ancestors_batch(session, list(group_ids))
+
+    viewers: list[SectionViewerSchema] = []
+    for key in keys:
+        section_state = states.get(key)
+        if section_state is None:
+            continue
+        viewers.append(
+            _build_section_viewer(
+                section_state,
+                notes_by_key.get(key),
+                is_positive_law=positive_law.get(key[0], False),
+                last_revision=last_revisions.get(key),
+                group_ancestors=(
+                    ancestors.get(section_state.group_id, [])
+                    if section_state.group_id is not None
+                    else []
+                ),
+            )
+        )
+    return viewers
+
+
+async def get_group_section_keys(
+    session: AsyncSession,
+    group_id: uuid.UUID,
+    revision_id: int | None = None,
+) -> list[tuple[int, str]] | None:
+    """Return keys of live sections under a group (and its descendants).
+
+    Sections are returned in display order. Returns None if the group does
+    not exist; an empty list if it has no live sections at the revision.
+    """
+    if await session.get(SectionGroup, group_id) is None:
+        return None
+    head_id, chain = await _resolve_head_and_chain(session, revision_id)
+    if head_id is None or not chain:
+        return []
+
+    # Candidates are sections that were ever in the subtree along the chain;
+    # the outer filter keeps those whose *latest* snapshot is still there.
+    result = await session.execute(
+        text("""
+            WITH RECURSIVE subtree AS (
+                SELECT group_id FROM section_group WHERE group_id = :group_id
+                UNION ALL
+                SELECT sg.group_id FROM section_group sg
+                JOIN subtree st ON sg.parent_id = st.group_id
+            )
+            SELECT title_number, section_number FROM (
+                SELECT DISTINCT ON (title_number, section_number)
+                    title_number, section_number, is_deleted, group_id,
+                    sort_order
+                FROM section_snapshot
+                WHERE revision_id = ANY(:chain)
+                  AND (title_number, section_number) IN (
+                      SELECT title_number, section_number
+                      FROM section_snapshot
+                      WHERE revision_id = ANY(:chain)
+                        AND group_id IN (SELECT group_id FROM subtree)
+                  )
+                ORDER BY title_number, section_number,
+                    array_position(:chain, revision_id)
+            ) latest
+            WHERE NOT is_deleted AND group_id IN (SELECT group_id FROM subtree)
+            ORDER BY sort_order, section_number
+        """),
+        {"group_id": group_id, "chain": chain},
+    )
+    return [(row[0], row[1]) for row in result]
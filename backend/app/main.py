@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+import importlib
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -11,8 +12,9 @@ from sqlalchemy import text
 from app.api.v1.router import api_router
 from app.config import settings
 from app.core.cache_middleware import CacheControlMiddleware
+from app.core.law_title_cache import law_title_cache
 from app.core.logging_middleware import RequestLoggingMiddleware
-from app.models.base import engine
+from app.models.base import async_session_maker, engine
 
 logging.basicConfig(
     level=logging.DEBUG if settings.debug else logging.INFO,
@@ -25,7 +27,7 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(application: FastAPI) -> AsyncIterator[None]:  # noqa: ARG001
-    """Warm up the database connection pool on startup.
+    """Warm up the database connection pool and law title cache on startup.
 
     Cloud Run cold starts pay ~1-2s for the first DB connection to Cloud SQL.
     Priming the pool here moves that cost to container startup (before the
@@ -34,6 +36,20 @@ async def lifespan(application: FastAPI) -> AsyncIterator[None]:  # noqa: ARG001
     async with engine.connect() as conn:
         await conn.execute(text("SELECT 1"))
     logger.info("Database connection pool warmed up")
+    law_title_cache.configure(async_session_maker)
+    try:
+        async with async_session_maker() as session:
+            await law_title_cache.warm(session)
+    except Exception as e:
+        # Not fatal: the cache warms itself on first use
+        logger.warning(f"Law title cache warm-up failed: {e}")
+    if settings.gcs_cache_bucket:
+        # Share the pipeline's amendment parse results through the GCS tier;
+        # without a bucket the API's local disk would only cache for itself.
+        # Dynamic imports keep pipeline/ out of mypy's module graph.
+        pipeline_cache = importlib.import_module("pipeline.cache")
+        parse_cache = importlib.import_module("pipeline.legal_parser.parse_cache")
+        parse_cache.set_pipeline_cache(pipeline_cache.get_pipeline_cache())
     yield
 
 
@@ -215,6 +215,13 @@ class Vote(Base, TimestampMixin):
     )
 
     __table_args__ = (
+        UniqueConstraint(
+            "chamber",
+            "congress",
+            "session",
+            "vote_number",
+            name="uq_vote_chamber_congress_session_number",
+        ),
         Index("idx_vote_chamber", "chamber"),
         Index("idx_vote_date", "vote_date"),
         Index("idx_vote_law", "law_id"),
@@ -109,6 +109,7 @@ class PublicLaw(Base, TimestampMixin):
         Index("idx_law_number", "congress", "law_number"),
         Index("idx_law_congress", "congress"),
         Index("idx_law_enacted", "enacted_date"),
+        Index("idx_law_enacted_keyset", "enacted_date", "law_id"),
         Index("idx_law_effective", "effective_date"),
         Index("idx_law_popular_name", "popular_name"),
         Index("idx_law_president", "president"),
@@ -5,9 +5,11 @@ walk the parent revision chain to find the most recent snapshot.
 """
 
 import uuid
+from datetime import date
 from typing import TYPE_CHECKING, Any, Optional
 
 from sqlalchemy import (
+    Date,
     ForeignKey,
     Index,
     Integer,
@@ -75,6 +77,16 @@ class SectionSnapshot(Base, TimestampMixin):
     full_citation: Mapped[str | None] = mapped_column(
         String(200), nullable=True, doc='e.g., "17 USC 106"'
     )
+    enacted_date: Mapped[date | None] = mapped_column(
+        Date,
+        nullable=True,
+        doc="Date of the enacting law, derived from normalized_notes on write",
+    )
+    last_modified_date: Mapped[date | None] = mapped_column(
+        Date,
+        nullable=True,
+        doc="Date of the latest amending law, derived from normalized_notes on write",
+    )
     is_deleted: Mapped[bool] = mapped_column(
         default=False,
         nullable=False,
@@ -125,6 +137,8 @@ class SectionSnapshot(Base, TimestampMixin):
             "title_number",
             "section_number",
         ),
+        # "Recently changed" filters and sorting across the whole Code
+        Index("idx_section_snapshot_last_modified", "last_modified_date"),
     )
 
     def __repr__(self) -> str:
@@ -161,6 +161,13 @@ class USCodeSection(Base, TimestampMixin):
             postgresql_where="is_repealed = FALSE",
         ),
         Index("idx_section_sort", "group_id", "sort_order"),
+        Index(
+            "idx_section_title_sort_keyset",
+            "title_number",
+            "sort_order",
+            "section_id",
+        ),
+        Index("idx_section_last_modified", "last_modified_date"),
     )
 
     def __repr__(self) -> str:
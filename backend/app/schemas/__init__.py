@@ -24,6 +24,7 @@ from app.schemas.us_code import (
     CodeReferenceSchema,
     NoteCategoryEnum,
     NoteReferenceSchema,
+    SectionBatchResponse,
     SectionGroupTreeSchema,
     SectionNoteSchema,
     SectionNotesSchema,
@@ -56,6 +57,7 @@ __all__ = [
     "SectionNotesSchema",
     # Section viewer schemas
     "SectionViewerSchema",
+    "SectionBatchResponse",
     # Tree navigation schemas
     "TitleSummarySchema",
     "SectionSummarySchema",
@@ -23,10 +23,18 @@ class LawSummarySchema(BaseModel):
 class PaginatedLawsResponse(BaseModel):
     """Paginated response for the public laws list."""
 
-    total: int = Field(..., description="Total number of laws in the database")
+    total: int | None = Field(
+        ..., description="Total number of laws (None when totals are disabled)"
+    )
     items: list[LawSummarySchema]
     limit: int
     offset: int
+    next_cursor: str | None = Field(
+        None, description="Opaque cursor for the next page (None on the last page)"
+    )
+    total_is_estimate: bool = Field(
+        False, description="True when total is a planner row estimate"
+    )
 
 
 class LawTextSchema(BaseModel):
@@ -25,13 +25,17 @@ class LawSearchResult(BaseModel):
 
 class SectionSearchResponse(BaseModel):
     results: list[SectionSearchResult]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class LawSearchResponse(BaseModel):
     results: list[LawSearchResult]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
@@ -501,6 +501,13 @@ class SectionViewerSchema(BaseModel):
         return sorted({n.category.value for n in self.notes.notes})
 
 
+class SectionBatchResponse(BaseModel):
+    """Viewer payloads for a batch of sections."""
+
+    sections: list[SectionViewerSchema]
+    missing: list[str] = []  # "title:section" keys not found at the revision
+
+
 class TitleSummarySchema(BaseModel):
     """Summary of a US Code title for list views."""
 
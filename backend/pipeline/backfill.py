@@ -0,0 +1,393 @@
+"""Streaming, batched backfills of values derived from stored columns.
+
+A backfill recomputes something from columns a row already has (re-parsing
+raw notes into ``normalized_notes``, deriving ``last_modified_date`` from
+them) and writes back only the rows whose value changes. ``run_backfill``
+does the work for any ``Backfill`` spec:
+
+- Rows are read in primary-key order one keyset page at a time
+  (``WHERE key > :last ORDER BY key LIMIT batch_size``), so memory stays
+  bounded however large the table. A server-side cursor would not survive
+  the commit after every batch.
+- ``transform`` runs in a process pool (``workers``; 0 runs it inline).
+  It must be a module-level function so it can be pickled. The next page is
+  read while the pool works on the current one.
+- A batch's changes are written with one ``UPDATE ... FROM (VALUES ...)``
+  on PostgreSQL (an executemany ``UPDATE`` on other databases) and
+  committed.
+- After each commit the last key is checkpointed in the PipelineCache
+  under ``backfill/<name>.json``; a rerun resumes after it unless
+  ``restart`` is set. The checkpoint is deleted once the last page is
+  committed, so only interrupted runs resume. Dry runs neither read nor
+  write checkpoints.
+- ``pause`` sleeps between batches to throttle the load on the database.
+- Dry runs write nothing; every change they find can be written to a
+  JSON Lines diff report.
+
+Scripts expose this through ``backfill_arg_parser``::
+
+    uv run python -m pipeline.backfill_last_modified          # dry-run
+    uv run python -m pipeline.backfill_last_modified --apply  # commit
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import IO, TYPE_CHECKING, Any
+
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Table,
+    Update,
+    bindparam,
+    column,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import TypeEngine
+
+if TYPE_CHECKING:
+    from pipeline.cache import PipelineCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+_CHECKPOINT_PREFIX = "backfill"
+
+
+@dataclass
+class RowChange:
+    """A row whose derived value differs from what is stored."""
+
+    key: Any
+    # Bound into the UPDATE, keyed by the names in Backfill.values
+    values: dict[str, Any]
+    # What the dry-run report shows
+    before: Any = None
+    after: Any = None
+
+
+@dataclass
+class Backfill:
+    """What a backfill reads, how it recomputes a row and what it writes.
+
+    Attributes:
+        name: Checkpoint and log name; unique per table.
+        table: Table being backfilled.
+        key: Integer primary key column, the keyset order.
+        columns: Columns passed to ``transform`` after the key.
+        transform: Module-level function from ``(key, *columns)`` to a
+            RowChange, or None when the row is already correct.
+        values: Name and SQL type of each value in ``RowChange.values``.
+        assignments: Builds the SET clause from the values, given as
+            column expressions keyed by name.
+        where: Filters selecting candidate rows.
+    """
+
+    name: str
+    table: Table
+    key: Column[Any]
+    columns: list[Column[Any]]
+    transform: Callable[[tuple[Any, ...]], RowChange | None]
+    values: dict[str, TypeEngine[Any]]
+    assignments: Callable[
+        [Mapping[str, ColumnElement[Any]]], dict[str, ColumnElement[Any]]
+    ]
+    where: list[ColumnElement[bool]] = field(default_factory=list)
+
+    @property
+    def checkpoint_key(self) -> str:
+        return f"{_CHECKPOINT_PREFIX}/{self.name}.json"
+
+
+@dataclass
+class BackfillResult:
+    """Outcome of one ``run_backfill`` call."""
+
+    name: str
+    scanned: int = 0
+    changed: int = 0
+    resumed_after: Any = None
+
+
+def _transform_rows(
+    transform: Callable[[tuple[Any, ...]], RowChange | None],
+    rows: list[tuple[Any, ...]],
+) -> list[RowChange]:
+    """Apply ``transform`` to rows, keeping only the changes (pool worker)."""
+    return [change for row in rows if (change := transform(row)) is not None]
+
+
+async def _transform_page(
+    backfill: Backfill,
+    rows: list[tuple[Any, ...]],
+    pool: ProcessPoolExecutor | None,
+    workers: int,
+) -> list[RowChange]:
+    """Transform a page, split across the pool's workers, in key order."""
+    if pool is None:
+        return _transform_rows(backfill.transform, rows)
+    loop = asyncio.get_running_loop()
+    size = max(1, -(-len(rows) // workers))
+    chunks = await asyncio.gather(
+        *[
+            loop.run_in_executor(
+                pool, _transform_rows, backfill.transform, rows[i : i + size]
+            )
+            for i in range(0, len(rows), size)
+        ]
+    )
+    return [change for chunk in chunks for change in chunk]
+
+
+async def _read_page(
+    session: AsyncSession,
+    backfill: Backfill,
+    after: Any,
+    batch_size: int,
+) -> list[tuple[Any, ...]]:
+    """Read the next ``batch_size`` candidate rows after key ``after``."""
+    stmt = (
+        select(backfill.key, *backfill.columns)
+        .where(*backfill.where)
+        .order_by(backfill.key)
+        .limit(batch_size)
+    )
+    if after is not None:
+        stmt = stmt.where(backfill.key > after)
+    result = await session.execute(stmt)
+    return [tuple(row) for row in result]
+
+
+def update_statement(
+    backfill: Backfill,
+    changes: Sequence[RowChange],
+) -> Update:
+    """Build the set-based ``UPDATE ... FROM (VALUES ...)`` for a batch."""
+    names = list(backfill.values)
+    rows = values(
+        column(backfill.key.name, backfill.key.type),
+        *[column(name, type_) for name, type_ in backfill.values.items()],
+        name="v",
+    ).data([(c.key, *[c.values[name] for name in names]) for c in changes])
+    return (
+        update(backfill.table)
+        .where(backfill.key == rows.c[backfill.key.name])
+        .values(backfill.assignments({name: rows.c[name] for name in names}))
+    )
+
+
+async def _write_changes(
+    session: AsyncSession,
+    backfill: Backfill,
+    changes: list[RowChange],
+) -> None:
+    """Write a batch of changes (not committed)."""
+    if session.get_bind().dialect.name == "postgresql":
+        await session.execute(update_statement(backfill, changes))
+        return
+
+    # Other databases lack UPDATE ... FROM (VALUES ...) column aliases
+    params = {
+        name: bindparam(f"v_{name}", type_=type_)
+        for name, type_ in backfill.values.items()
+    }
+    stmt = (
+        update(backfill.table)
+        .where(backfill.key == bindparam("v_key", type_=backfill.key.type))
+        .values(backfill.assignments(params))
+    )
+    await session.execute(
+        stmt,
+        [
+            {"v_key": c.key, **{f"v_{name}": value for name, value in c.values.items()}}
+            for c in changes
+        ],
+    )
+
+
+def _load_checkpoint(cache: PipelineCache | None, backfill: Backfill) -> Any:
+    if cache is None:
+        return None
+    data = cache.get_text(backfill.checkpoint_key)
+    return json.loads(data)["last_key"] if data else None
+
+
+def _save_checkpoint(
+    cache: PipelineCache | None,
+    backfill: Backfill,
+    last_key: Any,
+    result: BackfillResult,
+) -> None:
+    if cache is None:
+        return
+    cache.put_text(
+        backfill.checkpoint_key,
+        json.dumps(
+            {
+                "last_key": last_key,
+                "scanned": result.scanned,
+                "changed": result.changed,
+            }
+        ),
+    )
+
+
+async def run_backfill(
+    session: AsyncSession,
+    backfill: Backfill,
+    *,
+    dry_run: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int | None = None,
+    cache: PipelineCache | None = None,
+    restart: bool = False,
+    pause: float = 0.0,
+    report: IO[str] | None = None,
+) -> BackfillResult:
+    """Run ``backfill`` over every candidate row.
+
+    Args:
+        session: Database session; each applied batch is committed.
+        backfill: What to read, recompute and write.
+        dry_run: If True, write nothing and only count (and report) changes.
+        batch_size: Rows read, transformed and written per batch.
+        workers: Transform processes (None for one per CPU, 0 for inline).
+        cache: Where checkpoints are kept; without one nothing is resumed.
+        restart: Ignore and overwrite an existing checkpoint.
+        pause: Seconds to sleep between batches.
+        report: Text stream receiving one JSON line per change found.
+
+    Returns:
+        BackfillResult with the rows scanned and changed by this run.
+    """
+    result = BackfillResult(name=backfill.name)
+    checkpoints = None if dry_run else cache
+    after = None if restart else _load_checkpoint(checkpoints, backfill)
+    result.resumed_after = after
+    if after is not None:
+        logger.info("[%s] Resuming after key %s", backfill.name, after)
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers != 0 else None
+    pool_size = getattr(pool, "_max_workers", 1)
+    mode = "DRY-RUN" if dry_run else "APPLIED"
+
+    try:
+        page = await _read_page(session, backfill, after, batch_size)
+        while page:
+            transforming = asyncio.ensure_future(
+                _transform_page(backfill, page, pool, pool_size)
+            )
+            try:
+                next_page = (
+                    await _read_page(session, backfill, page[-1][0], batch_size)
+                    if len(page) == batch_size
+                    else []
+                )
+                changes = await transforming
+            except BaseException:
+                transforming.cancel()
+                raise
+
+            if report is not None:
+                for change in changes:
+                    report.write(
+                        json.dumps(
+                            {
+                                "backfill": backfill.name,
+                                "key": change.key,
+                                "before": change.before,
+                                "after": change.after,
+                            },
+                            default=str,
+                        )
+                        + "\n"
+                    )
+            if changes and not dry_run:
+                await _write_changes(session, backfill, changes)
+                await session.commit()
+
+            result.scanned += len(page)
+            result.changed += len(changes)
+            if not dry_run:
+                _save_checkpoint(checkpoints, backfill, page[-1][0], result)
+            logger.info(
+                "[%s][%s] %d rows scanned, %d changed (through key %s)",
+                mode,
+                backfill.name,
+                result.scanned,
+                result.changed,
+                page[-1][0],
+            )
+
+            page = next_page
+            if page and pause > 0:
+                await asyncio.sleep(pause)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    # Finished: the next run starts from the first row again
+    if checkpoints is not None:
+        checkpoints.delete(backfill.checkpoint_key)
+    logger.info(
+        "[%s][%s] %d of %d rows changed",
+        mode,
+        backfill.name,
+        result.changed,
+        result.scanned,
+    )
+    return result
+
+
+def backfill_arg_parser(description: str | None) -> argparse.ArgumentParser:
+    """Command-line options shared by the backfill scripts."""
+    parser = argparse.ArgumentParser(
+        description=description,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Write the changes (default is a dry run)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Rows per batch (default: {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Transform processes (default: one per CPU; 0 runs inline)",
+    )
+    parser.add_argument(
+        "--pause",
+        type=float,
+        default=0.0,
+        help="Seconds to sleep between batches (default: 0)",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore the saved checkpoint and start from the first row",
+    )
+    parser.add_argument(
+        "--report",
+        type=argparse.FileType("w"),
+        default=None,
+        help="Write every change found to this file as JSON Lines",
+    )
+    return parser
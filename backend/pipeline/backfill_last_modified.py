@@ -1,130 +1,115 @@
 """Backfill last_modified_date on sections from normalized_notes amendments.
 
+Uses the same derivation as snapshot writes (``derive_section_dates``) and
+runs on the framework in ``pipeline.backfill``.
+
 Usage:
     uv run python -m pipeline.backfill_last_modified          # dry-run
     uv run python -m pipeline.backfill_last_modified --apply  # commit changes
+    uv run python -m pipeline.backfill_last_modified --report diff.jsonl
 """
 
 import asyncio
 import logging
-import sys
-from datetime import date
+from collections.abc import Mapping
+from typing import IO, Any
 
-from sqlalchemy import select, update
+from sqlalchemy import ColumnElement, Date, Table
 
 from app.models.base import async_session_maker
 from app.models.us_code import USCodeSection
-from pipeline.olrc.group_service import _parse_citation_date
+from pipeline.backfill import (
+    DEFAULT_BATCH_SIZE,
+    Backfill,
+    RowChange,
+    backfill_arg_parser,
+    run_backfill,
+)
+from pipeline.cache import PipelineCache, get_pipeline_cache
+from pipeline.olrc.section_dates import derive_section_dates
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(
     level=logging.INFO, format="%(levelname)-5.5s [%(name)s] %(message)s"
 )
 
-BATCH_SIZE = 500
 
+def _last_modified_row(row: tuple[Any, ...]) -> RowChange | None:
+    """Return the date for a (section_id, normalized_notes) row."""
+    section_id, notes = row
+    if not notes:
+        return None
+    _, lmd = derive_section_dates(notes)
+    if lmd is None:
+        return None
+    return RowChange(section_id, {"last_modified_date": lmd}, after=lmd.isoformat())
 
-async def backfill(*, dry_run: bool = True) -> int:
-    """Backfill last_modified_date from normalized_notes amendment citations.
 
-    Prefers the full enactment date from amendment citations over the
-    year-only approximation from the amendments list.
+def _assignments(v: Mapping[str, ColumnElement[Any]]) -> dict[str, ColumnElement[Any]]:
+    return {"last_modified_date": v["last_modified_date"]}
 
-    Returns the number of rows updated.
-    """
-    updated = 0
 
+_table: Table = USCodeSection.__table__  # type: ignore[assignment]
+
+BACKFILL = Backfill(
+    name="last_modified_date",
+    table=_table,
+    key=_table.c.section_id,
+    columns=[_table.c.normalized_notes],
+    transform=_last_modified_row,
+    values={"last_modified_date": Date()},
+    assignments=_assignments,
+    where=[
+        _table.c.last_modified_date.is_(None),
+        _table.c.normalized_notes.isnot(None),
+    ],
+)
+
+
+async def backfill(
+    *,
+    dry_run: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int | None = None,
+    cache: PipelineCache | None = None,
+    restart: bool = False,
+    pause: float = 0.0,
+    report: IO[str] | None = None,
+) -> int:
+    """Backfill last_modified_date from normalized_notes amendment citations.
+
+    Returns the number of rows updated (or that would be updated).
+    """
     async with async_session_maker() as session:
-        # Select sections with notes but no last_modified_date
-        stmt = select(
-            USCodeSection.section_id,
-            USCodeSection.normalized_notes,
-        ).where(
-            USCodeSection.last_modified_date.is_(None),
-            USCodeSection.normalized_notes.isnot(None),
+        result = await run_backfill(
+            session,
+            BACKFILL,
+            dry_run=dry_run,
+            batch_size=batch_size,
+            workers=workers,
+            cache=cache,
+            restart=restart,
+            pause=pause,
+            report=report,
         )
-        result = await session.execute(stmt)
-        rows = result.all()
-
-        logger.info("Found %d sections to check", len(rows))
-
-        batch: list[dict] = []
-        for section_id, notes in rows:
-            if not notes:
-                continue
-
-            lmd: date | None = None
-
-            # Prefer full date from non-Framework citations.  Including
-            # Enactment citations covers sections enacted by a single law
-            # with no subsequent amendments — the enactment date IS the
-            # last-modified date.  Original Framework (pre-1957 structural
-            # context) citations are excluded because their dates pre-date
-            # the section's actual creation/modification; non-original
-            # Framework citations (e.g. chapter acts, issue #563) are still
-            # included since they represent an actual amendment.
-            citations = notes.get("citations", [])
-            modification_dates = []
-            for c in citations:
-                is_original_framework = c.get("relationship") == "Framework" and c.get(
-                    "is_original", True
-                )
-                if is_original_framework:
-                    continue
-                law_data = c.get("law") or c.get("act")
-                if law_data and law_data.get("date"):
-                    parsed = _parse_citation_date(law_data["date"])
-                    if parsed is not None:
-                        modification_dates.append(parsed)
-            if modification_dates:
-                lmd = max(modification_dates)
-            else:
-                # Fallback: year-only from amendments
-                amendments = notes.get("amendments", [])
-                years = [a.get("year") for a in amendments if a.get("year")]
-                if years:
-                    lmd = date(max(years), 1, 1)
-
-            if lmd is None:
-                continue
-
-            batch.append({"sid": section_id, "lmd": lmd})
-
-            if len(batch) >= BATCH_SIZE:
-                if not dry_run:
-                    for item in batch:
-                        await session.execute(
-                            update(USCodeSection)
-                            .where(USCodeSection.section_id == item["sid"])
-                            .values(last_modified_date=item["lmd"])
-                        )
-                    await session.commit()
-                updated += len(batch)
-                logger.info("Processed %d rows so far", updated)
-                batch = []
-
-        # Final batch
-        if batch:
-            if not dry_run:
-                for item in batch:
-                    await session.execute(
-                        update(USCodeSection)
-                        .where(USCodeSection.section_id == item["sid"])
-                        .values(last_modified_date=item["lmd"])
-                    )
-                await session.commit()
-            updated += len(batch)
-
-    mode = "DRY-RUN" if dry_run else "APPLIED"
-    logger.info("[%s] Would update %d sections", mode, updated)
-    return updated
+    return result.changed
 
 
 def main() -> None:
-    dry_run = "--apply" not in sys.argv
-    if dry_run:
+    args = backfill_arg_parser(__doc__).parse_args()
+    if not args.apply:
         logger.info("Running in dry-run mode (pass --apply to commit)")
-    asyncio.run(backfill(dry_run=dry_run))
+    asyncio.run(
+        backfill(
+            dry_run=not args.apply,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            cache=get_pipeline_cache(),
+            restart=args.restart,
+            pause=args.pause,
+            report=args.report,
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -12,21 +12,34 @@ type affected by two bug fixes applied after initial ingestion:
   2. ``"References in Text"`` added to ``PARAGRAPH_LINE_HEADERS`` — routes
      that note type through ``_paragraph_lines()`` (one line per ``<p>``).
 
-See GitHub issue #625.
+See GitHub issue #625. Runs on the framework in ``pipeline.backfill``.
 
 Usage:
     uv run python -m pipeline.backfill_renormalize_notes          # dry-run
     uv run python -m pipeline.backfill_renormalize_notes --apply  # commit
+    uv run python -m pipeline.backfill_renormalize_notes --report diff.jsonl
 """
 
 import asyncio
 import json
 import logging
-import sys
+from collections.abc import Mapping
+from typing import IO, Any
 
-from sqlalchemy import text
+from sqlalchemy import ColumnElement, Table, func, literal_column
+from sqlalchemy.dialects.postgresql import JSONB
 
 from app.models.base import async_session_maker
+from app.models.snapshot import SectionSnapshot
+from app.models.us_code import USCodeSection
+from pipeline.backfill import (
+    DEFAULT_BATCH_SIZE,
+    Backfill,
+    RowChange,
+    backfill_arg_parser,
+    run_backfill,
+)
+from pipeline.cache import PipelineCache, get_pipeline_cache
 from pipeline.olrc.normalized_section import SectionNotes, _parse_notes_structure
 
 logger = logging.getLogger(__name__)
@@ -34,33 +47,6 @@ logging.basicConfig(
     level=logging.INFO, format="%(levelname)-5.5s [%(name)s] %(message)s"
 )
 
-BATCH_SIZE = 100
-
-# Tables that store (raw) notes + normalized_notes JSONB
-_TABLES = [
-    ("section_snapshot", "snapshot_id"),
-    ("us_code_section", "section_id"),
-]
-
-_SELECT_SQL = """\
-SELECT {pk}, notes, normalized_notes
-FROM {table}
-WHERE notes LIKE '%References in Text%'
-  AND notes IS NOT NULL
-  AND normalized_notes IS NOT NULL
-ORDER BY {pk}
-"""
-
-_UPDATE_SQL = """\
-UPDATE {table}
-SET normalized_notes = jsonb_set(
-        normalized_notes,
-        '{{notes}}',
-        :new_notes::jsonb
-    )
-WHERE {pk} = :row_id
-"""
-
 
 def _renormalize_notes_list(raw_notes: str) -> list[dict]:
     """Return the re-parsed notes[] list for the given raw notes text."""
@@ -69,78 +55,82 @@ def _renormalize_notes_list(raw_notes: str) -> list[dict]:
     return [note.model_dump(mode="json", exclude_none=True) for note in schema.notes]
 
 
-async def _backfill_table(
-    table: str,
-    pk: str,
-    *,
-    dry_run: bool,
-) -> int:
-    """Backfill one table; return the number of rows that differ."""
-    changed = 0
+def _renormalize_row(row: tuple[Any, ...]) -> RowChange | None:
+    """Return the new notes[] for a (key, notes, normalized_notes) row."""
+    row_id, raw_notes, normalized_notes = row
+    if not raw_notes or not normalized_notes:
+        return None
 
-    async with async_session_maker() as session:
-        result = await session.execute(text(_SELECT_SQL.format(table=table, pk=pk)))
-        rows = result.all()
-        logger.info("[%s] Found %d candidate rows", table, len(rows))
-
-        batch: list[dict] = []
-
-        for row_id, raw_notes, normalized_notes in rows:
-            if not raw_notes or not normalized_notes:
-                continue
-
-            new_notes = _renormalize_notes_list(raw_notes)
-            old_notes = normalized_notes.get("notes", [])
-
-            # Compare serialised forms to detect any difference
-            if json.dumps(new_notes, sort_keys=True) == json.dumps(
-                old_notes, sort_keys=True
-            ):
-                continue
-
-            batch.append(
-                {
-                    "row_id": row_id,
-                    "new_notes": json.dumps(new_notes),
-                }
+    new_notes = _renormalize_notes_list(raw_notes)
+    old_notes = normalized_notes.get("notes", [])
+
+    # Compare serialised forms to detect any difference
+    if json.dumps(new_notes, sort_keys=True) == json.dumps(old_notes, sort_keys=True):
+        return None
+    return RowChange(row_id, {"notes": new_notes}, before=old_notes, after=new_notes)
+
+
+def _notes_backfill(model: type[SectionSnapshot] | type[USCodeSection]) -> Backfill:
+    table: Table = model.__table__  # type: ignore[assignment]
+
+    def assignments(
+        v: Mapping[str, ColumnElement[Any]],
+    ) -> dict[str, ColumnElement[Any]]:
+        return {
+            "normalized_notes": func.jsonb_set(
+                table.c.normalized_notes, literal_column("'{notes}'"), v["notes"]
             )
+        }
+
+    return Backfill(
+        name=f"renormalize_notes.{table.name}",
+        table=table,
+        key=next(iter(table.primary_key.columns)),
+        columns=[table.c.notes, table.c.normalized_notes],
+        transform=_renormalize_row,
+        values={"notes": JSONB()},
+        assignments=assignments,
+        where=[
+            table.c.notes.like("%References in Text%"),
+            table.c.notes.isnot(None),
+            table.c.normalized_notes.isnot(None),
+        ],
+    )
 
-            if len(batch) >= BATCH_SIZE:
-                if not dry_run:
-                    for item in batch:
-                        await session.execute(
-                            text(_UPDATE_SQL.format(table=table, pk=pk)),
-                            item,
-                        )
-                    await session.commit()
-                changed += len(batch)
-                logger.info("[%s] Processed %d changed rows so far", table, changed)
-                batch = []
-
-        # Final batch
-        if batch:
-            if not dry_run:
-                for item in batch:
-                    await session.execute(
-                        text(_UPDATE_SQL.format(table=table, pk=pk)),
-                        item,
-                    )
-                await session.commit()
-            changed += len(batch)
 
-    mode = "DRY-RUN" if dry_run else "APPLIED"
-    logger.info("[%s][%s] %d rows would be updated", mode, table, changed)
-    return changed
+# Tables that store (raw) notes + normalized_notes JSONB
+BACKFILLS = [_notes_backfill(SectionSnapshot), _notes_backfill(USCodeSection)]
 
 
-async def backfill(*, dry_run: bool = True) -> int:
+async def backfill(
+    *,
+    dry_run: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int | None = None,
+    cache: PipelineCache | None = None,
+    restart: bool = False,
+    pause: float = 0.0,
+    report: IO[str] | None = None,
+) -> int:
     """Backfill stale notes[] in all affected tables.
 
     Returns the total number of rows updated (or that would be updated).
     """
     total = 0
-    for table, pk in _TABLES:
-        total += await _backfill_table(table, pk, dry_run=dry_run)
+    async with async_session_maker() as session:
+        for spec in BACKFILLS:
+            result = await run_backfill(
+                session,
+                spec,
+                dry_run=dry_run,
+                batch_size=batch_size,
+                workers=workers,
+                cache=cache,
+                restart=restart,
+                pause=pause,
+                report=report,
+            )
+            total += result.changed
 
     mode = "DRY-RUN" if dry_run else "APPLIED"
     logger.info("[%s] Total rows affected: %d", mode, total)
@@ -148,10 +138,20 @@ async def backfill(*, dry_run: bool = True) -> int:
 
 
 def main() -> None:
-    dry_run = "--apply" not in sys.argv
-    if dry_run:
+    args = backfill_arg_parser(__doc__).parse_args()
+    if not args.apply:
         logger.info("Running in dry-run mode (pass --apply to commit changes)")
-    asyncio.run(backfill(dry_run=dry_run))
+    asyncio.run(
+        backfill(
+            dry_run=not args.apply,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            cache=get_pipeline_cache(),
+            restart=args.restart,
+            pause=args.pause,
+            report=args.report,
+        )
+    )
 
 
 if __name__ == "__main__":
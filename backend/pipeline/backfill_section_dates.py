@@ -0,0 +1,126 @@
+"""Backfill enacted_date and last_modified_date on section snapshots.
+
+New snapshots get both dates from ``derive_section_dates`` when they are
+written; this fills them in on snapshots written before the columns
+existed. Runs on the framework in ``pipeline.backfill``.
+
+Usage:
+    uv run python -m pipeline.backfill_section_dates          # dry-run
+    uv run python -m pipeline.backfill_section_dates --apply  # commit changes
+    uv run python -m pipeline.backfill_section_dates --report diff.jsonl
+"""
+
+import asyncio
+import logging
+from collections.abc import Mapping
+from typing import IO, Any
+
+from sqlalchemy import ColumnElement, Date, Table
+
+from app.models.base import async_session_maker
+from app.models.snapshot import SectionSnapshot
+from pipeline.backfill import (
+    DEFAULT_BATCH_SIZE,
+    Backfill,
+    RowChange,
+    backfill_arg_parser,
+    run_backfill,
+)
+from pipeline.cache import PipelineCache, get_pipeline_cache
+from pipeline.olrc.section_dates import derive_section_dates
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(
+    level=logging.INFO, format="%(levelname)-5.5s [%(name)s] %(message)s"
+)
+
+
+def _section_dates_row(row: tuple[Any, ...]) -> RowChange | None:
+    """Return the dates for a (snapshot_id, normalized_notes) row."""
+    snapshot_id, notes = row
+    enacted, last_modified = derive_section_dates(notes)
+    if enacted is None and last_modified is None:
+        return None
+    return RowChange(
+        snapshot_id,
+        {"enacted_date": enacted, "last_modified_date": last_modified},
+        after={
+            "enacted_date": enacted and enacted.isoformat(),
+            "last_modified_date": last_modified and last_modified.isoformat(),
+        },
+    )
+
+
+def _assignments(v: Mapping[str, ColumnElement[Any]]) -> dict[str, ColumnElement[Any]]:
+    return {
+        "enacted_date": v["enacted_date"],
+        "last_modified_date": v["last_modified_date"],
+    }
+
+
+_table: Table = SectionSnapshot.__table__  # type: ignore[assignment]
+
+BACKFILL = Backfill(
+    name="section_snapshot_dates",
+    table=_table,
+    key=_table.c.snapshot_id,
+    columns=[_table.c.normalized_notes],
+    transform=_section_dates_row,
+    values={"enacted_date": Date(), "last_modified_date": Date()},
+    assignments=_assignments,
+    where=[
+        _table.c.enacted_date.is_(None),
+        _table.c.last_modified_date.is_(None),
+        _table.c.normalized_notes.isnot(None),
+    ],
+)
+
+
+async def backfill(
+    *,
+    dry_run: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int | None = None,
+    cache: PipelineCache | None = None,
+    restart: bool = False,
+    pause: float = 0.0,
+    report: IO[str] | None = None,
+) -> int:
+    """Backfill snapshot dates from normalized_notes citations.
+
+    Returns the number of rows updated (or that would be updated).
+    """
+    async with async_session_maker() as session:
+        result = await run_backfill(
+            session,
+            BACKFILL,
+            dry_run=dry_run,
+            batch_size=batch_size,
+            workers=workers,
+            cache=cache,
+            restart=restart,
+            pause=pause,
+            report=report,
+        )
+    return result.changed
+
+
+def main() -> None:
+    args = backfill_arg_parser(__doc__).parse_args()
+    if not args.apply:
+        logger.info("Running in dry-run mode (pass --apply to commit)")
+    asyncio.run(
+        backfill(
+            dry_run=not args.apply,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            cache=get_pipeline_cache(),
+            restart=args.restart,
+            pause=args.pause,
+            report=args.report,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,65 +1,270 @@
-"""Pipeline cache abstraction with local filesystem + optional GCS backing.
+"""Pipeline cache abstraction with local filesystem + optional remote backing.
 
-Provides a two-layer cache: local filesystem (fast) backed by GCS (shared).
-When GCS_CACHE_BUCKET is unset, behaves as local-only cache.
+Provides a two-layer cache: local filesystem (fast) backed by a remote
+store (shared) — a GCS bucket in production. When GCS_CACHE_BUCKET is
+unset, behaves as local-only cache.
 
 Cache keys mirror the local data/ directory structure, e.g.:
     govinfo/plaw/PLAW-119publ60.json
     olrc/downloads/title10@119-72not60.zip
     congress/member/B000944.json
+
+Entries are stored in both layers as an envelope: a magic prefix, the
+codec (none, gzip or zstd), the SHA-256 of the content and the encoded
+content. Reads verify the hash; a corrupt local entry is dropped and
+re-read from the remote tier, a corrupt remote entry is a miss. Entries
+written before the envelope existed (raw content) are still returned
+as-is. Already-compressed content (ZIPs, ``.gz``) is stored without
+re-compressing.
+
+Local writes go to a temporary file that is renamed into place, so a
+crashed or concurrent writer never leaves a truncated entry behind.
+
+Large archives need not pass through memory: ``put_file`` moves a file
+into the cache and ``local_file`` returns the path of a verified local
+entry. An uncompressed entry is the envelope header followed by the
+content unchanged, which ``zipfile`` reads in place (it accepts data
+prepended to an archive), so a cached ZIP can be opened directly.
+
+Every method has an async counterpart (``aget_text``, ``aput_bytes``, ...)
+that runs the blocking file and network I/O in a worker thread, for use
+from the async clients.
+
+The local tier can be given a byte budget (``max_local_bytes``). It is
+then managed as an LRU of *units* — cache entries plus directories
+registered with ``register_directory`` (the OLRC downloader's extracted
+XML) — and the least recently used units are deleted once the budget is
+exceeded. The remote tier stays authoritative, so an evicted entry is
+simply re-read from it. Recency survives restarts as file mtimes; units in
+active use can be protected with ``pinned``. Hit/miss/eviction counters
+are kept in ``stats`` and accumulated across runs by ``save_stats``.
 """
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import gzip
+import hashlib
+import json
 import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Protocol
 
 logger = logging.getLogger(__name__)
 
+_MAGIC = b"PCE1"
+_DIGEST_SIZE = hashlib.sha256().digest_size
+_HEADER_SIZE = len(_MAGIC) + 1 + _DIGEST_SIZE
 
-class PipelineCache:
-    """Two-layer cache: local filesystem -> GCS bucket -> API.
+# Codec identifiers stored in the envelope header
+_CODEC_NONE = 0
+_CODEC_GZIP = 1
+_CODEC_ZSTD = 2
+_CODECS = {"gzip": _CODEC_GZIP, "zstd": _CODEC_ZSTD}
+
+# Keys whose content is already compressed; stored with _CODEC_NONE
+_COMPRESSED_SUFFIXES = (".zip", ".gz", ".zst")
+
+# Bookkeeping files in the local root; dot-files are never cache units
+_STATS_FILE = ".cache-stats.json"
+_UNIT_MARKER = ".cache-unit"
+
+
+@dataclass
+class CacheStats:
+    """Lookup and eviction counters for the local tier."""
+
+    hits: int = 0
+    remote_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    evicted_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered by either tier (0.0 with no lookups)."""
+        total = self.hits + self.remote_hits + self.misses
+        return (self.hits + self.remote_hits) / total if total else 0.0
+
+
+class CacheIntegrityError(Exception):
+    """A cache entry failed to decode or did not match its content hash."""
+
+
+class RemoteStore(Protocol):
+    """Remote tier of the cache: a flat key → bytes object store."""
+
+    def get(self, key: str) -> bytes | None:
+        """Return the object stored under ``key``, or None if absent."""
+        ...
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` under ``key``, replacing any existing object."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Delete the object under ``key``; absent keys are ignored."""
+        ...
+
+    def get_file(self, key: str, dest: Path) -> bool:
+        """Download ``key`` to ``dest``; return False if absent."""
+        ...
 
-    When bucket_name is None, only local caching is used.
-    The google-cloud-storage library is imported lazily so it remains optional.
+    def put_file(self, key: str, source: Path) -> None:
+        """Upload the file at ``source`` under ``key``."""
+        ...
+
+
+class GCSRemoteStore:
+    """Remote tier backed by a GCS bucket.
+
+    The google-cloud-storage library is imported lazily so it remains
+    optional; if it (or the credentials) are unavailable, every operation
+    raises and PipelineCache degrades to local-only with a warning.
     """
 
-    def __init__(
-        self,
-        local_root: Path | str = "data",
-        bucket_name: str | None = None,
-    ) -> None:
-        self.local_root = Path(local_root)
+    def __init__(self, bucket_name: str) -> None:
         self.bucket_name = bucket_name
-        self._gcs_bucket: Any = None
-        self._gcs_available: bool | None = None
+        self._bucket: Any = None
+        self._available: bool | None = None
 
-    # =========================================================================
-    # Lazy GCS initialization
-    # =========================================================================
+    def _init_bucket(self) -> Any:
+        """Lazily create the GCS bucket handle."""
+        if self._available is None:
+            try:
+                from google.cloud.storage import Client
 
-    def _init_gcs(self) -> bool:
-        """Lazily initialize GCS client. Returns True if GCS is available."""
-        if self._gcs_available is not None:
-            return self._gcs_available
+                self._bucket = Client().bucket(self.bucket_name)
+                self._available = True
+                logger.info(f"GCS cache enabled: gs://{self.bucket_name}")
+            except Exception as e:
+                logger.warning(f"GCS cache unavailable (falling back to local): {e}")
+                self._available = False
+        if not self._available:
+            raise RuntimeError(f"GCS bucket {self.bucket_name} unavailable")
+        return self._bucket
+
+    def get(self, key: str) -> bytes | None:
+        """Download ``key`` in one request; a 404 is a miss."""
+        blob = self._init_bucket().blob(key)
+        try:
+            data: bytes = blob.download_as_bytes()
+        except Exception as e:
+            if getattr(e, "code", None) == 404:
+                return None
+            raise
+        return data
 
-        if not self.bucket_name:
-            self._gcs_available = False
-            return False
+    def put(self, key: str, data: bytes) -> None:
+        blob = self._init_bucket().blob(key)
+        blob.upload_from_string(data, content_type="application/octet-stream")
 
+    def delete(self, key: str) -> None:
+        blob = self._init_bucket().blob(key)
         try:
-            from google.cloud.storage import Client
+            blob.delete()
+        except Exception as e:
+            if getattr(e, "code", None) != 404:
+                raise
 
-            client = Client()
-            self._gcs_bucket = client.bucket(self.bucket_name)
-            self._gcs_available = True
-            logger.info(f"GCS cache enabled: gs://{self.bucket_name}")
+    def get_file(self, key: str, dest: Path) -> bool:
+        blob = self._init_bucket().blob(key)
+        try:
+            blob.download_to_filename(str(dest))
         except Exception as e:
-            logger.warning(f"GCS cache unavailable (falling back to local): {e}")
-            self._gcs_available = False
+            if getattr(e, "code", None) == 404:
+                return False
+            raise
+        return True
+
+    def put_file(self, key: str, source: Path) -> None:
+        blob = self._init_bucket().blob(key)
+        blob.upload_from_filename(str(source), content_type="application/octet-stream")
+
+
+class LocalDirRemoteStore:
+    """Remote tier backed by a local directory (stands in for GCS in tests)."""
+
+    def __init__(self, root: Path | str) -> None:
+        self.root = Path(root)
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return (self.root / key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        _atomic_write(self.root / key, data)
+
+    def delete(self, key: str) -> None:
+        (self.root / key).unlink(missing_ok=True)
+
+    def get_file(self, key: str, dest: Path) -> bool:
+        try:
+            shutil.copyfile(self.root / key, dest)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def put_file(self, key: str, source: Path) -> None:
+        dest = self.root / key
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, dest)
 
-        return self._gcs_available
+
+class PipelineCache:
+    """Two-layer cache: local filesystem -> remote store -> API.
+
+    Args:
+        local_root: Directory of the local layer.
+        bucket_name: GCS bucket for the remote layer; None for local-only
+            (unless ``remote`` is given).
+        remote: Remote layer to use instead of a GCS bucket.
+        compression: Codec for new entries, "gzip" or "zstd" (requires the
+            optional ``zstandard`` package; falls back to gzip without it).
+            Entries written with either codec are readable by both
+            settings, provided ``zstandard`` is installed for zstd entries.
+        max_local_bytes: Byte budget for the local tier; None for unbounded.
+    """
+
+    def __init__(
+        self,
+        local_root: Path | str = "data",
+        bucket_name: str | None = None,
+        remote: RemoteStore | None = None,
+        compression: str = "gzip",
+        max_local_bytes: int | None = None,
+    ) -> None:
+        self.local_root = Path(local_root)
+        self.bucket_name = bucket_name
+        if remote is None and bucket_name:
+            remote = GCSRemoteStore(bucket_name)
+        self.remote = remote
+        if compression not in _CODECS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+        if compression == "zstd" and _zstd() is None:
+            logger.warning("zstandard not installed; caching with gzip")
+            compression = "gzip"
+        self.compression = compression
+        self.max_local_bytes = max_local_bytes
+        self.stats = CacheStats()
+        self._saved_stats = CacheStats()
+        self._lock = threading.RLock()
+        # LRU of local units (path relative to local_root -> bytes), oldest
+        # first; built by the first operation that needs it
+        self._units: OrderedDict[str, int] | None = None
+        self._local_bytes = 0
+        self._pins: Counter[str] = Counter()
 
     # =========================================================================
     # Public API — text (JSON, XML, HTML)
@@ -68,44 +273,15 @@ class PipelineCache:
     def get_text(self, key: str) -> str | None:
         """Get cached text content by key.
 
-        Checks local first, then GCS. On GCS hit, backfills local.
+        Checks local first, then the remote store. On a remote hit,
+        backfills local.
         """
-        # Local hit
-        local = self._local_path(key)
-        if local.exists():
-            return local.read_text()
-
-        # GCS hit
-        if self._init_gcs() and self._gcs_bucket is not None:
-            try:
-                blob = self._gcs_bucket.blob(key)
-                if blob.exists():
-                    content: str = blob.download_as_text()
-                    # Backfill local
-                    local.parent.mkdir(parents=True, exist_ok=True)
-                    local.write_text(content)
-                    logger.debug(f"Cache backfill from GCS: {key}")
-                    return content
-            except Exception as e:
-                logger.warning(f"GCS read failed for {key}: {e}")
-
-        return None
+        data = self.get_bytes(key)
+        return data.decode() if data is not None else None
 
     def put_text(self, key: str, content: str) -> None:
-        """Write text content to both local and GCS caches."""
-        # Local write
-        local = self._local_path(key)
-        local.parent.mkdir(parents=True, exist_ok=True)
-        local.write_text(content)
-
-        # GCS write
-        if self._init_gcs() and self._gcs_bucket is not None:
-            try:
-                blob = self._gcs_bucket.blob(key)
-                blob.upload_from_string(content, content_type="text/plain")
-                logger.debug(f"Cache uploaded to GCS: {key}")
-            except Exception as e:
-                logger.warning(f"GCS write failed for {key}: {e}")
+        """Write text content to both local and remote caches."""
+        self.put_bytes(key, content.encode())
 
     # =========================================================================
     # Public API — bytes (ZIP files)
@@ -114,57 +290,98 @@ class PipelineCache:
     def get_bytes(self, key: str) -> bytes | None:
         """Get cached binary content by key.
 
-        Checks local first, then GCS. On GCS hit, backfills local.
+        Checks local first, then the remote store. On a remote hit,
+        backfills local.
         """
         local = self._local_path(key)
-        if local.exists():
-            return local.read_bytes()
-
-        if self._init_gcs() and self._gcs_bucket is not None:
+        try:
+            entry = local.read_bytes()
+        except FileNotFoundError:
+            entry = None
+        if entry is not None:
             try:
-                blob = self._gcs_bucket.blob(key)
-                if blob.exists():
-                    data: bytes = blob.download_as_bytes()
-                    local.parent.mkdir(parents=True, exist_ok=True)
-                    local.write_bytes(data)
-                    logger.debug(f"Cache backfill from GCS (bytes): {key}")
-                    return data
+                content = _decode(entry)
+            except CacheIntegrityError as e:
+                logger.warning(f"Dropping corrupt local cache entry {key}: {e}")
+                local.unlink(missing_ok=True)
+                self._forget(key)
+            else:
+                self._count("hits")
+                self._touch(key, local)
+                return content
+
+        if self.remote is not None:
+            try:
+                entry = self.remote.get(key)
             except Exception as e:
-                logger.warning(f"GCS read failed for {key}: {e}")
+                logger.warning(f"Remote cache read failed for {key}: {e}")
+                entry = None
+            if entry is not None:
+                try:
+                    content = _decode(entry)
+                except CacheIntegrityError as e:
+                    logger.warning(f"Ignoring corrupt remote cache entry {key}: {e}")
+                else:
+                    _atomic_write(local, entry)
+                    self._record(key, len(entry))
+                    self._count("remote_hits")
+                    logger.debug(f"Cache backfill from remote: {key}")
+                    return content
 
+        self._count("misses")
         return None
 
     def put_bytes(self, key: str, content: bytes) -> None:
-        """Write binary content to both local and GCS caches."""
-        local = self._local_path(key)
-        local.parent.mkdir(parents=True, exist_ok=True)
-        local.write_bytes(content)
+        """Write binary content to both local and remote caches."""
+        entry = _encode(content, self._codec_for(key))
+        _atomic_write(self._local_path(key), entry)
+        self._record(key, len(entry))
 
-        if self._init_gcs() and self._gcs_bucket is not None:
+        if self.remote is not None:
             try:
-                blob = self._gcs_bucket.blob(key)
-                blob.upload_from_string(
-                    content, content_type="application/octet-stream"
-                )
-                logger.debug(f"Cache uploaded to GCS (bytes): {key}")
+                self.remote.put(key, entry)
+                logger.debug(f"Cache uploaded to remote: {key}")
             except Exception as e:
-                logger.warning(f"GCS write failed for {key}: {e}")
+                logger.warning(f"Remote cache write failed for {key}: {e}")
 
     def delete(self, key: str) -> None:
-        """Delete a cache entry from both local and GCS."""
+        """Delete a cache entry from both local and remote."""
         local = self._local_path(key)
         if local.exists():
             local.unlink()
             logger.debug(f"Cache deleted locally: {key}")
+        self._forget(key)
 
-        if self._init_gcs() and self._gcs_bucket is not None:
+        if self.remote is not None:
             try:
-                blob = self._gcs_bucket.blob(key)
-                if blob.exists():
-                    blob.delete()
-                    logger.debug(f"Cache deleted from GCS: {key}")
+                self.remote.delete(key)
+                logger.debug(f"Cache deleted from remote: {key}")
             except Exception as e:
-                logger.warning(f"GCS delete failed for {key}: {e}")
+                logger.warning(f"Remote cache delete failed for {key}: {e}")
+
+    # =========================================================================
+    # Async API — same semantics, I/O runs in a worker thread
+    # =========================================================================
+
+    async def aget_text(self, key: str) -> str | None:
+        """Async ``get_text``."""
+        return await asyncio.to_thread(self.get_text, key)
+
+    async def aput_text(self, key: str, content: str) -> None:
+        """Async ``put_text``."""
+        await asyncio.to_thread(self.put_text, key, content)
+
+    async def aget_bytes(self, key: str) -> bytes | None:
+        """Async ``get_bytes``."""
+        return await asyncio.to_thread(self.get_bytes, key)
+
+    async def aput_bytes(self, key: str, content: bytes) -> None:
+        """Async ``put_bytes``."""
+        await asyncio.to_thread(self.put_bytes, key, content)
+
+    async def adelete(self, key: str) -> None:
+        """Async ``delete``."""
+        await asyncio.to_thread(self.delete, key)
 
     # =========================================================================
     # Local-only helpers (for directory-level checks like OLRC extraction)
@@ -175,9 +392,185 @@ class PipelineCache:
         return self._local_path(key).exists()
 
     def local_path(self, key: str) -> Path:
-        """Return the local filesystem path for a cache key."""
+        """Return the local filesystem path for a cache key.
+
+        The file holds the encoded entry, not the raw content.
+        """
         return self._local_path(key)
 
+    # =========================================================================
+    # Public API — files (large archives, never loaded into memory)
+    # =========================================================================
+
+    def put_file(self, key: str, source: Path) -> None:
+        """Move the file at ``source`` into the cache under ``key``.
+
+        For already-compressed keys the content is streamed into the
+        envelope; other keys are read and encoded like ``put_bytes``.
+        ``source`` is removed.
+        """
+        local = self._local_path(key)
+        if self._codec_for(key) == _CODEC_NONE:
+            with source.open("rb") as f:
+                digest = hashlib.file_digest(f, "sha256").digest()
+            _atomic_write_from(local, _MAGIC + bytes([_CODEC_NONE]) + digest, source)
+        else:
+            _atomic_write(local, _encode(source.read_bytes(), self._codec_for(key)))
+        source.unlink(missing_ok=True)
+        self._record(key, local.stat().st_size)
+
+        if self.remote is not None:
+            try:
+                self.remote.put_file(key, local)
+                logger.debug(f"Cache uploaded to remote: {key}")
+            except Exception as e:
+                logger.warning(f"Remote cache write failed for {key}: {e}")
+
+    def local_file(self, key: str) -> Path | None:
+        """Return the path of the local entry for ``key``, or None on a miss.
+
+        The remote tier is downloaded straight to disk on a local miss, and
+        the entry's hash is verified while streaming it. Only meaningful for
+        already-compressed keys (ZIPs), whose local file holds the content
+        unchanged after the envelope header.
+        """
+        local = self._local_path(key)
+        if local.exists():
+            if _verify_file(local):
+                self._count("hits")
+                self._touch(key, local)
+                return local
+            logger.warning(f"Dropping corrupt local cache entry {key}")
+            local.unlink(missing_ok=True)
+            self._forget(key)
+
+        if self.remote is not None:
+            local.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=local.parent, prefix=f".{local.name}.", suffix=".tmp"
+            )
+            os.close(fd)
+            tmp = Path(tmp_name)
+            try:
+                found = self.remote.get_file(key, tmp)
+            except Exception as e:
+                logger.warning(f"Remote cache read failed for {key}: {e}")
+                found = False
+            if found and _verify_file(tmp):
+                os.replace(tmp, local)
+                self._record(key, local.stat().st_size)
+                self._count("remote_hits")
+                logger.debug(f"Cache backfill from remote: {key}")
+                return local
+            if found:
+                logger.warning(f"Ignoring corrupt remote cache entry {key}")
+            tmp.unlink(missing_ok=True)
+
+        self._count("misses")
+        return None
+
+    async def aput_file(self, key: str, source: Path) -> None:
+        """Async ``put_file``."""
+        await asyncio.to_thread(self.put_file, key, source)
+
+    async def alocal_file(self, key: str) -> Path | None:
+        """Async ``local_file``."""
+        return await asyncio.to_thread(self.local_file, key)
+
+    # =========================================================================
+    # Local tier budget — directories, pinning, usage and stats
+    # =========================================================================
+
+    def register_directory(self, path: Path | str) -> None:
+        """Manage a directory under the local root as one evictable unit.
+
+        For directories written outside ``put_*`` (extracted archives).
+        Registering again marks the directory as recently used. Paths
+        outside the local root are ignored.
+        """
+        path = Path(path)
+        unit = self._unit_for(path)
+        if unit is None or not path.is_dir():
+            return
+        (path / _UNIT_MARKER).touch()
+        self._record(unit, _tree_size(path))
+
+    @contextmanager
+    def pinned(self, key_or_path: str | Path) -> Iterator[None]:
+        """Protect an entry or registered directory from eviction.
+
+        Accepts a cache key or a path under the local root; pins nest.
+        """
+        unit = (
+            self._unit_for(key_or_path)
+            if isinstance(key_or_path, Path)
+            else Path(key_or_path).as_posix()
+        )
+        if unit is None:
+            yield
+            return
+        with self._lock:
+            self._pins[unit] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._pins[unit] -= 1
+                if not self._pins[unit]:
+                    del self._pins[unit]
+
+    def local_usage(self) -> tuple[int, int]:
+        """Return (bytes, units) currently held by the local tier."""
+        with self._lock:
+            if self.max_local_bytes is None:
+                # Unbounded caches don't track writes; rescan every time
+                self._units = None
+            units = self._index()
+            return self._local_bytes, len(units)
+
+    def save_stats(self) -> CacheStats:
+        """Add this process's counters to the totals kept in the local root.
+
+        Returns the accumulated totals. Safe to call repeatedly; only the
+        counts since the previous call are added.
+        """
+        with self._lock:
+            totals = self.saved_stats()
+            current = dataclasses.asdict(self.stats)
+            saved = dataclasses.asdict(self._saved_stats)
+            merged = CacheStats(
+                **{
+                    name: value + current[name] - saved[name]
+                    for name, value in dataclasses.asdict(totals).items()
+                }
+            )
+            try:
+                _atomic_write(
+                    self.local_root / _STATS_FILE,
+                    json.dumps(dataclasses.asdict(merged)).encode(),
+                )
+            except OSError as e:
+                logger.warning(f"Failed to save cache stats: {e}")
+                return merged
+            self._saved_stats = dataclasses.replace(self.stats)
+            return merged
+
+    def saved_stats(self) -> CacheStats:
+        """Return the counters accumulated by previous ``save_stats`` calls."""
+        try:
+            data = json.loads((self.local_root / _STATS_FILE).read_text())
+            fields = {f.name for f in dataclasses.fields(CacheStats)}
+            return CacheStats(**{k: int(v) for k, v in data.items() if k in fields})
+        except (OSError, ValueError, TypeError):
+            return CacheStats()
+
+    def reset_stats(self) -> None:
+        """Zero both this process's counters and the accumulated totals."""
+        with self._lock:
+            self.stats = CacheStats()
+            self._saved_stats = CacheStats()
+            (self.local_root / _STATS_FILE).unlink(missing_ok=True)
+
     # =========================================================================
     # Internal
     # =========================================================================
@@ -185,6 +578,230 @@ class PipelineCache:
     def _local_path(self, key: str) -> Path:
         return self.local_root / key
 
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    def _unit_for(self, path: str | Path) -> str | None:
+        """Unit name of a path under the local root, or None if outside it."""
+        try:
+            relative = Path(path).resolve().relative_to(self.local_root.resolve())
+        except ValueError:
+            return None
+        return relative.as_posix() if relative.parts else None
+
+    def _index(self) -> OrderedDict[str, int]:
+        """The LRU of local units, scanning the local root on first use.
+
+        Directories holding a unit marker are one unit, recency taken from
+        the marker; every other file is its own unit. Dot-files (markers,
+        stats, in-flight temporary files) are not units.
+        """
+        if self._units is None:
+            found: list[tuple[float, str, int]] = []
+            for dirpath, dirnames, filenames in os.walk(self.local_root):
+                directory = Path(dirpath)
+                if _UNIT_MARKER in filenames and directory != self.local_root:
+                    dirnames.clear()
+                    found.append(
+                        (
+                            (directory / _UNIT_MARKER).stat().st_mtime,
+                            directory.relative_to(self.local_root).as_posix(),
+                            _tree_size(directory),
+                        )
+                    )
+                    continue
+                for name in filenames:
+                    if name.startswith("."):
+                        continue
+                    try:
+                        stat = (directory / name).stat()
+                    except OSError:
+                        continue
+                    found.append(
+                        (
+                            stat.st_mtime,
+                            (directory / name).relative_to(self.local_root).as_posix(),
+                            stat.st_size,
+                        )
+                    )
+            found.sort()
+            self._units = OrderedDict((unit, size) for _mtime, unit, size in found)
+            self._local_bytes = sum(self._units.values())
+        return self._units
+
+    def _record(self, unit: str, size: int) -> None:
+        """Note that ``unit`` was written with ``size`` bytes; evict if over."""
+        if self.max_local_bytes is None:
+            return
+        with self._lock:
+            units = self._index()
+            self._local_bytes += size - units.get(unit, 0)
+            units[unit] = size
+            units.move_to_end(unit)
+            self._evict(keep=unit)
+
+    def _touch(self, unit: str, path: Path) -> None:
+        """Mark ``unit`` as most recently used, in memory and on disk."""
+        if self.max_local_bytes is None:
+            return
+        with self._lock:
+            units = self._index()
+            if unit in units:
+                units.move_to_end(unit)
+            else:
+                self._record(unit, path.stat().st_size)
+        with suppress(OSError):
+            os.utime(path)
+
+    def _forget(self, unit: str) -> None:
+        if self._units is None:
+            return
+        with self._lock:
+            self._local_bytes -= self._units.pop(unit, 0)
+
+    def _evict(self, keep: str) -> None:
+        """Delete least recently used units until the budget is met."""
+        assert self._units is not None and self.max_local_bytes is not None
+        if self._local_bytes <= self.max_local_bytes:
+            return
+        for unit in list(self._units):
+            if self._local_bytes <= self.max_local_bytes:
+                return
+            if unit == keep or self._pins[unit]:
+                continue
+            size = self._units.pop(unit)
+            path = self.local_root / unit
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+            self._local_bytes -= size
+            self.stats.evictions += 1
+            self.stats.evicted_bytes += size
+            logger.debug(f"Cache evicted {unit} ({size:,} bytes)")
+        if self._local_bytes > self.max_local_bytes:
+            logger.warning(
+                f"Local cache over budget ({self._local_bytes:,} > "
+                f"{self.max_local_bytes:,} bytes): remaining entries are pinned"
+            )
+
+    def _codec_for(self, key: str) -> int:
+        if key.endswith(_COMPRESSED_SUFFIXES):
+            return _CODEC_NONE
+        return _CODECS[self.compression]
+
+
+def _zstd() -> Any:
+    """Return the optional ``zstandard`` module, or None."""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def _encode(content: bytes, codec: int) -> bytes:
+    """Wrap content in the cache envelope."""
+    if codec == _CODEC_GZIP:
+        payload = gzip.compress(content, compresslevel=6)
+    elif codec == _CODEC_ZSTD:
+        payload = _zstd().ZstdCompressor(level=10).compress(content)
+    else:
+        payload = content
+    digest = hashlib.sha256(content).digest()
+    return _MAGIC + bytes([codec]) + digest + payload
+
+
+def _decode(entry: bytes) -> bytes:
+    """Unwrap a cache envelope and verify its hash; raw entries pass through."""
+    if not entry.startswith(_MAGIC):
+        return entry
+    if len(entry) < _HEADER_SIZE:
+        raise CacheIntegrityError("truncated header")
+    codec = entry[len(_MAGIC)]
+    digest = entry[len(_MAGIC) + 1 : _HEADER_SIZE]
+    payload = entry[_HEADER_SIZE:]
+    try:
+        if codec == _CODEC_GZIP:
+            content = gzip.decompress(payload)
+        elif codec == _CODEC_ZSTD:
+            zstandard = _zstd()
+            if zstandard is None:
+                raise CacheIntegrityError("zstd entry but zstandard is not installed")
+            content = zstandard.ZstdDecompressor().decompress(payload)
+        elif codec == _CODEC_NONE:
+            content = payload
+        else:
+            raise CacheIntegrityError(f"unknown codec {codec}")
+    except CacheIntegrityError:
+        raise
+    except Exception as e:
+        raise CacheIntegrityError(f"cannot decompress: {e}") from e
+    if hashlib.sha256(content).digest() != digest:
+        raise CacheIntegrityError("content hash mismatch")
+    return content
+
+
+def _verify_file(path: Path) -> bool:
+    """Check a file entry's envelope hash without loading it into memory.
+
+    Raw (pre-envelope) files pass; compressed entries are checked by
+    decoding them.
+    """
+    try:
+        with path.open("rb") as f:
+            header = f.read(_HEADER_SIZE)
+            if not header.startswith(_MAGIC):
+                return True
+            if len(header) < _HEADER_SIZE or header[len(_MAGIC)] != _CODEC_NONE:
+                f.seek(0)
+                _decode(f.read())
+                return True
+            digest = hashlib.file_digest(f, "sha256").digest()
+    except (OSError, CacheIntegrityError):
+        return False
+    return digest == header[len(_MAGIC) + 1 :]
+
+
+def _tree_size(path: Path) -> int:
+    """Total size of the regular files under ``path``."""
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += (Path(dirpath) / name).stat().st_size
+            except OSError:
+                continue
+    return total
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temporary file and rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _atomic_write_from(path: Path, header: bytes, source: Path) -> None:
+    """Write ``header`` followed by the content of ``source`` to ``path``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f, source.open("rb") as src:
+            f.write(header)
+            shutil.copyfileobj(src, f, length=1024 * 1024)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
 
 def get_pipeline_cache() -> PipelineCache:
     """Factory that reads settings and returns a configured PipelineCache."""
@@ -193,4 +810,5 @@ def get_pipeline_cache() -> PipelineCache:
     return PipelineCache(
         local_root=Path("data"),
         bucket_name=settings.gcs_cache_bucket,
+        max_local_bytes=settings.pipeline_cache_max_bytes,
     )
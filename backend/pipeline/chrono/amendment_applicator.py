@@ -5,6 +5,8 @@ No database access. All state is passed in and returned.
 
 from __future__ import annotations
 
+import bisect
+import itertools
 import logging
 import re
 from dataclasses import dataclass
@@ -37,64 +39,209 @@ class ApplicationResult:
     old_text_matched: bool
 
 
-def _normalize_whitespace(text: str) -> str:
-    """Collapse runs of whitespace into single spaces."""
-    return re.sub(r"\s+", " ", text.strip())
+_WHITESPACE_RUN = re.compile(r"\s+")
+
+
+def _normalize_segment(text: str) -> tuple[str, list[int], list[int]]:
+    """Collapse whitespace runs in ``text`` to single spaces.
+
+    Returns (normalized, starts, shifts): for every run longer than one
+    character, the normalized position just after its space and how many
+    characters the collapse removed, so ``starts``/``shifts`` let a
+    normalized offset be mapped back to ``text``.
+    """
+    pieces: list[str] = []
+    starts: list[int] = []
+    shifts: list[int] = []
+    last = 0
+    norm_len = 0
+    for match in _WHITESPACE_RUN.finditer(text):
+        pieces.append(text[last : match.start()])
+        pieces.append(" ")
+        norm_len += match.start() - last + 1
+        if match.end() - match.start() > 1:
+            starts.append(norm_len)
+            shifts.append(match.end() - match.start() - 1)
+        last = match.end()
+    pieces.append(text[last:])
+    return "".join(pieces), starts, shifts
+
+
+class SectionMatchIndex:
+    """Match index over one section's text, kept current across changes.
+
+    A law often amends the same section dozens of times (tax titles
+    especially). Instead of re-normalizing the whole text and compiling a
+    fresh regex per change, the index keeps a whitespace-normalized copy
+    of the text — and, for ASCII text, a lowercased one — with a map from
+    normalized offsets back to original offsets. Both are built on the
+    first lookup that needs them and patched locally by ``replace``.
+
+    Lookups keep ``_find_and_replace``'s semantics: the first exact
+    occurrence, else the first whitespace-normalized one, else the first
+    case-insensitive one.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._norm: str | None = None
+        self._folded: str | None = None
+        # Normalized positions where the original runs ahead, and the
+        # cumulative original-minus-normalized offset from there on
+        self._starts: list[int] = []
+        self._deltas: list[int] = []
+
+    def find(self, old_text: str) -> tuple[int, int, bool] | None:
+        """Locate ``old_text``; returns (start, end, case_folded) or None."""
+        start = self.text.find(old_text)
+        if start >= 0:
+            return start, start + len(old_text), False
+
+        parts = old_text.split()
+        if not parts:
+            # Whitespace-only old_text matches the empty string at 0
+            return 0, 0, False
+
+        self._ensure_built()
+        assert self._norm is not None
+        needle = " ".join(parts)
+        start = self._norm.find(needle)
+        if start >= 0:
+            return self._span(start, len(needle)) + (False,)
+
+        if self._folded is not None and old_text.isascii():
+            start = self._folded.find(needle.lower())
+            if start >= 0:
+                return self._span(start, len(needle)) + (True,)
+            return None
+
+        # Non-ASCII text: leave Unicode case folding to the regex engine
+        ws_pattern = r"\s+".join(re.escape(part) for part in parts)
+        match = re.compile(ws_pattern, re.IGNORECASE).search(self.text)
+        if match:
+            return match.start(), match.end(), True
+        return None
+
+    def replace(self, start: int, end: int, replacement: str) -> str:
+        """Replace ``text[start:end]``, patching the normalized views.
+
+        Only the window around the edit, widened to the whitespace runs
+        touching it, is re-normalized. Returns the new text.
+        """
+        old = self.text
+        self.text = old[:start] + replacement + old[end:]
+        if self._norm is None:
+            return self.text
+
+        lo, hi = start, end
+        while lo > 0 and old[lo - 1].isspace():
+            lo -= 1
+        while hi < len(old) and old[hi].isspace():
+            hi += 1
+        new_hi = hi + len(replacement) - (end - start)
+
+        base = self._delta_at_original(lo)
+        norm_lo = lo - base
+        norm_hi = hi - self._delta_at_original(hi)
+        segment, seg_starts, seg_shifts = _normalize_segment(self.text[lo:new_hi])
+
+        # Breakpoints before the window stay; the window's are recomputed;
+        # later ones move with the edit.
+        keep = self._breakpoints_through(lo)
+        tail = self._breakpoints_through(hi)
+
+        shift_norm = len(segment) - (norm_hi - norm_lo)
+        shift_orig = len(replacement) - (end - start)
+        delta = base
+        mid_starts, mid_deltas = [], []
+        for pos, shift in zip(seg_starts, seg_shifts, strict=True):
+            delta += shift
+            mid_starts.append(norm_lo + pos)
+            mid_deltas.append(delta)
+        self._starts = (
+            self._starts[:keep]
+            + mid_starts
+            + [p + shift_norm for p in self._starts[tail:]]
+        )
+        self._deltas = (
+            self._deltas[:keep]
+            + mid_deltas
+            + [d + shift_orig - shift_norm for d in self._deltas[tail:]]
+        )
+
+        self._norm = self._norm[:norm_lo] + segment + self._norm[norm_hi:]
+        if self._folded is not None and replacement.isascii():
+            self._folded = (
+                self._folded[:norm_lo] + segment.lower() + self._folded[norm_hi:]
+            )
+        else:
+            self._folded = None
+        return self.text
+
+    def _ensure_built(self) -> None:
+        if self._norm is None:
+            self._norm, starts, shifts = _normalize_segment(self.text)
+            self._starts = starts
+            self._deltas = list(itertools.accumulate(shifts))
+            self._folded = self._norm.lower() if self.text.isascii() else None
+
+    def _breakpoints_through(self, pos: int) -> int:
+        """Number of breakpoints at or before original offset ``pos``."""
+        return bisect.bisect_right(
+            range(len(self._starts)),
+            pos,
+            key=lambda i: self._starts[i] + self._deltas[i],
+        )
+
+    def _delta_at_original(self, pos: int) -> int:
+        """Offset to subtract from original ``pos`` (outside a collapsed run)."""
+        i = self._breakpoints_through(pos) - 1
+        return self._deltas[i] if i >= 0 else 0
+
+    def _span(self, norm_start: int, length: int) -> tuple[int, int]:
+        """Map a normalized match (which starts and ends on non-space
+        characters) back to original offsets."""
+        return (
+            self._to_original(norm_start),
+            self._to_original(norm_start + length - 1) + 1,
+        )
+
+    def _to_original(self, norm_pos: int) -> int:
+        i = bisect.bisect_right(self._starts, norm_pos) - 1
+        return norm_pos + (self._deltas[i] if i >= 0 else 0)
 
 
 def _find_and_replace(
     text_content: str,
     old_text: str,
     new_text: str | None,
+    match_index: SectionMatchIndex | None = None,
 ) -> tuple[str | None, bool]:
     """Find old_text in text_content and replace with new_text.
 
     Tries exact match first, then whitespace-normalized, then case-insensitive.
-    Replaces only the first occurrence.
+    Replaces only the first occurrence. ``match_index`` is reused (and
+    updated) when it indexes ``text_content``.
 
     Returns:
         (result_text, matched) — result_text is None if not found.
     """
     replacement = new_text if new_text is not None else ""
+    if match_index is None or match_index.text is not text_content:
+        match_index = SectionMatchIndex(text_content)
 
-    # 1. Exact match
-    if old_text in text_content:
-        return text_content.replace(old_text, replacement, 1), True
+    span = match_index.find(old_text)
+    if span is None:
+        return None, False
 
-    # 2. Whitespace-normalized match
-    norm_old = _normalize_whitespace(old_text)
-    norm_content = _normalize_whitespace(text_content)
-    if norm_old in norm_content:
-        # Build a whitespace-flexible pattern from old_text
-        parts = old_text.split()
-        ws_pattern = r"\s+".join(re.escape(part) for part in parts)
-        ws_re = re.compile(ws_pattern)
-        match = ws_re.search(text_content)
-        if match:
-            result = (
-                text_content[: match.start()]
-                + replacement
-                + text_content[match.end() :]
-            )
-            return result, True
-
-    # 3. Case-insensitive match (last resort)
-    parts = old_text.split()
-    ws_pattern = r"\s+".join(re.escape(part) for part in parts)
-    ci_re = re.compile(ws_pattern, re.IGNORECASE)
-    match = ci_re.search(text_content)
-    if match:
+    start, end, case_folded = span
+    if case_folded:
         logger.warning(
             "Case-insensitive fallback used for text match (original: %r, found: %r)",
             old_text[:80],
-            match.group()[:80],
+            text_content[start:end][:80],
         )
-        result = (
-            text_content[: match.start()] + replacement + text_content[match.end() :]
-        )
-        return result, True
-
-    return None, False
+    return match_index.replace(start, end, replacement), True
 
 
 def apply_text_change(
@@ -104,6 +251,7 @@ def apply_text_change(
     new_text: str | None,
     title_number: int,
     section_number: str,
+    match_index: SectionMatchIndex | None = None,
 ) -> ApplicationResult:
     """Apply a single law change to section text content.
 
@@ -121,6 +269,9 @@ def apply_text_change(
         new_text: Replacement or new text.
         title_number: US Code title number.
         section_number: Section number string.
+        match_index: Index over ``text_content`` to search and update in
+            place, so consecutive changes to one section share it. Ignored
+            if it indexes different text.
 
     Returns:
         ApplicationResult with status and updated text.
@@ -159,6 +310,9 @@ def apply_text_change(
     if change_type == ChangeType.ADD:
         if text_content is None:
             result_text = new_text or ""
+        elif match_index is not None and match_index.text is text_content:
+            end = len(text_content)
+            result_text = match_index.replace(end, end, new_text or "")
         else:
             result_text = text_content + (new_text or "")
         return ApplicationResult(
@@ -184,7 +338,9 @@ def apply_text_change(
         )
 
     replace_with = new_text if change_type == ChangeType.MODIFY else None
-    result_text, matched = _find_and_replace(text_content, old_text, replace_with)
+    result_text, matched = _find_and_replace(
+        text_content, old_text, replace_with, match_index
+    )
 
     if not matched:
         return ApplicationResult(
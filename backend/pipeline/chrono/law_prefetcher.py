@@ -0,0 +1,107 @@
+"""Lookahead law preparation for the play-forward engine.
+
+Applying a law (RevisionBuilder.build_revision) must happen strictly in
+timeline order, but preparing it — fetching text from GovInfo, parsing
+amendments, resolving sections and persisting LawChange records via
+LawChangeService.process_law — depends only on the law itself. Diff
+generation never reads snapshot state (old text is validated by the
+amendment applicator), so law N+1 can be prepared while law N is applied.
+
+LawPrefetcher keeps up to ``lookahead`` laws ahead of the applier in
+flight, each in its own session, so the GovInfo round-trips and parsing
+overlap the DB work of the sequential apply step.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pipeline.govinfo.client import GovInfoClient
+from pipeline.legal_parser.law_change_service import LawChangeResult, LawChangeService
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+LawKey = tuple[int, int]
+
+
+class LawPrefetcher:
+    """Prepares upcoming laws concurrently, ahead of the sequential applier.
+
+    Args:
+        session_factory: Opens a fresh session per prepared law; sessions
+            must not be shared with the applier.
+        laws: (congress, law_number) of every law the applier will ask for,
+            in the order it will ask.
+        lookahead: Maximum number of laws prepared ahead of the applier.
+        govinfo_client: Client shared by all preparations (stateless).
+    """
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        laws: list[LawKey],
+        lookahead: int,
+        govinfo_client: GovInfoClient | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._laws = laws
+        self._lookahead = max(1, lookahead)
+        self._govinfo_client = govinfo_client
+        self._positions = {key: i for i, key in enumerate(laws)}
+        self._tasks: dict[LawKey, asyncio.Task[LawChangeResult | None]] = {}
+        self._next = 0
+
+    async def prepare(self, congress: int, law_number: int) -> LawChangeResult | None:
+        """Wait until a law is prepared, topping up the lookahead window.
+
+        Returns the LawChangeResult, or None if preparation failed (the
+        failure is logged; the applier proceeds with whatever LawChange
+        records exist, as it does without prefetching).
+        """
+        key = (congress, law_number)
+        position = self._positions.get(key)
+        if position is None:
+            # Not announced up front; prepare it on its own
+            return await self._prepare_one(key)
+
+        self._fill(position + self._lookahead)
+        task = self._tasks.pop(key, None)
+        if task is None:
+            task = asyncio.create_task(self._prepare_one(key))
+        return await task
+
+    async def close(self) -> None:
+        """Cancel preparations the applier will not ask for."""
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _fill(self, until: int) -> None:
+        """Start preparing every announced law up to position ``until``."""
+        while self._next <= until and self._next < len(self._laws):
+            key = self._laws[self._next]
+            if key not in self._tasks:
+                self._tasks[key] = asyncio.create_task(self._prepare_one(key))
+            self._next += 1
+
+    async def _prepare_one(self, key: LawKey) -> LawChangeResult | None:
+        congress, law_number = key
+        try:
+            async with self._session_factory() as session:
+                service = LawChangeService(session, govinfo_client=self._govinfo_client)
+                return await service.process_law(
+                    congress=congress, law_number=law_number
+                )
+        except Exception:
+            logger.exception(f"Failed to auto-process PL {congress}-{law_number}")
+            return None
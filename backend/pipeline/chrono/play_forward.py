@@ -24,13 +24,21 @@ from app.models.enums import RevisionStatus, RevisionType
 from app.models.public_law import PublicLaw
 from app.models.revision import CodeRevision
 from pipeline.chrono.checkpoint import CheckpointResult, validate_checkpoint
+from pipeline.chrono.law_prefetcher import LawPrefetcher, SessionFactory
 from pipeline.chrono.revision_builder import RevisionBuilder
+from pipeline.chrono.working_set import SectionWorkingSet, WorkingSetStats
 from pipeline.govinfo.client import GovInfoClient
 from pipeline.legal_parser.law_change_service import LawChangeService
 from pipeline.olrc.downloader import OLRCDownloader
+from pipeline.olrc.release_point import ReleasePointRegistry
 from pipeline.olrc.rp_ingestor import RPIngestor
 from pipeline.olrc.snapshot_service import SnapshotService
-from pipeline.timeline import TimelineBuilder, TimelineEvent, TimelineEventType
+from pipeline.timeline import (
+    Timeline,
+    TimelineBuilder,
+    TimelineEvent,
+    TimelineEventType,
+)
 
 if TYPE_CHECKING:
     from pipeline.cache import PipelineCache
@@ -49,6 +57,7 @@ class AdvanceResult:
     laws_skipped: int = 0
     laws_failed: int = 0
     checkpoint_result: CheckpointResult | None = None
+    working_set_stats: WorkingSetStats | None = None
     elapsed_seconds: float = 0.0
 
 
@@ -58,6 +67,16 @@ class PlayForwardEngine:
     Uses TimelineBuilder for event ordering, RevisionBuilder for law events,
     and RPIngestor for release point events. Validates derived state against
     RP ground truth at each checkpoint.
+
+    With a ``session_factory`` and ``lookahead`` > 0, upcoming laws are
+    prepared (fetched, parsed, diffed into LawChange records) up to
+    ``lookahead`` events ahead in their own sessions while earlier laws are
+    applied, so the sequential apply step is no longer stalled on GovInfo
+    and parsing.
+
+    With ``working_set_size`` > 0, section states read and written while
+    applying laws are kept in an LRU working set of that many sections, so
+    consecutive laws amending the same sections skip the parent-state query.
     """
 
     def __init__(
@@ -65,16 +84,27 @@ class PlayForwardEngine:
         session: AsyncSession,
         downloader: OLRCDownloader,
         cache: PipelineCache | None = None,
+        session_factory: SessionFactory | None = None,
+        lookahead: int = 0,
+        working_set_size: int = 0,
     ):
         self.session = session
-        self.timeline_builder = TimelineBuilder(session)
+        self.timeline_builder = TimelineBuilder(
+            session, registry=ReleasePointRegistry(cache=cache)
+        )
         self.rp_ingestor = RPIngestor(session, downloader)
-        self.revision_builder = RevisionBuilder(session)
+        self.working_set = (
+            SectionWorkingSet(working_set_size) if working_set_size > 0 else None
+        )
+        self.revision_builder = RevisionBuilder(session, working_set=self.working_set)
         self.snapshot_service = SnapshotService(session)
-        govinfo_client = GovInfoClient(cache=cache) if cache is not None else None
+        self.govinfo_client = GovInfoClient(cache=cache) if cache is not None else None
         self.law_change_service = LawChangeService(
-            session, govinfo_client=govinfo_client
+            session, govinfo_client=self.govinfo_client
         )
+        self._session_factory = session_factory
+        self._lookahead = lookahead if session_factory is not None else 0
+        self._prefetcher: LawPrefetcher | None = None
 
     async def advance(self, count: int = 1) -> AdvanceResult:
         """Advance the timeline by processing the next `count` events.
@@ -120,13 +150,9 @@ class PlayForwardEngine:
         # Build set of deferred laws from upcoming RPs
         deferred = self._collect_deferred_laws(remaining)
 
-        parent_revision_id = head.revision_id
-        sequence_number = head.sequence_number + 1
-
-        for event in to_process:
-            parent_revision_id, sequence_number = await self._process_event(
-                event, parent_revision_id, sequence_number, deferred, result
-            )
+        await self._process_events(
+            to_process, head.revision_id, head.sequence_number + 1, deferred, result
+        )
 
         result.elapsed_seconds = time.monotonic() - start
         return result
@@ -163,15 +189,7 @@ class PlayForwardEngine:
             position = len(events) - 1
 
         # Find the target RP
-        target_idx = None
-        for i, event in enumerate(events):
-            if (
-                event.event_type == TimelineEventType.RELEASE_POINT
-                and event.identifier == rp_identifier
-            ):
-                target_idx = i
-                break
-
+        target_idx = events.release_point_position(rp_identifier)
         if target_idx is None:
             raise ValueError(f"Release point '{rp_identifier}' not found in timeline.")
 
@@ -186,13 +204,9 @@ class PlayForwardEngine:
         to_process = events[position + 1 : target_idx + 1]
         deferred = self._collect_deferred_laws(to_process)
 
-        parent_revision_id = head.revision_id
-        sequence_number = head.sequence_number + 1
-
-        for event in to_process:
-            parent_revision_id, sequence_number = await self._process_event(
-                event, parent_revision_id, sequence_number, deferred, result
-            )
+        await self._process_events(
+            to_process, head.revision_id, head.sequence_number + 1, deferred, result
+        )
 
         result.elapsed_seconds = time.monotonic() - start
         return result
@@ -233,30 +247,19 @@ class PlayForwardEngine:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    def _find_position(
-        self, events: list[TimelineEvent], head: CodeRevision
-    ) -> int | None:
+    def _find_position(self, events: Timeline, head: CodeRevision) -> int | None:
         """Find the current head's position in the timeline.
 
         Matches by law_id (for PUBLIC_LAW revisions) or release_point_id
         identifier (for RELEASE_POINT revisions).
         """
-        for i, event in enumerate(events):
-            if (
-                head.revision_type == RevisionType.PUBLIC_LAW.value
-                and event.event_type == TimelineEventType.PUBLIC_LAW
-                and event.law_id == head.law_id
-            ):
-                return i
-            if (
-                head.revision_type == RevisionType.RELEASE_POINT.value
-                and event.event_type == TimelineEventType.RELEASE_POINT
-            ):
-                # Match by RP identifier — need to check if the revision's
-                # release_point has the same identifier
-                rp = head.release_point
-                if rp is not None and event.identifier == rp.full_identifier:
-                    return i
+        if head.revision_type == RevisionType.PUBLIC_LAW.value:
+            return events.law_position(head.law_id)
+        if head.revision_type == RevisionType.RELEASE_POINT.value:
+            # Match by RP identifier of the revision's release_point
+            rp = head.release_point
+            if rp is not None:
+                return events.release_point_position(rp.full_identifier)
         return None
 
     def _collect_deferred_laws(
@@ -270,6 +273,42 @@ class PlayForwardEngine:
                     deferred.add((event.congress, law_num))
         return deferred
 
+    async def _process_events(
+        self,
+        events: list[TimelineEvent],
+        parent_revision_id: int,
+        sequence_number: int,
+        deferred: set[tuple[int, int]],
+        result: AdvanceResult,
+    ) -> None:
+        """Process events in order, preparing upcoming laws ahead if enabled."""
+        if self._lookahead > 0 and self._session_factory is not None:
+            laws = [
+                (event.congress, event.law_number)
+                for event in events
+                if event.event_type == TimelineEventType.PUBLIC_LAW
+                and event.law_number is not None
+                and (event.congress, event.law_number) not in deferred
+            ]
+            self._prefetcher = LawPrefetcher(
+                self._session_factory,
+                laws,
+                lookahead=self._lookahead,
+                govinfo_client=self.govinfo_client,
+            )
+        try:
+            for event in events:
+                parent_revision_id, sequence_number = await self._process_event(
+                    event, parent_revision_id, sequence_number, deferred, result
+                )
+        finally:
+            if self._prefetcher is not None:
+                await self._prefetcher.close()
+                self._prefetcher = None
+            if self.working_set is not None:
+                # Cumulative over the engine's lifetime (one CLI run)
+                result.working_set_stats = self.working_set.stats
+
     async def _process_event(
         self,
         event: TimelineEvent,
@@ -322,16 +361,11 @@ class PlayForwardEngine:
             return parent_revision_id, sequence_number
 
         # Auto-process: generate LawChange records if none exist (idempotent)
-        try:
-            await self.law_change_service.process_law(
-                congress=law.congress,
-                law_number=int(law.law_number),
-            )
-        except Exception:
-            logger.exception(
-                f"Failed to auto-process PL {event.congress}-{event.law_number}"
-            )
-            await self.session.rollback()
+        if self._prefetcher is not None:
+            # Prepared in its own session, usually while earlier laws applied
+            await self._prefetcher.prepare(law.congress, int(law.law_number))
+        else:
+            await self._prepare_law(law)
 
         try:
             build_result = await self.revision_builder.build_revision(
@@ -360,6 +394,19 @@ class PlayForwardEngine:
         result.revisions_created.append(build_result.revision_id)
         return build_result.revision_id, sequence_number + 1
 
+    async def _prepare_law(self, law: PublicLaw) -> None:
+        """Generate LawChange records for a law in the engine's own session."""
+        try:
+            await self.law_change_service.process_law(
+                congress=law.congress,
+                law_number=int(law.law_number),
+            )
+        except Exception:
+            logger.exception(
+                f"Failed to auto-process PL {law.congress}-{law.law_number}"
+            )
+            await self.session.rollback()
+
     async def _process_rp(
         self,
         event: TimelineEvent,
@@ -0,0 +1,263 @@
+"""Copy-on-write view of a section's normalized provision lines.
+
+Both the revision builder (``_patch_provisions``) and the law viewer's
+diff endpoint (``_apply_amendments_to_provisions``) apply a law's
+amendments to the parent snapshot's ``normalized_provisions``: text
+replacements inside lines, subsection strikes and inserts, and
+redesignations. They used to deepcopy the whole list up front, scan every
+line in Python for each replacement and rescan every marker for each
+subsection lookup.
+
+``ProvisionDocument`` wraps the parent lines without copying them. A line
+is copied the first time it is modified, so unchanged lines in the result
+are the parent's own dicts — callers must treat both as read-only. Two
+indexes are built lazily and rebuilt only after an edit that invalidates
+them:
+
+- a marker index (marker → line positions, plus per-style positions for
+  subsection boundaries), so a subsection range is found with a bisect
+  instead of a scan over all lines;
+- the joined line contents with their start offsets, so a replacement
+  finds candidate lines with one regex search over the whole text and a
+  bisect per hit.
+
+Line numbers are renumbered once, in ``to_list``.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from typing import Any
+
+ProvisionLine = dict[str, Any]
+
+_NEW_LINE_MARKER_RE = re.compile(r"^(\([a-zA-Z0-9]+\)(?:\([A-Z0-9]+\))?)")
+
+# Same-level subsection boundaries, by the style of the struck markers
+_BOUNDARY_RES = {
+    "digit": re.compile(r"^\([0-9]+\)$"),
+    "upper": re.compile(r"^\([A-Z]+\)$"),
+    "lower": re.compile(r"^\([a-z]+\)$"),
+}
+
+# Joins line contents for the text index; \s never matches it, so a
+# whitespace-tolerant pattern cannot match across two lines.
+_LINE_SEPARATOR = "\x00"
+
+
+def _marker_style(marker: str) -> str:
+    if marker.isdigit():
+        return "digit"
+    if marker.isupper():
+        return "upper"
+    return "lower"
+
+
+def provision_lines(
+    text: str, line_number: int, start_char: int
+) -> list[ProvisionLine]:
+    """Build provision lines for amendment text, one per non-blank line.
+
+    Markers are detected from each line's leading "(x)" or "(x)(Y)";
+    indentation is not inferred, since nesting heuristics are unreliable
+    without XML structure and the next release-point ingestion supplies
+    proper formatting.
+    """
+    lines: list[ProvisionLine] = []
+    char_offset = start_char
+    for raw in text.split("\n"):
+        content = raw.strip()
+        if not content:
+            continue
+        marker_match = _NEW_LINE_MARKER_RE.match(content)
+        lines.append(
+            {
+                "line_number": line_number,
+                "content": content,
+                "indent_level": 0,
+                "marker": marker_match.group(1) if marker_match else None,
+                "is_header": False,
+                "start_char": char_offset,
+                "end_char": char_offset + len(content),
+            }
+        )
+        line_number += 1
+        char_offset += len(content) + 1
+    return lines
+
+
+class ProvisionDocument:
+    """Editable provision lines backed by the parent's lines.
+
+    Args:
+        lines: Parent provision lines. Neither the list nor its dicts are
+            modified.
+    """
+
+    def __init__(self, lines: list[ProvisionLine]) -> None:
+        self._lines = list(lines)
+        self._owned: set[int] = set()
+        self._marker_index: dict[str, list[int]] | None = None
+        self._style_index: dict[str, list[int]] | None = None
+        self._joined: str | None = None
+        self._starts: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __getitem__(self, index: int) -> ProvisionLine:
+        return self._lines[index]
+
+    # ------------------------------------------------------------------
+    # Edits
+    # ------------------------------------------------------------------
+
+    def splice(self, start: int, stop: int, lines: list[ProvisionLine]) -> None:
+        """Replace lines ``start`` to ``stop`` (exclusive) with ``lines``.
+
+        ``lines`` become owned by the document; ``start == stop`` inserts.
+        """
+        self._owned.update(id(line) for line in lines)
+        self._lines[start:stop] = lines
+        self._marker_index = None
+        self._style_index = None
+        self._joined = None
+
+    def redesignate(self, index: int, marker: str) -> None:
+        """Give line ``index`` a new marker, prefixing it to the content."""
+        if not 0 <= index < len(self._lines):
+            return
+        line = self._edit(index)
+        line["marker"] = marker
+        content = line.get("content", "")
+        if not content.startswith(marker):
+            line["content"] = f"{marker} {content}"
+            self._joined = None
+        self._marker_index = None
+        self._style_index = None
+
+    def replace_text(self, old_text: str, replacement: str) -> None:
+        """Replace ``old_text`` in every line that contains it.
+
+        Per line, in order of preference: every exact occurrence; else the
+        first whitespace-normalized occurrence; else the first
+        case-insensitive one.
+        """
+        parts = old_text.split()
+        ws_pattern = r"\s+".join(re.escape(part) for part in parts)
+        ws_re = re.compile(ws_pattern)
+        ci_re = re.compile(ws_pattern, re.IGNORECASE)
+
+        # Every exact or whitespace-normalized match is also a
+        # case-insensitive match, so lines without one can be skipped.
+        if parts and _LINE_SEPARATOR not in old_text:
+            candidates = self._lines_matching(ci_re)
+        else:
+            candidates = list(range(len(self._lines)))
+
+        for i in candidates:
+            content = self._lines[i].get("content", "")
+            if not content:
+                continue
+            if old_text in content:
+                patched = content.replace(old_text, replacement)
+            elif not parts:
+                continue
+            else:
+                match = ws_re.search(content) or ci_re.search(content)
+                if not match:
+                    continue
+                patched = (
+                    content[: match.start()] + replacement + content[match.end() :]
+                )
+            self._edit(i)["content"] = patched
+            self._joined = None
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def subsection_range(self, markers: list[str]) -> tuple[int, int] | None:
+        """Find the contiguous line range belonging to subsection ``markers``.
+
+        ``markers`` are bare ("a", "2"). Returns (start, end) inclusive: from
+        the first line carrying one of the markers up to, not including,
+        the next same-level marker outside the set — "same-level" meaning
+        the style of the first marker (e.g. lowercase letters), so (1) and
+        (A) children are included. None if no line carries any of the
+        markers.
+        """
+        marker_index, style_index = self._indexes()
+        marker_set = {f"({m})" for m in markers}
+
+        firsts = [marker_index[m][0] for m in marker_set if m in marker_index]
+        if not firsts:
+            return None
+        start = min(firsts)
+
+        boundaries = style_index[_marker_style(markers[0])]
+        for pos in range(bisect_right(boundaries, start), len(boundaries)):
+            i = boundaries[pos]
+            if self._lines[i].get("marker") not in marker_set:
+                return (start, i - 1)
+        return (start, len(self._lines) - 1)
+
+    def to_list(self) -> list[ProvisionLine]:
+        """Return the lines, renumbered sequentially from 1."""
+        for i in range(len(self._lines)):
+            if self._lines[i].get("line_number") != i + 1:
+                self._edit(i)["line_number"] = i + 1
+        return list(self._lines)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _edit(self, index: int) -> ProvisionLine:
+        """Return line ``index``, copying it first if it is the parent's."""
+        line = self._lines[index]
+        if id(line) not in self._owned:
+            line = dict(line)
+            self._lines[index] = line
+            self._owned.add(id(line))
+        return line
+
+    def _indexes(self) -> tuple[dict[str, list[int]], dict[str, list[int]]]:
+        if self._marker_index is None or self._style_index is None:
+            marker_index: dict[str, list[int]] = {}
+            style_index: dict[str, list[int]] = {s: [] for s in _BOUNDARY_RES}
+            for i, line in enumerate(self._lines):
+                marker = line.get("marker")
+                if not marker:
+                    continue
+                marker_index.setdefault(marker, []).append(i)
+                for style, boundary_re in _BOUNDARY_RES.items():
+                    if boundary_re.match(marker):
+                        style_index[style].append(i)
+            self._marker_index = marker_index
+            self._style_index = style_index
+        return self._marker_index, self._style_index
+
+    def _lines_matching(self, pattern: re.Pattern[str]) -> list[int]:
+        """Positions of lines whose content matches ``pattern``, in order."""
+        if self._joined is None:
+            contents = [line.get("content") or "" for line in self._lines]
+            starts: list[int] = []
+            offset = 0
+            for content in contents:
+                starts.append(offset)
+                offset += len(content) + len(_LINE_SEPARATOR)
+            self._joined = _LINE_SEPARATOR.join(contents)
+            self._starts = starts
+
+        hits: list[int] = []
+        pos = 0
+        while (match := pattern.search(self._joined, pos)) is not None:
+            i = bisect_right(self._starts, match.start()) - 1
+            hits.append(i)
+            # Resume at the next line; one hit is enough to select this one
+            if i + 1 >= len(self._starts):
+                break
+            pos = self._starts[i + 1]
+        return hits
@@ -9,6 +9,7 @@ from __future__ import annotations
 import logging
 import time
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any
 
 from sqlalchemy import select
@@ -17,14 +18,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.enums import ChangeType, RevisionStatus, RevisionType
 from app.models.public_law import LawChange, PublicLaw
 from app.models.revision import CodeRevision
-from app.models.snapshot import SectionSnapshot
 from pipeline.chrono.amendment_applicator import (
     ApplicationResult,
     ApplicationStatus,
+    SectionMatchIndex,
     apply_text_change,
 )
 from pipeline.chrono.notes_updater import update_notes_for_applied_law
+from pipeline.chrono.provision_document import ProvisionDocument, provision_lines
+from pipeline.chrono.working_set import SectionWorkingSet
+from pipeline.olrc.bootstrap import write_snapshot_rows
 from pipeline.olrc.parser import compute_text_hash
+from pipeline.olrc.section_dates import derive_section_dates
 from pipeline.olrc.snapshot_service import SectionState, SnapshotService
 
 logger = logging.getLogger(__name__)
@@ -104,56 +109,6 @@ def _parse_struck_subsections(text: str) -> list[str] | None:
     return markers if markers else None
 
 
-def _find_subsection_range(
-    provisions: list[dict[str, Any]], markers: list[str]
-) -> tuple[int, int] | None:
-    """Find the contiguous index range of provision lines belonging to
-    the given subsection markers.
-
-    Returns (start_index, end_index) inclusive, stopping at the next
-    top-level subsection that is NOT in the target set.
-
-    "Top-level" means the same marker style as the struck markers.
-    E.g. if striking (a) and (b) (lowercase letters), then (c) is a
-    boundary but (1), (A), (i) are children and should be included.
-    """
-    import re
-
-    marker_set = {f"({m})" for m in markers}
-
-    # Determine what kind of markers we're striking to know what
-    # constitutes a same-level boundary.  E.g. lowercase letters →
-    # only other lowercase-letter markers are boundaries.
-    sample = markers[0]
-    if sample.isdigit():
-        boundary_re = re.compile(r"^\([0-9]+\)$")
-    elif sample.isupper():
-        boundary_re = re.compile(r"^\([A-Z]+\)$")
-    else:
-        # lowercase letters (most common: subsections (a), (b), …)
-        boundary_re = re.compile(r"^\([a-z]+\)$")
-
-    start_idx: int | None = None
-    end_idx: int | None = None
-
-    for i, line in enumerate(provisions):
-        line_marker = line.get("marker", "")
-        if line_marker in marker_set:
-            if start_idx is None:
-                start_idx = i
-            end_idx = i
-        elif start_idx is not None:
-            # Stop at the next same-level marker outside the target set
-            if line_marker and boundary_re.match(line_marker):
-                break
-            end_idx = i
-
-    if start_idx is None:
-        return None
-    assert end_idx is not None
-    return (start_idx, end_idx)
-
-
 def _prev_marker(marker: str) -> str | None:
     """Return the marker that logically precedes *marker*.
 
@@ -185,15 +140,15 @@ def _patch_provisions(
        inserting the following"). Identifies the provision lines belonging
        to those subsections and replaces them with new_text lines.
 
-    Returns a new list (or None if the parent had no provisions).
+    Returns a new list (or None if the parent had no provisions). Lines the
+    changes leave untouched are shared with ``parent_provisions``.
     """
     if not isinstance(parent_provisions, list):
         return parent_provisions
 
-    import copy
     import re
 
-    patched = copy.deepcopy(parent_provisions)
+    doc = ProvisionDocument(parent_provisions)
 
     # Process redesignations first so markers exist for subsequent ADD anchoring
     for change in changes:
@@ -204,12 +159,7 @@ def _patch_provisions(
         if not mapping:
             continue
         for idx, new_marker in mapping:
-            if 0 <= idx < len(patched):
-                patched[idx]["marker"] = new_marker
-                content = patched[idx].get("content", "")
-                # Prepend marker to content if not already present
-                if not content.startswith(new_marker):
-                    patched[idx]["content"] = f"{new_marker} {content}"
+            doc.redesignate(idx, new_marker)
 
     for change in changes:
         if change.change_type not in (
@@ -221,88 +171,34 @@ def _patch_provisions(
 
         # Case 3: ADD — insert new provisions at the correct position
         if change.change_type == ChangeType.ADD and change.new_text:
-            new_lines_text = change.new_text.split("\n")
-            insert_idx = len(patched)  # default: append at end
+            insert_idx = len(doc)  # default: append at end
 
             # Infer insertion point from new_text marker (e.g. "(b)" → after "(a)")
-            first_line = new_lines_text[0].strip()
+            first_line = change.new_text.split("\n")[0].strip()
             marker_match = re.match(r"^\(([a-zA-Z0-9]+)\)", first_line)
             if marker_match:
-                marker_val = marker_match.group(1)
-                prev = _prev_marker(marker_val)
+                prev = _prev_marker(marker_match.group(1))
                 if prev:
-                    span = _find_subsection_range(patched, [prev])
+                    span = doc.subsection_range([prev])
                     if span:
                         insert_idx = span[1] + 1
 
-            # Build provision dicts
-            base_line_number = (
-                int(patched[insert_idx - 1].get("line_number", insert_idx)) + 1
-                if insert_idx > 0 and patched
-                else 1
-            )
-            base_char = (
-                int(patched[insert_idx - 1].get("end_char", 0))
-                if insert_idx > 0 and patched
-                else 0
+            if insert_idx > 0 and len(doc):
+                anchor = doc[insert_idx - 1]
+                line_number = int(anchor.get("line_number", insert_idx)) + 1
+                start_char = int(anchor.get("end_char", 0))
+            else:
+                line_number, start_char = 1, 0
+            doc.splice(
+                insert_idx,
+                insert_idx,
+                provision_lines(change.new_text, line_number, start_char),
             )
-            char_offset = base_char
-            line_num = base_line_number
-            new_provisions: list[dict[str, Any]] = []
-            for text in new_lines_text:
-                text = text.strip()
-                if not text:
-                    continue
-                m_marker = re.match(r"^(\([a-zA-Z0-9]+\)(?:\([A-Z0-9]+\))?)", text)
-                marker = m_marker.group(1) if m_marker else None
-                new_provisions.append(
-                    {
-                        "line_number": line_num,
-                        "content": text,
-                        "indent_level": 0,
-                        "marker": marker,
-                        "is_header": False,
-                        "start_char": char_offset,
-                        "end_char": char_offset + len(text),
-                    }
-                )
-                line_num += 1
-                char_offset += len(text) + 1
-
-            patched[insert_idx:insert_idx] = new_provisions
             continue
 
         # Case 1: Simple text replacement (old_text present)
         if change.old_text is not None:
-            replacement = change.new_text or ""
-            for line in patched:
-                content = line.get("content", "")
-                if not content:
-                    continue
-
-                # Exact match
-                if change.old_text in content:
-                    line["content"] = content.replace(change.old_text, replacement)
-                    continue
-
-                # Whitespace-normalised match
-                parts = change.old_text.split()
-                ws_pattern = r"\s+".join(re.escape(part) for part in parts)
-                ws_re = re.compile(ws_pattern)
-                match = ws_re.search(content)
-                if match:
-                    line["content"] = (
-                        content[: match.start()] + replacement + content[match.end() :]
-                    )
-                    continue
-
-                # Case-insensitive fallback
-                ci_re = re.compile(ws_pattern, re.IGNORECASE)
-                match = ci_re.search(content)
-                if match:
-                    line["content"] = (
-                        content[: match.start()] + replacement + content[match.end() :]
-                    )
+            doc.replace_text(change.old_text, change.new_text or "")
             continue
 
         # Case 2: Structural replacement (old_text is None, new_text present)
@@ -315,50 +211,25 @@ def _patch_provisions(
         if not struck:
             continue
 
-        span = _find_subsection_range(patched, struck)
+        span = doc.subsection_range(struck)
         if not span:
             continue
 
         start_idx, end_idx = span
-
-        # Build replacement lines from new_text with basic marker
-        # detection.  We don't attempt indent inference here because
-        # heuristic-based nesting is unreliable without XML structure;
-        # the next release-point ingestion will supply proper formatting.
-        new_lines_text = change.new_text.split("\n")
-        base_line_number = int(patched[start_idx].get("line_number", start_idx + 1))
-        base_char = int(patched[start_idx].get("start_char", 0))
-        char_offset = base_char
-        line_num = base_line_number
-        replacement_provisions: list[dict[str, Any]] = []
-        for text in new_lines_text:
-            text = text.strip()
-            if not text:
-                continue
-            marker_match = re.match(r"^(\([a-zA-Z0-9]+\)(?:\([A-Z0-9]+\))?)", text)
-            marker = marker_match.group(1) if marker_match else None
-            replacement_provisions.append(
-                {
-                    "line_number": line_num,
-                    "content": text,
-                    "indent_level": 0,
-                    "marker": marker,
-                    "is_header": False,
-                    "start_char": char_offset,
-                    "end_char": char_offset + len(text),
-                }
-            )
-            line_num += 1
-            char_offset += len(text) + 1
-
-        patched[start_idx : end_idx + 1] = replacement_provisions
+        first = doc[start_idx]
+        doc.splice(
+            start_idx,
+            end_idx + 1,
+            provision_lines(
+                change.new_text,
+                int(first.get("line_number", start_idx + 1)),
+                int(first.get("start_char", 0)),
+            ),
+        )
 
     # Renumber all lines sequentially so replacements that change the
     # line count don't leave gaps or duplicates.
-    for i, line in enumerate(patched):
-        line["line_number"] = i + 1
-
-    return patched
+    return doc.to_list()
 
 
 @dataclass
@@ -379,11 +250,27 @@ class RevisionBuildResult:
 
 
 class RevisionBuilder:
-    """Builds derived revisions by applying law changes."""
+    """Builds derived revisions by applying law changes.
 
-    def __init__(self, session: AsyncSession):
+    With a ``working_set``, parent states of sections read or written by
+    recent builds are served from memory; only cold sections are queried.
+
+    Snapshot rows are accumulated and written in bulk once per revision
+    (see ``write_snapshot_rows``) rather than one ORM INSERT per section.
+    ``use_copy`` selects asyncpg binary COPY; by default it is used
+    whenever the session is bound to an asyncpg engine.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        working_set: SectionWorkingSet | None = None,
+        use_copy: bool | None = None,
+    ):
         self.session = session
         self.snapshot_service = SnapshotService(session)
+        self.working_set = working_set
+        self.use_copy = use_copy
 
     async def build_revision(
         self,
@@ -469,13 +356,13 @@ class RevisionBuilder:
         # 5. Batch-fetch all parent states in a single query instead of
         # per-section lookups (each of which would rebuild the revision chain).
         keys = list(section_groups.keys())
-        parent_states = await self.snapshot_service.get_sections_at_revision(
-            keys, parent_revision_id
-        )
+        parent_states = await self._get_parent_states(keys, parent_revision_id)
 
         # 6. Process each section group
+        now = datetime.utcnow()  # naive, matching TimestampMixin
+        written: dict[tuple[int, str], dict[str, Any]] = {}
         for (title_num, section_num), section_changes in section_groups.items():
-            await self._apply_section_changes(
+            row = await self._apply_section_changes(
                 revision=revision,
                 title_number=title_num,
                 section_number=section_num,
@@ -483,12 +370,29 @@ class RevisionBuilder:
                 parent_state=parent_states.get((title_num, section_num)),
                 law=law,
                 result=result,
+                now=now,
             )
+            if row is not None:
+                written[(title_num, section_num)] = row
 
-        # 6. Mark revision as INGESTED
+        # 7. Write all snapshots in one bulk statement
+        await write_snapshot_rows(
+            self.session, list(written.values()), use_copy=self._should_copy()
+        )
+
+        # 8. Mark revision as INGESTED
         revision.status = RevisionStatus.INGESTED.value
         await self.session.flush()
 
+        if self.working_set is not None:
+            self.working_set.advance(
+                revision.revision_id,
+                {
+                    key: None if row["is_deleted"] else _row_state(row)
+                    for key, row in written.items()
+                },
+            )
+
         result.elapsed_seconds = time.monotonic() - start
         logger.info(
             "Built revision %d for PL %s-%s: "
@@ -504,6 +408,30 @@ class RevisionBuilder:
         )
         return result
 
+    def _should_copy(self) -> bool:
+        """Whether to write snapshots with binary COPY."""
+        if self.use_copy is not None:
+            return self.use_copy
+        bind = self.session.bind
+        return getattr(getattr(bind, "dialect", None), "driver", None) == "asyncpg"
+
+    async def _get_parent_states(
+        self, keys: list[tuple[int, str]], parent_revision_id: int
+    ) -> dict[tuple[int, str], SectionState]:
+        """Fetch parent states, from the working set where possible."""
+        if self.working_set is None:
+            return await self.snapshot_service.get_sections_at_revision(
+                keys, parent_revision_id
+            )
+        states, cold = self.working_set.lookup(keys, parent_revision_id)
+        if cold:
+            fetched = await self.snapshot_service.get_sections_at_revision(
+                cold, parent_revision_id
+            )
+            self.working_set.remember(cold, fetched)
+            states.update(fetched)
+        return states
+
     async def _apply_section_changes(
         self,
         revision: CodeRevision,
@@ -513,8 +441,13 @@ class RevisionBuilder:
         parent_state: SectionState | None,
         law: PublicLaw,
         result: RevisionBuildResult,
-    ) -> None:
-        """Apply all changes for a single section and create a snapshot."""
+        now: datetime,
+    ) -> dict[str, Any] | None:
+        """Apply all changes for a single section and build its snapshot row.
+
+        Returns the row for ``write_snapshot_rows``, or None if no change
+        applied.
+        """
         current_text = parent_state.text_content if parent_state else None
         is_deleted = False
         is_new_section = parent_state is None
@@ -522,6 +455,7 @@ class RevisionBuilder:
         descriptions: list[str] = []
 
         has_structural_changes = False
+        match_index = SectionMatchIndex(current_text or "")
 
         for change in section_changes:
             app_result = apply_text_change(
@@ -531,6 +465,7 @@ class RevisionBuilder:
                 new_text=change.new_text,
                 title_number=title_number,
                 section_number=section_number,
+                match_index=match_index,
             )
             result.application_results.append(app_result)
 
@@ -603,7 +538,7 @@ class RevisionBuilder:
 
         # Only create a snapshot if something changed
         if not any_applied:
-            return
+            return None
 
         # Update notes
         existing_notes = parent_state.normalized_notes if parent_state else None
@@ -646,25 +581,57 @@ class RevisionBuilder:
                 line.get("content", "") for line in provisions_json
             )
 
-        # Create snapshot, carrying forward structural metadata from parent
-        snapshot = SectionSnapshot(
-            revision_id=revision.revision_id,
-            title_number=title_number,
-            section_number=section_number,
-            heading=parent_state.heading if parent_state else None,
-            text_content=current_text,
-            normalized_provisions=provisions_json,
-            notes=updated_raw_notes,
-            normalized_notes=updated_notes_dict,
-            text_hash=text_hash,
-            notes_hash=notes_hash,
-            full_citation=(
+        enacted_date, last_modified_date = derive_section_dates(updated_notes_dict)
+
+        # Snapshot row, carrying forward structural metadata from parent
+        return {
+            "revision_id": revision.revision_id,
+            "title_number": title_number,
+            "section_number": section_number,
+            "heading": parent_state.heading if parent_state else None,
+            "text_content": current_text,
+            "normalized_provisions": provisions_json,
+            "notes": updated_raw_notes,
+            "normalized_notes": updated_notes_dict,
+            "text_hash": text_hash,
+            "notes_hash": notes_hash,
+            "full_citation": (
                 parent_state.full_citation
                 if parent_state
                 else f"{title_number} USC {section_number}"
             ),
-            is_deleted=is_deleted,
-            group_id=parent_state.group_id if parent_state else None,
-            sort_order=parent_state.sort_order if parent_state else 0,
-        )
-        self.session.add(snapshot)
+            "is_deleted": is_deleted,
+            "group_id": parent_state.group_id if parent_state else None,
+            "sort_order": parent_state.sort_order if parent_state else 0,
+            "enacted_date": enacted_date,
+            "last_modified_date": last_modified_date,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+
+def _row_state(row: dict[str, Any]) -> SectionState:
+    """The SectionState a written snapshot row represents.
+
+    Bulk writes do not return generated keys, so ``snapshot_id`` is 0;
+    nothing downstream of the builder reads it.
+    """
+    return SectionState(
+        title_number=row["title_number"],
+        section_number=row["section_number"],
+        heading=row["heading"],
+        text_content=row["text_content"],
+        text_hash=row["text_hash"],
+        normalized_provisions=row["normalized_provisions"],
+        notes=row["notes"],
+        normalized_notes=row["normalized_notes"],
+        notes_hash=row["notes_hash"],
+        full_citation=row["full_citation"],
+        snapshot_id=0,
+        revision_id=row["revision_id"],
+        is_deleted=row["is_deleted"],
+        group_id=row["group_id"],
+        sort_order=row["sort_order"],
+        enacted_date=row["enacted_date"],
+        last_modified_date=row["last_modified_date"],
+    )
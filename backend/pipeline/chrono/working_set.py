@@ -0,0 +1,134 @@
+"""In-memory working set of section states for batched play-forward runs.
+
+Each ``RevisionBuilder.build_revision`` call looks up the parent state of
+every section its law touches with ``get_sections_at_revision``, which walks
+an ever-longer revision chain with DISTINCT ON. During ``advance(count=N)``
+most of those states were written by the engine itself a few laws earlier
+(appropriations and tax laws keep amending the same sections), so the
+builder can answer them from memory instead.
+
+``SectionWorkingSet`` holds the state of recently read and written sections
+*at one revision* — the head the builder last produced. Entries stay valid
+as long as the next revision is built directly on that head: a law only
+changes the sections it writes, and those are written back here. Any other
+parent (an RP ingested in between, a rolled-back build) clears the set.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from pipeline.olrc.snapshot_service import SectionState
+
+logger = logging.getLogger(__name__)
+
+SectionKey = tuple[int, str]
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+@dataclass
+class WorkingSetStats:
+    """Lookup counters for a working set."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    resets: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from memory (0.0 with no lookups)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SectionWorkingSet:
+    """LRU cache of section states at the most recently built revision.
+
+    A key mapped to None is known to be absent (never existed or deleted)
+    at the head revision, which is as useful as a state: it saves the same
+    query.
+
+    Args:
+        max_entries: Maximum number of sections kept; least recently used
+            sections are evicted first.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self.head_revision_id: int | None = None
+        self.stats = WorkingSetStats()
+        self._states: OrderedDict[SectionKey, SectionState | None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def lookup(
+        self, keys: list[SectionKey], revision_id: int
+    ) -> tuple[dict[SectionKey, SectionState], list[SectionKey]]:
+        """Split ``keys`` into states known at ``revision_id`` and cold keys.
+
+        Returns (states, cold_keys). Known-absent sections appear in
+        neither. A ``revision_id`` other than the head clears the set.
+        """
+        if revision_id != self.head_revision_id:
+            self.reset(revision_id)
+
+        states: dict[SectionKey, SectionState] = {}
+        cold: list[SectionKey] = []
+        for key in keys:
+            if key in self._states:
+                self._states.move_to_end(key)
+                state = self._states[key]
+                if state is not None:
+                    states[key] = state
+                self.stats.hits += 1
+            else:
+                cold.append(key)
+                self.stats.misses += 1
+        return states, cold
+
+    def remember(
+        self, keys: list[SectionKey], states: dict[SectionKey, SectionState]
+    ) -> None:
+        """Record states read from the database for ``keys`` at the head.
+
+        Keys without a state are recorded as absent.
+        """
+        for key in keys:
+            self._put(key, states.get(key))
+
+    def advance(
+        self, revision_id: int, written: dict[SectionKey, SectionState | None]
+    ) -> None:
+        """Move the head to ``revision_id``, built on the current head.
+
+        ``written`` holds the new state of every section the revision
+        changed (None for repealed sections); all other entries carry over
+        unchanged.
+        """
+        for key, state in written.items():
+            self._put(key, state)
+        self.head_revision_id = revision_id
+
+    def reset(self, revision_id: int | None = None) -> None:
+        """Drop every entry and start tracking ``revision_id``."""
+        if self._states:
+            self.stats.resets += 1
+            logger.debug(
+                "Working set reset at revision %s (%d entries dropped)",
+                revision_id,
+                len(self._states),
+            )
+        self._states.clear()
+        self.head_revision_id = revision_id
+
+    def _put(self, key: SectionKey, state: SectionState | None) -> None:
+        self._states[key] = state
+        self._states.move_to_end(key)
+        while len(self._states) > self.max_entries:
+            self._states.popitem(last=False)
+            self.stats.evictions += 1
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import atexit
 import logging
 import os
 import sys
@@ -16,6 +17,7 @@ from pipeline.olrc.parser import USLMParser
 
 if TYPE_CHECKING:
     from pipeline.cache import PipelineCache
+    from pipeline.chrono.working_set import WorkingSetStats
     from pipeline.olrc.parser import ParsedSection
 
 # Configure logging
@@ -1757,6 +1759,65 @@ async def process_law_command(
         return 0
 
 
+async def process_congress_command(
+    congress: int,
+    law_numbers: list[int] | None = None,
+    default_title: int | None = None,
+    dry_run: bool = False,
+    fetch_concurrency: int = 8,
+    workers: int | None = None,
+    commit_every: int = 25,
+) -> int:
+    """Process every Public Law of a Congress into LawChange records.
+
+    Args:
+        congress: Congress number.
+        law_numbers: Restrict to these laws (default: all in the database).
+        default_title: Default US Code title.
+        dry_run: If True, don't persist changes.
+        fetch_concurrency: Maximum concurrent GovInfo fetches.
+        workers: Parser processes (None: one per CPU, 0: in-process).
+        commit_every: Laws persisted per transaction.
+
+    Returns:
+        0 if every law was processed, 1 if any failed.
+    """
+    from app.models.base import async_session_maker
+    from pipeline.legal_parser.law_change_service import LawChangeService
+
+    async with async_session_maker() as session:
+        service = LawChangeService(session)
+        batch = await service.process_congress(
+            congress=congress,
+            law_numbers=law_numbers,
+            default_title=default_title,
+            dry_run=dry_run,
+            fetch_concurrency=fetch_concurrency,
+            workers=workers,
+            commit_every=commit_every,
+        )
+
+    failed = batch.failed
+    print(f"\nCongress {congress} Processing Results:")
+    print(f"  Laws processed: {len(batch.results) - len(failed)}")
+    print(f"  Laws skipped (already processed): {len(batch.skipped)}")
+    print(f"  Laws failed: {len(failed)}")
+    print(f"  Amendments found: {sum(len(r.amendments) for r in batch.results)}")
+    print(f"  Diffs generated: {sum(len(r.diffs) for r in batch.results)}")
+    print(f"  LawChange records: {batch.changes_created}")
+
+    if failed:
+        print("\n  Errors:")
+        for result in failed:
+            for error in result.errors:
+                print(f"    - {error}")
+
+    if dry_run:
+        print("\n  [DRY RUN - changes not persisted]")
+
+    return 1 if failed else 0
+
+
 async def validate_release_point_command(
     release_point: str,
     titles: list[int] | None = None,
@@ -2446,6 +2507,51 @@ Examples:
         help="Show detailed progress",
     )
 
+    # process-congress command
+    process_congress_parser = subparsers.add_parser(
+        "process-congress",
+        help="Process every Public Law of a Congress into LawChange records",
+    )
+    process_congress_parser.add_argument(
+        "congress",
+        type=int,
+        help="Congress number (e.g., 113)",
+    )
+    process_congress_parser.add_argument(
+        "--laws",
+        type=int,
+        nargs="+",
+        help="Only these law numbers (default: all laws of the Congress)",
+    )
+    process_congress_parser.add_argument(
+        "--default-title",
+        type=int,
+        help="Default US Code title when not specified in text",
+    )
+    process_congress_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Generate diffs without persisting to database",
+    )
+    process_congress_parser.add_argument(
+        "--fetch-concurrency",
+        type=int,
+        default=8,
+        help="Maximum concurrent GovInfo text fetches (default: 8)",
+    )
+    process_congress_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Parser processes (default: one per CPU; 0 parses in-process)",
+    )
+    process_congress_parser.add_argument(
+        "--commit-every",
+        type=int,
+        default=25,
+        help="Laws persisted per transaction (default: 25)",
+    )
+
     # validate-release-point command
     validate_rp_parser = subparsers.add_parser(
         "validate-release-point",
@@ -2705,6 +2811,24 @@ Examples:
         default=1,
         help="Number of events to process (default: 1)",
     )
+    chrono_advance_parser.add_argument(
+        "--working-set",
+        type=int,
+        default=10_000,
+        help=(
+            "Keep up to N recently touched section states in memory across "
+            "laws; 0 disables (default: 10000)"
+        ),
+    )
+    chrono_advance_parser.add_argument(
+        "--lookahead",
+        type=int,
+        default=8,
+        help=(
+            "Prepare up to N upcoming laws (fetch, parse, diff) concurrently "
+            "while earlier laws are applied; 0 disables (default: 8)"
+        ),
+    )
     chrono_advance_parser.add_argument(
         "--dir",
         type=Path,
@@ -2721,6 +2845,24 @@ Examples:
         type=str,
         help="Target release point identifier (e.g., '113-37')",
     )
+    chrono_advance_to_parser.add_argument(
+        "--working-set",
+        type=int,
+        default=10_000,
+        help=(
+            "Keep up to N recently touched section states in memory across "
+            "laws; 0 disables (default: 10000)"
+        ),
+    )
+    chrono_advance_to_parser.add_argument(
+        "--lookahead",
+        type=int,
+        default=8,
+        help=(
+            "Prepare up to N upcoming laws (fetch, parse, diff) concurrently "
+            "while earlier laws are applied; 0 disables (default: 8)"
+        ),
+    )
     chrono_advance_to_parser.add_argument(
         "--dir",
         type=Path,
@@ -2774,6 +2916,12 @@ Examples:
         default=False,
         help="Delete existing rows and re-fetch from Congress.gov",
     )
+    seed_congress_law_history_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum laws fetched from Congress.gov concurrently (default: 8)",
+    )
 
     # seed-committees command
     seed_committees_parser = subparsers.add_parser(
@@ -2850,6 +2998,47 @@ Examples:
         help="Re-fetch even if cached",
     )
 
+    # export-static command
+    export_static_parser = subparsers.add_parser(
+        "export-static",
+        help="Render titles and sections at a revision into a static JSON export",
+    )
+    export_static_parser.add_argument(
+        "--revision",
+        type=int,
+        default=None,
+        help="Revision ID to export (defaults to latest ingested)",
+    )
+    export_static_parser.add_argument(
+        "--titles",
+        type=str,
+        default=None,
+        help="Comma-separated title numbers to export (e.g., '10,17,18')",
+    )
+    export_static_parser.add_argument(
+        "--out",
+        type=Path,
+        default=Path("data/export"),
+        help="Export directory (default: data/export)",
+    )
+    export_static_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum payloads rendered concurrently (default: 8)",
+    )
+
+    # cache-stats command
+    cache_stats_parser = subparsers.add_parser(
+        "cache-stats",
+        help="Show local pipeline cache usage and hit/miss/eviction counters",
+    )
+    cache_stats_parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Reset the accumulated counters after printing them",
+    )
+
     args = parser.parse_args()
 
     # Initialize shared pipeline cache (local-only unless GCS_CACHE_BUCKET is set)
@@ -2857,12 +3046,19 @@ Examples:
     from pipeline.cache import get_pipeline_cache
 
     _cli_cache = get_pipeline_cache()
+    # Accumulate this run's hit/miss/eviction counts for cache-stats
+    atexit.register(_cli_cache.save_stats)
 
     # Wire cache into title_lookup module for GCS persistence
     from pipeline.olrc.title_lookup import set_pipeline_cache
 
     set_pipeline_cache(_cli_cache)
 
+    # ...and into the amendment parse-result cache
+    from pipeline.legal_parser import parse_cache
+
+    parse_cache.set_pipeline_cache(_cli_cache)
+
     if args.command == "download":
         titles = args.titles or list(range(1, 55))
         logger.info(f"Downloading titles: {titles}")
@@ -3112,6 +3308,19 @@ Examples:
             )
         )
 
+    elif args.command == "process-congress":
+        return asyncio.run(
+            process_congress_command(
+                congress=args.congress,
+                law_numbers=args.laws,
+                default_title=args.default_title,
+                dry_run=args.dry_run,
+                fetch_concurrency=args.fetch_concurrency,
+                workers=args.workers,
+                commit_every=args.commit_every,
+            )
+        )
+
     elif args.command == "validate-release-point":
         return asyncio.run(
             validate_release_point_command(
@@ -3220,6 +3429,8 @@ Examples:
             chrono_advance_command(
                 count=args.count,
                 download_dir=args.dir,
+                lookahead=args.lookahead,
+                working_set_size=args.working_set,
             )
         )
 
@@ -3228,6 +3439,8 @@ Examples:
             chrono_advance_to_command(
                 release_point=args.release_point,
                 download_dir=args.dir,
+                lookahead=args.lookahead,
+                working_set_size=args.working_set,
             )
         )
 
@@ -3252,6 +3465,7 @@ Examples:
             seed_congress_law_history_command(
                 congress=args.congress,
                 force=args.force,
+                concurrency=args.concurrency,
             )
         )
 
@@ -3288,6 +3502,22 @@ Examples:
             )
         )
 
+    elif args.command == "export-static":
+        title_list = None
+        if args.titles:
+            title_list = [int(t.strip()) for t in args.titles.split(",")]
+        return asyncio.run(
+            export_static_command(
+                revision_id=args.revision,
+                titles=title_list,
+                output_dir=args.out,
+                concurrency=args.concurrency,
+            )
+        )
+
+    elif args.command == "cache-stats":
+        return cache_stats_command(_cli_cache, reset=args.reset)
+
     else:
         parser.print_help()
         return 1
@@ -3326,12 +3556,14 @@ async def seed_law_history_command(
 async def seed_congress_law_history_command(
     congress: int,
     force: bool = False,
+    concurrency: int = 8,
 ) -> int:
     """Seed bill actions and sponsors for all public laws in a congress.
 
     Args:
         congress: Congress number.
         force: If True, delete existing rows and re-fetch.
+        concurrency: Maximum laws fetched concurrently.
 
     Returns:
         0 on success, 1 on failure.
@@ -3340,7 +3572,9 @@ async def seed_congress_law_history_command(
     from pipeline.congress.law_history_ingestion import LawHistoryIngestionService
 
     async with async_session_maker() as session:
-        service = LawHistoryIngestionService(session, cache=_cli_cache)
+        service = LawHistoryIngestionService(
+            session, cache=_cli_cache, concurrency=concurrency
+        )
         log = await service.seed_congress(congress, force=force)
 
         if log.status in ("completed", "skipped"):
@@ -3359,10 +3593,13 @@ async def chrono_timeline_command(
 ) -> int:
     """Display the consolidated US Code timeline."""
     from app.models.base import async_session_maker
+    from pipeline.olrc.release_point import ReleasePointRegistry
     from pipeline.timeline import TimelineBuilder
 
     async with async_session_maker() as session:
-        builder = TimelineBuilder(session)
+        builder = TimelineBuilder(
+            session, registry=ReleasePointRegistry(cache=_cli_cache)
+        )
         events = await builder.build(
             start_congress=start_congress,
             end_congress=end_congress,
@@ -3402,7 +3639,7 @@ async def chrono_rps_only_command(
     """Display OLRC release points only (no database required)."""
     from pipeline.olrc.release_point import ReleasePointRegistry
 
-    registry = ReleasePointRegistry()
+    registry = ReleasePointRegistry(cache=_cli_cache)
     await registry.fetch_release_points()
 
     rps = [
@@ -3516,7 +3753,7 @@ async def chrono_bootstrap_command(
     fan_out_mode = task_index is not None and task_count is not None
 
     if release_point is None:
-        registry = ReleasePointRegistry()
+        registry = ReleasePointRegistry(cache=_cli_cache)
         rps = await registry.fetch_release_points()
         if not rps:
             logger.error("No release points found from OLRC.")
@@ -3524,7 +3761,11 @@ async def chrono_bootstrap_command(
         release_point = rps[0].full_identifier
         print(f"Auto-detected oldest release point: {release_point}")
 
-    downloader = OLRCDownloader(download_dir=download_dir, cache=_cli_cache)
+    # Titles are parsed straight from the cached ZIPs; extracting every title
+    # of a release point would double its disk footprint
+    downloader = OLRCDownloader(
+        download_dir=download_dir, cache=_cli_cache, extract=False
+    )
 
     async with async_session_maker() as session:
         service = BootstrapService(
@@ -3958,9 +4199,22 @@ def _print_section_state(
             print("  [No notes]")
 
 
+def _print_working_set_stats(stats: WorkingSetStats | None) -> None:
+    """Print section working-set counters from a play-forward run."""
+    if stats is None:
+        return
+    print(
+        f"  Working set:   {stats.hit_rate:.1%} hit rate "
+        f"({stats.hits} hits, {stats.misses} misses, "
+        f"{stats.evictions} evicted, {stats.resets} resets)"
+    )
+
+
 async def chrono_advance_command(
     count: int,
     download_dir: Path,
+    lookahead: int = 0,
+    working_set_size: int = 0,
 ) -> int:
     """Advance the timeline by processing the next N events."""
     from app.models.base import async_session_maker
@@ -3969,7 +4223,14 @@ async def chrono_advance_command(
     downloader = OLRCDownloader(download_dir=download_dir, cache=_cli_cache)
 
     async with async_session_maker() as session:
-        engine = PlayForwardEngine(session, downloader, cache=_cli_cache)
+        engine = PlayForwardEngine(
+            session,
+            downloader,
+            cache=_cli_cache,
+            session_factory=async_session_maker,
+            lookahead=lookahead,
+            working_set_size=working_set_size,
+        )
         try:
             result = await engine.advance(count=count)
         except RuntimeError as exc:
@@ -3982,6 +4243,7 @@ async def chrono_advance_command(
     print(f"  Laws failed:   {result.laws_failed}")
     print(f"  RPs ingested:  {result.rps_ingested}")
     print(f"  Revisions:     {result.revisions_created}")
+    _print_working_set_stats(result.working_set_stats)
     print(f"  Elapsed:       {result.elapsed_seconds:.1f}s")
 
     if result.checkpoint_result:
@@ -3993,6 +4255,8 @@ async def chrono_advance_command(
 async def chrono_advance_to_command(
     release_point: str,
     download_dir: Path,
+    lookahead: int = 0,
+    working_set_size: int = 0,
 ) -> int:
     """Advance through all events up to a target release point."""
     from app.models.base import async_session_maker
@@ -4001,7 +4265,14 @@ async def chrono_advance_to_command(
     downloader = OLRCDownloader(download_dir=download_dir, cache=_cli_cache)
 
     async with async_session_maker() as session:
-        engine = PlayForwardEngine(session, downloader, cache=_cli_cache)
+        engine = PlayForwardEngine(
+            session,
+            downloader,
+            cache=_cli_cache,
+            session_factory=async_session_maker,
+            lookahead=lookahead,
+            working_set_size=working_set_size,
+        )
         try:
             result = await engine.advance_to(release_point)
         except (RuntimeError, ValueError) as exc:
@@ -4016,6 +4287,7 @@ async def chrono_advance_to_command(
     print(f"  Laws failed:   {result.laws_failed}")
     print(f"  RPs ingested:  {result.rps_ingested}")
     print(f"  Revisions:     {result.revisions_created}")
+    _print_working_set_stats(result.working_set_stats)
     print(f"  Elapsed:       {result.elapsed_seconds:.1f}s")
 
     if result.checkpoint_result:
@@ -4075,6 +4347,64 @@ def _print_checkpoint_result(checkpoint) -> None:  # type: ignore[type-arg]
             print(f"      ... and {len(checkpoint.mismatches) - 30} more")
 
 
+async def export_static_command(
+    revision_id: int | None,
+    titles: list[int] | None,
+    output_dir: Path,
+    concurrency: int,
+) -> int:
+    """Render a static pre-rendered export of the Code at a revision."""
+    from app.models.base import async_session_maker
+    from pipeline.static_export import StaticExporter
+
+    exporter = StaticExporter(
+        async_session_maker, output_dir=output_dir, concurrency=concurrency
+    )
+    try:
+        result = await exporter.export(revision_id=revision_id, titles=titles)
+    except RuntimeError as exc:
+        logger.error(str(exc))
+        return 1
+
+    print(f"\nStatic export of revision {result.revision_id} -> {output_dir}:")
+    print(f"  Titles:     {result.titles_exported}")
+    print(f"  Sections:   {result.sections_exported}")
+    print(f"  Written:    {result.objects_written}")
+    print(f"  Unchanged:  {result.objects_unchanged}")
+    print(f"  Failed:     {len(result.failed_keys)}")
+    print(f"  Elapsed:    {result.elapsed_seconds:.1f}s")
+    for key in result.failed_keys[:20]:
+        print(f"    {key}")
+
+    return 1 if result.failed_keys else 0
+
+
+def cache_stats_command(cache: PipelineCache, reset: bool = False) -> int:
+    """Print local pipeline cache usage and accumulated lookup counters."""
+    totals = cache.save_stats()
+    used, units = cache.local_usage()
+    budget = cache.max_local_bytes
+
+    print(f"\nPipeline cache: {cache.local_root}")
+    if cache.bucket_name:
+        print(f"  Remote:     gs://{cache.bucket_name}")
+    print(f"  Local:      {used / 1e6:,.1f} MB in {units:,} entries")
+    if budget:
+        print(f"  Budget:     {budget / 1e6:,.1f} MB ({used / budget:.0%} used)")
+    else:
+        print("  Budget:     unbounded (set PIPELINE_CACHE_MAX_BYTES)")
+    print(f"  Local hits: {totals.hits:,}")
+    print(f"  GCS hits:   {totals.remote_hits:,}")
+    print(f"  Misses:     {totals.misses:,}")
+    print(f"  Hit rate:   {totals.hit_rate:.1%}")
+    print(f"  Evictions:  {totals.evictions:,} ({totals.evicted_bytes / 1e6:,.1f} MB)")
+
+    if reset:
+        cache.reset_stats()
+        print("\n  Counters reset.")
+    return 0
+
+
 async def seed_committees_command(
     yaml_path: Path | None = None,
     force: bool = False,
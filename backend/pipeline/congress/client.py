@@ -7,6 +7,8 @@ import contextlib
 import json
 import logging
 import re
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Any
@@ -36,6 +38,16 @@ CONGRESS_BASE_URL = "https://api.congress.gov/v3"
 # Source: https://api.congress.gov (maximum is 250, default is 20)
 DEFAULT_PAGE_SIZE = 250
 
+# The hourly request budget is per API key, so every client in the process
+# draws from one bucket by default. The burst lets short runs go at full
+# speed; sustained runs settle at the hourly rate.
+RATE_LIMIT_PER_HOUR = 5000
+RATE_LIMIT_BURST = 100
+
+# Pages of one listing fetched at once after the first page reports the
+# total count (requests still wait on the rate limiter)
+DEFAULT_PAGE_CONCURRENCY = 4
+
 
 def _safe_int(value: Any) -> int | None:
     """Safely convert a value to int, returning None if not possible."""
@@ -47,6 +59,36 @@ def _safe_int(value: Any) -> int | None:
         return None
 
 
+class RateLimiter:
+    """Token bucket shared by concurrent requests.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``.
+    ``acquire`` reserves a token even when the bucket is empty (the balance
+    goes negative) and sleeps until that reservation comes due, so waiters
+    are served in arrival order without a lock.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+_shared_rate_limiter = RateLimiter(RATE_LIMIT_PER_HOUR / 3600, RATE_LIMIT_BURST)
+
+
 @dataclass
 class MemberTerm:
     """A single term served by a member of Congress."""
@@ -532,6 +574,7 @@ class CongressClient:
         api_key: str | None = None,
         timeout: float = 30.0,
         cache: PipelineCache | None = None,
+        rate_limiter: RateLimiter | None = None,
     ):
         """Initialize the Congress.gov client.
 
@@ -540,6 +583,8 @@ class CongressClient:
                 (which loads from CONGRESS_API_KEY environment variable or .env).
             timeout: HTTP request timeout in seconds.
             cache: Optional PipelineCache for shared (GCS-backed) caching.
+            rate_limiter: Limiter every request waits on. Defaults to one
+                shared by all clients in the process.
 
         Raises:
             ValueError: If no API key is provided or found in settings.
@@ -560,7 +605,9 @@ class CongressClient:
         self.base_url = CONGRESS_BASE_URL
         self.max_retries = 3
         self.retry_delay = 2.0  # seconds
+        self.page_concurrency = DEFAULT_PAGE_CONCURRENCY
         self._cache = cache
+        self.rate_limiter = rate_limiter or _shared_rate_limiter
 
     async def _request_with_retry(
         self,
@@ -571,6 +618,8 @@ class CongressClient:
     ) -> httpx.Response:
         """Make HTTP request with retry logic for 5xx errors.
 
+        Every attempt, retries included, waits on the rate limiter first.
+
         Args:
             client: httpx AsyncClient instance.
             method: HTTP method (GET, POST, etc.).
@@ -587,6 +636,7 @@ class CongressClient:
 
         for attempt in range(self.max_retries):
             try:
+                await self.rate_limiter.acquire()
                 response = await client.request(method, url, **kwargs)
                 response.raise_for_status()
                 return response
@@ -618,6 +668,86 @@ class CongressClient:
             raise last_error
         raise RuntimeError("Unexpected error in retry logic")
 
+    async def _paginate(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        items: Callable[[dict[str, Any]], list[dict[str, Any]]],
+        description: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        limit: int | None = None,
+        missing_ok: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Fetch every page of an offset-paginated listing.
+
+        The first page reports ``pagination.count``; the remaining offsets
+        (only those below ``limit``, if given) are then fetched
+        concurrently, up to ``page_concurrency`` at a time. If one page
+        fails the others are cancelled and the error is raised.
+
+        Args:
+            client: httpx AsyncClient instance.
+            url: Listing URL.
+            items: Extracts the page's items from its JSON body.
+            description: What is being fetched, for log messages.
+            params: Extra query parameters.
+            page_size: Number of results per page (max 250).
+            limit: Maximum total results to return (optional).
+            missing_ok: If True, a 404 is an empty page instead of an error.
+
+        Returns:
+            Raw items of every page, in offset order.
+        """
+
+        async def _page(offset: int) -> dict[str, Any]:
+            page_params: dict[str, Any] = {
+                "api_key": self.api_key,
+                "format": "json",
+                "limit": page_size,
+                "offset": offset,
+                **(params or {}),
+            }
+            logger.info(f"Fetching {description} (offset={offset})")
+            try:
+                response = await self._request_with_retry(
+                    client, "GET", url, params=page_params
+                )
+            except httpx.HTTPStatusError as e:
+                if missing_ok and e.response.status_code == 404:
+                    return {}
+                raise
+            data: dict[str, Any] = response.json()
+            return data
+
+        first = await _page(0)
+        results = items(first)
+        if not results:
+            return []
+
+        count = first.get("pagination", {}).get("count", 0)
+        total = count if limit is None else min(count, limit)
+        offsets = range(page_size, total, page_size)
+        if offsets:
+            sem = asyncio.Semaphore(self.page_concurrency)
+
+            async def _bounded(offset: int) -> dict[str, Any]:
+                async with sem:
+                    return await _page(offset)
+
+            tasks = [asyncio.ensure_future(_bounded(o)) for o in offsets]
+            try:
+                pages = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            for data in pages:
+                results.extend(items(data))
+
+        return results if limit is None else results[:limit]
+
     async def get_members(
         self,
         current_member: bool | None = None,
@@ -634,45 +764,22 @@ class CongressClient:
         Returns:
             List of MemberInfo objects.
         """
-        results: list[MemberInfo] = []
-        offset = 0
+        params: dict[str, Any] = {}
+        if current_member is not None:
+            params["currentMember"] = str(current_member).lower()
 
+        url = f"{self.base_url}/member"
         async with httpx.AsyncClient(timeout=self.timeout) as client:
-            while True:
-                params: dict[str, Any] = {
-                    "api_key": self.api_key,
-                    "format": "json",
-                    "limit": page_size,
-                    "offset": offset,
-                }
-                if current_member is not None:
-                    params["currentMember"] = str(current_member).lower()
-
-                url = f"{self.base_url}/member"
-                logger.info(f"Fetching members from {url} (offset={offset})")
-                response = await self._request_with_retry(
-                    client, "GET", url, params=params
-                )
-                data = response.json()
-
-                # Parse members
-                members = data.get("members", [])
-                for member_data in members:
-                    info = MemberInfo.from_api_response(member_data)
-                    results.append(info)
-
-                # Check if we've hit the limit
-                if limit and len(results) >= limit:
-                    results = results[:limit]
-                    break
-
-                # Check for more pages
-                pagination = data.get("pagination", {})
-                count = pagination.get("count", 0)
-                if offset + page_size >= count or not members:
-                    break
-
-                offset += page_size
+            members = await self._paginate(
+                client,
+                url,
+                lambda data: data.get("members", []),
+                f"members from {url}",
+                params=params,
+                page_size=page_size,
+                limit=limit,
+            )
+        results = [MemberInfo.from_api_response(m) for m in members]
 
         logger.info(f"Fetched {len(results)} members")
         return results
@@ -694,39 +801,16 @@ class CongressClient:
         Returns:
             List of MemberInfo objects.
         """
-        results: list[MemberInfo] = []
-        offset = 0
-
         async with httpx.AsyncClient(timeout=self.timeout) as client:
-            while True:
-                params: dict[str, Any] = {
-                    "api_key": self.api_key,
-                    "format": "json",
-                    "limit": page_size,
-                    "offset": offset,
-                    "currentMember": str(current_member).lower(),
-                }
-
-                url = f"{self.base_url}/member/congress/{congress}"
-                logger.info(f"Fetching Congress {congress} members (offset={offset})")
-                response = await self._request_with_retry(
-                    client, "GET", url, params=params
-                )
-                data = response.json()
-
-                # Parse members
-                members = data.get("members", [])
-                for member_data in members:
-                    info = MemberInfo.from_api_response(member_data)
-                    results.append(info)
-
-                # Check for more pages
-                pagination = data.get("pagination", {})
-                count = pagination.get("count", 0)
-                if offset + page_size >= count or not members:
-                    break
-
-                offset += page_size
+            members = await self._paginate(
+                client,
+                f"{self.base_url}/member/congress/{congress}",
+                lambda data: data.get("members", []),
+                f"Congress {congress} members",
+                params={"currentMember": str(current_member).lower()},
+                page_size=page_size,
+            )
+        results = [MemberInfo.from_api_response(m) for m in members]
 
         logger.info(f"Fetched {len(results)} members for Congress {congress}")
         return results
@@ -744,7 +828,7 @@ class CongressClient:
 
         # Check cache
         if self._cache:
-            cached = self._cache.get_text(cache_key)
+            cached = await self._cache.aget_text(cache_key)
             if cached is not None:
                 logger.info(f"Using cached member detail for {bioguide_id}")
                 return MemberDetail.from_api_response(json.loads(cached))
@@ -761,7 +845,7 @@ class CongressClient:
 
         # Write to cache
         if self._cache:
-            self._cache.put_text(cache_key, json.dumps(member_data))
+            await self._cache.aput_text(cache_key, json.dumps(member_data))
 
         return MemberDetail.from_api_response(member_data)
 
@@ -785,7 +869,6 @@ class CongressClient:
         # Get bill details for sponsor
         url = f"{self.base_url}/bill/{congress}/{bill_type.lower()}/{bill_number}"
         sponsor: SponsorInfo | None = None
-        cosponsors: list[SponsorInfo] = []
 
         async with httpx.AsyncClient(timeout=self.timeout) as client:
             # Fetch bill details (includes sponsor)
@@ -800,30 +883,13 @@ class CongressClient:
                 sponsor = SponsorInfo.from_api_response(sponsors_data[0])
 
             # Fetch cosponsors
-            cosponsors_url = f"{url}/cosponsors"
-            offset = 0
-            while True:
-                params = {
-                    "api_key": self.api_key,
-                    "format": "json",
-                    "limit": DEFAULT_PAGE_SIZE,
-                    "offset": offset,
-                }
-                response = await self._request_with_retry(
-                    client, "GET", cosponsors_url, params=params
-                )
-                data = response.json()
-
-                cosponsors_data = data.get("cosponsors", [])
-                for cosponsor_data in cosponsors_data:
-                    cosponsors.append(SponsorInfo.from_api_response(cosponsor_data))
-
-                # Check for more pages
-                pagination = data.get("pagination", {})
-                count = pagination.get("count", 0)
-                if offset + DEFAULT_PAGE_SIZE >= count or not cosponsors_data:
-                    break
-                offset += DEFAULT_PAGE_SIZE
+            cosponsors_data = await self._paginate(
+                client,
+                f"{url}/cosponsors",
+                lambda data: data.get("cosponsors", []),
+                f"cosponsors for {congress}/{bill_type}/{bill_number}",
+            )
+            cosponsors = [SponsorInfo.from_api_response(c) for c in cosponsors_data]
 
         logger.info(
             f"Fetched sponsor and {len(cosponsors)} cosponsors "
@@ -887,35 +953,15 @@ class CongressClient:
         url = (
             f"{self.base_url}/bill/{congress}/{bill_type.lower()}/{bill_number}/actions"
         )
-        results: list[BillAction] = []
-        offset = 0
-
         async with httpx.AsyncClient(timeout=self.timeout) as client:
-            while True:
-                params: dict[str, Any] = {
-                    "api_key": self.api_key,
-                    "format": "json",
-                    "limit": page_size,
-                    "offset": offset,
-                }
-                logger.info(
-                    f"Fetching bill actions for {congress}/{bill_type}/{bill_number} "
-                    f"(offset={offset})"
-                )
-                response = await self._request_with_retry(
-                    client, "GET", url, params=params
-                )
-                data = response.json()
-
-                actions = data.get("actions", [])
-                for action_data in actions:
-                    results.append(BillAction.from_api_response(action_data))
-
-                pagination = data.get("pagination", {})
-                count = pagination.get("count", 0)
-                if offset + page_size >= count or not actions:
-                    break
-                offset += page_size
+            actions = await self._paginate(
+                client,
+                url,
+                lambda data: data.get("actions", []),
+                f"bill actions for {congress}/{bill_type}/{bill_number}",
+                page_size=page_size,
+            )
+        results = [BillAction.from_api_response(a) for a in actions]
 
         logger.info(
             f"Fetched {len(results)} actions for {bill_type.upper()} {bill_number}"
@@ -949,48 +995,23 @@ class CongressClient:
             )
             return []
 
-        results: list[HouseVoteInfo] = []
-        offset = 0
+        # Build URL based on whether session is specified
+        if session:
+            url = f"{self.base_url}/house-vote/{congress}/{session}"
+        else:
+            url = f"{self.base_url}/house-vote/{congress}"
 
         async with httpx.AsyncClient(timeout=self.timeout) as client:
-            while True:
-                params: dict[str, Any] = {
-                    "api_key": self.api_key,
-                    "format": "json",
-                    "limit": page_size,
-                    "offset": offset,
-                }
-
-                # Build URL based on whether session is specified
-                if session:
-                    url = f"{self.base_url}/house-vote/{congress}/{session}"
-                else:
-                    url = f"{self.base_url}/house-vote/{congress}"
-
-                logger.info(f"Fetching House votes from {url} (offset={offset})")
-                response = await self._request_with_retry(
-                    client, "GET", url, params=params
-                )
-                data = response.json()
-
-                # Parse votes (API returns "houseRollCallVotes")
-                votes = data.get("houseRollCallVotes", [])
-                for vote_data in votes:
-                    info = HouseVoteInfo.from_api_response(vote_data)
-                    results.append(info)
-
-                # Check if we've hit the limit
-                if limit and len(results) >= limit:
-                    results = results[:limit]
-                    break
-
-                # Check for more pages
-                pagination = data.get("pagination", {})
-                count = pagination.get("count", 0)
-                if offset + page_size >= count or not votes:
-                    break
-
-                offset += page_size
+            # API returns "houseRollCallVotes"
+            votes = await self._paginate(
+                client,
+                url,
+                lambda data: data.get("houseRollCallVotes", []),
+                f"House votes from {url}",
+                page_size=page_size,
+                limit=limit,
+            )
+        results = [HouseVoteInfo.from_api_response(v) for v in votes]
 
         logger.info(f"Fetched {len(results)} House votes for Congress {congress}")
         return results
@@ -1042,40 +1063,18 @@ class CongressClient:
             List of MemberVoteInfo objects.
         """
         url = f"{self.base_url}/house-vote/{congress}/{session}/{roll_number}/members"
-        results: list[MemberVoteInfo] = []
-        offset = 0
-
         async with httpx.AsyncClient(timeout=self.timeout) as client:
-            while True:
-                params: dict[str, Any] = {
-                    "api_key": self.api_key,
-                    "format": "json",
-                    "limit": page_size,
-                    "offset": offset,
-                }
-
-                logger.info(
-                    f"Fetching member votes for {congress}/{session}/{roll_number} (offset={offset})"
-                )
-                response = await self._request_with_retry(
-                    client, "GET", url, params=params
-                )
-                data = response.json()
-
-                # Parse member votes (nested in houseRollCallVoteMemberVotes.results)
-                vote_data = data.get("houseRollCallVoteMemberVotes", {})
-                members = vote_data.get("results", [])
-                for member_data in members:
-                    info = MemberVoteInfo.from_api_response(member_data)
-                    results.append(info)
-
-                # Check for more pages
-                pagination = data.get("pagination", {})
-                count = pagination.get("count", 0)
-                if offset + page_size >= count or not members:
-                    break
-
-                offset += page_size
+            # Member votes are nested in houseRollCallVoteMemberVotes.results
+            members = await self._paginate(
+                client,
+                url,
+                lambda data: data.get("houseRollCallVoteMemberVotes", {}).get(
+                    "results", []
+                ),
+                f"member votes for {congress}/{session}/{roll_number}",
+                page_size=page_size,
+            )
+        results = [MemberVoteInfo.from_api_response(m) for m in members]
 
         logger.info(f"Fetched {len(results)} member votes")
         return results
@@ -1099,40 +1098,16 @@ class CongressClient:
             List of BillAmendment objects.
         """
         url = f"{self.base_url}/bill/{congress}/{bill_type.lower()}/{bill_number}/amendments"
-        results: list[BillAmendment] = []
-        offset = 0
-
         async with httpx.AsyncClient(timeout=self.timeout) as client:
-            while True:
-                params: dict[str, Any] = {
-                    "api_key": self.api_key,
-                    "format": "json",
-                    "limit": page_size,
-                    "offset": offset,
-                }
-                logger.info(
-                    f"Fetching amendments for {congress}/{bill_type}/{bill_number} "
-                    f"(offset={offset})"
-                )
-                try:
-                    response = await self._request_with_retry(
-                        client, "GET", url, params=params
-                    )
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 404:
-                        break
-                    raise
-                data = response.json()
-
-                amendments = data.get("amendments", [])
-                for item in amendments:
-                    results.append(BillAmendment.from_api_response(item))
-
-                pagination = data.get("pagination", {})
-                count = pagination.get("count", 0)
-                if offset + page_size >= count or not amendments:
-                    break
-                offset += page_size
+            amendments = await self._paginate(
+                client,
+                url,
+                lambda data: data.get("amendments", []),
+                f"amendments for {congress}/{bill_type}/{bill_number}",
+                page_size=page_size,
+                missing_ok=True,
+            )
+        results = [BillAmendment.from_api_response(a) for a in amendments]
 
         logger.info(
             f"Fetched {len(results)} amendments for {bill_type.upper()} {bill_number}"
@@ -1159,39 +1134,15 @@ class CongressClient:
             f"{self.base_url}/bill/{congress}/{bill_type.lower()}/{bill_number}"
             "/costestimates"
         )
-        results: list[CBOEstimate] = []
-        offset = 0
-
         async with httpx.AsyncClient(timeout=self.timeout) as client:
-            while True:
-                params: dict[str, Any] = {
-                    "api_key": self.api_key,
-                    "format": "json",
-                    "limit": DEFAULT_PAGE_SIZE,
-                    "offset": offset,
-                }
-                logger.info(
-                    f"Fetching CBO estimates for {congress}/{bill_type}/{bill_number}"
-                )
-                try:
-                    response = await self._request_with_retry(
-                        client, "GET", url, params=params
-                    )
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 404:
-                        break
-                    raise
-                data = response.json()
-
-                estimates = data.get("costEstimates", [])
-                for item in estimates:
-                    results.append(CBOEstimate.from_api_response(item))
-
-                pagination = data.get("pagination", {})
-                count = pagination.get("count", 0)
-                if offset + DEFAULT_PAGE_SIZE >= count or not estimates:
-                    break
-                offset += DEFAULT_PAGE_SIZE
+            estimates = await self._paginate(
+                client,
+                url,
+                lambda data: data.get("costEstimates", []),
+                f"CBO estimates for {congress}/{bill_type}/{bill_number}",
+                missing_ok=True,
+            )
+        results = [CBOEstimate.from_api_response(e) for e in estimates]
 
         logger.info(
             f"Fetched {len(results)} CBO estimates for {bill_type.upper()} {bill_number}"
@@ -1220,40 +1171,16 @@ class CongressClient:
             f"{self.base_url}/bill/{congress}/{bill_type.lower()}/{bill_number}"
             "/relatedbills"
         )
-        results: list[RelatedBill] = []
-        offset = 0
-
         async with httpx.AsyncClient(timeout=self.timeout) as client:
-            while True:
-                params: dict[str, Any] = {
-                    "api_key": self.api_key,
-                    "format": "json",
-                    "limit": page_size,
-                    "offset": offset,
-                }
-                logger.info(
-                    f"Fetching related bills for {congress}/{bill_type}/{bill_number} "
-                    f"(offset={offset})"
-                )
-                try:
-                    response = await self._request_with_retry(
-                        client, "GET", url, params=params
-                    )
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 404:
-                        break
-                    raise
-                data = response.json()
-
-                related = data.get("relatedBills", [])
-                for item in related:
-                    results.append(RelatedBill.from_api_response(item))
-
-                pagination = data.get("pagination", {})
-                count = pagination.get("count", 0)
-                if offset + page_size >= count or not related:
-                    break
-                offset += page_size
+            related = await self._paginate(
+                client,
+                url,
+                lambda data: data.get("relatedBills", []),
+                f"related bills for {congress}/{bill_type}/{bill_number}",
+                page_size=page_size,
+                missing_ok=True,
+            )
+        results = [RelatedBill.from_api_response(r) for r in related]
 
         logger.info(
             f"Fetched {len(results)} related bills for {bill_type.upper()} {bill_number}"
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import date, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import DataIngestionLog, Legislator, LegislatorTerm
@@ -76,14 +78,129 @@ def _year_to_date(year: int | None, month: int = 1, day: int = 1) -> date | None
     return date(year, month, day)
 
 
+# Member details fetched at once. Requests also wait on the client's rate
+# limiter, which is shared with every other Congress.gov client.
+DEFAULT_FETCH_CONCURRENCY = 8
+
+# Legislators per INSERT ... ON CONFLICT statement (terms follow their batch).
+UPSERT_BATCH_SIZE = 100
+
+_LEGISLATOR_UPDATE_COLUMNS = (
+    "first_name",
+    "middle_name",
+    "last_name",
+    "suffix",
+    "full_name",
+    "party",
+    "state",
+    "district",
+    "current_chamber",
+    "is_current_member",
+    "first_served",
+    "last_served",
+    "photo_url",
+    "official_website",
+    "birth_date",
+    "death_date",
+)
+
+
+def _legislator_row(detail: MemberDetail) -> dict[str, Any]:
+    """Build the ``legislator`` row for a member detail.
+
+    Args:
+        detail: Parsed member detail from Congress.gov.
+
+    Returns:
+        Column values keyed by column name.
+    """
+    # Current chamber, state and district come from the most recent term.
+    # Note: detail.state returns full name (e.g., "Ohio"), but we need 2-letter code
+    current_chamber: Chamber | None = None
+    state: str | None = None
+    district: str | None = None
+    if detail.terms:
+        latest = max(detail.terms, key=lambda t: t.start_year or 0)
+        current_chamber = _parse_chamber(latest.chamber)
+        state = latest.state  # This is the 2-letter code
+        if latest.district is not None:
+            district = str(latest.district)
+
+    # Calculate first/last served dates from terms; a current member with
+    # no end year yet has no last_served date
+    start_years = [t.start_year for t in detail.terms if t.start_year]
+    end_years = [t.end_year for t in detail.terms if t.end_year]
+    first_served = _year_to_date(min(start_years)) if start_years else None
+    last_served = _year_to_date(max(end_years), 12, 31) if end_years else None
+
+    return {
+        "bioguide_id": detail.bioguide_id,
+        "first_name": detail.first_name,
+        "middle_name": detail.middle_name,
+        "last_name": detail.last_name,
+        "suffix": detail.suffix,
+        "full_name": detail.direct_order_name,
+        "party": _parse_party(detail.party_name),
+        "state": state,
+        "district": district,
+        "current_chamber": current_chamber,
+        "is_current_member": detail.current_member,
+        "first_served": first_served,
+        "last_served": last_served,
+        "photo_url": detail.depiction_url,
+        "official_website": detail.official_website_url,
+        "birth_date": _year_to_date(detail.birth_year),
+        "death_date": _year_to_date(detail.death_year),
+    }
+
+
+def _term_rows(
+    legislator_id: int,
+    state: str | None,
+    terms: list[MemberTerm],
+) -> list[dict[str, Any]]:
+    """Build the ``legislator_term`` rows for a legislator.
+
+    Args:
+        legislator_id: The Legislator record ID.
+        state: The legislator's current state, used when a term has none.
+        terms: List of MemberTerm objects from the API.
+
+    Returns:
+        Column values for each term that has a start year.
+    """
+    return [
+        {
+            "legislator_id": legislator_id,
+            "chamber": _parse_chamber(term.chamber),
+            "state": term.state or state or "XX",
+            "district": str(term.district) if term.district is not None else None,
+            "party": _parse_party(None) or PoliticalParty.OTHER,
+            "start_date": _year_to_date(term.start_year) or date(1970, 1, 1),
+            "end_date": (
+                _year_to_date(term.end_year, 12, 31) if term.end_year else None
+            ),
+            "congress": term.congress,
+        }
+        for term in terms
+        if term.start_year
+    ]
+
+
 class LegislatorIngestionService:
-    """Service for ingesting legislator data into the database."""
+    """Service for ingesting legislator data into the database.
+
+    Member details are fetched concurrently (bounded by ``concurrency`` and
+    the client's rate limiter) and written with batched
+    ``INSERT ... ON CONFLICT`` upserts keyed on ``bioguide_id``.
+    """
 
     def __init__(
         self,
         session: AsyncSession,
         api_key: str | None = None,
         cache: PipelineCache | None = None,
+        concurrency: int = DEFAULT_FETCH_CONCURRENCY,
     ):
         """Initialize the ingestion service.
 
@@ -91,9 +208,11 @@ class LegislatorIngestionService:
             session: SQLAlchemy async session.
             api_key: Congress.gov API key (or set CONGRESS_API_KEY env var).
             cache: Optional PipelineCache for shared caching.
+            concurrency: Maximum member detail requests in flight.
         """
         self.session = session
         self.client = CongressClient(api_key=api_key, cache=cache)
+        self.concurrency = max(1, concurrency)
 
     async def ingest_member(
         self,
@@ -120,13 +239,15 @@ class LegislatorIngestionService:
 
         try:
             detail = await self.client.get_member_detail(bioguide_id)
-            was_created = await self._upsert_legislator(detail, force)
+            existing = await self._existing_legislators([bioguide_id])
+            if force or not existing:
+                await self._upsert_legislators([detail])
 
             log.status = "completed"
             log.completed_at = datetime.utcnow()
             log.records_processed = 1
-            log.records_created = 1 if was_created is True else 0
-            log.records_updated = 1 if was_created is False else 0
+            log.records_created = 0 if existing else 1
+            log.records_updated = 1 if existing and force else 0
             log.details = f"{detail.direct_order_name} ({bioguide_id})"
 
             await self.session.commit()
@@ -172,31 +293,9 @@ class LegislatorIngestionService:
             )
             logger.info(f"Found {len(members)} members for Congress {congress}")
 
-            created = 0
-            updated = 0
-            skipped = 0
-
-            for member_info in members:
-                try:
-                    # Get detailed info for each member
-                    detail = await self.client.get_member_detail(
-                        member_info.bioguide_id
-                    )
-
-                    # Upsert the legislator
-                    was_created = await self._upsert_legislator(detail, force)
-                    if was_created is True:
-                        created += 1
-                    elif was_created is False:
-                        updated += 1
-                    else:
-                        skipped += 1
-
-                except Exception as e:
-                    logger.error(
-                        f"Error ingesting member {member_info.bioguide_id}: {e}"
-                    )
-                    continue
+            created, updated, skipped = await self._ingest_members(
+                [m.bioguide_id for m in members], force
+            )
 
             log.status = "completed"
             log.completed_at = datetime.utcnow()
@@ -247,27 +346,9 @@ class LegislatorIngestionService:
             members = await self.client.get_members(current_member=True)
             logger.info(f"Found {len(members)} current members")
 
-            created = 0
-            updated = 0
-            skipped = 0
-
-            for member_info in members:
-                try:
-                    detail = await self.client.get_member_detail(
-                        member_info.bioguide_id
-                    )
-                    was_created = await self._upsert_legislator(detail, force)
-                    if was_created is True:
-                        created += 1
-                    elif was_created is False:
-                        updated += 1
-                    else:
-                        skipped += 1
-                except Exception as e:
-                    logger.error(
-                        f"Error ingesting member {member_info.bioguide_id}: {e}"
-                    )
-                    continue
+            created, updated, _ = await self._ingest_members(
+                [m.bioguide_id for m in members], force
+            )
 
             log.status = "completed"
             log.completed_at = datetime.utcnow()
@@ -289,169 +370,112 @@ class LegislatorIngestionService:
             await self.session.commit()
             return log
 
-    async def _upsert_legislator(
+    async def _ingest_members(
         self,
-        detail: MemberDetail,
-        force: bool = False,
-    ) -> bool | None:
-        """Insert or update a Legislator record.
+        bioguide_ids: list[str],
+        force: bool,
+    ) -> tuple[int, int, int]:
+        """Fetch and upsert a list of members.
+
+        Existing legislators are looked up in one query first; without
+        ``force`` their details are not fetched at all. Members whose
+        detail request fails are logged and left out of every count.
 
         Args:
-            detail: Parsed member detail from Congress.gov.
+            bioguide_ids: Bioguide IDs to ingest.
             force: If True, update existing records.
 
         Returns:
-            True if created, False if updated, None if skipped.
+            Tuple of (created, updated, skipped) counts.
         """
-        # Check for existing record
+        bioguide_ids = list(dict.fromkeys(bioguide_ids))
+        existing = await self._existing_legislators(bioguide_ids)
+        to_fetch = [b for b in bioguide_ids if force or b not in existing]
+
+        details = await self._fetch_details(to_fetch)
+        await self._upsert_legislators(details)
+
+        updated = sum(1 for d in details if d.bioguide_id in existing)
+        return len(details) - updated, updated, len(bioguide_ids) - len(to_fetch)
+
+    async def _existing_legislators(self, bioguide_ids: list[str]) -> dict[str, int]:
+        """Map the given Bioguide IDs that already exist to legislator IDs."""
+        if not bioguide_ids:
+            return {}
         result = await self.session.execute(
-            select(Legislator).where(Legislator.bioguide_id == detail.bioguide_id)
-        )
-        existing = result.scalar_one_or_none()
-
-        if existing and not force:
-            return None  # Skipped
-
-        # Parse party
-        party = _parse_party(detail.party_name)
-
-        # Determine current chamber from most recent term
-        current_chamber: Chamber | None = None
-        if detail.terms:
-            # Sort terms by start year descending to get most recent
-            sorted_terms = sorted(
-                detail.terms,
-                key=lambda t: t.start_year or 0,
-                reverse=True,
+            select(Legislator.bioguide_id, Legislator.legislator_id).where(
+                Legislator.bioguide_id.in_(bioguide_ids)
             )
-            if sorted_terms:
-                current_chamber = _parse_chamber(sorted_terms[0].chamber)
-
-        # Calculate first/last served dates from terms
-        first_served: date | None = None
-        last_served: date | None = None
-        if detail.terms:
-            start_years = [t.start_year for t in detail.terms if t.start_year]
-            end_years = [t.end_year for t in detail.terms if t.end_year]
-            if start_years:
-                first_served = _year_to_date(min(start_years))
-            if end_years:
-                last_served = _year_to_date(max(end_years), 12, 31)
-            elif detail.current_member and start_years:
-                # Current member, no end year yet
-                last_served = None
-
-        # Extract state/district from most recent term
-        # Note: detail.state returns full name (e.g., "Ohio"), but we need 2-letter code
-        state: str | None = None
-        district: str | None = None
-        if detail.terms:
-            sorted_terms = sorted(
-                detail.terms,
-                key=lambda t: t.start_year or 0,
-                reverse=True,
-            )
-            if sorted_terms:
-                state = sorted_terms[0].state  # This is the 2-letter code
-                if sorted_terms[0].district is not None:
-                    district = str(sorted_terms[0].district)
-
-        if existing:
-            # Update existing record
-            existing.first_name = detail.first_name
-            existing.middle_name = detail.middle_name
-            existing.last_name = detail.last_name
-            existing.suffix = detail.suffix
-            existing.full_name = detail.direct_order_name
-            existing.party = party
-            existing.state = state
-            existing.district = district
-            existing.current_chamber = current_chamber
-            existing.is_current_member = detail.current_member
-            existing.first_served = first_served
-            existing.last_served = last_served
-            existing.photo_url = detail.depiction_url
-            existing.official_website = detail.official_website_url
-            existing.birth_date = _year_to_date(detail.birth_year)
-            existing.death_date = _year_to_date(detail.death_year)
-
-            # Update terms
-            await self._sync_terms(existing, detail.terms)
-
-            return False  # Updated
-
-        # Create new record
-        legislator = Legislator(
-            bioguide_id=detail.bioguide_id,
-            first_name=detail.first_name,
-            middle_name=detail.middle_name,
-            last_name=detail.last_name,
-            suffix=detail.suffix,
-            full_name=detail.direct_order_name,
-            party=party,
-            state=state,
-            district=district,
-            current_chamber=current_chamber,
-            is_current_member=detail.current_member,
-            first_served=first_served,
-            last_served=last_served,
-            photo_url=detail.depiction_url,
-            official_website=detail.official_website_url,
-            birth_date=_year_to_date(detail.birth_year),
-            death_date=_year_to_date(detail.death_year),
         )
-        self.session.add(legislator)
-        await self.session.flush()
+        return dict(result.all())
 
-        # Add terms
-        await self._add_terms(legislator, detail.terms)
-
-        return True  # Created
-
-    async def _add_terms(
-        self,
-        legislator: Legislator,
-        terms: list[MemberTerm],
-    ) -> None:
-        """Add terms for a legislator.
+    async def _fetch_details(self, bioguide_ids: list[str]) -> list[MemberDetail]:
+        """Fetch member details concurrently, dropping (and logging) failures.
 
         Args:
-            legislator: The Legislator record.
-            terms: List of MemberTerm objects from the API.
+            bioguide_ids: Bioguide IDs to fetch.
+
+        Returns:
+            Details in the order of ``bioguide_ids``.
         """
-        for term in terms:
-            if not term.start_year:
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def _fetch(bioguide_id: str) -> MemberDetail:
+            async with sem:
+                return await self.client.get_member_detail(bioguide_id)
+
+        results = await asyncio.gather(
+            *[_fetch(b) for b in bioguide_ids], return_exceptions=True
+        )
+
+        details: list[MemberDetail] = []
+        for bioguide_id, result in zip(bioguide_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Error ingesting member {bioguide_id}: {result}")
                 continue
+            details.append(result)
+        return details
 
-            term_record = LegislatorTerm(
-                legislator_id=legislator.legislator_id,
-                chamber=_parse_chamber(term.chamber),
-                state=term.state or legislator.state or "XX",
-                district=str(term.district) if term.district is not None else None,
-                party=_parse_party(None) or PoliticalParty.OTHER,
-                start_date=_year_to_date(term.start_year) or date(1970, 1, 1),
-                end_date=(
-                    _year_to_date(term.end_year, 12, 31) if term.end_year else None
-                ),
-                congress=term.congress,
-            )
-            self.session.add(term_record)
+    async def _upsert_legislators(self, details: list[MemberDetail]) -> None:
+        """Insert or update Legislator records and replace their terms.
 
-    async def _sync_terms(
-        self,
-        legislator: Legislator,
-        terms: list[MemberTerm],
-    ) -> None:
-        """Sync terms for an existing legislator (delete and re-add).
+        Each batch is one ``INSERT ... ON CONFLICT (bioguide_id) DO UPDATE``
+        returning the legislator IDs, one ``DELETE`` of the batch's terms
+        and one multi-row ``INSERT`` of the new terms. Terms have no
+        natural key, so they are replaced rather than upserted.
 
         Args:
-            legislator: The Legislator record.
-            terms: List of MemberTerm objects from the API.
+            details: Parsed member details from Congress.gov.
         """
-        # Delete existing terms
-        for existing_term in legislator.terms:
-            await self.session.delete(existing_term)
-        await self.session.flush()
-
-        # Add new terms
-        await self._add_terms(legislator, terms)
+        # One row per member: a statement may not touch the same row twice
+        unique = list({d.bioguide_id: d for d in details}.values())
+
+        for start in range(0, len(unique), UPSERT_BATCH_SIZE):
+            batch = unique[start : start + UPSERT_BATCH_SIZE]
+            rows = [_legislator_row(d) for d in batch]
+
+            stmt = insert(Legislator).values(rows)
+            upsert = stmt.on_conflict_do_update(
+                index_elements=["bioguide_id"],
+                set_={
+                    **{col: stmt.excluded[col] for col in _LEGISLATOR_UPDATE_COLUMNS},
+                    "updated_at": datetime.utcnow(),
+                },
+            ).returning(Legislator.bioguide_id, Legislator.legislator_id)
+            result = await self.session.execute(upsert)
+            ids: dict[str, int] = dict(result.all())
+
+            await self.session.execute(
+                delete(LegislatorTerm).where(
+                    LegislatorTerm.legislator_id.in_(list(ids.values()))
+                )
+            )
+            term_rows = [
+                term_row
+                for detail, row in zip(batch, rows, strict=True)
+                for term_row in _term_rows(
+                    ids[detail.bioguide_id], row["state"], detail.terms
+                )
+            ]
+            if term_rows:
+                await self.session.execute(insert(LegislatorTerm).values(term_rows))
@@ -7,10 +7,11 @@ from the DB instead of hitting the live API on every request.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -28,6 +29,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Laws fetched at once by seed_congress. Requests also wait on the Congress.gov
+# client's rate limiter, so a full Congress runs at the API's hourly budget.
+DEFAULT_SEED_CONCURRENCY = 8
+
+# Laws written per transaction by seed_congress
+SEED_WRITE_BATCH = 50
+
+# Rows for one law: (law_bill_action rows, law_sponsor rows)
+HistoryRows = tuple[list[dict[str, Any]], list[dict[str, Any]]]
+
 
 class LawHistoryIngestionService:
     """Fetches and persists legislative history (actions + sponsors) for public laws."""
@@ -36,9 +47,11 @@ class LawHistoryIngestionService:
         self,
         session: AsyncSession,
         cache: PipelineCache | None = None,
+        concurrency: int = DEFAULT_SEED_CONCURRENCY,
     ) -> None:
         self.session = session
         self.cache = cache
+        self.concurrency = max(1, concurrency)
 
     async def seed_law(
         self,
@@ -76,7 +89,7 @@ class LawHistoryIngestionService:
 
             # Skip if already seeded and not forced
             if not force:
-                existing = await self._count_existing(law.law_id)
+                existing = (await self._count_existing([law.law_id])).get(law.law_id, 0)
                 if existing > 0:
                     log.status = "skipped"
                     log.details = (
@@ -101,29 +114,16 @@ class LawHistoryIngestionService:
                 await self.session.commit()
                 return log
 
-            bill_type, bill_number_int = bill_ref
-
-            # Delete existing rows if forcing
-            if force:
-                await self.session.execute(
-                    delete(LawBillAction).where(LawBillAction.law_id == law.law_id)
-                )
-                await self.session.execute(
-                    delete(LawSponsor).where(LawSponsor.law_id == law.law_id)
-                )
-
-            actions_created = await self._ingest_actions(
-                law.law_id, congress, bill_type, bill_number_int, congress_client
-            )
-            sponsors_created = await self._ingest_sponsors(
-                law.law_id, congress, bill_type, bill_number_int, congress_client
+            actions, sponsors = await self._fetch_rows(
+                law.law_id, congress, *bill_ref, congress_client
             )
+            await self._write_rows([law.law_id], actions, sponsors, replace=force)
 
-            total = actions_created + sponsors_created
+            total = len(actions) + len(sponsors)
             log.status = "completed"
             log.records_processed = total
             log.records_created = total
-            log.details = f"{actions_created} actions, {sponsors_created} sponsors"
+            log.details = f"{len(actions)} actions, {len(sponsors)} sponsors"
             await self.session.commit()
 
         except Exception as exc:
@@ -145,6 +145,15 @@ class LawHistoryIngestionService:
     ) -> DataIngestionLog:
         """Seed bill actions and sponsors for all laws in a congress.
 
+        Already-seeded laws are found with one grouped count and skipped
+        unless forced. The rest are fetched concurrently (up to
+        ``concurrency`` laws at once, each fetching actions and sponsors
+        together), then written from this session in batches of
+        ``SEED_WRITE_BATCH`` laws with one bulk insert per table. Each
+        seeded law still gets its own DataIngestionLog, and failures are
+        reported per law: a batch that fails to write is retried one law at
+        a time.
+
         Args:
             congress: Congress number.
             force: If True, re-seed even if data already exists.
@@ -163,37 +172,144 @@ class LawHistoryIngestionService:
         self.session.add(log)
         await self.session.flush()
 
-        stmt = select(PublicLaw).where(PublicLaw.congress == congress)
+        stmt = (
+            select(PublicLaw)
+            .where(PublicLaw.congress == congress)
+            .options(selectinload(PublicLaw.origin_bill))
+        )
         result = await self.session.execute(stmt)
         laws = result.scalars().all()
 
+        existing = (
+            {} if force else await self._count_existing([law.law_id for law in laws])
+        )
+        to_seed = [law for law in laws if existing.get(law.law_id, 0) == 0]
+        skipped = len(laws) - len(to_seed)
+
+        congress_client = self._make_client() if to_seed else None
+        if to_seed and congress_client is None:
+            log.status = "failed"
+            log.error_message = "Congress.gov API key not configured"
+            await self.session.commit()
+            return log
+
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def _fetch(law: PublicLaw) -> HistoryRows | None:
+            async with sem:
+                bill_ref = await self._resolve_bill_ref(law, congress_client)
+                if bill_ref is None:
+                    return None
+                return await self._fetch_rows(
+                    law.law_id, law.congress, *bill_ref, congress_client
+                )
+
+        fetched = await asyncio.gather(
+            *[_fetch(law) for law in to_seed], return_exceptions=True
+        )
+        # Plain values: a failed batch's rollback expires the ORM objects
+        seeds = [
+            (law.law_id, f"{law.congress}-{law.law_number}", rows)
+            for law, rows in zip(to_seed, fetched, strict=True)
+        ]
+
         total_created = 0
-        total_processed = 0
         failed = 0
         failure_reasons: list[str] = []
 
-        for law in laws:
-            child_log = await self.seed_law(
-                law.congress, int(law.law_number), force=force
-            )
-            total_processed += child_log.records_processed or 0
-            total_created += child_log.records_created or 0
-            if child_log.status == "failed":
-                failed += 1
-                reason = child_log.error_message or "unknown error"
-                failure_reasons.append(f"PL {law.congress}-{law.law_number}: {reason}")
+        def _fail(label: str, child_log: DataIngestionLog, reason: str) -> None:
+            nonlocal failed
+            failed += 1
+            child_log.status = "failed"
+            child_log.error_message = reason
+            failure_reasons.append(f"PL {label}: {reason}")
+            logger.warning("Failed to seed PL %s: %s", label, reason)
+
+        for start in range(0, len(seeds), SEED_WRITE_BATCH):
+            child_logs: list[DataIngestionLog] = []
+            written: list[tuple[int, str, DataIngestionLog, HistoryRows]] = []
+            actions: list[dict[str, Any]] = []
+            sponsors: list[dict[str, Any]] = []
+
+            for law_id, label, rows in seeds[start : start + SEED_WRITE_BATCH]:
+                child_log = DataIngestionLog(
+                    source="Congress.gov",
+                    operation=f"seed-law-history-{label}",
+                    status="started",
+                    records_processed=0,
+                    records_created=0,
+                    records_updated=0,
+                )
+                child_logs.append(child_log)
+                if isinstance(rows, BaseException):
+                    _fail(label, child_log, str(rows))
+                elif rows is None:
+                    _fail(
+                        label,
+                        child_log,
+                        f"Could not resolve bill reference for PL {label}",
+                    )
+                else:
+                    law_actions, law_sponsors = rows
+                    actions.extend(law_actions)
+                    sponsors.extend(law_sponsors)
+                    count = len(law_actions) + len(law_sponsors)
+                    child_log.status = "completed"
+                    child_log.records_processed = count
+                    child_log.records_created = count
+                    child_log.details = (
+                        f"{len(law_actions)} actions, {len(law_sponsors)} sponsors"
+                    )
+                    written.append((law_id, label, child_log, rows))
+
+            try:
+                await self._write_rows(
+                    [law_id for law_id, _, _, _ in written],
+                    actions,
+                    sponsors,
+                    replace=force,
+                )
+                self.session.add_all(child_logs)
+                await self.session.commit()
+                total_created += len(actions) + len(sponsors)
+                continue
+            except Exception:
                 logger.warning(
-                    "Failed to seed PL %d-%s: %s",
-                    law.congress,
-                    law.law_number,
-                    reason,
+                    "Law history batch for congress %d failed, retrying one at a time",
+                    congress,
+                    exc_info=True,
                 )
+                await self.session.rollback()
+                # Before the first commit the rollback discards the aggregate log
+                self.session.add(log)
+                await self.session.commit()
+
+            # Write each law on its own so only the offending one fails
+            for law_id, label, child_log, (law_actions, law_sponsors) in written:
+                try:
+                    await self._write_rows(
+                        [law_id], law_actions, law_sponsors, replace=force
+                    )
+                    self.session.add(child_log)
+                    await self.session.commit()
+                    total_created += len(law_actions) + len(law_sponsors)
+                except Exception as exc:
+                    logger.exception("Failed to write law history for PL %s", label)
+                    await self.session.rollback()
+                    child_log.records_processed = 0
+                    child_log.records_created = 0
+                    child_log.details = None
+                    _fail(label, child_log, str(exc))
+            # The logs of the laws that failed (the rollbacks discarded them)
+            self.session.add_all(child_logs)
+            await self.session.commit()
 
         log.status = "failed" if failed > 0 and total_created == 0 else "completed"
-        log.records_processed = total_processed
+        log.records_processed = total_created
         log.records_created = total_created
         log.details = (
-            f"{len(laws)} laws processed, {failed} failed, {total_created} rows created"
+            f"{len(laws)} laws processed, {skipped} skipped, {failed} failed, "
+            f"{total_created} rows created"
         )
         if log.status == "failed" and failure_reasons:
             # Surface the first reason so callers get a useful message rather than None
@@ -219,16 +335,17 @@ class LawHistoryIngestionService:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def _count_existing(self, law_id: int) -> int:
-        from sqlalchemy import func
-
+    async def _count_existing(self, law_ids: list[int]) -> dict[int, int]:
+        """Map each already-seeded law ID to its action count, in one query."""
+        if not law_ids:
+            return {}
         stmt = (
-            select(func.count())
-            .select_from(LawBillAction)
-            .where(LawBillAction.law_id == law_id)
+            select(LawBillAction.law_id, func.count())
+            .where(LawBillAction.law_id.in_(law_ids))
+            .group_by(LawBillAction.law_id)
         )
         result = await self.session.execute(stmt)
-        return result.scalar_one()
+        return dict(result.all())
 
     def _make_client(self) -> Any | None:
         import importlib
@@ -281,25 +398,71 @@ class LawHistoryIngestionService:
         except (ValueError, TypeError):
             return None
 
-    async def _ingest_actions(
+    async def _fetch_rows(
+        self,
+        law_id: int,
+        congress: int,
+        bill_type: str,
+        bill_number: int,
+        congress_client: Any,
+    ) -> HistoryRows:
+        """Fetch a law's actions and sponsors concurrently as table rows."""
+        actions, sponsors = await asyncio.gather(
+            self._action_rows(
+                law_id, congress, bill_type, bill_number, congress_client
+            ),
+            self._sponsor_rows(
+                law_id, congress, bill_type, bill_number, congress_client
+            ),
+        )
+        return actions, sponsors
+
+    async def _write_rows(
+        self,
+        law_ids: list[int],
+        actions: list[dict[str, Any]],
+        sponsors: list[dict[str, Any]],
+        replace: bool = False,
+    ) -> None:
+        """Bulk insert action and sponsor rows, replacing the laws' old rows.
+
+        Args:
+            law_ids: Laws the rows belong to.
+            actions: law_bill_action rows.
+            sponsors: law_sponsor rows.
+            replace: If True, delete the laws' existing rows first.
+        """
+        if replace and law_ids:
+            await self.session.execute(
+                delete(LawBillAction).where(LawBillAction.law_id.in_(law_ids))
+            )
+            await self.session.execute(
+                delete(LawSponsor).where(LawSponsor.law_id.in_(law_ids))
+            )
+        if actions:
+            await self.session.execute(insert(LawBillAction), actions)
+        if sponsors:
+            await self.session.execute(insert(LawSponsor), sponsors)
+
+    async def _action_rows(
         self,
         law_id: int,
         congress: int,
         bill_type: str,
         bill_number: int,
         congress_client: Any,
-    ) -> int:
+    ) -> list[dict[str, Any]]:
         try:
             raw_actions = await congress_client.get_bill_actions(
                 congress, bill_type, bill_number
             )
         except Exception as exc:
             logger.warning("Failed to fetch bill actions: %s", exc)
-            return 0
+            return []
 
         seen_intro = False
         seen_committee = False
-        created = 0
+        rows: list[dict[str, Any]] = []
 
         for sort_order, action in enumerate(raw_actions):
             event_type, is_milestone = classify_action(
@@ -318,84 +481,61 @@ class LawHistoryIngestionService:
             yeas, nays, not_voting = parse_vote_tally(action.text)
             title = build_event_title(event_type, action.text, action.chamber)
 
-            row = LawBillAction(
-                law_id=law_id,
-                sort_order=sort_order,
-                action_date=action.action_date,
-                action_code=action.action_code,
-                action_type=action.action_type,
-                text=action.text,
-                chamber=action.chamber,
-                congressional_record_refs=action.congressional_record_refs,
-                event_type=event_type,
-                is_milestone=is_milestone,
-                vote_yeas=yeas,
-                vote_nays=nays,
-                vote_not_voting=not_voting,
-                event_title=title,
+            rows.append(
+                {
+                    "law_id": law_id,
+                    "sort_order": sort_order,
+                    "action_date": action.action_date,
+                    "action_code": action.action_code,
+                    "action_type": action.action_type,
+                    "text": action.text,
+                    "chamber": action.chamber,
+                    "congressional_record_refs": action.congressional_record_refs,
+                    "event_type": event_type,
+                    "is_milestone": is_milestone,
+                    "vote_yeas": yeas,
+                    "vote_nays": nays,
+                    "vote_not_voting": not_voting,
+                    "event_title": title,
+                }
             )
-            self.session.add(row)
-            created += 1
 
-        return created
+        return rows
 
-    async def _ingest_sponsors(
+    async def _sponsor_rows(
         self,
         law_id: int,
         congress: int,
         bill_type: str,
         bill_number: int,
         congress_client: Any,
-    ) -> int:
+    ) -> list[dict[str, Any]]:
         try:
             sponsor_info, cosponsors = await congress_client.get_bill_sponsors(
                 congress, bill_type, bill_number
             )
         except Exception as exc:
             logger.warning("Failed to fetch sponsors: %s", exc)
-            return 0
-
-        created = 0
-        sort_order = 0
-
-        if sponsor_info:
-            row = LawSponsor(
-                law_id=law_id,
-                sort_order=sort_order,
-                name=compose_sponsor_name(
-                    sponsor_info.first_name,
-                    sponsor_info.middle_name,
-                    sponsor_info.last_name,
+            return []
+
+        sponsors = [(sponsor_info, True)] if sponsor_info else []
+        sponsors.extend((cs, False) for cs in cosponsors)
+
+        return [
+            {
+                "law_id": law_id,
+                "sort_order": sort_order,
+                "name": compose_sponsor_name(
+                    sponsor.first_name,
+                    sponsor.middle_name,
+                    sponsor.last_name,
                 )
-                or sponsor_info.full_name,
-                party=sponsor_info.party,
-                state=sponsor_info.state,
-                district=sponsor_info.district or None,
-                bioguide_id=sponsor_info.bioguide_id,
-                is_primary=True,
-            )
-            self.session.add(row)
-            created += 1
-            sort_order += 1
-
-        for cs in cosponsors:
-            row = LawSponsor(
-                law_id=law_id,
-                sort_order=sort_order,
-                name=compose_sponsor_name(
-                    cs.first_name,
-                    cs.middle_name,
-                    cs.last_name,
-                )
-                or cs.full_name,
-                party=cs.party,
-                state=cs.state,
-                district=cs.district or None,
-                bioguide_id=cs.bioguide_id,
-                is_primary=False,
-            )
-            self.session.add(row)
-            created += 1
-            sort_order += 1
-
-        return created
+                or sponsor.full_name,
+                "party": sponsor.party,
+                "state": sponsor.state,
+                "district": sponsor.district or None,
+                "bioguide_id": sponsor.bioguide_id,
+                "is_primary": is_primary,
+            }
+            for sort_order, (sponsor, is_primary) in enumerate(sponsors)
+        ]
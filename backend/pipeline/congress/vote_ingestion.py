@@ -1,17 +1,48 @@
 """Ingest vote data from Congress.gov into the database."""
 
+import asyncio
 import logging
 from datetime import date, datetime
+from typing import Any
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import DataIngestionLog, IndividualVote, Legislator, Vote
 from app.models.enums import Chamber, VoteType
-from pipeline.congress.client import CongressClient, HouseVoteDetail, MemberVoteInfo
+from pipeline.congress.client import (
+    CongressClient,
+    HouseVoteDetail,
+    HouseVoteInfo,
+    MemberVoteInfo,
+)
 
 logger = logging.getLogger(__name__)
 
+# Roll calls fetched at once (each is a detail and a member-votes request).
+# Requests also wait on the client's rate limiter, which is shared with
+# every other Congress.gov client.
+DEFAULT_FETCH_CONCURRENCY = 8
+
+# Rows per INSERT ... ON CONFLICT statement. Individual votes have four
+# columns, so a batch stays well under the bind parameter limit.
+VOTE_BATCH_SIZE = 100
+INDIVIDUAL_VOTE_BATCH_SIZE = 2000
+
+_VOTE_UPDATE_COLUMNS = (
+    "vote_date",
+    "question",
+    "result",
+    "yeas",
+    "nays",
+    "present",
+    "not_voting",
+)
+
+# A roll call fetched from the API: its detail and how each member voted
+FetchedVote = tuple[HouseVoteDetail, list[MemberVoteInfo]]
+
 
 def _parse_vote_date(date_str: str | None) -> date:
     """Parse vote date string to date object.
@@ -62,22 +93,54 @@ def _parse_vote_cast(vote_position: str) -> VoteType:
         return VoteType.NOT_VOTING
 
 
+def _vote_row(detail: HouseVoteDetail) -> dict[str, Any]:
+    """Build the ``vote`` row for a House roll call.
+
+    Args:
+        detail: Vote detail from API.
+
+    Returns:
+        Column values keyed by column name.
+    """
+    return {
+        "chamber": Chamber.HOUSE,
+        "congress": detail.congress,
+        "session": detail.session,
+        "vote_number": detail.roll_number,
+        "vote_date": _parse_vote_date(detail.vote_date),
+        "question": detail.question,
+        "result": detail.result,
+        "yeas": detail.yea_total,
+        "nays": detail.nay_total,
+        "present": detail.present_total,
+        "not_voting": detail.not_voting_total,
+    }
+
+
 class VoteIngestionService:
-    """Service for ingesting vote data into the database."""
+    """Service for ingesting vote data into the database.
+
+    Roll calls are fetched concurrently (bounded by ``concurrency`` and the
+    client's rate limiter) and written with batched ``INSERT ... ON
+    CONFLICT`` upserts of votes and individual votes.
+    """
 
     def __init__(
         self,
         session: AsyncSession,
         api_key: str | None = None,
+        concurrency: int = DEFAULT_FETCH_CONCURRENCY,
     ):
         """Initialize the ingestion service.
 
         Args:
             session: SQLAlchemy async session.
             api_key: Congress.gov API key (or set CONGRESS_API_KEY env var).
+            concurrency: Maximum roll calls being fetched at once.
         """
         self.session = session
         self.client = CongressClient(api_key=api_key)
+        self.concurrency = max(1, concurrency)
 
     async def ingest_house_vote(
         self,
@@ -107,23 +170,9 @@ class VoteIngestionService:
         await self.session.flush()
 
         try:
-            # Fetch vote detail
-            detail = await self.client.get_house_vote_detail(
-                congress, session_num, roll_number
-            )
+            existing = await self._existing_votes(congress, session_num)
 
-            # Check for existing vote
-            result = await self.session.execute(
-                select(Vote).where(
-                    Vote.chamber == Chamber.HOUSE,
-                    Vote.congress == congress,
-                    Vote.session == session_num,
-                    Vote.vote_number == roll_number,
-                )
-            )
-            existing = result.scalar_one_or_none()
-
-            if existing and not force:
+            if (congress, session_num, roll_number) in existing and not force:
                 log.status = "completed"
                 log.completed_at = datetime.utcnow()
                 log.records_processed = 1
@@ -135,13 +184,11 @@ class VoteIngestionService:
                 await self.session.commit()
                 return log
 
-            # Fetch member votes
-            member_votes = await self.client.get_house_vote_members(
+            detail, member_votes = await self._fetch_vote(
                 congress, session_num, roll_number
             )
-
-            # Create or update vote record
-            was_created = await self._upsert_vote(detail, member_votes, existing)
+            await self._store_votes([(detail, member_votes)])
+            was_created = (congress, session_num, roll_number) not in existing
 
             log.status = "completed"
             log.completed_at = datetime.utcnow()
@@ -176,6 +223,10 @@ class VoteIngestionService:
     ) -> DataIngestionLog:
         """Ingest all House votes for a Congress (or session).
 
+        Existing votes are looked up in one query; without ``force`` they
+        are not fetched. Roll calls whose requests fail are logged and left
+        out of the created/updated counts.
+
         Args:
             congress: Congress number (118+).
             session_num: Session number (1 or 2, optional).
@@ -204,51 +255,23 @@ class VoteIngestionService:
                 f"Found {len(votes)} House votes for Congress {congress}{session_str}"
             )
 
-            created = 0
-            updated = 0
-            skipped = 0
-
-            for vote_info in votes:
-                try:
-                    # Get vote detail
-                    detail = await self.client.get_house_vote_detail(
-                        vote_info.congress, vote_info.session, vote_info.roll_number
-                    )
-
-                    # Check for existing
-                    result = await self.session.execute(
-                        select(Vote).where(
-                            Vote.chamber == Chamber.HOUSE,
-                            Vote.congress == vote_info.congress,
-                            Vote.session == vote_info.session,
-                            Vote.vote_number == vote_info.roll_number,
-                        )
-                    )
-                    existing = result.scalar_one_or_none()
-
-                    if existing and not force:
-                        skipped += 1
-                        continue
-
-                    # Get member votes
-                    member_votes = await self.client.get_house_vote_members(
-                        vote_info.congress, vote_info.session, vote_info.roll_number
-                    )
-
-                    was_created = await self._upsert_vote(
-                        detail, member_votes, existing
-                    )
-                    if was_created:
-                        created += 1
-                    else:
-                        updated += 1
-
-                except Exception as e:
-                    logger.error(
-                        f"Error ingesting vote {vote_info.congress}/{vote_info.session}/"
-                        f"{vote_info.roll_number}: {e}"
-                    )
-                    continue
+            existing = await self._existing_votes(congress, session_num)
+            to_fetch = [
+                v
+                for v in votes
+                if force or (v.congress, v.session, v.roll_number) not in existing
+            ]
+            skipped = len(votes) - len(to_fetch)
+
+            fetched = await self._fetch_votes(to_fetch)
+            await self._store_votes(fetched)
+
+            updated = sum(
+                1
+                for detail, _ in fetched
+                if (detail.congress, detail.session, detail.roll_number) in existing
+            )
+            created = len(fetched) - updated
 
             log.status = "completed"
             log.completed_at = datetime.utcnow()
@@ -273,99 +296,158 @@ class VoteIngestionService:
             await self.session.commit()
             return log
 
-    async def _upsert_vote(
+    async def _existing_votes(
         self,
-        detail: HouseVoteDetail,
-        member_votes: list[MemberVoteInfo],
-        existing: Vote | None,
-    ) -> bool:
-        """Insert or update a Vote record with individual votes.
+        congress: int,
+        session_num: int | None = None,
+    ) -> set[tuple[int, int | None, int | None]]:
+        """Return (congress, session, roll number) of the stored House votes.
 
         Args:
-            detail: Vote detail from API.
-            member_votes: List of member votes.
-            existing: Existing vote record (if any).
+            congress: Congress number.
+            session_num: Restrict to one session (optional).
 
         Returns:
-            True if created, False if updated.
+            Keys of every matching vote, from a single query.
         """
-        vote_date = _parse_vote_date(detail.vote_date)
-
-        if existing:
-            # Update existing vote
-            existing.vote_date = vote_date
-            existing.question = detail.question
-            existing.result = detail.result
-            existing.yeas = detail.yea_total
-            existing.nays = detail.nay_total
-            existing.present = detail.present_total
-            existing.not_voting = detail.not_voting_total
-
-            # Delete existing individual votes using direct query (avoids lazy loading)
-            from sqlalchemy import delete
-
-            await self.session.execute(
-                delete(IndividualVote).where(IndividualVote.vote_id == existing.vote_id)
-            )
-            await self.session.flush()
-
-            # Add individual votes
-            await self._add_individual_votes(existing.vote_id, member_votes)
-            return False
-
-        # Create new vote
-        vote = Vote(
-            chamber=Chamber.HOUSE,
-            congress=detail.congress,
-            session=detail.session,
-            vote_number=detail.roll_number,
-            vote_date=vote_date,
-            question=detail.question,
-            result=detail.result,
-            yeas=detail.yea_total,
-            nays=detail.nay_total,
-            present=detail.present_total,
-            not_voting=detail.not_voting_total,
+        query = select(Vote.congress, Vote.session, Vote.vote_number).where(
+            Vote.chamber == Chamber.HOUSE, Vote.congress == congress
         )
-        self.session.add(vote)
-        await self.session.flush()
-
-        # Add individual votes
-        await self._add_individual_votes(vote.vote_id, member_votes)
-        return True
+        if session_num:
+            query = query.where(Vote.session == session_num)
+        result = await self.session.execute(query)
+        return set(result.all())
 
-    async def _add_individual_votes(
+    async def _fetch_vote(
         self,
-        vote_id: int,
-        member_votes: list[MemberVoteInfo],
-    ) -> int:
-        """Add individual vote records for a vote.
+        congress: int,
+        session_num: int,
+        roll_number: int,
+    ) -> FetchedVote:
+        """Fetch a roll call's detail and member votes concurrently."""
+        detail, member_votes = await asyncio.gather(
+            self.client.get_house_vote_detail(congress, session_num, roll_number),
+            self.client.get_house_vote_members(congress, session_num, roll_number),
+        )
+        return detail, member_votes
+
+    async def _fetch_votes(self, votes: list[HouseVoteInfo]) -> list[FetchedVote]:
+        """Fetch roll calls concurrently, dropping (and logging) failures.
 
         Args:
-            vote_id: The Vote record ID.
-            member_votes: List of member votes from API.
+            votes: Roll calls to fetch.
 
         Returns:
-            Number of individual votes added.
+            Fetched votes in the order of ``votes``.
         """
-        added = 0
-        for mv in member_votes:
-            # Look up legislator by bioguide_id
-            result = await self.session.execute(
-                select(Legislator).where(Legislator.bioguide_id == mv.bioguide_id)
-            )
-            legislator = result.scalar_one_or_none()
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def _fetch(info: HouseVoteInfo) -> FetchedVote:
+            async with sem:
+                return await self._fetch_vote(
+                    info.congress, info.session, info.roll_number
+                )
 
-            if not legislator:
-                logger.debug(f"Legislator not found: {mv.bioguide_id} ({mv.name})")
+        results = await asyncio.gather(
+            *[_fetch(v) for v in votes], return_exceptions=True
+        )
+
+        fetched: list[FetchedVote] = []
+        for info, result in zip(votes, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"Error ingesting vote {info.congress}/{info.session}/"
+                    f"{info.roll_number}: {result}"
+                )
                 continue
+            fetched.append(result)
+        return fetched
 
-            individual_vote = IndividualVote(
-                vote_id=vote_id,
-                legislator_id=legislator.legislator_id,
-                vote_cast=_parse_vote_cast(mv.vote_cast),
-            )
-            self.session.add(individual_vote)
-            added += 1
+    async def _store_votes(self, fetched: list[FetchedVote]) -> None:
+        """Upsert Vote records and their individual votes.
+
+        Legislators are resolved for every member vote in one query. Each
+        batch of votes is one ``INSERT ... ON CONFLICT DO UPDATE`` on the
+        roll call key, returning vote IDs for the individual votes, which
+        are upserted on (vote_id, legislator_id).
+
+        Args:
+            fetched: Fetched roll calls.
+        """
+        legislator_ids = await self._legislator_ids(
+            {mv.bioguide_id for _, member_votes in fetched for mv in member_votes}
+        )
+
+        # One row per roll call: a statement may not touch the same row twice
+        unique = list(
+            {
+                (d.congress, d.session, d.roll_number): (d, mv) for d, mv in fetched
+            }.values()
+        )
+
+        for start in range(0, len(unique), VOTE_BATCH_SIZE):
+            batch = unique[start : start + VOTE_BATCH_SIZE]
+
+            stmt = insert(Vote).values([_vote_row(detail) for detail, _ in batch])
+            upsert = stmt.on_conflict_do_update(
+                index_elements=["chamber", "congress", "session", "vote_number"],
+                set_={
+                    **{col: stmt.excluded[col] for col in _VOTE_UPDATE_COLUMNS},
+                    "updated_at": datetime.utcnow(),
+                },
+            ).returning(Vote.congress, Vote.session, Vote.vote_number, Vote.vote_id)
+            result = await self.session.execute(upsert)
+            vote_ids = {
+                (congress, session, number): vote_id
+                for congress, session, number, vote_id in result
+            }
+
+            casts: dict[tuple[int, int], VoteType] = {}
+            for detail, member_votes in batch:
+                vote_id = vote_ids[
+                    (detail.congress, detail.session, detail.roll_number)
+                ]
+                for mv in member_votes:
+                    legislator_id = legislator_ids.get(mv.bioguide_id)
+                    if legislator_id is None:
+                        logger.debug(
+                            f"Legislator not found: {mv.bioguide_id} ({mv.name})"
+                        )
+                        continue
+                    casts[(vote_id, legislator_id)] = _parse_vote_cast(mv.vote_cast)
 
-        return added
+            await self._upsert_individual_votes(casts)
+
+    async def _upsert_individual_votes(
+        self,
+        casts: dict[tuple[int, int], VoteType],
+    ) -> None:
+        """Upsert individual votes keyed by (vote_id, legislator_id).
+
+        Args:
+            casts: Vote cast for each (vote_id, legislator_id).
+        """
+        rows = [
+            {"vote_id": vote_id, "legislator_id": legislator_id, "vote_cast": cast}
+            for (vote_id, legislator_id), cast in casts.items()
+        ]
+        for start in range(0, len(rows), INDIVIDUAL_VOTE_BATCH_SIZE):
+            stmt = insert(IndividualVote).values(
+                rows[start : start + INDIVIDUAL_VOTE_BATCH_SIZE]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["vote_id", "legislator_id"],
+                set_={"vote_cast": stmt.excluded.vote_cast},
+            )
+            await self.session.execute(stmt)
+
+    async def _legislator_ids(self, bioguide_ids: set[str]) -> dict[str, int]:
+        """Map Bioguide IDs to legislator IDs in one query."""
+        if not bioguide_ids:
+            return {}
+        result = await self.session.execute(
+            select(Legislator.bioguide_id, Legislator.legislator_id).where(
+                Legislator.bioguide_id.in_(bioguide_ids)
+            )
+        )
+        return dict(result.all())
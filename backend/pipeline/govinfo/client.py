@@ -348,6 +348,9 @@ class GovInfoClient:
             end_str = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
             url = f"{url}/{end_str}"
 
+        # offsetMark is an opaque cursor read from each page's nextPage link,
+        # so unlike Congress.gov's numeric offsets these pages cannot be
+        # requested concurrently.
         async with httpx.AsyncClient(timeout=self.timeout) as client:
             while True:
                 params = {
@@ -407,7 +410,7 @@ class GovInfoClient:
 
         # Check PipelineCache first
         if self._cache and not force:
-            cached = self._cache.get_text(cache_key)
+            cached = await self._cache.aget_text(cache_key)
             if cached is not None:
                 logger.info(f"Using cached summary for {package_id}")
                 return PLAWPackageDetail.from_api_response(json.loads(cached))
@@ -431,7 +434,7 @@ class GovInfoClient:
 
         # Write to PipelineCache
         if self._cache:
-            self._cache.put_text(cache_key, json.dumps(data))
+            await self._cache.aput_text(cache_key, json.dumps(data))
             logger.info(f"Cached summary for {package_id}")
         elif cache_file:
             cache_file.parent.mkdir(parents=True, exist_ok=True)
@@ -569,7 +572,7 @@ class GovInfoClient:
 
         # Check PipelineCache first
         if self._cache and not force:
-            cached = self._cache.get_text(cache_key)
+            cached = await self._cache.aget_text(cache_key)
             if cached is not None:
                 logger.info(
                     f"Using cached {format.upper()} for PL {congress}-{law_number}"
@@ -609,7 +612,7 @@ class GovInfoClient:
 
                 # Write to PipelineCache
                 if self._cache:
-                    self._cache.put_text(cache_key, text)
+                    await self._cache.aput_text(cache_key, text)
                     logger.info(
                         f"Cached {format.upper()} for PL {congress}-{law_number}"
                     )
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.law_title_cache import law_title_cache
 from app.models import DataIngestionLog, PublicLaw
 from app.models.enums import LawType
 from pipeline.govinfo.client import GovInfoClient, PLAWPackageDetail
@@ -118,6 +119,8 @@ class PublicLawIngestionService:
             log.error_message = str(e)
             log.completed_at = datetime.utcnow()
             await self.session.rollback()
+            # Titles cached by _upsert_public_law may not have been committed
+            law_title_cache.invalidate()
             self.session.add(log)
             await self.session.commit()
             return log
@@ -169,6 +172,8 @@ class PublicLawIngestionService:
             log.error_message = str(e)
             log.completed_at = datetime.utcnow()
             await self.session.rollback()
+            # Titles cached by _upsert_public_law may not have been committed
+            law_title_cache.invalidate()
             self.session.add(log)
             await self.session.commit()
             return log
@@ -252,6 +257,8 @@ class PublicLawIngestionService:
             log.error_message = str(e)
             log.completed_at = datetime.utcnow()
             await self.session.rollback()
+            # Titles cached by _upsert_public_law may not have been committed
+            law_title_cache.invalidate()
             self.session.add(log)
             await self.session.commit()
             return log
@@ -304,6 +311,9 @@ class PublicLawIngestionService:
             existing.enacted_date = enacted_date
             existing.govinfo_url = govinfo_url
             existing.statutes_at_large_citation = detail.statutes_at_large_citation
+            law_title_cache.put(
+                detail.congress, detail.law_number, detail.short_title, detail.title
+            )
             return False  # Updated
 
         # Create new record
@@ -319,4 +329,7 @@ class PublicLawIngestionService:
         )
         self.session.add(law)
         await self.session.flush()
+        law_title_cache.put(
+            detail.congress, detail.law_number, detail.short_title, detail.title
+        )
         return True  # Created
@@ -51,10 +51,10 @@ class HouseRulesIngestionService:
         url = self._hman_url(congress)
 
         if self._cache and not force:
-            cached = self._cache.get(cache_key)
+            cached = await self._cache.aget_text(cache_key)
             if cached is not None:
                 logger.debug("Cache hit: %s", cache_key)
-                return cached if isinstance(cached, str) else cached.decode()
+                return cached
 
         logger.info("Fetching %s", url)
         try:
@@ -70,7 +70,7 @@ class HouseRulesIngestionService:
 
         html = response.text
         if self._cache:
-            self._cache.set(cache_key, html)
+            await self._cache.aput_text(cache_key, html)
         return html
 
     async def _get_committee_id_map(self) -> dict[str, int]:
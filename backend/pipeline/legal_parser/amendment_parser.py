@@ -11,6 +11,8 @@ import re
 from dataclasses import dataclass, field
 
 from app.models.enums import ChangeType
+from pipeline.legal_parser.intervals import SweepOverlapIndex
+from pipeline.legal_parser.pattern_matcher import AnchoredMatcher
 from pipeline.legal_parser.patterns import (
     AMENDMENT_PATTERNS,
     AmendmentPattern,
@@ -216,11 +218,8 @@ class AmendmentParser:
         self.default_title = default_title
         self.patterns = patterns or AMENDMENT_PATTERNS
         self.min_confidence = min_confidence
-        self._compiled_patterns: dict[str, re.Pattern] = {}
-
-        # Pre-compile all patterns
-        for pattern in self.patterns:
-            self._compiled_patterns[pattern.name] = pattern.compile()
+        # Pre-compile all patterns behind a single keyword scan
+        self._matcher = AnchoredMatcher(self.patterns)
 
     def parse(self, text: str, context_chars: int = 100) -> list[ParsedAmendment]:
         """Parse text and extract all amendments.
@@ -234,13 +233,15 @@ class AmendmentParser:
         """
         amendments: list[ParsedAmendment] = []
 
+        # Locate every pattern keyword once; patterns are then only tried
+        # where a match can start instead of scanning the whole text each.
+        positions = self._matcher.scan(text)
+
         for pattern in self.patterns:
             if pattern.confidence < self.min_confidence:
                 continue
 
-            compiled = self._compiled_patterns[pattern.name]
-
-            for match in compiled.finditer(text):
+            for match in self._matcher.finditer(pattern.name, text, positions):
                 amendment = self._process_match(match, pattern, text, context_chars)
                 if amendment:
                     amendments.append(amendment)
@@ -474,10 +475,22 @@ class AmendmentParser:
         return base_confidence
 
     def _deduplicate(self, amendments: list[ParsedAmendment]) -> list[ParsedAmendment]:
-        """Remove overlapping amendments, keeping higher confidence ones."""
+        """Remove overlapping amendments, keeping higher confidence ones.
+
+        Each amendment is compared with the first kept amendment it
+        overlaps; if it has higher confidence it takes that one's place.
+        For input sorted by start_pos (as parse() produces) the first
+        overlapping kept amendment is found with a sweep in O(log n).
+        """
         if len(amendments) <= 1:
             return amendments
 
+        if all(
+            a.start_pos <= b.start_pos
+            for a, b in zip(amendments, amendments[1:], strict=False)
+        ):
+            return self._deduplicate_sorted(amendments)
+
         result: list[ParsedAmendment] = []
 
         for amendment in amendments:
@@ -496,6 +509,24 @@ class AmendmentParser:
 
         return result
 
+    def _deduplicate_sorted(
+        self, amendments: list[ParsedAmendment]
+    ) -> list[ParsedAmendment]:
+        """``_deduplicate`` for amendments sorted by start_pos."""
+        result: list[ParsedAmendment] = []
+        index = SweepOverlapIndex()
+
+        for amendment in amendments:
+            i = index.first_overlapping(amendment.start_pos, amendment.end_pos)
+            if i is None:
+                index.add(amendment.start_pos, amendment.end_pos)
+                result.append(amendment)
+            elif amendment.confidence > result[i].confidence:
+                index.replace(i, amendment.start_pos, amendment.end_pos)
+                result[i] = amendment
+
+        return result
+
     def _overlaps(self, a: ParsedAmendment, b: ParsedAmendment) -> bool:
         """Check if two amendments overlap in the source text."""
         return not (a.end_pos <= b.start_pos or b.end_pos <= a.start_pos)
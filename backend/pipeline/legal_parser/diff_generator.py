@@ -255,27 +255,8 @@ class DiffGenerator:
         Returns:
             List of created LawChange records.
         """
-        changes: list[LawChange] = []
-
-        for diff in diffs:
-            if not diff.resolution.resolved:
-                continue
-
-            effective = law.effective_date or law.enacted_date
-
-            change = LawChange(
-                law_id=law.law_id,
-                title_number=diff.resolution.title_number,
-                section_number=diff.resolution.section_number,
-                change_type=diff.change_type,
-                old_text=diff.old_text,
-                new_text=diff.new_text,
-                effective_date=effective,
-                description=diff.description,
-                subsection_path=diff.subsection_path,
-            )
-            self.session.add(change)
-            changes.append(change)
+        changes = [LawChange(**row) for row in self.law_change_rows(diffs, law)]
+        self.session.add_all(changes)
 
         if changes:
             await self.session.flush()
@@ -283,6 +264,30 @@ class DiffGenerator:
 
         return changes
 
+    @staticmethod
+    def law_change_rows(diffs: list[DiffResult], law: PublicLaw) -> list[dict]:
+        """Build LawChange column values for the resolved diffs.
+
+        Shared by ``persist_law_changes`` and bulk inserts
+        (``LawChangeService.process_congress``).
+        """
+        effective = law.effective_date or law.enacted_date
+        return [
+            {
+                "law_id": law.law_id,
+                "title_number": diff.resolution.title_number,
+                "section_number": diff.resolution.section_number,
+                "change_type": diff.change_type,
+                "old_text": diff.old_text,
+                "new_text": diff.new_text,
+                "effective_date": effective,
+                "description": diff.description,
+                "subsection_path": diff.subsection_path,
+            }
+            for diff in diffs
+            if diff.resolution.resolved
+        ]
+
 
 def _truncate(text: str, max_len: int = 50) -> str:
     """Truncate text for display in descriptions."""
@@ -0,0 +1,88 @@
+"""Sorted-interval helpers shared by the parser and text accounting.
+
+Omnibus laws produce thousands of pattern matches, so pairwise overlap
+checks between matches (and re-merging claimed spans on every query)
+become quadratic. Both users process half-open ``[start, end)`` spans in
+start order, which allows a sweep instead:
+
+- ``merge_intervals`` merges sorted spans in one pass.
+- ``SweepOverlapIndex`` answers "which kept span does this one overlap?"
+  for spans arriving in start order, in O(log n) per span.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+
+
+def merge_intervals(spans: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge overlapping or touching ``(start, end)`` spans sorted by start."""
+    merged: list[tuple[int, int]] = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1]:
+            last_start, last_end = merged[-1]
+            merged[-1] = (last_start, max(last_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class SweepOverlapIndex:
+    """Slots of kept spans, queried by spans arriving in start order.
+
+    Each slot holds one span; ``first_overlapping`` returns the lowest slot
+    index whose span overlaps the query. Because queries arrive with
+    non-decreasing starts and every kept span started at or before the
+    current query, a non-empty query ``[s, e)`` overlaps exactly the slots
+    whose end is past ``s``. Slots whose end falls at or before ``s`` can
+    never overlap a later query, so they are retired from a min-heap on
+    ends, and a min-heap on slot indices yields the first live slot.
+    """
+
+    def __init__(self) -> None:
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._live: list[bool] = []
+        self._by_end: list[tuple[int, int]] = []
+        self._by_index: list[int] = []
+
+    def first_overlapping(self, start: int, end: int) -> int | None:
+        """Return the lowest live slot overlapping ``[start, end)``.
+
+        ``start`` must be >= the start of every previous query.
+        """
+        self._retire(start)
+        if end <= start:
+            # Empty spans do not get the "every live slot overlaps" shortcut
+            for i, live in enumerate(self._live):
+                if live and self._starts[i] < end and start < self._ends[i]:
+                    return i
+            return None
+        while self._by_index and not self._live[self._by_index[0]]:
+            heapq.heappop(self._by_index)
+        return self._by_index[0] if self._by_index else None
+
+    def add(self, start: int, end: int) -> int:
+        """Add a span in a new slot and return its index."""
+        index = len(self._starts)
+        self._starts.append(start)
+        self._ends.append(end)
+        self._live.append(True)
+        heapq.heappush(self._by_end, (end, index))
+        heapq.heappush(self._by_index, index)
+        return index
+
+    def replace(self, index: int, start: int, end: int) -> None:
+        """Replace the span held in slot ``index``."""
+        self._starts[index] = start
+        self._ends[index] = end
+        heapq.heappush(self._by_end, (end, index))
+
+    def _retire(self, position: int) -> None:
+        """Retire slots whose span ends at or before ``position``."""
+        while self._by_end and self._by_end[0][0] <= position:
+            end, index = heapq.heappop(self._by_end)
+            # Skip heap entries left behind by replace()
+            if self._ends[index] == end:
+                self._live[index] = False
@@ -8,26 +8,43 @@ records. It coordinates:
 4. Generating validated diffs
 5. Persisting LawChange records
 6. Updating PublicLaw statistics
+
+``process_law`` handles one law; ``process_congress`` backfills a whole
+Congress in batch (concurrent fetches, process-pool parsing, bulk inserts).
 """
 
+import asyncio
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import DataIngestionLog
 from app.models.public_law import LawChange, PublicLaw
 from pipeline.govinfo.client import GovInfoClient
-from pipeline.legal_parser.amendment_parser import ParsedAmendment
+from pipeline.legal_parser import parse_cache
+from pipeline.legal_parser.amendment_parser import (
+    AmendmentParser,
+    ParsedAmendment,
+    SectionReference,
+)
 from pipeline.legal_parser.diff_generator import DiffGenerator, DiffReport, DiffResult
-from pipeline.legal_parser.parsing_modes import RegExParsingSession
-from pipeline.legal_parser.section_resolver import SectionResolver
-from pipeline.legal_parser.text_extractor import TextExtractor
+from pipeline.legal_parser.parsing_modes import RegExParsingSession, _is_uslm_xml
+from pipeline.legal_parser.section_resolver import ResolutionResult, SectionResolver
+from pipeline.legal_parser.text_extractor import ExtractedText, TextExtractor
+from pipeline.legal_parser.xml_parser import XMLAmendmentParser
 
 logger = logging.getLogger(__name__)
 
+# Concurrent GovInfo text fetches in process_congress
+DEFAULT_FETCH_CONCURRENCY = 8
+
+# Laws persisted per transaction in process_congress
+DEFAULT_COMMIT_EVERY = 25
+
 
 @dataclass
 class LawChangeResult:
@@ -52,6 +69,98 @@ class LawChangeResult:
     dry_run: bool = False
 
 
+@dataclass
+class CongressBatchResult:
+    """Result of processing every law of a Congress in one batch.
+
+    Attributes:
+        congress: Congress number.
+        results: Per-law results: requested laws missing from the database
+            first, then every processed law in law order.
+        skipped: Laws skipped because they already have LawChange records.
+        dry_run: Whether this was a dry run (no persistence).
+    """
+
+    congress: int
+    results: list[LawChangeResult] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    dry_run: bool = False
+
+    @property
+    def failed(self) -> list[LawChangeResult]:
+        """Results of laws that could not be processed."""
+        return [r for r in self.results if r.errors]
+
+    @property
+    def changes_created(self) -> int:
+        """Total LawChange records persisted."""
+        return sum(len(r.changes) for r in self.results)
+
+
+@dataclass
+class _PreparedLaw:
+    """Database-independent analysis of one law's text."""
+
+    amendments: list[ParsedAmendment]
+    resolutions: list[ResolutionResult]
+    extractions: dict[int, ExtractedText]
+
+
+def _resolve_amendments(
+    amendments: list[ParsedAmendment], default_title: int | None
+) -> list[ResolutionResult]:
+    """Resolve every amendment's section reference, one result per amendment.
+
+    Amendments without a section reference get an unresolved result.
+    """
+    resolver = SectionResolver()
+    resolutions = iter(
+        resolver.resolve_batch(
+            [a.section_ref for a in amendments if a.section_ref is not None],
+            default_title=default_title,
+        )
+    )
+    return [
+        (
+            next(resolutions)
+            if amendment.section_ref is not None
+            else ResolutionResult(
+                section_ref=SectionReference(title=None, section="?"),
+                error="No section reference in amendment",
+            )
+        )
+        for amendment in amendments
+    ]
+
+
+def _law_parser(
+    law_text: str, default_title: int | None
+) -> AmendmentParser | XMLAmendmentParser:
+    """The parser RegExParsingSession.parse_law would use for ``law_text``."""
+    if _is_uslm_xml(law_text):
+        return XMLAmendmentParser(default_title=default_title)
+    return AmendmentParser(default_title=default_title)
+
+
+def _prepare_law(
+    law_text: str,
+    default_title: int | None,
+    amendments: list[ParsedAmendment] | None = None,
+) -> _PreparedLaw:
+    """Parse (unless ``amendments`` are given), resolve and extract a law.
+
+    Pure CPU work with picklable inputs and outputs, so process_congress
+    can run it in a worker process.
+    """
+    if amendments is None:
+        amendments = _law_parser(law_text, default_title).parse(law_text)
+    return _PreparedLaw(
+        amendments=amendments,
+        resolutions=_resolve_amendments(amendments, default_title),
+        extractions=TextExtractor(law_text).extract_batch(amendments),
+    )
+
+
 class LawChangeService:
     """Orchestrate the full pipeline for processing a law into LawChange records.
 
@@ -183,30 +292,7 @@ class LawChangeService:
                 return result
 
             # Step 4: Resolve section references
-            resolver = SectionResolver()
-            section_refs = [a.section_ref for a in result.amendments]
-            resolutions = resolver.resolve_batch(
-                [ref for ref in section_refs if ref is not None],
-                default_title=default_title,
-            )
-
-            # Pad resolutions for amendments without section refs
-            full_resolutions = []
-            resolution_idx = 0
-            for amendment in result.amendments:
-                if amendment.section_ref is not None:
-                    full_resolutions.append(resolutions[resolution_idx])
-                    resolution_idx += 1
-                else:
-                    from pipeline.legal_parser.amendment_parser import SectionReference
-                    from pipeline.legal_parser.section_resolver import ResolutionResult
-
-                    full_resolutions.append(
-                        ResolutionResult(
-                            section_ref=SectionReference(title=None, section="?"),
-                            error="No section reference in amendment",
-                        )
-                    )
+            full_resolutions = _resolve_amendments(result.amendments, default_title)
 
             resolved_count = sum(1 for r in full_resolutions if r.resolved)
             if verbose:
@@ -276,6 +362,266 @@ class LawChangeService:
             await self.session.commit()
             return result
 
+    async def process_congress(
+        self,
+        congress: int,
+        law_numbers: list[int] | None = None,
+        default_title: int | None = None,
+        dry_run: bool = False,
+        fetch_concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+        workers: int | None = None,
+        commit_every: int = DEFAULT_COMMIT_EVERY,
+    ) -> CongressBatchResult:
+        """Process every law of a Congress into LawChange records in batch.
+
+        Produces the same LawChange records as calling ``process_law`` per
+        law, with the per-law overhead amortized:
+
+        - one grouped count finds laws that already have changes (skipped);
+        - law texts are fetched concurrently, ``fetch_concurrency`` at a time;
+        - as each text arrives, its parsing, resolution and extraction run in
+          a pool of ``workers`` processes (0 runs them in this process),
+          reading through the parse-result cache;
+        - LawChange rows are bulk-inserted and committed every
+          ``commit_every`` laws, with one DataIngestionLog for the batch.
+
+        Errors are isolated per law: a failed fetch or parse is recorded on
+        that law's result, and if a transaction fails its laws are retried
+        one at a time. Parsing-session audit records (coverage spans,
+        ingestion reports) are not written; ``parse-law`` produces them for
+        a single law.
+
+        Args:
+            congress: Congress number (e.g., 113).
+            law_numbers: Restrict to these laws; all laws of the Congress in
+                the database by default.
+            default_title: Default US Code title for amendments that don't
+                specify.
+            dry_run: If True, generate diffs without persisting.
+            fetch_concurrency: Maximum concurrent GovInfo fetches.
+            workers: Parser processes (None: one per CPU; 0: in-process).
+            commit_every: Laws persisted per transaction.
+
+        Returns:
+            CongressBatchResult with one LawChangeResult per processed law.
+        """
+        batch = CongressBatchResult(congress=congress, dry_run=dry_run)
+
+        stmt = select(PublicLaw).where(PublicLaw.congress == congress)
+        if law_numbers is not None:
+            stmt = stmt.where(PublicLaw.law_number.in_([str(n) for n in law_numbers]))
+        laws = sorted(
+            (await self.session.execute(stmt)).scalars().all(),
+            key=lambda law: int(law.law_number),
+        )
+        found = {int(law.law_number) for law in laws}
+        for law_number in sorted(set(law_numbers or []) - found):
+            missing = LawChangeResult(
+                law=PublicLaw(congress=congress, law_number=str(law_number)),
+                dry_run=dry_run,
+            )
+            missing.errors.append(
+                f"PL {congress}-{law_number} not in database. "
+                "Run 'govinfo-ingest-law' first."
+            )
+            batch.results.append(missing)
+
+        # Idempotency: one grouped count instead of a count() per law
+        if not dry_run and laws:
+            count_result = await self.session.execute(
+                select(LawChange.law_id, func.count())
+                .where(LawChange.law_id.in_([law.law_id for law in laws]))
+                .group_by(LawChange.law_id)
+            )
+            existing = {law_id for law_id, count in count_result.all() if count}
+            batch.skipped = [
+                f"PL {congress}-{law.law_number}"
+                for law in laws
+                if law.law_id in existing
+            ]
+            laws = [law for law in laws if law.law_id not in existing]
+        if not laws:
+            return batch
+
+        log = DataIngestionLog(
+            source="LawChangeService",
+            operation=f"process_congress_{congress}",
+            started_at=datetime.utcnow(),
+            status="running",
+        )
+        self.session.add(log)
+        await self.session.flush()
+        if not dry_run:
+            # Commit the log on its own so a failed chunk cannot roll it back
+            await self.session.commit()
+
+        texts, prepared = await self._fetch_and_prepare_laws(
+            laws, fetch_concurrency, default_title, workers
+        )
+
+        diff_gen = DiffGenerator(self.session)
+        step = max(1, commit_every)
+        for start in range(0, len(laws), step):
+            chunk: list[tuple[LawChangeResult, list[dict]]] = []
+            for law, text, prep in zip(
+                laws[start : start + step],
+                texts[start : start + step],
+                prepared[start : start + step],
+                strict=True,
+            ):
+                await self._reload_if_expired(law)
+                result = LawChangeResult(law=law, dry_run=dry_run)
+                batch.results.append(result)
+                label = f"PL {congress}-{law.law_number}"
+                if isinstance(text, BaseException) or not text:
+                    result.errors.append(
+                        f"Could not retrieve text for {label}"
+                        + (f": {text}" if isinstance(text, BaseException) else "")
+                    )
+                    continue
+                if isinstance(prep, BaseException) or prep is None:
+                    result.errors.append(f"Failed to parse {label}: {prep}")
+                    continue
+                result.amendments = prep.amendments
+                result.diffs, result.report = await diff_gen.generate_diffs(
+                    prep.amendments, prep.resolutions, prep.extractions, law
+                )
+                chunk.append((result, diff_gen.law_change_rows(result.diffs, law)))
+
+            if not dry_run and chunk:
+                await self._persist_chunk(chunk)
+
+        await self._reload_if_expired(log)
+        log.status = "completed"
+        log.completed_at = datetime.utcnow()
+        log.records_processed = len(laws)
+        log.records_created = batch.changes_created
+        log.details = (
+            f"Congress {congress}: {len(laws) - len(batch.failed)} processed, "
+            f"{len(batch.failed)} failed, {len(batch.skipped)} skipped, "
+            f"{batch.changes_created} changes"
+        )
+        if not dry_run:
+            await self.session.commit()
+
+        logger.info(log.details)
+        return batch
+
+    async def _fetch_and_prepare_laws(
+        self,
+        laws: list[PublicLaw],
+        concurrency: int,
+        default_title: int | None,
+        workers: int | None,
+    ) -> tuple[
+        list[str | BaseException | None], list[_PreparedLaw | BaseException | None]
+    ]:
+        """Fetch every law's text and run ``_prepare_law`` on it, in law order.
+
+        Texts are fetched ``concurrency`` at a time, and each is prepared as
+        soon as it arrives, so parsing overlaps the remaining fetches.
+        Cached parse results are resolved in this process; the rest are
+        parsed in the process pool and written back to the cache.
+        """
+        client = self.govinfo_client or GovInfoClient()
+        sem = asyncio.Semaphore(max(1, concurrency))
+        loop = asyncio.get_running_loop()
+        pool = ProcessPoolExecutor(max_workers=workers) if workers != 0 else None
+
+        async def _prepare(text: str) -> _PreparedLaw:
+            parser = _law_parser(text, default_title)
+            cached = await parse_cache.aload_cached(parser, text)
+            if cached is not None or pool is None:
+                prepared = _prepare_law(text, default_title, cached)
+            else:
+                prepared = await loop.run_in_executor(
+                    pool, _prepare_law, text, default_title
+                )
+            if cached is None:
+                await parse_cache.astore(parser, text, prepared.amendments)
+            return prepared
+
+        async def _fetch_and_prepare(
+            law: PublicLaw,
+        ) -> tuple[str | BaseException | None, _PreparedLaw | BaseException | None]:
+            try:
+                # Only the fetch holds the semaphore; parsing has the pool
+                async with sem:
+                    text = await client.get_law_text(law.congress, int(law.law_number))
+            except Exception as e:
+                return e, None
+            if not text:
+                return text, None
+            try:
+                return text, await _prepare(text)
+            except Exception as e:
+                return text, e
+
+        try:
+            results = await asyncio.gather(*[_fetch_and_prepare(law) for law in laws])
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+        return [text for text, _ in results], [prep for _, prep in results]
+
+    async def _persist_chunk(
+        self, chunk: list[tuple[LawChangeResult, list[dict]]]
+    ) -> None:
+        """Insert and commit several laws' changes, isolating failures.
+
+        All rows go in one bulk INSERT and one transaction; if that fails,
+        each law is retried in its own transaction and only the laws that
+        still fail are marked as errors.
+        """
+        labels = [
+            f"PL {result.law.congress}-{result.law.law_number}" for result, _ in chunk
+        ]
+        try:
+            await self._insert_changes(chunk)
+            await self.session.commit()
+            return
+        except Exception:
+            logger.warning(
+                f"Bulk insert of {len(chunk)} laws failed; retrying one at a time",
+                exc_info=True,
+            )
+            await self.session.rollback()
+
+        for (result, rows), label in zip(chunk, labels, strict=True):
+            try:
+                await self._reload_if_expired(result.law)
+                await self._insert_changes([(result, rows)])
+                await self.session.commit()
+            except Exception as e:
+                logger.exception(f"Error persisting {label}")
+                await self.session.rollback()
+                result.changes = []
+                result.errors.append(f"Failed to persist {label}: {e}")
+
+    async def _insert_changes(
+        self, chunk: list[tuple[LawChangeResult, list[dict]]]
+    ) -> None:
+        """Bulk-insert LawChange rows and update each law's statistics."""
+        rows = [row for _result, law_rows in chunk for row in law_rows]
+        changes: list[LawChange] = []
+        if rows:
+            inserted = await self.session.scalars(
+                insert(LawChange).returning(LawChange, sort_by_parameter_order=True),
+                rows,
+            )
+            changes = list(inserted)
+        offset = 0
+        for result, law_rows in chunk:
+            result.changes = changes[offset : offset + len(law_rows)]
+            offset += len(law_rows)
+            if result.report is not None:
+                await self._update_law_stats(result.law, result.report)
+
+    async def _reload_if_expired(self, instance: object) -> None:
+        """Reload an instance expired by a rollback before it is read again."""
+        if inspect(instance).expired_attributes:
+            await self.session.refresh(instance)
+
     async def _update_law_stats(self, law: PublicLaw, report: DiffReport) -> None:
         """Update PublicLaw aggregate statistics from diff report."""
         sections_added = 0
@@ -0,0 +1,220 @@
+"""Persisted cache of amendment parse results.
+
+Parsing a large law (regex or USLM XML) costs seconds, and the same text
+is parsed again by ``parse-law``, ``LawChangeService.process_law``, the
+play-forward prefetcher and the law viewer API. Results are cached in the
+``PipelineCache`` under a key made of:
+
+- the SHA-256 of the law text;
+- a parser version: a hash of the pattern set (``AMENDMENT_PATTERNS``
+  for the regex parser) and ``PARSE_CACHE_FORMAT``;
+- the parser settings that change its output (default title, minimum
+  confidence).
+
+Adding a promoted pattern to ``patterns.py`` changes the version, so
+entries parsed without it are simply never read again. Entries are
+gzip-compressed JSON.
+
+Caching is off until ``set_pipeline_cache`` is called (the CLI does so at
+startup, the API when a GCS cache bucket is configured); ``parse_with_cache``
+then parses directly. Code running on an event loop uses the ``a``-prefixed
+variants, whose cache I/O runs in a worker thread.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import gzip
+import hashlib
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+
+from app.models.enums import ChangeType
+from pipeline.legal_parser.amendment_parser import (
+    AmendmentParser,
+    ParsedAmendment,
+    PositionQualifier,
+    PositionType,
+    SectionReference,
+)
+from pipeline.legal_parser.patterns import AmendmentPattern, PatternType
+
+if TYPE_CHECKING:
+    from pipeline.cache import PipelineCache
+    from pipeline.legal_parser.xml_parser import XMLAmendmentParser
+
+logger = logging.getLogger(__name__)
+
+# Bump when a parser's code (not its patterns) changes what it extracts,
+# or when the serialized form below changes.
+PARSE_CACHE_FORMAT = 1
+
+_KEY_PREFIX = "parsed"
+
+# Module-level PipelineCache reference (set via set_pipeline_cache())
+_pipeline_cache: PipelineCache | None = None
+
+
+def set_pipeline_cache(cache: PipelineCache | None) -> None:
+    """Set the module-level PipelineCache that stores parse results."""
+    global _pipeline_cache
+    _pipeline_cache = cache
+
+
+def parser_version(patterns: list[AmendmentPattern] | None = None) -> str:
+    """Version of a parser's output, as a short hex digest.
+
+    With ``patterns`` (regex parser), hashes every pattern's name, type,
+    regex and confidence; without, only the XML parser's inputs (the
+    pattern types it classifies into). Both include ``PARSE_CACHE_FORMAT``.
+    """
+    if patterns is None:
+        spec: list[Any] = ["xml", sorted(t.value for t in PatternType)]
+    else:
+        spec = [[p.name, p.pattern_type.value, p.regex, p.confidence] for p in patterns]
+    payload = json.dumps([PARSE_CACHE_FORMAT, spec], separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def cache_key(parser: AmendmentParser | XMLAmendmentParser, text: str) -> str:
+    """Return the cache key for ``parser``'s result on ``text``."""
+    text_hash = hashlib.sha256(text.encode()).hexdigest()
+    if isinstance(parser, AmendmentParser):
+        kind = "text"
+        version = parser_version(parser.patterns)
+        settings = f"t{parser.default_title or 0}-c{parser.min_confidence}"
+    else:
+        kind = "xml"
+        version = parser_version()
+        settings = f"t{parser.default_title or 0}"
+    return f"{_KEY_PREFIX}/{kind}/{version}/{text_hash}-{settings}.json.gz"
+
+
+def serialize_amendments(amendments: list[ParsedAmendment]) -> bytes:
+    """Encode parse results as gzip-compressed JSON."""
+    payload = json.dumps(
+        [dataclasses.asdict(a) for a in amendments], separators=(",", ":")
+    )
+    return gzip.compress(payload.encode(), compresslevel=6)
+
+
+def deserialize_amendments(data: bytes) -> list[ParsedAmendment]:
+    """Decode ``serialize_amendments`` output."""
+    amendments: list[ParsedAmendment] = []
+    for item in json.loads(gzip.decompress(data)):
+        section_ref = item.pop("section_ref")
+        position = item.pop("position_qualifier")
+        amendments.append(
+            ParsedAmendment(
+                **item
+                | {
+                    "pattern_type": PatternType(item["pattern_type"]),
+                    "change_type": ChangeType(item["change_type"]),
+                    "section_ref": (
+                        SectionReference(**section_ref) if section_ref else None
+                    ),
+                    "position_qualifier": (
+                        PositionQualifier(
+                            **position | {"type": PositionType(position["type"])}
+                        )
+                        if position
+                        else None
+                    ),
+                }
+            )
+        )
+    return amendments
+
+
+def load_cached(
+    parser: AmendmentParser | XMLAmendmentParser, text: str
+) -> list[ParsedAmendment] | None:
+    """Return the cached result of ``parser`` on ``text``, or None.
+
+    None when caching is off, on a miss, or when the entry is unreadable
+    (logged).
+    """
+    cache = _pipeline_cache
+    if cache is None:
+        return None
+    key = cache_key(parser, text)
+    return _decode(key, cache.get_bytes(key))
+
+
+async def aload_cached(
+    parser: AmendmentParser | XMLAmendmentParser, text: str
+) -> list[ParsedAmendment] | None:
+    """Async ``load_cached``."""
+    cache = _pipeline_cache
+    if cache is None:
+        return None
+    key = cache_key(parser, text)
+    return _decode(key, await cache.aget_bytes(key))
+
+
+def _decode(key: str, data: bytes | None) -> list[ParsedAmendment] | None:
+    """Deserialize a cache entry; None if missing or unreadable (logged)."""
+    if data is None:
+        return None
+    try:
+        amendments = deserialize_amendments(data)
+    except Exception as e:
+        logger.warning(f"Discarding unreadable parse cache entry {key}: {e}")
+        return None
+    logger.debug(f"Parse cache hit: {key}")
+    return amendments
+
+
+def store(
+    parser: AmendmentParser | XMLAmendmentParser,
+    text: str,
+    amendments: list[ParsedAmendment],
+) -> None:
+    """Cache the result of ``parser`` on ``text``; write failures are logged."""
+    cache = _pipeline_cache
+    if cache is None:
+        return
+    key = cache_key(parser, text)
+    try:
+        cache.put_bytes(key, serialize_amendments(amendments))
+    except Exception as e:
+        logger.warning(f"Failed to write parse cache entry {key}: {e}")
+
+
+async def astore(
+    parser: AmendmentParser | XMLAmendmentParser,
+    text: str,
+    amendments: list[ParsedAmendment],
+) -> None:
+    """Async ``store``."""
+    cache = _pipeline_cache
+    if cache is None:
+        return
+    key = cache_key(parser, text)
+    try:
+        await cache.aput_bytes(key, serialize_amendments(amendments))
+    except Exception as e:
+        logger.warning(f"Failed to write parse cache entry {key}: {e}")
+
+
+def parse_with_cache(
+    parser: AmendmentParser | XMLAmendmentParser, text: str
+) -> list[ParsedAmendment]:
+    """Return ``parser.parse(text)``, read through the parse-result cache."""
+    amendments = load_cached(parser, text)
+    if amendments is None:
+        amendments = parser.parse(text)
+        store(parser, text, amendments)
+    return amendments
+
+
+async def aparse_with_cache(
+    parser: AmendmentParser | XMLAmendmentParser, text: str
+) -> list[ParsedAmendment]:
+    """Async ``parse_with_cache``; parsing itself still runs inline."""
+    amendments = await aload_cached(parser, text)
+    if amendments is None:
+        amendments = parser.parse(text)
+        await astore(parser, text, amendments)
+    return amendments
@@ -27,6 +27,7 @@ from app.models.validation import (
     TextSpan,
 )
 from pipeline.legal_parser.amendment_parser import AmendmentParser, ParsedAmendment
+from pipeline.legal_parser.parse_cache import aparse_with_cache
 from pipeline.legal_parser.text_accounting import (
     CoverageReport,
     TextAccountant,
@@ -134,9 +135,9 @@ class RegExParsingSession:
                 from pipeline.legal_parser.xml_parser import XMLAmendmentParser
 
                 xml_parser = XMLAmendmentParser(default_title=self.default_title)
-                amendments = xml_parser.parse(law_text)
+                amendments = await aparse_with_cache(xml_parser, law_text)
             else:
-                amendments = self.parser.parse(law_text)
+                amendments = await aparse_with_cache(self.parser, law_text)
 
             # Track text coverage
             accountant = TextAccountant(law_text)
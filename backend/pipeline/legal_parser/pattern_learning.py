@@ -249,7 +249,9 @@ class PatternLearningService:
 
         Note: This marks the discovery as promoted but doesn't automatically
         add the pattern to AMENDMENT_PATTERNS. That requires a code change
-        to patterns.py.
+        to patterns.py, which also changes the parser version that cached
+        parse results are keyed by (see parse_cache), so laws are re-parsed
+        with the new pattern.
 
         Args:
             discovery_id: ID of the discovery.
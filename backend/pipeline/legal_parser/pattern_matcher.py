@@ -0,0 +1,223 @@
+"""Anchored multi-pattern matching for amendment patterns.
+
+Running every amendment pattern with ``finditer`` over a law means one full
+scan of the text per pattern, and multi-megabyte omnibus laws make that the
+dominant parsing cost. Every pattern in ``AMENDMENT_PATTERNS`` starts with a
+keyword (``striking``, ``inserting``, ``section``, ``paragraph``, ...),
+optionally preceded by ``by``, so a match can only begin at a handful of
+positions.
+
+``AnchoredMatcher`` finds all keyword occurrences up front, then
+tries each pattern only at the positions where one of its leading keywords
+(or the ``by`` before it) starts, using ``Pattern.match``. Because every
+possible match start is tried in ascending order and the scan resumes after
+each match, the result is exactly what ``finditer`` returns.
+
+Patterns whose leading keyword cannot be determined from the regex source
+(e.g. ones added by pattern learning) fall back to a plain ``finditer``.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from collections.abc import Iterator
+
+from pipeline.legal_parser.patterns import AmendmentPattern
+
+# Optional "by " prefix shared by most patterns, in regex-source form
+_BY_PREFIX = r"(?:by\s+)?"
+
+# Leading keyword forms: "[Ss]ection", "(?:adding|inserting)", "striking"
+_CHAR_CLASS_WORD = re.compile(r"\[([A-Za-z])([A-Za-z])\]([a-z]+)")
+_ALTERNATION = re.compile(r"\(\?:([a-z]+(?:\|[a-z]+)*)\)")
+_PLAIN_WORD = re.compile(r"([a-z]+)")
+
+# A keyword is only mandatory if it is not followed by a quantifier
+_QUANTIFIERS = ("?", "*", "+", "{")
+
+# Matches "by" + whitespace exactly as the patterns' (?:by\s+)? does
+_BY_RE = re.compile(r"by\s+", re.IGNORECASE | re.MULTILINE | re.DOTALL)
+
+
+def _has_top_level_alternation(regex: str) -> bool:
+    """True if ``regex`` has a ``|`` outside any group or character class."""
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(regex):
+        char = regex[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+            # A "]" right after "[" or "[^" is a literal member
+            if regex[i + 1 : i + 2] == "^":
+                i += 1
+            if regex[i + 1 : i + 2] == "]":
+                i += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+def leading_keywords(regex: str) -> tuple[bool, frozenset[str]] | None:
+    """Return (has_by_prefix, keywords) a match of ``regex`` must start with.
+
+    Returns None if the regex does not start with a recognizable mandatory
+    keyword, in which case the pattern must be scanned in full. A top-level
+    alternation lets later branches start anywhere, so it also returns None.
+    """
+    if _has_top_level_alternation(regex):
+        return None
+    has_by = regex.startswith(_BY_PREFIX)
+    rest = regex[len(_BY_PREFIX) :] if has_by else regex
+
+    words: list[str] | None = None
+    end = 0
+    if m := _CHAR_CLASS_WORD.match(rest):
+        if m.group(1).lower() == m.group(2).lower():
+            words = [m.group(1).lower() + m.group(3)]
+            end = m.end()
+    elif m := _ALTERNATION.match(rest):
+        words = m.group(1).split("|")
+        end = m.end()
+    elif m := _PLAIN_WORD.match(rest):
+        words = [m.group(1)]
+        end = m.end()
+
+    if not words or rest[end : end + 1] in _QUANTIFIERS:
+        return None
+    return has_by, frozenset(words)
+
+
+class AnchoredMatcher:
+    """Finds matches of many patterns with one keyword scan of the text.
+
+    Args:
+        patterns: Amendment patterns to match.
+        flags: Regex flags the patterns are compiled with.
+    """
+
+    def __init__(
+        self,
+        patterns: list[AmendmentPattern],
+        flags: int = re.IGNORECASE | re.MULTILINE | re.DOTALL,
+    ) -> None:
+        self._compiled: dict[str, re.Pattern[str]] = {}
+        self._anchors: dict[str, tuple[bool, frozenset[str]]] = {}
+        keywords: set[str] = set()
+        for pattern in patterns:
+            self._compiled[pattern.name] = re.compile(pattern.regex, flags)
+            anchors = leading_keywords(pattern.regex)
+            if anchors is not None:
+                self._anchors[pattern.name] = anchors
+                keywords |= anchors[1]
+
+        # Keywords that are prefixes of other keywords would be shadowed at
+        # the same position by the longer alternative; scan those in full.
+        shadowed = {a for a in keywords for b in keywords if a != b and b.startswith(a)}
+        if shadowed:
+            for name, (_, words) in list(self._anchors.items()):
+                if words & shadowed:
+                    del self._anchors[name]
+            keywords -= shadowed
+
+        # One capture group per keyword: under IGNORECASE the matched text
+        # need not lowercase to the keyword (e.g. the long s in "ſtriking").
+        self._keywords = sorted(keywords)
+        self._keyword_scan: re.Pattern[str] | None = None
+        if keywords:
+            alternation = "|".join(f"({k})" for k in self._keywords)
+            # Zero-width lookahead so overlapping keywords ("subsection" and
+            # the "section" inside it) are all reported.
+            self._keyword_scan = re.compile(f"(?=(?:{alternation}))", flags)
+
+    def scan(self, text: str) -> dict[str, list[int]]:
+        """Return the sorted start positions of each keyword in ``text``."""
+        positions: dict[str, list[int]] = {}
+        if self._keyword_scan is None:
+            return positions
+        keywords = self._keywords
+        if text.isascii():
+            # For ASCII text, lowercasing keeps offsets and matches exactly
+            # what IGNORECASE does, so C-speed str.find can do the scan.
+            lowered = text.lower()
+            for keyword in keywords:
+                found: list[int] = []
+                pos = lowered.find(keyword)
+                while pos != -1:
+                    found.append(pos)
+                    pos = lowered.find(keyword, pos + 1)
+                if found:
+                    positions[keyword] = found
+            return positions
+        for m in self._keyword_scan.finditer(text):
+            keyword = keywords[m.lastindex - 1]  # type: ignore[operator]
+            positions.setdefault(keyword, []).append(m.start())
+        return positions
+
+    def finditer(
+        self,
+        name: str,
+        text: str,
+        positions: dict[str, list[int]] | None = None,
+    ) -> Iterator[re.Match[str]]:
+        """Yield the matches ``re.finditer`` would yield for pattern ``name``.
+
+        Args:
+            name: Pattern name.
+            text: Text to search.
+            positions: Result of ``scan(text)``; computed if omitted. Pass it
+                when matching several patterns against the same text.
+        """
+        compiled = self._compiled[name]
+        anchors = self._anchors.get(name)
+        if anchors is None:
+            yield from compiled.finditer(text)
+            return
+
+        if positions is None:
+            positions = self.scan(text)
+        has_by, words = anchors
+        starts: set[int] = set()
+        for word in words:
+            for pos in positions.get(word, ()):
+                starts.add(pos)
+                if has_by:
+                    by_start = self._by_start(text, pos)
+                    if by_start is not None:
+                        starts.add(by_start)
+        candidates = sorted(starts)
+
+        i = 0
+        while i < len(candidates):
+            m = compiled.match(text, candidates[i])
+            if m is None:
+                i += 1
+                continue
+            yield m
+            # finditer resumes after the match (one further on empty matches)
+            resume = m.end() if m.end() > m.start() else m.start() + 1
+            i = bisect_left(candidates, resume, i + 1)
+
+    @staticmethod
+    def _by_start(text: str, pos: int) -> int | None:
+        """Start of a "by" + whitespace run ending right at ``pos``, if any."""
+        q = pos
+        while q > 0 and text[q - 1].isspace():
+            q -= 1
+        if q == pos or q < 2:
+            return None
+        if _BY_RE.match(text, q - 2, pos) is None:
+            return None
+        return q - 2
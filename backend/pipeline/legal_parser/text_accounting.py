@@ -9,6 +9,8 @@ import json
 import re
 from dataclasses import dataclass, field
 
+from pipeline.legal_parser.intervals import merge_intervals
+
 # Keywords that suggest amendment content in unclaimed text
 AMENDMENT_KEYWORDS = [
     "amended",
@@ -89,6 +91,10 @@ class TextAccountant:
         self.text = text
         self.total_length = len(text)
         self._claimed_spans: list[ClaimedSpan] = []
+        # Sorted claims and their merged (start, end) intervals, computed
+        # lazily and reset whenever a span is claimed
+        self._sorted_claims: list[ClaimedSpan] | None = None
+        self._merged_claims: list[tuple[int, int]] | None = None
         self._keyword_pattern = self._build_keyword_pattern()
 
     def _build_keyword_pattern(self) -> re.Pattern:
@@ -129,10 +135,22 @@ class TextAccountant:
                 pattern_name=pattern_name,
             )
         )
+        self._sorted_claims = None
+        self._merged_claims = None
 
     def get_claimed_spans(self) -> list[ClaimedSpan]:
         """Get all claimed spans, sorted by position."""
-        return sorted(self._claimed_spans, key=lambda s: s.start_pos)
+        if self._sorted_claims is None:
+            self._sorted_claims = sorted(self._claimed_spans, key=lambda s: s.start_pos)
+        return list(self._sorted_claims)
+
+    def _get_merged_claims(self) -> list[tuple[int, int]]:
+        """Claimed spans merged into disjoint (start, end) intervals."""
+        if self._merged_claims is None:
+            self._merged_claims = merge_intervals(
+                (s.start_pos, s.end_pos) for s in self.get_claimed_spans()
+            )
+        return self._merged_claims
 
     def get_unclaimed_spans(self, min_length: int = 10) -> list[UnclaimedSpan]:
         """Get spans of text not claimed by any pattern.
@@ -151,28 +169,22 @@ class TextAccountant:
                 return [UnclaimedSpan(start_pos=0, end_pos=len(text), text=text)]
             return []
 
-        # Sort claimed spans by start position
-        sorted_claims = sorted(self._claimed_spans, key=lambda s: s.start_pos)
-
-        # Merge overlapping claims
-        merged_claims = self._merge_overlapping_spans(sorted_claims)
-
         unclaimed: list[UnclaimedSpan] = []
         current_pos = 0
 
-        for claim in merged_claims:
-            if claim.start_pos > current_pos:
+        for claim_start, claim_end in self._get_merged_claims():
+            if claim_start > current_pos:
                 # Gap before this claim
-                gap_text = self.text[current_pos : claim.start_pos]
+                gap_text = self.text[current_pos:claim_start]
                 if len(gap_text.strip()) >= min_length:
                     unclaimed.append(
                         UnclaimedSpan(
                             start_pos=current_pos,
-                            end_pos=claim.start_pos,
+                            end_pos=claim_start,
                             text=gap_text,
                         )
                     )
-            current_pos = max(current_pos, claim.end_pos)
+            current_pos = max(current_pos, claim_end)
 
         # Check for gap at end
         if current_pos < self.total_length:
@@ -188,30 +200,6 @@ class TextAccountant:
 
         return unclaimed
 
-    def _merge_overlapping_spans(
-        self, sorted_spans: list[ClaimedSpan]
-    ) -> list[ClaimedSpan]:
-        """Merge overlapping claimed spans."""
-        if not sorted_spans:
-            return []
-
-        merged: list[ClaimedSpan] = [sorted_spans[0]]
-
-        for span in sorted_spans[1:]:
-            last = merged[-1]
-            if span.start_pos <= last.end_pos:
-                # Overlapping - extend the last span
-                merged[-1] = ClaimedSpan(
-                    start_pos=last.start_pos,
-                    end_pos=max(last.end_pos, span.end_pos),
-                    amendment_id=last.amendment_id,
-                    pattern_name=last.pattern_name,
-                )
-            else:
-                merged.append(span)
-
-        return merged
-
     def check_unclaimed_for_keywords(self, span: UnclaimedSpan) -> UnclaimedSpan:
         """Check if an unclaimed span contains amendment keywords.
 
@@ -242,8 +230,7 @@ class TextAccountant:
         claimed_spans = self.get_claimed_spans()
 
         # Calculate claimed length (accounting for overlaps)
-        merged = self._merge_overlapping_spans(claimed_spans)
-        claimed_length = sum(s.end_pos - s.start_pos for s in merged)
+        claimed_length = sum(end - start for start, end in self._get_merged_claims())
 
         # Calculate coverage percentage
         coverage_percentage = (
@@ -3,12 +3,19 @@
 Parses amendments from GovInfo USLM XML using semantic tags
 (<amendingAction>, <quotedText>, <ref>) instead of regex on plain text.
 Falls back gracefully when XML structure is incomplete.
+
+The document is parsed with lxml and walked once: that pass collects the
+instruction and section elements and marks every element containing an
+``<amendingAction>`` (by walking up from each action), so leaf
+decomposition never searches a subtree. Source offsets come from an
+index of ``identifier`` attributes built in one scan of the raw XML.
 """
 
 import dataclasses
 import logging
 import re
-import xml.etree.ElementTree as ET
+
+from lxml import etree
 
 from app.models.enums import ChangeType
 from pipeline.legal_parser.amendment_parser import (
@@ -68,7 +75,7 @@ def _classify_actions(
     return PatternType.AMEND_GENERAL, ChangeType.MODIFY
 
 
-def _element_text(elem: ET.Element) -> str:
+def _element_text(elem: etree._Element) -> str:
     """Get all text content of an element (including children), stripped."""
     return "".join(elem.itertext()).strip()
 
@@ -77,7 +84,7 @@ def _element_text(elem: ET.Element) -> str:
 _QUOTE_CHARS = '"\u201c\u201d\u2018\u2019\u0060\u00b4'
 
 
-def _quoted_element_text(elem: ET.Element) -> str:
+def _quoted_element_text(elem: etree._Element) -> str:
     """Get text of a ``<quotedText>`` or ``<quotedContent>`` element.
 
     Strips typographic quote characters from every text fragment, not just
@@ -94,7 +101,7 @@ def _quoted_element_text(elem: ET.Element) -> str:
 _QUOTED_TAGS = frozenset({_tag("quotedText"), _tag("quotedContent")})
 
 
-def _instruction_text(elem: ET.Element) -> str:
+def _instruction_text(elem: etree._Element) -> str:
     """Get instruction prose, excluding ``<quotedText>`` / ``<quotedContent>``.
 
     This prevents subsection/paragraph mentions inside inserted or struck
@@ -102,7 +109,7 @@ def _instruction_text(elem: ET.Element) -> str:
     """
     parts: list[str] = []
 
-    def _walk(el: ET.Element) -> None:
+    def _walk(el: etree._Element) -> None:
         if el.tag in _QUOTED_TAGS:
             return
         if el.text:
@@ -168,6 +175,7 @@ def _parse_section_from_text(
 
 
 _ACTION_TAG = _tag("amendingAction")
+_SECTION_TAG = _tag("section")
 
 # Structural USLM elements that can contain sub-instructions.
 _STRUCTURAL_TAGS = frozenset(
@@ -176,25 +184,23 @@ _STRUCTURAL_TAGS = frozenset(
 )
 
 
-def _has_amending_action(elem: ET.Element) -> bool:
-    """Return True if *elem* or any descendant contains an ``<amendingAction>``."""
-    return any(True for _ in elem.iter(_ACTION_TAG))
-
-
-def _is_redesignation(elem: ET.Element) -> bool:
+def _is_redesignation(elem: etree._Element) -> bool:
     """Return True if *elem* text matches a redesignation pattern."""
     text = _element_text(elem).lower()
     return bool(re.search(r"\bby\s+(re)?designating\b", text))
 
 
 def _find_leaf_instructions(
-    elem: ET.Element, ancestor_prose: str = ""
-) -> list[tuple[ET.Element, str]]:
+    elem: etree._Element,
+    with_action: set[etree._Element],
+    ancestor_prose: str = "",
+) -> list[tuple[etree._Element, str]]:
     """Decompose a multi-part instruction into its leaf amendment groups.
 
     A "leaf" is the deepest structural element that contains
     ``<amendingAction>`` tags without having structural children that also
-    contain ``<amendingAction>`` tags.
+    contain ``<amendingAction>`` tags. *with_action* holds every element
+    that is or contains an ``<amendingAction>``.
 
     Returns ``(leaf_element, ancestor_prose)`` pairs.  *ancestor_prose*
     accumulates ``<chapeau>`` / ``<num>`` text from parent structural
@@ -213,12 +219,12 @@ def _find_leaf_instructions(
     structural_kids = [
         child
         for child in elem
-        if child.tag in _STRUCTURAL_TAGS and _has_amending_action(child)
+        if child.tag in _STRUCTURAL_TAGS and child in with_action
     ]
     if structural_kids:
-        leaves: list[tuple[ET.Element, str]] = []
+        leaves: list[tuple[etree._Element, str]] = []
         for kid in structural_kids:
-            leaves.extend(_find_leaf_instructions(kid, combined))
+            leaves.extend(_find_leaf_instructions(kid, with_action, combined))
 
         # Also capture structural siblings that have no <amendingAction>
         # but contain redesignation prose (e.g. "by designating...").
@@ -227,17 +233,97 @@ def _find_leaf_instructions(
         for child in elem:
             if (
                 child.tag in _STRUCTURAL_TAGS
-                and not _has_amending_action(child)
+                and child not in with_action
                 and _is_redesignation(child)
             ):
                 leaves.append((child, combined))
         return leaves
 
-    if _has_amending_action(elem):
+    if elem in with_action:
         return [(elem, combined)]
     return []
 
 
+def _scan_tree(
+    root: etree._Element,
+) -> tuple[list[etree._Element], list[etree._Element], set[etree._Element]]:
+    """Walk the tree once, collecting what ``parse`` needs.
+
+    Returns ``(instructions, sections, with_action)``: every element with
+    role="instruction" (USLM places the attribute on whichever structural
+    element contains the amending instruction), every ``<section>``, both
+    in document order, and every element that is or contains an
+    ``<amendingAction>``.
+    """
+    instructions: list[etree._Element] = []
+    sections: list[etree._Element] = []
+    with_action: set[etree._Element] = set()
+    for elem in root.iter():
+        if elem.tag == _ACTION_TAG:
+            # Mark upwards until reaching an already-marked ancestor
+            node = elem
+            while node is not None and node not in with_action:
+                with_action.add(node)
+                node = node.getparent()
+        elif elem.tag == _SECTION_TAG:
+            sections.append(elem)
+        if elem.get("role") == "instruction":
+            instructions.append(elem)
+    return instructions, sections, with_action
+
+
+_IDENTIFIER_ATTR_RE = re.compile(r'identifier="([^"]*)"')
+
+
+class _SourcePositions:
+    """Approximate character offsets of instruction elements in the raw XML.
+
+    Elements are located by their ``identifier`` attribute, through an
+    index of each identifier's first occurrence built on first use.
+    """
+
+    def __init__(self, xml_text: str) -> None:
+        self.xml_text = xml_text
+        self._identifiers: dict[str, int] | None = None
+
+    def span(self, elem: etree._Element) -> tuple[int, int]:
+        """Return (start, end) of *elem*, or (0, 0) if it cannot be found."""
+        xml_text = self.xml_text
+        identifier = elem.get("identifier", "")
+        if identifier:
+            if self._identifiers is None:
+                self._identifiers = {}
+                for m in _IDENTIFIER_ATTR_RE.finditer(xml_text):
+                    self._identifiers.setdefault(m.group(1), m.start())
+            idx = self._identifiers.get(identifier, -1)
+            if idx >= 0:
+                # Walk backwards to find the opening '<'
+                start = xml_text.rfind("<", 0, idx)
+                if start < 0:
+                    start = idx
+                # Derive end tag from the element's actual tag name
+                # (may be section, subsection, paragraph, etc.)
+                local_name = etree.QName(elem).localname
+                end_marker = f"</{local_name}>"
+                end = xml_text.find(end_marker, idx)
+                if end < 0:
+                    end = xml_text.find(f"</{elem.tag}>", idx)
+                if end >= 0:
+                    end += len(end_marker)
+                else:
+                    end = min(idx + 500, len(xml_text))
+                return start, end
+
+        # Fallback: use the element's text to find approximate position
+        content_text = _element_text(elem)
+        if content_text:
+            idx = xml_text.find(content_text[:80])
+            if idx >= 0:
+                return idx, idx + len(content_text)
+
+        return 0, 0
+
+
 class XMLAmendmentParser:
     """Parse amendments from USLM XML using semantic tags.
 
@@ -252,39 +338,38 @@ class XMLAmendmentParser:
 
     def parse(self, xml_text: str) -> list[ParsedAmendment]:
         """Parse all amendments from a USLM XML string."""
+        parser = etree.XMLParser(
+            encoding="utf-8", remove_comments=True, remove_pis=True, huge_tree=True
+        )
         try:
-            root = ET.fromstring(xml_text)
-        except ET.ParseError as exc:
+            root = etree.fromstring(xml_text.encode("utf-8"), parser)
+        except etree.XMLSyntaxError as exc:
             logger.error("Failed to parse USLM XML: %s", exc)
             return []
 
+        instructions, sections, with_action = _scan_tree(root)
         amendments: list[ParsedAmendment] = []
+        positions = _SourcePositions(xml_text)
 
-        # Find ALL elements with role="instruction" (section, subsection,
-        # paragraph, etc.).  USLM places the attribute on whichever
-        # structural element contains the amending instruction.
-        for elem in root.iter():
-            if elem.get("role") != "instruction":
-                continue
-
+        for elem in instructions:
             # Extract the section reference from the top-level instruction
             # (the <ref> tag lives here, not in the leaf sub-instructions).
             parent_ref = self._extract_section_ref(elem)
 
             # Decompose multi-part instructions into leaf amendment groups.
-            for leaf, ancestor_prose in _find_leaf_instructions(elem):
-                amendment = self._parse_leaf(leaf, xml_text, parent_ref, ancestor_prose)
+            for leaf, ancestor_prose in _find_leaf_instructions(elem, with_action):
+                amendment = self._parse_leaf(
+                    leaf, positions, parent_ref, ancestor_prose
+                )
                 if amendment is not None:
                     amendments.append(amendment)
 
         # Second pass: detect freestanding note sections (no amending
         # instruction) that have a <sidenote> like "16 USC 797 note".
         processed_ids = {
-            elem.get("identifier")
-            for elem in root.iter()
-            if elem.get("role") == "instruction" and elem.get("identifier")
+            elem.get("identifier") for elem in instructions if elem.get("identifier")
         }
-        for elem in root.iter(_tag("section")):
+        for elem in sections:
             if elem.get("role") == "instruction":
                 continue
             ident = elem.get("identifier")
@@ -298,8 +383,8 @@ class XMLAmendmentParser:
 
     def _parse_leaf(
         self,
-        leaf: ET.Element,
-        xml_text: str,
+        leaf: etree._Element,
+        positions: _SourcePositions,
         parent_ref: SectionReference | None,
         ancestor_prose: str = "",
     ) -> ParsedAmendment | None:
@@ -340,8 +425,8 @@ class XMLAmendmentParser:
             leaf, quoted_texts, old_text, new_text
         )
 
-        # --- Position in source XML (byte-level approximation) ---
-        start_pos, end_pos = self._find_section_positions(leaf, xml_text)
+        # --- Position in source XML (character-level approximation) ---
+        start_pos, end_pos = positions.span(leaf)
 
         # --- Confidence ---
         has_ref = section_ref is not None
@@ -375,7 +460,7 @@ class XMLAmendmentParser:
             metadata={"source": "xml", "action_types": sorted(action_types)},
         )
 
-    def _extract_section_ref(self, section: ET.Element) -> SectionReference | None:
+    def _extract_section_ref(self, section: etree._Element) -> SectionReference | None:
         """Extract a SectionReference from ``<ref>`` tags or text fallback."""
         # Look for <ref href="/us/usc/t{title}/s{section}">
         for ref_elem in section.iter(_tag("ref")):
@@ -398,7 +483,7 @@ class XMLAmendmentParser:
     def _refine_section_ref(
         self,
         parent_ref: SectionReference | None,
-        leaf: ET.Element,
+        leaf: etree._Element,
         ancestor_prose: str = "",
     ) -> SectionReference | None:
         """Refine *parent_ref* using ancestor and leaf text.
@@ -444,7 +529,7 @@ class XMLAmendmentParser:
 
     @staticmethod
     def _augment_subsection(
-        ref: SectionReference, section: ET.Element
+        ref: SectionReference, section: etree._Element
     ) -> SectionReference:
         """Try to fill in ``subsection_path`` from the instruction text.
 
@@ -486,7 +571,7 @@ class XMLAmendmentParser:
             )
         return ref
 
-    def _extract_quoted_texts(self, section: ET.Element) -> list[str]:
+    def _extract_quoted_texts(self, section: etree._Element) -> list[str]:
         """Collect text from all ``<quotedText>`` and ``<quotedContent>`` elements.
 
         Strips leading/trailing typographic quote characters that appear as
@@ -503,7 +588,7 @@ class XMLAmendmentParser:
         return texts
 
     def _extract_old_new(
-        self, section: ET.Element
+        self, section: etree._Element
     ) -> tuple[list[str], str | None, str | None]:
         """Walk the element tree in document order to pair quoted texts with
         the preceding ``<amendingAction>`` type.
@@ -554,7 +639,7 @@ class XMLAmendmentParser:
 
     def _extract_position_qualifier(
         self,
-        leaf: ET.Element,
+        leaf: etree._Element,
         all_quoted_texts: list[str],
         old_text: str | None,
         new_text: str | None,
@@ -608,7 +693,7 @@ class XMLAmendmentParser:
 
     @staticmethod
     def _find_anchor_text(
-        leaf: ET.Element,
+        leaf: etree._Element,
         all_quoted_texts: list[str],  # noqa: ARG004 - reserved for future heuristics
         old_text: str | None,
         new_text: str | None,
@@ -656,53 +741,10 @@ class XMLAmendmentParser:
 
         return None
 
-    def _find_section_positions(
-        self, section: ET.Element, xml_text: str
-    ) -> tuple[int, int]:
-        """Approximate the start/end positions of an instruction element in the raw XML.
-
-        Uses the element's ``identifier`` attribute to locate it.
-        Falls back to 0-based positions if not found.
-        """
-        identifier = section.get("identifier", "")
-        if identifier:
-            marker = f'identifier="{identifier}"'
-            idx = xml_text.find(marker)
-            if idx >= 0:
-                # Walk backwards to find the opening '<'
-                start = xml_text.rfind("<", 0, idx)
-                if start < 0:
-                    start = idx
-                # Derive end tag from the element's actual tag name
-                # (may be section, subsection, paragraph, etc.)
-                local_name = (
-                    section.tag.split("}")[-1] if "}" in section.tag else section.tag
-                )
-                end_marker = f"</{local_name}>"
-                ns_end = f"</{section.tag}>"
-                end = xml_text.find(end_marker, idx)
-                if end < 0:
-                    end = xml_text.find(ns_end, idx)
-                if end >= 0:
-                    end += len(end_marker)
-                else:
-                    end = min(idx + 500, len(xml_text))
-                return start, end
-
-        # Fallback: use the section's text to find approximate position
-        content_text = _element_text(section)
-        if content_text:
-            snippet = content_text[:80]
-            idx = xml_text.find(snippet)
-            if idx >= 0:
-                return idx, idx + len(content_text)
-
-        return 0, 0
-
     # -- Sidenote regex for freestanding note sections --
     _SIDENOTE_RE = re.compile(r"(\d+)\s+U\.?S\.?C\.?\s+(\S+)\s+note", re.IGNORECASE)
 
-    def _parse_note_section(self, section: ET.Element) -> ParsedAmendment | None:
+    def _parse_note_section(self, section: etree._Element) -> ParsedAmendment | None:
         """Parse a freestanding section with a ``<sidenote>`` annotation.
 
         Returns a ParsedAmendment with change_type=ADD_NOTE if the section
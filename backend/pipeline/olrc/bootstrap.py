@@ -30,6 +30,7 @@ from pipeline.olrc.group_service import upsert_groups_from_parse_result
 from pipeline.olrc.normalized_section import normalize_parsed_section
 from pipeline.olrc.parser import ParsedSection, USLMParser, compute_text_hash
 from pipeline.olrc.release_point import parse_release_point_identifier
+from pipeline.olrc.section_dates import derive_section_dates
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +90,8 @@ class _SectionRow(NamedTuple):
     full_citation: str | None
     parent_group_key: str | None
     sort_order: int | None
+    enacted_date: date | None
+    last_modified_date: date | None
 
 
 def _build_snapshot_rows(
@@ -129,6 +132,7 @@ def _build_snapshot_rows(
                 mode="json",
                 exclude={"raw_notes": True},
             )
+        enacted_date, last_modified_date = derive_section_dates(notes_json)
 
         rows.append(
             _SectionRow(
@@ -143,6 +147,8 @@ def _build_snapshot_rows(
                 full_citation=section.full_citation,
                 parent_group_key=section.parent_group_key,
                 sort_order=section.sort_order,
+                enacted_date=enacted_date,
+                last_modified_date=last_modified_date,
             )
         )
     return rows
@@ -166,6 +172,8 @@ _COPY_COLUMNS = [
     "is_deleted",
     "group_id",
     "sort_order",
+    "enacted_date",
+    "last_modified_date",
     "created_at",
     "updated_at",
 ]
@@ -205,6 +213,8 @@ async def _copy_snapshots_to_db(
             d["is_deleted"],
             d["group_id"],  # uuid.UUID | None
             d["sort_order"],
+            d["enacted_date"],
+            d["last_modified_date"],
             d["created_at"],
             d["updated_at"],
         )
@@ -222,6 +232,25 @@ async def _copy_snapshots_to_db(
     )
 
 
+async def write_snapshot_rows(
+    session: AsyncSession,
+    snapshot_dicts: list[dict],
+    use_copy: bool = False,
+) -> None:
+    """Write snapshot rows in bulk: binary COPY, or one batched INSERT.
+
+    Without COPY, ``insert(SectionSnapshot)`` with a list of rows runs as a
+    single executemany, which SQLAlchemy batches into multi-row INSERTs on
+    drivers that support it and falls back to plain executemany elsewhere.
+    """
+    if not snapshot_dicts:
+        return
+    if use_copy:
+        await _copy_snapshots_to_db(session, snapshot_dicts)
+    else:
+        await session.execute(insert(SectionSnapshot), snapshot_dicts)
+
+
 async def ingest_title(
     session: AsyncSession,
     downloader: OLRCDownloader,
@@ -288,7 +317,8 @@ async def ingest_title(
     # parse_file method is dispatched to the thread — each call gets its own
     # instance so concurrent invocations from asyncio.gather are safe.
     try:
-        parse_result = await asyncio.to_thread(USLMParser().parse_file, xml_path)
+        with downloader.pinned(xml_path):
+            parse_result = await asyncio.to_thread(USLMParser().parse_file, xml_path)
     except Exception:
         logger.error(f"Title {title_num}: parse failed, skipping", exc_info=True)
         return None
@@ -342,15 +372,14 @@ async def ingest_title(
                 "is_deleted": False,
                 "group_id": group_id,
                 "sort_order": row.sort_order if row.sort_order is not None else 0,
+                "enacted_date": row.enacted_date,
+                "last_modified_date": row.last_modified_date,
                 "created_at": now,
                 "updated_at": now,
             }
         )
 
-    if use_copy:
-        await _copy_snapshots_to_db(session, snapshot_dicts)
-    else:
-        await session.execute(insert(SectionSnapshot), snapshot_dicts)
+    await write_snapshot_rows(session, snapshot_dicts, use_copy=use_copy)
     t_insert = time.monotonic()
 
     count = len(rows)
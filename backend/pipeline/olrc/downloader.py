@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import zipfile
-from io import BytesIO
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -55,6 +55,25 @@ OLRC_DOWNLOAD_BASE = f"{OLRC_BASE_URL}/download"
 #   See: https://www.congress.gov/bill/119th-congress/senate-bill/1071
 DEFAULT_RELEASE_POINT = "119-72not60"
 
+# Concurrent title downloads allowed against one host
+DEFAULT_CONNECTIONS_PER_HOST = 4
+
+
+class _IncompleteDownload(Exception):
+    """A download ended before the announced length, or could not resume."""
+
+
+def _content_range(response: httpx.Response) -> tuple[int, int | None]:
+    """Parse ``Content-Range: bytes start-end/total`` into (start, total)."""
+    unit_range = response.headers.get("content-range", "")
+    try:
+        _unit, spec = unit_range.split(" ", 1)
+        span, total = spec.split("/", 1)
+        return int(span.split("-", 1)[0]), None if total == "*" else int(total)
+    except ValueError as e:
+        raise _IncompleteDownload(f"bad Content-Range {unit_range!r}") from e
+
+
 # HARDCODED ASSUMPTION: URL pattern for downloading individual title XML files
 # Source: https://uscode.house.gov/download/download.shtml (inspect download links)
 # Last verified: January 2026
@@ -75,6 +94,8 @@ class OLRCDownloader:
         release_point: str = DEFAULT_RELEASE_POINT,
         timeout: float = 120.0,
         cache: PipelineCache | None = None,
+        extract: bool = True,
+        max_connections_per_host: int = DEFAULT_CONNECTIONS_PER_HOST,
     ):
         """Initialize the downloader.
 
@@ -84,12 +105,20 @@ class OLRCDownloader:
             timeout: HTTP request timeout in seconds.
             cache: Optional PipelineCache for shared (GCS-backed) caching
                 of raw ZIP downloads.
+            extract: If False, ``download_title_at_release_point`` returns
+                the downloaded ZIP instead of extracting it, and the parser
+                reads the XML straight from the archive.
+            max_connections_per_host: Concurrent downloads allowed against
+                one host (the OLRC throttles parallel title downloads).
         """
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
         self.release_point = release_point
         self.timeout = timeout
         self._cache = cache
+        self.extract = extract
+        self.max_connections_per_host = max_connections_per_host
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
 
         # Parse release point into congress and public_law components
         # e.g., "119-72not60" -> congress="119", public_law="72not60"
@@ -97,6 +126,23 @@ class OLRCDownloader:
         self.congress = parts[0]
         self.public_law = parts[1] if len(parts) > 1 else ""
 
+    def pinned(self, xml_path: Path) -> AbstractContextManager[None]:
+        """Protect a downloaded title's extracted directory (or ZIP) from eviction.
+
+        Use around work that reads the XML returned by a download method,
+        so a concurrent download cannot evict it from a size-bounded cache.
+        """
+        if self._cache is None:
+            return nullcontext()
+        if xml_path.suffix == ".zip":
+            return self._cache.pinned(xml_path)
+        return self._cache.pinned(xml_path.parent)
+
+    async def _track_extracted(self, xml_dir: Path) -> None:
+        """Hand an extracted title directory to the cache's local budget."""
+        if self._cache:
+            await asyncio.to_thread(self._cache.register_directory, xml_dir)
+
     def get_title_url(self, title_number: int) -> str:
         """Get the download URL for a specific title.
 
@@ -132,43 +178,40 @@ class OLRCDownloader:
                 logger.info(
                     f"Title {title_number} already extracted on disk: {xml_files[0]}"
                 )
+                await self._track_extracted(xml_dir)
                 return xml_files[0]
 
         cache_key = f"olrc/downloads/title{title_number}@{self.release_point}.zip"
 
         # Try GCS cache for the ZIP before hitting the OLRC API. Track the
         # source so the post-extract log line names where the bytes came from.
-        zip_bytes: bytes | None = None
+        archive: Path | None = None
         source = "OLRC"
         if self._cache and not force:
-            zip_bytes = self._cache.get_bytes(cache_key)
-            if zip_bytes:
+            archive = await self._cache.alocal_file(cache_key)
+            if archive:
                 source = "GCS cache"
 
-        if zip_bytes is None:
-            url = self.get_title_url(title_number)
-            logger.info(f"Fetching Title {title_number} from OLRC: {url}")
-
-            try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(url, follow_redirects=True)
-                    response.raise_for_status()
-                    zip_bytes = response.content
+        partial = self.download_dir / f".title{title_number}.zip.part"
+        try:
+            if archive is None:
+                url = self.get_title_url(title_number)
+                logger.info(f"Fetching Title {title_number} from OLRC: {url}")
+                if not await self._stream_to_file(
+                    url, partial, f"Title {title_number}"
+                ):
+                    return None
 
                 # Store in cache
                 if self._cache:
-                    self._cache.put_bytes(cache_key, zip_bytes)
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error downloading Title {title_number}: {e}")
-                return None
-            except Exception as e:
-                logger.exception(f"Error downloading Title {title_number}: {e}")
-                return None
+                    await self._cache.aput_file(cache_key, partial)
+                    archive = self._cache.local_path(cache_key)
+                else:
+                    archive = partial
 
-        # Extract ZIP file
-        try:
+            # Extract ZIP file
             xml_dir.mkdir(parents=True, exist_ok=True)
-            with zipfile.ZipFile(BytesIO(zip_bytes)) as zf:
+            with zipfile.ZipFile(archive) as zf:
                 zf.extractall(xml_dir)
 
             xml_files = list(xml_dir.glob("*.xml"))
@@ -176,6 +219,7 @@ class OLRCDownloader:
                 logger.info(
                     f"Title {title_number} loaded from {source}: {xml_files[0]}"
                 )
+                await self._track_extracted(xml_dir)
                 return xml_files[0]
             else:
                 logger.error(
@@ -185,6 +229,8 @@ class OLRCDownloader:
         except zipfile.BadZipFile as e:
             logger.error(f"Invalid ZIP file for Title {title_number}: {e}")
             return None
+        finally:
+            partial.unlink(missing_ok=True)
 
     def get_downloaded_titles(self) -> list[int]:
         """Get list of title numbers that have been downloaded.
@@ -232,6 +278,9 @@ class OLRCDownloader:
         """Download XML for a title at a specific release point.
 
         Downloads are cached in data/olrc/releases/{release_point}/title{N}/.
+        With ``extract=False`` the ZIP itself is returned instead (the
+        cache's local entry, or data/olrc/releases/{release_point}/title{N}.zip
+        without a cache); ``USLMParser.parse_file`` reads the XML from it.
 
         Args:
             title_number: The US Code title number (1-54).
@@ -239,7 +288,8 @@ class OLRCDownloader:
             force: If True, download even if file exists.
 
         Returns:
-            Path to the extracted XML file, or None if download failed.
+            Path to the extracted XML file (or the ZIP), or None if download
+            failed.
         """
         # Cache in release-point-specific directory
         rp_dir = self.download_dir / "releases" / release_point / f"title{title_number}"
@@ -251,94 +301,24 @@ class OLRCDownloader:
                     f"Title {title_number}@{release_point} already extracted "
                     f"on disk: {xml_files[0]}"
                 )
+                await self._track_extracted(rp_dir)
                 return xml_files[0]
 
-        cache_key = f"olrc/downloads/title{title_number}@{release_point}.zip"
-
-        # Try GCS cache for the ZIP. Track the source so the post-extract log
-        # line names where the bytes came from.
-        zip_bytes: bytes | None = None
-        source = "OLRC"
-        if self._cache and not force:
-            zip_bytes = self._cache.get_bytes(cache_key)
-            if zip_bytes:
-                source = "GCS cache"
-
-        if zip_bytes is None:
-            # Parse the release point
-            parts = release_point.split("-", 1)
-            congress = parts[0]
-            public_law = parts[1] if len(parts) > 1 else ""
-
-            url = TITLE_XML_URL_PATTERN.format(
-                congress=congress,
-                public_law=public_law,
-                title_number=title_number,
-            )
-            logger.info(
-                f"Fetching Title {title_number}@{release_point} from OLRC: {url}"
-            )
-
-            max_retries = 3
-            for attempt in range(1, max_retries + 1):
-                try:
-                    async with httpx.AsyncClient(timeout=self.timeout) as client:
-                        response = await client.get(url, follow_redirects=True)
-                        response.raise_for_status()
-                        zip_bytes = response.content
-                    break
-                except httpx.HTTPStatusError as e:
-                    logger.error(
-                        f"HTTP error downloading Title {title_number}@{release_point}: {e}"
-                    )
-                    return None
-                except (httpx.RemoteProtocolError, httpx.ReadError) as e:
-                    if attempt < max_retries:
-                        wait = 2**attempt
-                        logger.warning(
-                            f"Title {title_number}@{release_point}: connection error "
-                            f"(attempt {attempt}/{max_retries}), retrying in {wait}s: {e}"
-                        )
-                        await asyncio.sleep(wait)
-                    else:
-                        logger.error(
-                            f"Title {title_number}@{release_point}: failed after "
-                            f"{max_retries} attempts: {e}"
-                        )
-                        return None
-                except Exception as e:
-                    logger.exception(
-                        f"Error downloading Title {title_number}@{release_point}: {e}"
-                    )
-                    return None
-
-            if zip_bytes is None:
-                return None
+        fetched = await self._fetch_archive(title_number, release_point, force)
+        if fetched is None:
+            return None
+        archive, source = fetched
 
-        # Validate ZIP magic bytes regardless of source (OLRC or GCS cache).
-        # The OLRC returns HTTP 200 with an HTML error page for titles that
-        # don't exist at a given release point (e.g. Title 54 was enacted in
-        # P.L. 113-287, so it's absent from RP 113-21). Stale cache entries
-        # written before this check was added would otherwise surface as a
-        # confusing BadZipFile ERROR below.
-        if not zip_bytes.startswith((b"PK\x03\x04", b"PK\x05\x06")):
+        if not self.extract:
             logger.info(
-                f"Title {title_number}@{release_point}: not a ZIP "
-                "(not codified at this release point), skipping"
+                f"Title {title_number}@{release_point} loaded from {source}: {archive}"
             )
-            # Evict the stale cache entry so future runs don't repeat this.
-            if self._cache and source == "GCS cache":
-                self._cache.delete(cache_key)
-            return None
-
-        # Cache valid ZIPs (only reached after magic-byte validation passes).
-        if self._cache and source == "OLRC":
-            self._cache.put_bytes(cache_key, zip_bytes)
+            return archive
 
         # Extract ZIP
         try:
             rp_dir.mkdir(parents=True, exist_ok=True)
-            with zipfile.ZipFile(BytesIO(zip_bytes)) as zf:
+            with zipfile.ZipFile(archive) as zf:
                 zf.extractall(rp_dir)
 
             xml_files = list(rp_dir.glob("*.xml"))
@@ -347,6 +327,7 @@ class OLRCDownloader:
                     f"Title {title_number}@{release_point} loaded from "
                     f"{source}: {xml_files[0]}"
                 )
+                await self._track_extracted(rp_dir)
                 return xml_files[0]
             else:
                 logger.error(
@@ -359,6 +340,193 @@ class OLRCDownloader:
                 f"Title {title_number}@{release_point}: corrupt ZIP from {source}"
             )
             return None
+        finally:
+            # Without a cache the ZIP was only needed for extraction
+            if self._cache is None:
+                archive.unlink(missing_ok=True)
+
+    async def _fetch_archive(
+        self, title_number: int, release_point: str, force: bool
+    ) -> tuple[Path, str] | None:
+        """Return the local path of a title's release point ZIP and its source.
+
+        Reads the cache's local entry in place (backfilled from GCS if
+        needed), or streams the ZIP from the OLRC to a temporary file that
+        is then moved into the cache, so the archive is never held in
+        memory. Returns None if the title is not available.
+        """
+        cache_key = f"olrc/downloads/title{title_number}@{release_point}.zip"
+        archive = (
+            self.download_dir / "releases" / release_point / f"title{title_number}.zip"
+        )
+
+        if not force:
+            cached: Path | None = None
+            source = "GCS cache"
+            if self._cache:
+                cached = await self._cache.alocal_file(cache_key)
+            elif not self.extract and archive.exists():
+                cached, source = archive, "disk"
+            if cached is not None:
+                # The OLRC returns HTTP 200 with an HTML error page for titles
+                # that don't exist at a given release point (e.g. Title 54 was
+                # enacted in P.L. 113-287, so it's absent from RP 113-21).
+                # Stale cache entries written before downloads were validated
+                # are evicted so future runs don't repeat this.
+                if await asyncio.to_thread(zipfile.is_zipfile, cached):
+                    return cached, source
+                logger.info(
+                    f"Title {title_number}@{release_point}: cached entry is not "
+                    "a ZIP (not codified at this release point), skipping"
+                )
+                if self._cache:
+                    await self._cache.adelete(cache_key)
+                return None
+
+        # Parse the release point
+        parts = release_point.split("-", 1)
+        congress = parts[0]
+        public_law = parts[1] if len(parts) > 1 else ""
+
+        url = TITLE_XML_URL_PATTERN.format(
+            congress=congress,
+            public_law=public_law,
+            title_number=title_number,
+        )
+        logger.info(f"Fetching Title {title_number}@{release_point} from OLRC: {url}")
+
+        archive.parent.mkdir(parents=True, exist_ok=True)
+        partial = archive.with_name(f".{archive.name}.part")
+        try:
+            if not await self._stream_to_file(
+                url, partial, f"Title {title_number}@{release_point}"
+            ):
+                return None
+
+            # Validate ZIP magic bytes before anything is cached.
+            with partial.open("rb") as f:
+                magic = f.read(4)
+            if magic not in (b"PK\x03\x04", b"PK\x05\x06"):
+                logger.info(
+                    f"Title {title_number}@{release_point}: not a ZIP "
+                    "(not codified at this release point), skipping"
+                )
+                return None
+
+            if self._cache:
+                await self._cache.aput_file(cache_key, partial)
+                return self._cache.local_path(cache_key), "OLRC"
+            partial.replace(archive)
+            return archive, "OLRC"
+        finally:
+            partial.unlink(missing_ok=True)
+
+    async def _stream_to_file(self, url: str, dest: Path, label: str) -> bool:
+        """Stream ``url`` to ``dest``, resuming dropped connections.
+
+        After a dropped connection the download continues from the bytes
+        already written, with a ``Range`` request conditioned (``If-Range``)
+        on the ETag or Last-Modified of the first response; a server that
+        changed the file or ignores ranges answers 200 and the download
+        restarts. The final size is checked against the announced length.
+        Every failed attempt counts towards ``max_retries`` except a resumed
+        (206) one that added bytes, so restarts from byte 0 cannot retry
+        forever. At most
+        ``max_connections_per_host`` downloads run against one host.
+
+        Returns False (after logging) if the download failed.
+        """
+        max_retries = 3
+        failures = 0
+        validator: str | None = None
+        total: int | None = None
+        dest.unlink(missing_ok=True)
+
+        while True:
+            offset = dest.stat().st_size if dest.exists() else 0
+            resumed = False
+            # Byte offsets must refer to the file itself, not an encoding
+            headers = {"Accept-Encoding": "identity"}
+            if offset and validator:
+                headers |= {"Range": f"bytes={offset}-", "If-Range": validator}
+            try:
+                async with (
+                    self._host_limit(url),
+                    httpx.AsyncClient(timeout=self.timeout) as client,
+                    client.stream(
+                        "GET", url, headers=headers, follow_redirects=True
+                    ) as response,
+                ):
+                    if response.status_code == 416:
+                        # Our partial file is unusable; start over
+                        dest.unlink(missing_ok=True)
+                        raise _IncompleteDownload("range not satisfiable")
+                    response.raise_for_status()
+                    if response.status_code == 206:
+                        start, total = _content_range(response)
+                        if start != offset:
+                            dest.unlink(missing_ok=True)
+                            raise _IncompleteDownload(
+                                f"server resumed at byte {start}, expected {offset}"
+                            )
+                        mode = "ab"
+                        resumed = True
+                    else:
+                        offset = 0
+                        mode = "wb"
+                        length = response.headers.get("content-length")
+                        total = int(length) if length else None
+                        validator = (
+                            response.headers.get("etag")
+                            or response.headers.get("last-modified")
+                            if response.headers.get("accept-ranges") == "bytes"
+                            else None
+                        )
+                    # Unsized iteration writes every chunk as it arrives, so
+                    # nothing received before a drop is lost
+                    with dest.open(mode) as f:
+                        async for chunk in response.aiter_bytes():
+                            f.write(chunk)
+
+                size = dest.stat().st_size
+                if total is not None and size != total:
+                    raise _IncompleteDownload(f"got {size:,} of {total:,} bytes")
+                return True
+            except httpx.HTTPStatusError as e:
+                logger.error(f"HTTP error downloading {label}: {e}")
+                return False
+            except (
+                httpx.RemoteProtocolError,
+                httpx.ReadError,
+                _IncompleteDownload,
+            ) as e:
+                progressed = resumed and dest.exists() and dest.stat().st_size > offset
+                if not progressed:
+                    failures += 1
+                if failures < max_retries:
+                    wait = 2 ** max(failures, 1)
+                    resume = dest.stat().st_size if dest.exists() else 0
+                    logger.warning(
+                        f"{label}: connection error "
+                        f"(attempt {failures + 1}/{max_retries}), "
+                        f"retrying in {wait}s"
+                        + (f" from byte {resume:,}" if resume and validator else "")
+                        + f": {e}"
+                    )
+                    await asyncio.sleep(wait)
+                else:
+                    logger.error(f"{label}: failed after {max_retries} attempts: {e}")
+                    return False
+            except Exception as e:
+                logger.exception(f"Error downloading {label}: {e}")
+                return False
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent downloads from ``url``'s host."""
+        host = httpx.URL(url).host
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return self._host_limits[host]
 
     def get_xml_path_at_release_point(
         self, title_number: int, release_point: str
@@ -6,6 +6,7 @@ import contextlib
 import hashlib
 import logging
 import re
+import zipfile
 from collections.abc import Generator, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -446,8 +447,12 @@ class USLMParser:
     def parse_file(self, xml_path: Path | str) -> USLMParseResult:
         """Parse a USLM XML file.
 
+        A ``.zip`` path (an OLRC title download) is read in place: its XML
+        member is decompressed as a stream into the parser, without being
+        extracted to disk.
+
         Args:
-            xml_path: Path to the XML file.
+            xml_path: Path to the XML file, or to a ZIP containing it.
 
         Returns:
             Parsed result containing groups and sections.
@@ -462,7 +467,15 @@ class USLMParser:
         self._groups = []
 
         # Parse XML
-        tree = etree.parse(str(xml_path))
+        if xml_path.suffix == ".zip":
+            with zipfile.ZipFile(xml_path) as zf:
+                member = next((n for n in zf.namelist() if n.endswith(".xml")), None)
+                if member is None:
+                    raise ValueError(f"No XML file in archive: {xml_path}")
+                with zf.open(member) as stream:
+                    tree = etree.parse(stream)
+        else:
+            tree = etree.parse(str(xml_path))
         root = tree.getroot()
 
         # Extract title information and create root group
@@ -1,10 +1,18 @@
 """Profiling script for USLMParser.parse_file and normalize_parsed_section.
 
 Usage (from backend/ directory):
-    uv run python -m pipeline.olrc.profile_parse_normalize [xml_path...]
+    uv run python -m pipeline.olrc.profile_parse_normalize [--extract] [path...]
 
-If no paths are given, a synthetic XML file is generated that mimics the
-structure of a large title (deep nesting, continuation elements, notes).
+Paths may be XML files or OLRC title ZIPs. ZIPs are parsed in place, the
+way ``chrono-bootstrap`` reads them from the cache; with ``--extract`` they
+are first extracted to a temporary directory, as ``OLRCDownloader`` does
+by default. If no paths are given, a synthetic XML file is generated that
+mimics the structure of a large title (deep nesting, continuation
+elements, notes); ``--zip`` wraps it in an archive.
+
+Resident memory is reported after each stage together with the process's
+peak RSS. Peak RSS never goes down, so compare the two ZIP modes in
+separate runs.
 
 Output: cProfile stats sorted by cumulative time, written to stdout and
 optionally to a .prof file for visualization with snakeviz:
@@ -16,9 +24,12 @@ from __future__ import annotations
 import cProfile
 import io
 import pstats
+import resource
+import shutil
 import sys
 import tempfile
 import time
+import zipfile
 from pathlib import Path
 from textwrap import dedent
 
@@ -103,7 +114,7 @@ def _make_synthetic_xml(section_count: int = 500) -> str:
             </title>
           </main>
         </usc>
-    """)
+    """).lstrip()  # {sections} is unindented, so dedent() leaves a margin
 
 
 # ---------------------------------------------------------------------------
@@ -111,6 +122,25 @@ def _make_synthetic_xml(section_count: int = 500) -> str:
 # ---------------------------------------------------------------------------
 
 
+def _rss_mb() -> tuple[float, float]:
+    """Return (current, peak) resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KB on Linux, bytes on macOS
+    peak_mb = peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        current_mb = pages * resource.getpagesize() / 1024 / 1024
+    except OSError:
+        current_mb = peak_mb
+    return current_mb, peak_mb
+
+
+def _print_rss(label: str) -> None:
+    current, peak = _rss_mb()
+    print(f"  RSS {label}: {current:,.0f} MB  (peak {peak:,.0f} MB)")
+
+
 def _print_stats(pr: cProfile.Profile, top_n: int = 25) -> None:
     s = io.StringIO()
     ps = pstats.Stats(pr, stream=s).sort_stats("cumulative")
@@ -133,6 +163,7 @@ def profile_parse(xml_path: Path, save_prof: Path | None = None) -> USLMParseRes
     section_count = len(result.sections)
     ms_per_section = elapsed * 1000 / section_count if section_count else 0
     print(f"  {section_count} sections in {elapsed:.2f}s  ({ms_per_section:.2f} ms/§)")
+    _print_rss("after parse")
     _print_stats(pr)
 
     if save_prof:
@@ -160,6 +191,7 @@ def profile_normalize(
     section_count = len(result.sections)
     ms_per_section = elapsed * 1000 / section_count if section_count else 0
     print(f"  {section_count} sections in {elapsed:.2f}s  ({ms_per_section:.2f} ms/§)")
+    _print_rss("after normalize")
     _print_stats(pr)
 
     if save_prof:
@@ -167,43 +199,58 @@ def profile_normalize(
         print(f"  Profile saved → {save_prof}")
 
 
+def _extract(zip_path: Path, dest: Path) -> Path:
+    """Extract an OLRC title ZIP and return its XML file."""
+    with zipfile.ZipFile(zip_path) as zf:
+        zf.extractall(dest)
+    return next(dest.glob("*.xml"))
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
 
 def main(argv: list[str]) -> None:
-    xml_paths: list[Path] = [Path(p) for p in argv if argv]
+    extract = "--extract" in argv
+    as_zip = "--zip" in argv
+    paths: list[Path] = [Path(p) for p in argv if not p.startswith("--")]
+    scratch = Path(tempfile.mkdtemp(prefix="profile_parse_"))
 
-    if not xml_paths:
+    if not paths:
         print(
-            "No XML paths given — generating synthetic Title-26-style XML (500 sections)…"
+            "No paths given — generating synthetic Title-26-style XML (500 sections)…"
         )
-        with tempfile.NamedTemporaryFile(
-            suffix=".xml", delete=False, mode="w", encoding="utf-8"
-        ) as f:
-            f.write(_make_synthetic_xml(section_count=500))
-            tmp_path = Path(f.name)
-        xml_paths = [tmp_path]
-        cleanup = True
-    else:
-        cleanup = False
-
+        synthetic = scratch / "usc26.xml"
+        synthetic.write_text(_make_synthetic_xml(section_count=500), encoding="utf-8")
+        if as_zip:
+            with zipfile.ZipFile(
+                scratch / "usc26.zip", "w", zipfile.ZIP_DEFLATED
+            ) as zf:
+                zf.write(synthetic, synthetic.name)
+            synthetic.unlink()
+            synthetic = scratch / "usc26.zip"
+        paths = [synthetic]
+
+    _print_rss("at start")
     try:
-        for xml_path in xml_paths:
-            parse_prof = Path(f"parse_{xml_path.stem}.prof")
-            norm_prof = Path(f"normalize_{xml_path.stem}.prof")
+        for path in paths:
+            if path.suffix == ".zip" and extract:
+                t0 = time.monotonic()
+                path = _extract(path, scratch / path.stem)
+                print(f"\nExtracted to {path} in {time.monotonic() - t0:.2f}s")
+            parse_prof = Path(f"parse_{path.stem}.prof")
+            norm_prof = Path(f"normalize_{path.stem}.prof")
 
-            result = profile_parse(xml_path, save_prof=parse_prof)
-            profile_normalize(result, title_label=xml_path.name, save_prof=norm_prof)
+            result = profile_parse(path, save_prof=parse_prof)
+            profile_normalize(result, title_label=path.name, save_prof=norm_prof)
 
         print(
             "\nTip: visualize with  uv run snakeviz parse_<name>.prof\n"
             "     or              uv run snakeviz normalize_<name>.prof"
         )
     finally:
-        if cleanup:
-            tmp_path.unlink(missing_ok=True)
+        shutil.rmtree(scratch, ignore_errors=True)
 
 
 if __name__ == "__main__":
@@ -5,22 +5,45 @@ https://uscode.house.gov/download/priorreleasepoints.htm
 
 Each release point identifies the US Code "through" a specific Public Law,
 sometimes excluding certain laws that haven't yet been codified.
+
+With a ``PipelineCache``, the parsed list is persisted together with the
+page's ETag and Last-Modified. Within ``max_age`` seconds of the last check
+no request is made at all; after that the page is re-requested
+conditionally, and a 304 reuses the stored list without downloading or
+parsing the page. If the OLRC is unreachable the stored list is used.
 """
 
+from __future__ import annotations
+
 import contextlib
+import dataclasses
+import hashlib
+import json
 import logging
 import re
+import time
 from dataclasses import dataclass, field
 from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
 
 import httpx
 from lxml import html
 
+if TYPE_CHECKING:
+    from pipeline.cache import PipelineCache
+
 logger = logging.getLogger(__name__)
 
 # URL for the prior release points listing page
 PRIOR_RELEASE_POINTS_URL = "https://uscode.house.gov/download/priorreleasepoints.htm"
 
+# Cache key of the persisted registry
+RELEASE_POINTS_CACHE_KEY = "olrc/release_points.json"
+
+# Seconds a fetched list is used before the page is re-checked. The OLRC
+# publishes a few release points a month.
+DEFAULT_MAX_AGE = 3600.0
+
 
 @dataclass
 class ReleasePointInfo:
@@ -69,6 +92,22 @@ class ReleasePointInfo:
     def __str__(self) -> str:
         return f"PL {self.full_identifier}"
 
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form, for the persisted registry."""
+        data = dataclasses.asdict(self)
+        if self.publication_date is not None:
+            data["publication_date"] = self.publication_date.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ReleasePointInfo:
+        """Inverse of ``to_dict``."""
+        published = data.get("publication_date")
+        return cls(
+            **data
+            | {"publication_date": date.fromisoformat(published) if published else None}
+        )
+
 
 def parse_release_point_identifier(identifier: str) -> tuple[int, str]:
     """Parse a release point identifier into (congress, law_identifier).
@@ -101,26 +140,95 @@ class ReleasePointRegistry:
     """Registry for tracking OLRC release points.
 
     Provides methods to fetch, query, and manage release point metadata.
+
+    Args:
+        timeout: HTTP request timeout in seconds.
+        cache: Optional PipelineCache persisting the fetched list.
+        max_age: Seconds a fetched list is used without re-checking the page.
     """
 
-    def __init__(self, timeout: float = 30.0):
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        cache: PipelineCache | None = None,
+        max_age: float = DEFAULT_MAX_AGE,
+    ):
         self.timeout = timeout
+        self.cache = cache
+        self.max_age = max_age
         self._release_points: list[ReleasePointInfo] | None = None
+        # Validators of the page the list was parsed from, and when (epoch
+        # seconds) the page was last fetched or confirmed unchanged
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._checked_at = 0.0
+        self._version: str | None = None
+
+    @property
+    def version(self) -> str | None:
+        """Digest of the loaded release points; None before loading.
+
+        Changes whenever the OLRC publishes a release point, so it can key
+        anything derived from the list.
+        """
+        return self._version
 
     async def fetch_release_points(self) -> list[ReleasePointInfo]:
         """Fetch the list of prior release points from the OLRC website.
 
         Scrapes the prior release points page to build a registry of available
-        release points with their metadata (date, affected titles).
+        release points with their metadata (date, affected titles). A list
+        fetched (by this registry or, with a cache, by an earlier run) less
+        than ``max_age`` seconds ago is returned without a request; an older
+        one is revalidated with a conditional GET.
 
         Returns:
             List of ReleasePointInfo objects, sorted chronologically.
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(PRIOR_RELEASE_POINTS_URL, follow_redirects=True)
-            response.raise_for_status()
+        if self._release_points is None and self.cache is not None:
+            await self._load_cached()
+        if (
+            self._release_points is not None
+            and time.time() - self._checked_at < self.max_age
+        ):
+            return self._release_points
+
+        headers = {}
+        if self._release_points is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.get(
+                    PRIOR_RELEASE_POINTS_URL, headers=headers, follow_redirects=True
+                )
+                if response.status_code != 304:
+                    response.raise_for_status()
+        except httpx.HTTPError as e:
+            if self._release_points is None:
+                raise
+            logger.warning(f"Release points page unavailable, using stored list: {e}")
+            return self._release_points
+
+        if response.status_code == 304 and self._release_points is not None:
+            logger.debug("Release points page unchanged (304)")
+        else:
+            self._set_release_points(self._parse_release_points_page(response.content))
+            self._etag = response.headers.get("etag")
+            self._last_modified = response.headers.get("last-modified")
+            logger.debug(
+                f"Fetched {len(self.get_release_points())} total release points "
+                "from OLRC"
+            )
+        self._checked_at = time.time()
+        await self._store_cached()
+        return self.get_release_points()
 
-        tree = html.fromstring(response.content)
+    def _parse_release_points_page(self, content: bytes) -> list[ReleasePointInfo]:
+        """Parse the prior release points page into a sorted, unique list."""
+        tree = html.fromstring(content)
         release_points = []
 
         # Each release point is an <a> inside an <li>. The link text contains
@@ -159,10 +267,49 @@ class ReleasePointRegistry:
             )
         )
 
-        self._release_points = unique_rps
-        logger.debug(f"Fetched {len(unique_rps)} total release points from OLRC")
         return unique_rps
 
+    def _set_release_points(self, release_points: list[ReleasePointInfo]) -> None:
+        self._release_points = release_points
+        payload = json.dumps(
+            [rp.to_dict() for rp in release_points], separators=(",", ":")
+        )
+        self._version = hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+    async def _load_cached(self) -> None:
+        """Load the persisted list and its validators; unreadable is a miss."""
+        assert self.cache is not None
+        text = await self.cache.aget_text(RELEASE_POINTS_CACHE_KEY)
+        if text is None:
+            return
+        try:
+            data = json.loads(text)
+            release_points = [
+                ReleasePointInfo.from_dict(rp) for rp in data["release_points"]
+            ]
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable release point cache: {e}")
+            return
+        self._set_release_points(release_points)
+        self._etag = data.get("etag")
+        self._last_modified = data.get("last_modified")
+        self._checked_at = float(data.get("checked_at", 0.0))
+
+    async def _store_cached(self) -> None:
+        if self.cache is None or self._release_points is None:
+            return
+        await self.cache.aput_text(
+            RELEASE_POINTS_CACHE_KEY,
+            json.dumps(
+                {
+                    "etag": self._etag,
+                    "last_modified": self._last_modified,
+                    "checked_at": self._checked_at,
+                    "release_points": [rp.to_dict() for rp in self._release_points],
+                }
+            ),
+        )
+
     def _parse_release_point_link(
         self, href: str, link_text: str = ""
     ) -> ReleasePointInfo | None:
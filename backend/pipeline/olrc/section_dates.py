@@ -0,0 +1,64 @@
+"""Enactment and last-modified dates derived from a section's notes.
+
+The dates are computed once, when a snapshot row is written (bootstrap,
+release point ingestion, ``RevisionBuilder``), and stored on
+``section_snapshot`` so readers never walk the notes JSONB per request.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+from pipeline.olrc.group_service import _parse_citation_date
+
+
+def derive_section_dates(
+    normalized_notes: dict[str, Any] | None,
+) -> tuple[date | None, date | None]:
+    """Derive (enacted_date, last_modified_date) from normalized_notes."""
+    enacted_date = None
+    last_modified_date = None
+    if not normalized_notes:
+        return enacted_date, last_modified_date
+
+    # Extract enacted_date from first citation
+    citations = normalized_notes.get("citations") or []
+    if citations:
+        first = citations[0]
+        law_data = first.get("law") or first.get("act")
+        if law_data and law_data.get("date"):
+            enacted_date = _parse_citation_date(law_data["date"])
+
+    # Extract last_modified_date from the most recent non-Framework citation.
+    # Including Enactment citations covers sections that were enacted by a
+    # single law and never subsequently amended — in that case the enactment
+    # date IS the last-modified date.  Original Framework citations (pre-1957
+    # Acts providing structural context only) are excluded because their
+    # dates pre-date the section's actual creation/modification. Non-original
+    # Framework citations (e.g. chapter acts, issue #563) are still included
+    # since they represent an actual amendment to the section.
+    modification_dates = []
+    for c in citations:
+        is_original_framework = c.get("relationship") == "Framework" and c.get(
+            "is_original", True
+        )
+        if is_original_framework:
+            continue
+        law_data = c.get("law") or c.get("act")
+        if law_data and law_data.get("date"):
+            parsed = _parse_citation_date(law_data["date"])
+            if parsed is not None:
+                modification_dates.append(parsed)
+    if modification_dates:
+        last_modified_date = max(modification_dates)
+
+    # Fallback: use year-only from amendments when citation dates are unavailable
+    if last_modified_date is None:
+        years = [
+            a["year"] for a in normalized_notes.get("amendments") or [] if a.get("year")
+        ]
+        if years:
+            last_modified_date = date(max(years), 1, 1)
+
+    return enacted_date, last_modified_date
@@ -9,6 +9,7 @@ from __future__ import annotations
 import logging
 import uuid
 from dataclasses import dataclass
+from datetime import date
 from typing import Any
 
 from sqlalchemy import select, text
@@ -39,6 +40,8 @@ class SectionState:
     is_deleted: bool
     group_id: uuid.UUID | None = None
     sort_order: int = 0
+    enacted_date: date | None = None
+    last_modified_date: date | None = None
 
 
 class SnapshotService:
@@ -103,7 +106,8 @@ class SnapshotService:
                     snapshot_id, revision_id, title_number, section_number,
                     heading, text_content, text_hash,
                     normalized_provisions, notes, normalized_notes,
-                    notes_hash, full_citation, is_deleted, group_id, sort_order
+                    notes_hash, full_citation, is_deleted, group_id, sort_order,
+                    enacted_date, last_modified_date
                 FROM section_snapshot
                 WHERE revision_id = ANY(:chain)
                   AND title_number = :title
@@ -132,6 +136,8 @@ class SnapshotService:
             is_deleted=row.is_deleted,
             group_id=row.group_id,
             sort_order=row.sort_order,
+            enacted_date=row.enacted_date,
+            last_modified_date=row.last_modified_date,
         )
 
     async def get_all_sections_at_revision(
@@ -159,7 +165,8 @@ class SnapshotService:
                     snapshot_id, revision_id, title_number, section_number,
                     heading, text_content, text_hash,
                     normalized_provisions, notes, normalized_notes,
-                    notes_hash, full_citation, is_deleted, group_id, sort_order
+                    notes_hash, full_citation, is_deleted, group_id, sort_order,
+                    enacted_date, last_modified_date
                 FROM section_snapshot
                 WHERE revision_id = ANY(:chain)
                 ORDER BY title_number, section_number,
@@ -189,6 +196,8 @@ class SnapshotService:
                     is_deleted=row.is_deleted,
                     group_id=row.group_id,
                     sort_order=row.sort_order,
+                    enacted_date=row.enacted_date,
+                    last_modified_date=row.last_modified_date,
                 )
             )
 
@@ -267,7 +276,8 @@ class SnapshotService:
                     ss.section_number, ss.heading, ss.text_content,
                     ss.text_hash, ss.normalized_provisions, ss.notes,
                     ss.normalized_notes, ss.notes_hash, ss.full_citation,
-                    ss.is_deleted, ss.group_id, ss.sort_order
+                    ss.is_deleted, ss.group_id, ss.sort_order,
+                    ss.enacted_date, ss.last_modified_date
                 FROM section_snapshot ss
                 JOIN unnest(CAST(:titles AS int[]), CAST(:sections AS text[]))
                      AS keys(title, section)
@@ -300,6 +310,8 @@ class SnapshotService:
                 is_deleted=row.is_deleted,
                 group_id=row.group_id,
                 sort_order=row.sort_order,
+                enacted_date=row.enacted_date,
+                last_modified_date=row.last_modified_date,
             )
             states[(row.title_number, row.section_number)] = state
         return states
@@ -366,4 +378,6 @@ class SnapshotService:
             is_deleted=snapshot.is_deleted,
             group_id=snapshot.group_id,
             sort_order=snapshot.sort_order,
+            enacted_date=snapshot.enacted_date,
+            last_modified_date=snapshot.last_modified_date,
         )
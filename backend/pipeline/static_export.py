@@ -0,0 +1,273 @@
+"""Static pre-rendered export of the Code at a revision.
+
+Renders the titles list, every title structure and every section viewer
+payload at a revision into gzip-compressed, content-addressed JSON objects
+plus a manifest (see ``app/core/static_export.py`` for the layout). The
+output can be synced to object storage and served from a CDN, or served by
+API instances directly via ``STATIC_EXPORT_DIR``.
+
+Exports are incremental: objects are named by the SHA-256 of their JSON, so
+a payload that did not change since the previous export already exists on
+disk and is not rewritten. Only the manifest is replaced on every run.
+A ``titles``-restricted export keeps the previous manifest's entries for
+every other title, so it refreshes part of an export without dropping the
+rest.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.static_export import (
+    MANIFEST_NAME,
+    ExportManifest,
+    object_relpath,
+    section_key,
+    title_structure_key,
+    titles_key,
+)
+from app.crud.us_code import get_all_titles, get_section, get_title_structure
+from app.schemas.us_code import TitleSummarySchema
+from pipeline.olrc.snapshot_service import SnapshotService
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+_TITLES_ADAPTER = TypeAdapter(list[TitleSummarySchema])
+
+
+@dataclass
+class ExportResult:
+    """Summary returned by StaticExporter.export."""
+
+    revision_id: int
+    objects_written: int = 0
+    objects_unchanged: int = 0
+    sections_exported: int = 0
+    titles_exported: int = 0
+    failed_keys: list[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+
+class StaticExporter:
+    """Renders API payloads at a revision into a static export directory."""
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        output_dir: Path | str,
+        concurrency: int = 8,
+    ) -> None:
+        self._session_factory = session_factory
+        self.output_dir = Path(output_dir)
+        self._concurrency = concurrency
+
+    async def export(
+        self,
+        revision_id: int | None = None,
+        titles: list[int] | None = None,
+    ) -> ExportResult:
+        """Export all payloads at ``revision_id`` (default: HEAD).
+
+        Args:
+            revision_id: Revision to render. None resolves the HEAD revision.
+            titles: Restrict the export to these titles. The titles list
+                payload always covers every title, and entries of other
+                titles are carried over from the existing manifest.
+
+        Returns:
+            ExportResult with counts of written and unchanged objects.
+
+        Raises:
+            RuntimeError: If no ingested revision exists, or ``titles`` is
+                given and the existing manifest is for another revision
+                (merging would mix revisions in one export).
+        """
+        start = time.monotonic()
+
+        async with self._session_factory() as session:
+            svc = SnapshotService(session)
+            if revision_id is None:
+                revision_id = await svc.get_head_revision_id()
+                if revision_id is None:
+                    raise RuntimeError("No ingested revision to export")
+            chain = await svc.get_revision_chain(revision_id)
+            title_summaries = await get_all_titles(session, revision_id)
+            section_keys = await self._list_sections(session, chain, titles)
+
+        result = ExportResult(revision_id=revision_id)
+        entries: dict[str, dict[str, Any]] = {}
+        if titles is not None:
+            entries = self._carried_over_entries(revision_id, set(titles))
+
+        self._store(
+            entries,
+            result,
+            titles_key(),
+            _TITLES_ADAPTER.dump_json(title_summaries),
+        )
+
+        title_numbers = [
+            t.title_number
+            for t in title_summaries
+            if titles is None or t.title_number in titles
+        ]
+        sem = asyncio.Semaphore(self._concurrency)
+
+        async def _render_title(title_number: int) -> None:
+            key = title_structure_key(title_number)
+            async with sem, self._session_factory() as s:
+                try:
+                    structure = await get_title_structure(s, title_number, revision_id)
+                except Exception as e:
+                    logger.error(f"Failed to render {key}: {e}")
+                    result.failed_keys.append(key)
+                    return
+            if structure is not None:
+                self._store(entries, result, key, _dump(structure))
+                result.titles_exported += 1
+
+        async def _render_section(title_number: int, section_number: str) -> None:
+            key = section_key(title_number, section_number)
+            async with sem, self._session_factory() as s:
+                try:
+                    viewer = await get_section(
+                        s, title_number, section_number, revision_id, chain=chain
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to render {key}: {e}")
+                    result.failed_keys.append(key)
+                    return
+            if viewer is not None:
+                self._store(entries, result, key, _dump(viewer))
+                result.sections_exported += 1
+
+        await asyncio.gather(*[_render_title(t) for t in title_numbers])
+        await asyncio.gather(*[_render_section(t, s) for t, s in section_keys])
+
+        manifest = ExportManifest(
+            revision_id=revision_id,
+            generated_at=datetime.utcnow().isoformat(timespec="seconds"),
+            entries=dict(sorted(entries.items())),
+        )
+        _atomic_write(
+            self.output_dir / MANIFEST_NAME,
+            json.dumps(manifest.to_dict(), indent=1).encode(),
+        )
+
+        result.elapsed_seconds = time.monotonic() - start
+        logger.info(
+            f"Static export of revision {revision_id}: "
+            f"{result.titles_exported} titles, {result.sections_exported} sections, "
+            f"{result.objects_written} written, {result.objects_unchanged} unchanged, "
+            f"{len(result.failed_keys)} failed in {result.elapsed_seconds:.1f}s"
+        )
+        return result
+
+    def _carried_over_entries(
+        self, revision_id: int, titles: set[int]
+    ) -> dict[str, dict[str, Any]]:
+        """Entries of the existing manifest for titles not being re-rendered."""
+        path = self.output_dir / MANIFEST_NAME
+        if not path.exists():
+            return {}
+        previous = ExportManifest.from_dict(json.loads(path.read_text()))
+        if previous.revision_id != revision_id:
+            raise RuntimeError(
+                f"Existing export is of revision {previous.revision_id}; a "
+                f"partial export of revision {revision_id} would mix revisions. "
+                "Run a full export (without titles) instead."
+            )
+        return {
+            key: entry
+            for key, entry in previous.entries.items()
+            if (title := _title_of_key(key)) is not None and title not in titles
+        }
+
+    async def _list_sections(
+        self,
+        session: AsyncSession,
+        chain: list[int],
+        titles: list[int] | None,
+    ) -> list[tuple[int, str]]:
+        """Return (title_number, section_number) of live sections at the chain.
+
+        Projects only the key columns so the listing does not transfer
+        section text or JSONB.
+        """
+        if not chain:
+            return []
+        result = await session.execute(
+            text("""
+                SELECT title_number, section_number FROM (
+                    SELECT DISTINCT ON (title_number, section_number)
+                        title_number, section_number, is_deleted
+                    FROM section_snapshot
+                    WHERE revision_id = ANY(:chain)
+                    ORDER BY title_number, section_number,
+                        array_position(:chain, revision_id)
+                ) latest
+                WHERE NOT is_deleted
+            """),
+            {"chain": chain},
+        )
+        return [
+            (row[0], row[1]) for row in result if titles is None or row[0] in titles
+        ]
+
+    def _store(
+        self,
+        entries: dict[str, dict[str, Any]],
+        result: ExportResult,
+        key: str,
+        payload: bytes,
+    ) -> None:
+        """Write ``payload`` as a content-addressed object unless it exists."""
+        content_hash = hashlib.sha256(payload).hexdigest()
+        path = self.output_dir / object_relpath(content_hash)
+        if path.exists():
+            result.objects_unchanged += 1
+        else:
+            # mtime=0 keeps the compressed bytes deterministic across runs
+            _atomic_write(path, gzip.compress(payload, compresslevel=9, mtime=0))
+            result.objects_written += 1
+        entries[key] = {"hash": content_hash, "bytes": len(payload)}
+
+
+def _title_of_key(key: str) -> int | None:
+    """Title number of a structure or section key; None for the titles list."""
+    kind, _, rest = key.partition("/")
+    if kind not in ("titles", "sections") or not rest:
+        return None
+    number = rest.partition("/")[0]
+    return int(number) if number.isdigit() else None
+
+
+def _dump(model: BaseModel) -> bytes:
+    """Serialize a response schema the way the API would return it."""
+    return model.model_dump_json().encode()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write ``data`` to a temp file next to ``path`` and rename it in place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
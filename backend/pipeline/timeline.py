@@ -2,6 +2,10 @@
 
 Merges OLRC release points and Public Laws into a single chronological
 sequence. This is the foundation for the play-forward engine.
+
+Built timelines are memoized per builder, keyed by the release point
+registry's version and the newest law in the database, so advancing the
+play-forward engine repeatedly costs one aggregate query per build.
 """
 
 from __future__ import annotations
@@ -11,7 +15,7 @@ from dataclasses import dataclass, field
 from datetime import date
 from enum import StrEnum
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.public_law import PublicLaw
@@ -71,6 +75,32 @@ class TimelineEvent:
         return f"[LAW] PL {self.congress}-{self.law_number} ({date_str})"
 
 
+class Timeline(list[TimelineEvent]):
+    """A built timeline: the events in order, with positions indexed.
+
+    Shared between callers when memoized, so treat it as read-only.
+    """
+
+    def __init__(self, events: list[TimelineEvent] | None = None) -> None:
+        super().__init__(events or [])
+        self._law_positions: dict[int, int] = {}
+        self._rp_positions: dict[str, int] = {}
+        for i, event in enumerate(self):
+            if event.event_type == TimelineEventType.PUBLIC_LAW:
+                if event.law_id is not None:
+                    self._law_positions.setdefault(event.law_id, i)
+            else:
+                self._rp_positions.setdefault(event.identifier, i)
+
+    def law_position(self, law_id: int | None) -> int | None:
+        """Index of the Public Law event for ``law_id``, or None."""
+        return self._law_positions.get(law_id) if law_id is not None else None
+
+    def release_point_position(self, identifier: str) -> int | None:
+        """Index of the release point event ``identifier``, or None."""
+        return self._rp_positions.get(identifier)
+
+
 class TimelineBuilder:
     """Builds a consolidated chronological timeline of US Code changes.
 
@@ -85,25 +115,41 @@ class TimelineBuilder:
     ):
         self.session = session
         self.registry = registry or ReleasePointRegistry()
+        # (registry version, start, end congress, max law_id, law count)
+        self._memo: dict[tuple[str, int, int | None, int | None, int], Timeline] = {}
 
     async def build(
         self,
         start_congress: int = 113,
         end_congress: int | None = None,
-    ) -> list[TimelineEvent]:
+    ) -> Timeline:
         """Build the consolidated timeline.
 
+        Returns the previous result for the same congress range while the
+        registry version and the newest/number of laws are unchanged.
+
         Args:
             start_congress: First congress to include (default: 113th).
             end_congress: Last congress to include (default: latest available).
 
         Returns:
-            Chronologically sorted list of TimelineEvents.
+            Chronologically sorted Timeline of TimelineEvents.
         """
         # Fetch release points
         await self.registry.fetch_release_points()
         all_rps = self.registry.get_release_points()
 
+        key: tuple[str, int, int | None, int | None, int] | None = None
+        if self.registry.version is not None:
+            key = (
+                self.registry.version,
+                start_congress,
+                end_congress,
+                *await self._law_watermark(start_congress, end_congress),
+            )
+            if key in self._memo:
+                return self._memo[key]
+
         # Filter to congress range
         rps = [
             rp
@@ -156,7 +202,11 @@ class TimelineBuilder:
             f"{sum(1 for e in events if e.event_type == TimelineEventType.PUBLIC_LAW)} laws)"
         )
 
-        return events
+        timeline = Timeline(events)
+        if key is not None:
+            # Only the current state is worth keeping
+            self._memo = {key: timeline}
+        return timeline
 
     async def build_between_release_points(
         self,
@@ -178,19 +228,8 @@ class TimelineBuilder:
         full_timeline = await self.build()
 
         # Find indices of the two RPs
-        before_idx = None
-        after_idx = None
-        for i, event in enumerate(full_timeline):
-            if (
-                event.event_type == TimelineEventType.RELEASE_POINT
-                and event.identifier == rp_before
-            ):
-                before_idx = i
-            elif (
-                event.event_type == TimelineEventType.RELEASE_POINT
-                and event.identifier == rp_after
-            ):
-                after_idx = i
+        before_idx = full_timeline.release_point_position(rp_before)
+        after_idx = full_timeline.release_point_position(rp_after)
 
         if before_idx is None:
             raise ValueError(f"Release point not found: {rp_before}")
@@ -216,6 +255,18 @@ class TimelineBuilder:
         events = await self.build_between_release_points(rp_before, rp_after)
         return [e for e in events if e.event_type == TimelineEventType.PUBLIC_LAW]
 
+    async def _law_watermark(
+        self, start_congress: int, end_congress: int | None
+    ) -> tuple[int | None, int]:
+        """(max law_id, law count) in the congress range, to key the memo."""
+        stmt = select(func.max(PublicLaw.law_id), func.count()).where(
+            PublicLaw.congress >= start_congress
+        )
+        if end_congress is not None:
+            stmt = stmt.where(PublicLaw.congress <= end_congress)
+        max_law_id, count = (await self.session.execute(stmt)).one()
+        return max_law_id, count
+
     async def _fetch_laws(
         self,
         start_congress: int,
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, patch
 
 from fastapi.testclient import TestClient
 
+from app.core.pagination import InvalidCursorError
 from app.schemas.law_viewer import LawSummarySchema, PaginatedLawsResponse
 
 
@@ -86,3 +87,33 @@ def test_list_laws_limit_exceeds_old_cap(
 
     response = client.get("/api/v1/laws/?limit=500")
     assert response.status_code == 200
+
+
+@patch("app.api.v1.laws.get_laws_list", new_callable=AsyncMock)
+def test_list_laws_passes_cursor_and_total_mode(
+    mock_list: AsyncMock, client: TestClient
+) -> None:
+    """Cursor and total mode are forwarded; next_cursor is returned."""
+    mock_list.return_value = PaginatedLawsResponse(
+        total=None, items=[_make_law(113, "9")], limit=50, offset=0, next_cursor="abc"
+    )
+
+    response = client.get("/api/v1/laws/?cursor=xyz&total=none")
+    assert response.status_code == 200
+    _, kwargs = mock_list.call_args
+    assert kwargs["cursor"] == "xyz"
+    assert kwargs["total_mode"] == "none"
+    data = response.json()
+    assert data["total"] is None
+    assert data["next_cursor"] == "abc"
+
+
+@patch("app.api.v1.laws.get_laws_list", new_callable=AsyncMock)
+def test_list_laws_invalid_cursor_returns_400(
+    mock_list: AsyncMock, client: TestClient
+) -> None:
+    """A malformed cursor is a client error, not a server error."""
+    mock_list.side_effect = InvalidCursorError("Invalid cursor: 'bad'")
+
+    response = client.get("/api/v1/laws/?cursor=bad")
+    assert response.status_code == 400
@@ -1,10 +1,20 @@
 """Tests for section viewer API endpoints."""
 
+import gzip
+import json
 from datetime import date
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 from fastapi.testclient import TestClient
 
+from app.config import settings
+from app.core.static_export import (
+    MANIFEST_NAME,
+    ExportManifest,
+    object_relpath,
+    section_key,
+)
 from app.schemas.us_code import (
     CodeLineSchema,
     GroupAncestorSchema,
@@ -375,3 +385,117 @@ def test_get_section_source_credit_null_when_absent(
     response = client.get("/api/v1/sections/17/106")
     assert response.status_code == 200
     assert response.json()["source_credit"] is None
+
+
+# ---------------------------------------------------------------------------
+# Static export serving
+# ---------------------------------------------------------------------------
+
+
+@patch("app.api.v1.sections.get_section", new_callable=AsyncMock)
+def test_get_section_served_from_static_export(
+    mock_get: AsyncMock, client: TestClient, tmp_path: Path
+) -> None:
+    """With STATIC_EXPORT_DIR set, exported sections skip the database."""
+    payload = b'{"title_number": 17, "section_number": "106"}'
+    content_hash = "ab" * 32
+    obj = tmp_path / object_relpath(content_hash)
+    obj.parent.mkdir(parents=True)
+    obj.write_bytes(gzip.compress(payload))
+    (tmp_path / MANIFEST_NAME).write_text(
+        json.dumps(
+            ExportManifest(
+                revision_id=7,
+                generated_at="",
+                entries={section_key(17, "106"): {"hash": content_hash}},
+            ).to_dict()
+        )
+    )
+
+    with patch.object(settings, "static_export_dir", str(tmp_path)):
+        response = client.get("/api/v1/sections/17/106")
+        assert response.status_code == 200
+        assert response.json()["section_number"] == "106"
+        mock_get.assert_not_called()
+
+        # A different revision falls through to the database
+        mock_get.return_value = None
+        response = client.get("/api/v1/sections/17/106?revision=3")
+        assert response.status_code == 404
+        mock_get.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# GET /api/v1/sections/batch
+# ---------------------------------------------------------------------------
+
+
+def _batch_viewer(section_number: str) -> SectionViewerSchema:
+    return SectionViewerSchema(
+        title_number=17,
+        section_number=section_number,
+        heading=f"Section {section_number}",
+        full_citation=f"17 U.S.C. § {section_number}",
+        text_content="Text",
+    )
+
+
+@patch("app.api.v1.sections.get_sections_batch", new_callable=AsyncMock)
+def test_batch_returns_sections_and_missing(
+    mock_batch: AsyncMock, client: TestClient
+) -> None:
+    """Batch endpoint fetches all keys in one call and reports missing ones."""
+    mock_batch.return_value = [_batch_viewer("106"), _batch_viewer("107")]
+
+    response = client.get(
+        "/api/v1/sections/batch",
+        params=[("key", "17:106"), ("key", "17:107"), ("key", "17:999")],
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [s["section_number"] for s in data["sections"]] == ["106", "107"]
+    assert data["missing"] == ["17:999"]
+    mock_batch.assert_awaited_once()
+    assert mock_batch.call_args.args[1] == [(17, "106"), (17, "107"), (17, "999")]
+
+
+@patch("app.api.v1.sections.get_sections_batch", new_callable=AsyncMock)
+@patch("app.api.v1.sections.get_group_section_keys", new_callable=AsyncMock)
+def test_batch_by_group_streams_ndjson(
+    mock_keys: AsyncMock, mock_batch: AsyncMock, client: TestClient
+) -> None:
+    """Group batches stream one JSON section per line."""
+    mock_keys.return_value = [(17, "106"), (17, "107")]
+    mock_batch.return_value = [_batch_viewer("106"), _batch_viewer("107")]
+
+    response = client.get(
+        "/api/v1/sections/batch",
+        params={"group": "00000000-0000-0000-0000-000000000001", "stream": "true"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["section_number"] for line in lines] == ["106", "107"]
+
+
+@patch("app.api.v1.sections.get_group_section_keys", new_callable=AsyncMock)
+def test_batch_unknown_group(mock_keys: AsyncMock, client: TestClient) -> None:
+    """Unknown group IDs return 404."""
+    mock_keys.return_value = None
+    response = client.get(
+        "/api/v1/sections/batch",
+        params={"group": "00000000-0000-0000-0000-000000000001"},
+    )
+    assert response.status_code == 404
+
+
+def test_batch_rejects_bad_requests(client: TestClient) -> None:
+    """Malformed keys, no selector, or too many keys return 400."""
+    assert client.get("/api/v1/sections/batch").status_code == 400
+    assert (
+        client.get("/api/v1/sections/batch", params={"key": "106"}).status_code == 400
+    )
+    too_many = [("key", f"17:{i}") for i in range(101)]
+    assert client.get("/api/v1/sections/batch", params=too_many).status_code == 400
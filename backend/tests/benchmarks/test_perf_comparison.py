@@ -5,6 +5,12 @@ Measures:
 2. Snapshot query with vs without revision_id index
 3. Column projection: fetching all columns vs only needed columns
 4. Cache-Control middleware overhead per request
+5. N single section fetches vs one batch fetch
+6. Response serialization: FastAPI default vs pydantic-core fast path
+7. AmendmentParser throughput: per-pattern full scans vs anchored matching
+8. Revision snapshot writes: per-section add+flush vs one bulk INSERT
+9. Amendment text matching: re-normalize per change vs incremental index
+10. USLM XML amendment parsing: ElementTree multi-pass vs lxml single pass
 
 Run: uv run pytest tests/benchmarks/test_perf_comparison.py -v -s
 
@@ -14,8 +20,10 @@ to per-round-trip latency (~1-10ms on Cloud SQL vs ~0.01ms in-memory).
 """
 
 import asyncio
+import json
 import statistics
 import time
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -661,3 +669,699 @@ def test_cache_header_nostore_in_debug() -> None:
 
     assert response.status_code == 200
     assert response.headers.get("cache-control") == "no-store"
+
+
+# ---------------------------------------------------------------------------
+# 5. N single section fetches vs one batch fetch
+# ---------------------------------------------------------------------------
+
+BATCH_SIZE = 50
+
+
+def test_section_fetch_single_vs_batch() -> None:
+    """Compare N get_section-style query sequences vs one batch sequence.
+
+    Rendering a chapter used to mean one /sections/{title}/{section} call
+    per section, each resolving the chain, fetching one snapshot and
+    enriching notes with its own public_law lookup. get_sections_batch()
+    resolves the chain once and fetches all snapshots and law titles with
+    one query each.
+    """
+
+    _CHAIN_QUERY = """
+        WITH RECURSIVE chain AS (
+            SELECT revision_id, parent_revision_id, 1 AS depth
+            FROM code_revision WHERE revision_id = :start_id
+            UNION ALL
+            SELECT cr.revision_id, cr.parent_revision_id, c.depth + 1
+            FROM code_revision cr
+            JOIN chain c ON cr.revision_id = c.parent_revision_id
+        )
+        SELECT revision_id FROM chain ORDER BY depth
+    """
+
+    _SNAPSHOT_QUERY = """
+        SELECT s.section_number, s.heading, s.text_content,
+               s.normalized_provisions, s.normalized_notes, s.group_id
+        FROM section_snapshot s
+        INNER JOIN (
+            SELECT title_number, section_number, MAX(revision_id) AS max_rev
+            FROM section_snapshot
+            WHERE revision_id IN ({chain}) AND title_number = :title
+              AND section_number IN ({sections})
+            GROUP BY title_number, section_number
+        ) latest ON s.title_number = latest.title_number
+                 AND s.section_number = latest.section_number
+                 AND s.revision_id = latest.max_rev
+    """
+
+    _LAW_QUERY = """
+        SELECT congress, law_number, short_title FROM public_law
+        WHERE congress = 116 AND law_number IN ({laws})
+    """
+
+    sections = [str(s) for s in range(1, BATCH_SIZE + 1)]
+
+    async def _fetch(session: AsyncSession, keys: list[str]) -> int:
+        chain_rows = await session.execute(text(_CHAIN_QUERY), {"start_id": 20})
+        chain = ",".join(str(row[0]) for row in chain_rows)
+        rows = (
+            await session.execute(
+                text(
+                    _SNAPSHOT_QUERY.format(
+                        chain=chain, sections=",".join(f"'{k}'" for k in keys)
+                    )
+                ),
+                {"title": TITLE_NUMBER},
+            )
+        ).all()
+        # Each seeded section cites one law, keyed by its section number
+        await session.execute(
+            text(_LAW_QUERY.format(laws=",".join(f"'{k}'" for k in keys)))
+        )
+        return len(rows)
+
+    async def _single(session: AsyncSession) -> int:
+        return sum([await _fetch(session, [s]) for s in sections])
+
+    async def _batch(session: AsyncSession) -> int:
+        return await _fetch(session, sections)
+
+    async def _run():
+        engine, make_session = await _create_seeded_engine()
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "CREATE TABLE public_law (congress INTEGER, "
+                    "law_number TEXT, short_title TEXT)"
+                )
+            )
+            for s in sections:
+                await conn.execute(
+                    text("INSERT INTO public_law VALUES (116, :n, :t)"),
+                    {"n": s, "t": f"Act {s}"},
+                )
+            await conn.execute(
+                text("CREATE INDEX idx_snap_rev ON section_snapshot (revision_id)")
+            )
+
+        async with make_session() as session:
+            assert await _single(session) == await _batch(session) == BATCH_SIZE
+            single_stats = await _async_timed_runs(lambda: _single(session), n=10)
+            batch_stats = await _async_timed_runs(lambda: _batch(session), n=10)
+
+        await engine.dispose()
+        return single_stats, batch_stats
+
+    single_stats, batch_stats = asyncio.run(_run())
+    speedup = _print_comparison(
+        f"Section fetch — {BATCH_SIZE} sections",
+        f"{BATCH_SIZE} single calls:",
+        single_stats,
+        "One batch call:",
+        batch_stats,
+    )
+    print(
+        f"  Round-trips: {BATCH_SIZE * 3} single vs 3 batch "
+        "(each ~1-10ms over the network)\n"
+    )
+
+    assert speedup > 1.0
+
+
+# ---------------------------------------------------------------------------
+# 6. Response serialization: FastAPI default vs model_json_response
+# ---------------------------------------------------------------------------
+
+# Title 42 has ~160 chapters and well over 10,000 sections; the longest
+# sections run to thousands of provision lines and hundreds of citations.
+STRUCTURE_CHAPTERS = 160
+STRUCTURE_SECTIONS_PER_CHAPTER = 70
+SECTION_PROVISION_LINES = 2000
+SECTION_CITATIONS = 300
+
+
+def _large_title_structure():
+    from app.schemas.us_code import (
+        SectionGroupTreeSchema,
+        SectionSummarySchema,
+        TitleStructureSchema,
+    )
+
+    chapters = [
+        SectionGroupTreeSchema(
+            group_type="chapter",
+            number=str(c),
+            name=f"Chapter {c}",
+            sort_order=c,
+            sections=[
+                SectionSummarySchema(
+                    section_number=f"{c * 100 + s}",
+                    heading=f"Section heading {c}-{s}",
+                    sort_order=s,
+                    last_amendment_year=2020,
+                    last_amendment_law="PL 116-260",
+                    note_categories=["editorial", "statutory"],
+                )
+                for s in range(STRUCTURE_SECTIONS_PER_CHAPTER)
+            ],
+        )
+        for c in range(STRUCTURE_CHAPTERS)
+    ]
+    return TitleStructureSchema(
+        title_number=42,
+        title_name="The Public Health and Welfare",
+        is_positive_law=False,
+        children=chapters,
+    )
+
+
+def _large_section_viewer():
+    from app.crud.us_code import _CODE_LINES_ADAPTER
+    from app.schemas.public_law import PublicLawSchema, SourceLawSchema
+    from app.schemas.us_code import SectionNotesSchema, SectionViewerSchema
+
+    lines = [
+        {
+            "line_number": i + 1,
+            "content": "Subject to subsection (b), the Secretary shall " * 3,
+            "indent_level": i % 5,
+            "marker": "(a)",
+            "start_char": i * 150,
+            "end_char": i * 150 + 149,
+        }
+        for i in range(SECTION_PROVISION_LINES)
+    ]
+    notes = SectionNotesSchema(
+        citations=[
+            SourceLawSchema(
+                law=PublicLawSchema(
+                    congress=90 + i % 28,
+                    law_number=i + 1,
+                    date="Oct. 19, 1976",
+                    short_title=f"Act {i}",
+                ),
+                raw_text=f"Pub. L. {90 + i % 28}-{i + 1}, § 101",
+                order=i,
+            )
+            for i in range(SECTION_CITATIONS)
+        ]
+    )
+    return SectionViewerSchema(
+        title_number=42,
+        section_number="1395w-4",
+        heading="Payment for physicians' services",
+        full_citation="42 U.S.C. § 1395w-4",
+        text_content="x" * 300_000,
+        provisions=_CODE_LINES_ADAPTER.validate_python(lines),
+        notes=notes,
+    )
+
+
+def _measure_alloc(fn) -> float:
+    """Return peak traced allocation (MB) of one fn() call."""
+    import tracemalloc
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024
+
+
+@pytest.mark.parametrize("payload", ["title_structure", "section_viewer"])
+def test_response_serialization_fast_path(payload: str) -> None:
+    """Compare FastAPI's default response path with model_json_response.
+
+    The default path revalidates the returned model against the response
+    model, dumps it to Python primitives and encodes with stdlib json.
+    model_json_response serializes once with pydantic-core.
+    """
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+
+    from app.core.responses import model_json_response
+
+    model = (
+        _large_title_structure()
+        if payload == "title_structure"
+        else _large_section_viewer()
+    )
+    field = create_model_field(name="response", type_=type(model), mode="serialization")
+
+    def _default() -> bytes:
+        content = asyncio.run(
+            serialize_response(field=field, response_content=model, is_coroutine=True)
+        )
+        return JSONResponse(content).body
+
+    def _fast() -> bytes:
+        return model_json_response(model).body
+
+    assert json.loads(_default()) == json.loads(_fast())
+
+    default_stats = _timed_runs(_default, n=10)
+    fast_stats = _timed_runs(_fast, n=10)
+    speedup = _print_comparison(
+        f"Serialize {payload} ({len(_fast()) // 1024}KB JSON)",
+        "FastAPI default:",
+        default_stats,
+        "model_json_response:",
+        fast_stats,
+    )
+    print(
+        f"  Peak allocations: default={_measure_alloc(_default):.1f}MB  "
+        f"fast={_measure_alloc(_fast):.1f}MB\n"
+    )
+
+    assert speedup > 1.0
+
+
+# ---------------------------------------------------------------------------
+# 7. AmendmentParser: per-pattern full scans vs anchored matching
+# ---------------------------------------------------------------------------
+
+LAW_TEXT_MB = 1  # large omnibus laws run to several MB of text
+
+
+def _large_law_text() -> str:
+    """Synthesize omnibus-style law text: mostly prose, some amendments."""
+    import random
+
+    rng = random.Random(42)
+    amendments = [
+        'Section {n}(a) of title 42, United States Code, is amended by striking "{n} days" and inserting "{m} days".',
+        "Section {n} of such Act is amended by adding at the end the following new paragraph:",
+        "(2) by redesignating paragraphs (3) through (5) as paragraphs (4) through (6);",
+        "Section {n}(b)(4) is hereby repealed.",
+        "subsection (c) is amended to read as follows:",
+    ]
+    prose = (
+        "The Secretary shall submit to the appropriate congressional committees "
+        "a report describing the activities carried out under this section, "
+        "including an assessment of the effectiveness of such activities. "
+    )
+    parts: list[str] = []
+    size = 0
+    while size < LAW_TEXT_MB * 1024 * 1024:
+        n = rng.randint(1, 9999)
+        chunk = (
+            rng.choice(amendments).format(n=n, m=n + 30)
+            if rng.random() < 0.3
+            else prose
+        )
+        parts.append(chunk)
+        size += len(chunk) + 1
+    return "\n".join(parts)
+
+
+def test_amendment_parser_throughput() -> None:
+    """Report pattern-matching throughput in MB/s, full scans vs anchored.
+
+    The old parse() ran every pattern's finditer over the whole text; the
+    anchored matcher locates pattern keywords up front and tries each
+    pattern only where a match can start.
+    """
+    import re
+
+    from pipeline.legal_parser.amendment_parser import AmendmentParser
+
+    text = _large_law_text()
+    mb = len(text) / 1024 / 1024
+    parser = AmendmentParser(default_title=42)
+    matcher = parser._matcher
+    flags = re.IGNORECASE | re.MULTILINE | re.DOTALL
+    compiled = [(p.name, re.compile(p.regex, flags)) for p in parser.patterns]
+
+    def _full_scan():
+        return [(name, m.span()) for name, c in compiled for m in c.finditer(text)]
+
+    def _anchored():
+        positions = matcher.scan(text)
+        return [
+            (name, m.span())
+            for name, _ in compiled
+            for m in matcher.finditer(name, text, positions)
+        ]
+
+    assert _full_scan() == _anchored()
+
+    full_stats = _timed_runs(_full_scan, n=2)
+    anchored_stats = _timed_runs(_anchored, n=2)
+    speedup = _print_comparison(
+        f"Amendment pattern matching — {mb:.1f}MB law text",
+        "Full scan per pattern:",
+        full_stats,
+        "Anchored matching:",
+        anchored_stats,
+    )
+    print(
+        f"  Throughput: full scan {mb / (full_stats['mean_ms'] / 1000):.1f} MB/s, "
+        f"anchored {mb / (anchored_stats['mean_ms'] / 1000):.1f} MB/s\n"
+    )
+
+    assert speedup > 1.0
+
+
+# ---------------------------------------------------------------------------
+# 8. Revision snapshot writes: per-section add+flush vs one bulk INSERT
+# ---------------------------------------------------------------------------
+
+LAW_SECTIONS = 2_000  # omnibus appropriations laws touch thousands of sections
+
+
+def test_snapshot_write_per_row_vs_bulk() -> None:
+    """Compare writing a large law's snapshots one flush at a time vs in bulk.
+
+    RevisionBuilder used to session.add() and flush() each SectionSnapshot,
+    a round-trip per section. It now collects the rows and writes them with
+    write_snapshot_rows(): one multi-row INSERT here, COPY on asyncpg.
+    """
+    from sqlalchemy import func, insert, select
+
+    rows = [
+        {
+            "revision_id": 2,
+            "title_number": TITLE_NUMBER,
+            "section_number": str(n),
+            "heading": f"Section {n}",
+            "text_content": "x" * 2000,
+            "normalized_provisions": '{"lines": []}',
+            "text_hash": f"{n:064x}",
+            "full_citation": f"{TITLE_NUMBER} U.S.C. {n}",
+            "is_deleted": 0,
+        }
+        for n in range(1, LAW_SECTIONS + 1)
+    ]
+
+    async def _per_row(session: AsyncSession) -> None:
+        for row in rows:
+            session.add(FakeSnapshot(**row))
+            await session.flush()
+
+    async def _bulk(session: AsyncSession) -> None:
+        await session.execute(insert(FakeSnapshot), rows)
+
+    async def _run():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        make_session = sessionmaker(engine, class_=AsyncSession)
+
+        stats = []
+        for write in (_per_row, _bulk):
+            async with make_session() as session:
+
+                async def _once(write=write, session=session) -> None:
+                    await write(session)
+                    await session.rollback()
+
+                stats.append(await _async_timed_runs(_once, n=5))
+
+        async with make_session() as session:
+            await _bulk(session)
+            count = await session.scalar(select(func.count()).select_from(FakeSnapshot))
+
+        await engine.dispose()
+        return stats, count
+
+    (per_row_stats, bulk_stats), count = asyncio.run(_run())
+    assert count == LAW_SECTIONS
+
+    speedup = _print_comparison(
+        f"Snapshot writes — {LAW_SECTIONS} sections",
+        "add + flush per section:",
+        per_row_stats,
+        "One bulk INSERT:",
+        bulk_stats,
+    )
+    print(
+        f"  Round-trips: {LAW_SECTIONS} per-row vs a handful batched "
+        "(one COPY on PostgreSQL)\n"
+    )
+
+    assert speedup > 1.0
+
+
+# ---------------------------------------------------------------------------
+# 9. Amendment text matching: re-normalize per change vs incremental index
+# ---------------------------------------------------------------------------
+
+TAX_SECTION_KB = 400  # 26 U.S.C. 401 and 501 run to hundreds of KB
+TAX_AMENDMENTS = 40  # omnibus tax laws amend one section dozens of times
+
+
+def _large_tax_section() -> tuple[str, list[tuple[str, str]]]:
+    """Synthesize a Title 26-sized section and amendments against it.
+
+    The section text comes from XML with line breaks and double spaces
+    that the law's quoted text does not have, so most amendments need the
+    whitespace-normalized or case-insensitive match.
+    """
+    import random
+
+    rng = random.Random(26)
+    paragraphs = []
+    size = 0
+    n = 0
+    while size < TAX_SECTION_KB * 1024:
+        n += 1
+        paragraph = (
+            f"({n}) Limitation {n}.—The amount determined under paragraph\n"
+            f"({n - 1 or 1}) for any  taxable year shall not exceed "
+            f"${rng.randint(1, 99) * 500:,} in the case of a plan described in\n"
+            f"subsection (k)({n % 9 + 1}) for plan year {1986 + n % 40}."
+        )
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 1
+    text = "\n".join(paragraphs)
+
+    amendments = []
+    for i in rng.sample(range(1, n), TAX_AMENDMENTS):
+        old = f"paragraph ({i - 1 or 1}) for any taxable year"
+        if rng.random() < 0.3:
+            old = old.upper()
+        amendments.append((old, f"paragraph ({i - 1 or 1}) for any plan year"))
+    return text, amendments
+
+
+def test_amendment_text_matching() -> None:
+    """Compare per-change re-normalization with a per-section match index.
+
+    _find_and_replace used to collapse whitespace in the whole section
+    and compile fresh regexes for every change that was not an exact
+    match. SectionMatchIndex normalizes once and patches its view around
+    each replacement.
+    """
+    import logging
+    import re
+
+    from pipeline.chrono.amendment_applicator import (
+        SectionMatchIndex,
+        _find_and_replace,
+    )
+
+    text, amendments = _large_tax_section()
+
+    def _renormalize() -> str:
+        current = text
+        for old, new in amendments:
+            if old in current:
+                current = current.replace(old, new, 1)
+                continue
+            ws_pattern = r"\s+".join(re.escape(part) for part in old.split())
+            norm_old = re.sub(r"\s+", " ", old.strip())
+            match = None
+            if norm_old in re.sub(r"\s+", " ", current.strip()):
+                match = re.compile(ws_pattern).search(current)
+            if match is None:
+                match = re.compile(ws_pattern, re.IGNORECASE).search(current)
+            assert match is not None
+            current = current[: match.start()] + new + current[match.end() :]
+        return current
+
+    def _indexed() -> str:
+        index = SectionMatchIndex(text)
+        current = text
+        for old, new in amendments:
+            result, matched = _find_and_replace(current, old, new, index)
+            assert matched and result is not None
+            current = result
+        return current
+
+    applicator_logger = logging.getLogger("pipeline.chrono.amendment_applicator")
+    level = applicator_logger.level
+    applicator_logger.setLevel(logging.ERROR)  # one warning per folded match
+    try:
+        assert _renormalize() == _indexed()
+        old_stats = _timed_runs(_renormalize, n=5)
+        new_stats = _timed_runs(_indexed, n=5)
+    finally:
+        applicator_logger.setLevel(level)
+
+    speedup = _print_comparison(
+        f"Amendment matching — {len(text) // 1024}KB section, {TAX_AMENDMENTS} changes",
+        "Re-normalize per change:",
+        old_stats,
+        "Incremental index:",
+        new_stats,
+    )
+    print()
+
+    assert speedup > 1.0
+
+
+# ---------------------------------------------------------------------------
+# 10. USLM XML amendment parsing: ElementTree multi-pass vs lxml single pass
+# ---------------------------------------------------------------------------
+
+OMNIBUS_SECTIONS = 1_500  # NDAAs run to well over a thousand sections
+
+_GOVINFO_PLAW_DIR = Path(__file__).resolve().parents[2] / "data" / "govinfo" / "plaw"
+
+
+def _synthetic_omnibus_xml() -> str:
+    """Synthesize an NDAA-sized USLM law: nested multi-part instructions."""
+    ns = "http://schemas.gpo.gov/xml/uslm"
+    sections = []
+    for n in range(1, OMNIBUS_SECTIONS + 1):
+        ident = f"/us/pl/118/31/s{n}"
+        if n % 5 == 0:
+            sections.append(
+                f'<section identifier="{ident}"><num>SEC. {n}.</num>'
+                f"<heading>Report {n}.</heading>"
+                f"<sidenote>10 USC {n} note.</sidenote>"
+                "<content>The Secretary shall submit a report.</content>"
+                "</section>"
+            )
+            continue
+        paragraphs = "".join(
+            f'<paragraph identifier="{ident}/{p}"><num>({p})</num>'
+            f"<content>in paragraph ({p}), by "
+            '<amendingAction type="delete">striking</amendingAction> '
+            f"<quotedText>{p * 30} days</quotedText> and "
+            '<amendingAction type="insert">inserting</amendingAction> '
+            f"<quotedText>{p * 45} days</quotedText>;</content></paragraph>"
+            for p in range(1, 5)
+        )
+        sections.append(
+            f'<section identifier="{ident}" role="instruction">'
+            f"<num>SEC. {n}.</num><heading>Amendment {n}.</heading>"
+            f'<chapeau>Section {n} of title 10, <ref href="/us/usc/t10/s{n}">'
+            "United States Code</ref>, is "
+            '<amendingAction type="amend">amended</amendingAction>—</chapeau>'
+            f"{paragraphs}</section>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<pLaw xmlns="{ns}"><main>{"".join(sections)}</main></pLaw>'
+    )
+
+
+def _omnibus_xml_samples() -> list[tuple[str, str]]:
+    """The largest cached public laws, or a synthetic one if none exist."""
+    cached = sorted(
+        _GOVINFO_PLAW_DIR.glob("PLAW-*.xml"),
+        key=lambda f: f.stat().st_size,
+        reverse=True,
+    )[:2]
+    if cached:
+        return [(f.stem, f.read_text(encoding="utf-8")) for f in cached]
+    return [("synthetic NDAA", _synthetic_omnibus_xml())]
+
+
+def test_xml_parser_traversal() -> None:
+    """Compare the old multi-pass ElementTree traversal with the lxml pass.
+
+    XMLAmendmentParser used to walk the tree once for instructions, search
+    each structural child's subtree for <amendingAction> at every level of
+    leaf decomposition, walk it twice more for processed ids and sections,
+    and search the whole XML text for each leaf's position. It now marks
+    action-bearing elements in one lxml pass and looks positions up in an
+    identifier index. Both sides produce the leaf list and positions that
+    feed _parse_leaf, which is shared.
+    """
+    import xml.etree.ElementTree as ET
+
+    from lxml import etree
+
+    from pipeline.legal_parser.xml_parser import (
+        _ACTION_TAG,
+        _STRUCTURAL_TAGS,
+        XMLAmendmentParser,
+        _find_leaf_instructions,
+        _scan_tree,
+        _SourcePositions,
+        _tag,
+    )
+
+    def _old_leaves(elem):
+        kids = [
+            c
+            for c in elem
+            if c.tag in _STRUCTURAL_TAGS and any(True for _ in c.iter(_ACTION_TAG))
+        ]
+        if kids:
+            return [leaf for kid in kids for leaf in _old_leaves(kid)]
+        return [elem] if any(True for _ in elem.iter(_ACTION_TAG)) else []
+
+    def _old_position(elem, xml_text):
+        idx = xml_text.find(f'identifier="{elem.get("identifier", "")}"')
+        end_marker = f"</{elem.tag.split('}')[-1]}>"
+        return xml_text.rfind("<", 0, idx), xml_text.find(end_marker, idx)
+
+    def _multi_pass(xml_text: str) -> int:
+        root = ET.fromstring(xml_text)
+        spans = [
+            _old_position(leaf, xml_text)
+            for elem in root.iter()
+            if elem.get("role") == "instruction"
+            for leaf in _old_leaves(elem)
+        ]
+        processed = {
+            e.get("identifier") for e in root.iter() if e.get("role") == "instruction"
+        }
+        notes = [
+            e
+            for e in root.iter(_tag("section"))
+            if e.get("identifier") not in processed
+        ]
+        return len(spans) + len(notes)
+
+    def _single_pass(xml_text: str) -> int:
+        parser = etree.XMLParser(remove_comments=True, huge_tree=True)
+        root = etree.fromstring(xml_text.encode("utf-8"), parser)
+        instructions, sections, with_action = _scan_tree(root)
+        positions = _SourcePositions(xml_text)
+        spans = [
+            positions.span(leaf)
+            for elem in instructions
+            for leaf, _ in _find_leaf_instructions(elem, with_action)
+        ]
+        processed = {e.get("identifier") for e in instructions}
+        notes = [e for e in sections if e.get("identifier") not in processed]
+        return len(spans) + len(notes)
+
+    for name, xml_text in _omnibus_xml_samples():
+        mb = len(xml_text) / 1024 / 1024
+        assert _multi_pass(xml_text) == _single_pass(xml_text)
+
+        old_stats = _timed_runs(lambda x=xml_text: _multi_pass(x), n=3)
+        new_stats = _timed_runs(lambda x=xml_text: _single_pass(x), n=3)
+        speedup = _print_comparison(
+            f"XML parser traversal — {name} ({mb:.1f}MB)",
+            "ElementTree multi-pass:",
+            old_stats,
+            "lxml single pass:",
+            new_stats,
+        )
+        parse_stats = _timed_runs(
+            lambda x=xml_text: XMLAmendmentParser(default_title=10).parse(x), n=3
+        )
+        print(
+            f"  Full parse(): {parse_stats['mean_ms']:.1f}ms "
+            f"({mb / (parse_stats['mean_ms'] / 1000):.1f} MB/s)\n"
+        )
+
+        assert speedup > 1.0
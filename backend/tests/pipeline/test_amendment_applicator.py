@@ -1,8 +1,13 @@
 """Tests for pipeline.chrono.amendment_applicator — pure unit tests, no DB."""
 
+import random
+import re
+
 from app.models.enums import ChangeType
 from pipeline.chrono.amendment_applicator import (
     ApplicationStatus,
+    SectionMatchIndex,
+    _find_and_replace,
     apply_text_change,
 )
 
@@ -157,3 +162,81 @@ class TestApplyTextChange:
         assert result.new_text == (
             "10 percent of the first amount and 5 percent of the second."
         )
+
+
+def _reference_find_and_replace(
+    text_content: str, old_text: str, replacement: str
+) -> str | None:
+    """The matcher before SectionMatchIndex: re-normalize per change."""
+    if old_text in text_content:
+        return text_content.replace(old_text, replacement, 1)
+    parts = old_text.split()
+    ws_pattern = r"\s+".join(re.escape(part) for part in parts)
+    norm_old = re.sub(r"\s+", " ", old_text.strip())
+    if norm_old in re.sub(r"\s+", " ", text_content.strip()):
+        match = re.search(ws_pattern, text_content)
+        if match:
+            return (
+                text_content[: match.start()]
+                + replacement
+                + text_content[match.end() :]
+            )
+    match = re.search(ws_pattern, text_content, re.IGNORECASE)
+    if match:
+        return text_content[: match.start()] + replacement + text_content[match.end() :]
+    return None
+
+
+class TestSectionMatchIndex:
+    """The index must pick the same occurrence as a full re-normalization."""
+
+    def test_index_reused_across_changes(self) -> None:
+        text = "The  rate\n\nshall be 5 percent.  THE RATE shall apply."
+        index = SectionMatchIndex(text)
+        for old, new in [
+            ("rate shall be", "rate shall equal"),
+            ("the rate shall apply", "the rate applies"),
+            ("5 percent.", "7 percent. "),
+        ]:
+            result = apply_text_change(
+                text_content=text,
+                change_type=ChangeType.MODIFY,
+                old_text=old,
+                new_text=new,
+                title_number=26,
+                section_number="1",
+                match_index=index,
+            )
+            assert result.new_text == _reference_find_and_replace(text, old, new)
+            assert result.new_text is index.text
+            text = result.new_text
+
+    def test_non_ascii_text_falls_back_to_regex(self) -> None:
+        index = SectionMatchIndex("the term “Secretary” means—")
+        assert index.find("THE TERM “SECRETARY”") == (0, 20, True)
+
+    def test_matches_reference_over_random_edit_sequences(self) -> None:
+        rng = random.Random(26)
+        words = ["tax", "Tax", "credit", "the", "year", "1986", "(a)", "section"]
+        spaces = [" ", " ", " ", "  ", "\n", " \n\t"]
+
+        def _phrase(k: int) -> str:
+            out = rng.choice(words)
+            for _ in range(k - 1):
+                out += rng.choice(spaces) + rng.choice(words)
+            return out
+
+        for _ in range(300):
+            text = _phrase(rng.randint(1, 40))
+            index = SectionMatchIndex(text)
+            for _ in range(10):
+                old = _phrase(rng.randint(1, 3))
+                if rng.random() < 0.3:
+                    old = old.upper()
+                new = _phrase(rng.randint(0, 2)) if rng.random() < 0.8 else ""
+                expected = _reference_find_and_replace(text, old, new)
+                actual, matched = _find_and_replace(text, old, new, index)
+                assert actual == expected, (text, old, new)
+                if matched:
+                    assert actual is not None
+                    text = actual
@@ -0,0 +1,272 @@
+"""Tests for the batched, resumable backfill framework and its backfills."""
+
+import io
+import json
+from collections.abc import AsyncIterator
+from datetime import date
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models.enums import RevisionType
+from app.models.revision import CodeRevision
+from app.models.snapshot import SectionSnapshot
+from app.models.us_code import USCodeSection
+from pipeline.backfill import RowChange, _read_page, run_backfill, update_statement
+from pipeline.backfill_last_modified import BACKFILL
+from pipeline.backfill_renormalize_notes import BACKFILLS, _renormalize_row
+from pipeline.backfill_section_dates import BACKFILL as SNAPSHOT_DATES
+from pipeline.cache import PipelineCache
+from pipeline.olrc.section_dates import derive_section_dates
+
+
+@pytest_asyncio.fixture
+async def session() -> AsyncIterator[AsyncSession]:
+    from app.models.base import Base
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with maker() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> PipelineCache:
+    return PipelineCache(local_root=tmp_path, bucket_name=None)
+
+
+def _notes(year: int) -> dict[str, Any]:
+    return {
+        "citations": [
+            {"relationship": "Amendment", "law": {"date": f"{year}-06-01"}},
+        ]
+    }
+
+
+async def _add_sections(session: AsyncSession, count: int) -> None:
+    for n in range(1, count + 1):
+        session.add(
+            USCodeSection(
+                section_id=n,
+                title_number=17,
+                section_number=str(n),
+                heading=f"Section {n}",
+                full_citation=f"17 U.S.C. {n}",
+                # Every third section has nothing to derive a date from
+                normalized_notes=_notes(2000 + n) if n % 3 else {"notes": []},
+            )
+        )
+    await session.commit()
+
+
+async def _dates(session: AsyncSession) -> dict[int, date | None]:
+    result = await session.execute(
+        select(USCodeSection.section_id, USCodeSection.last_modified_date)
+    )
+    return dict(result.all())
+
+
+class TestRunBackfill:
+    @pytest.mark.asyncio
+    async def test_apply_updates_changed_rows_in_batches(
+        self, session: AsyncSession
+    ) -> None:
+        await _add_sections(session, 7)
+
+        result = await run_backfill(
+            session, BACKFILL, dry_run=False, batch_size=3, workers=0
+        )
+
+        assert (result.scanned, result.changed) == (7, 5)
+        dates = await _dates(session)
+        assert dates[1] == date(2001, 6, 1)
+        assert dates[7] == date(2007, 6, 1)
+        assert dates[3] is None
+        assert dates[6] is None
+
+    @pytest.mark.asyncio
+    async def test_dry_run_reports_without_writing(
+        self, session: AsyncSession, cache: PipelineCache
+    ) -> None:
+        await _add_sections(session, 4)
+        report = io.StringIO()
+
+        result = await run_backfill(
+            session, BACKFILL, batch_size=2, workers=0, cache=cache, report=report
+        )
+
+        assert result.changed == 3
+        assert set((await _dates(session)).values()) == {None}
+        lines = [json.loads(line) for line in report.getvalue().splitlines()]
+        assert [line["key"] for line in lines] == [1, 2, 4]
+        assert lines[0] == {
+            "backfill": "last_modified_date",
+            "key": 1,
+            "before": None,
+            "after": "2001-06-01",
+        }
+        assert cache.get_text(BACKFILL.checkpoint_key) is None
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_checkpoint(
+        self, session: AsyncSession, cache: PipelineCache
+    ) -> None:
+        await _add_sections(session, 5)
+        cache.put_text(BACKFILL.checkpoint_key, json.dumps({"last_key": 2}))
+
+        result = await run_backfill(
+            session, BACKFILL, dry_run=False, batch_size=2, workers=0, cache=cache
+        )
+
+        assert result.resumed_after == 2
+        assert (result.scanned, result.changed) == (3, 2)
+        dates = await _dates(session)
+        assert dates[1] is None
+        assert dates[4] == date(2004, 6, 1)
+        # A completed run clears its checkpoint so the next run starts over
+        assert cache.get_text(BACKFILL.checkpoint_key) is None
+
+    @pytest.mark.asyncio
+    async def test_interrupted_run_keeps_checkpoint(
+        self, session: AsyncSession, cache: PipelineCache
+    ) -> None:
+        await _add_sections(session, 5)
+
+        with (
+            patch(
+                "pipeline.backfill._read_page",
+                side_effect=[
+                    await _read_page(session, BACKFILL, None, 2),
+                    await _read_page(session, BACKFILL, 2, 2),
+                    RuntimeError("connection lost"),
+                ],
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            await run_backfill(
+                session, BACKFILL, dry_run=False, batch_size=2, workers=0, cache=cache
+            )
+
+        # The first page was committed before the second page's read failed
+        checkpoint = json.loads(cache.get_text(BACKFILL.checkpoint_key) or "")
+        assert checkpoint == {"last_key": 2, "scanned": 2, "changed": 2}
+
+    @pytest.mark.asyncio
+    async def test_restart_ignores_checkpoint(
+        self, session: AsyncSession, cache: PipelineCache
+    ) -> None:
+        await _add_sections(session, 2)
+        cache.put_text(BACKFILL.checkpoint_key, json.dumps({"last_key": 2}))
+
+        result = await run_backfill(
+            session, BACKFILL, dry_run=False, workers=0, cache=cache, restart=True
+        )
+
+        assert result.changed == 2
+
+    @pytest.mark.asyncio
+    async def test_process_pool_matches_inline(self, session: AsyncSession) -> None:
+        await _add_sections(session, 10)
+        inline, pooled = io.StringIO(), io.StringIO()
+
+        await run_backfill(session, BACKFILL, batch_size=4, workers=0, report=inline)
+        await run_backfill(session, BACKFILL, batch_size=4, workers=2, report=pooled)
+
+        assert pooled.getvalue() == inline.getvalue()
+        assert len(inline.getvalue().splitlines()) == 7
+
+
+class TestSectionDatesBackfill:
+    @pytest.mark.asyncio
+    async def test_fills_snapshot_dates(self, session: AsyncSession) -> None:
+        session.add(
+            CodeRevision(
+                revision_id=1,
+                revision_type=RevisionType.RELEASE_POINT.value,
+                effective_date=date(2024, 1, 1),
+                sequence_number=0,
+            )
+        )
+        notes = {
+            "citations": [
+                {"relationship": "Enactment", "law": {"date": "1976-10-19"}},
+                {"relationship": "Amendment", "law": {"date": "1998-10-27"}},
+            ]
+        }
+        for snapshot_id, normalized_notes in ((1, notes), (2, {"citations": []})):
+            session.add(
+                SectionSnapshot(
+                    snapshot_id=snapshot_id,
+                    revision_id=1,
+                    title_number=17,
+                    section_number=str(100 + snapshot_id),
+                    normalized_notes=normalized_notes,
+                )
+            )
+        await session.commit()
+
+        result = await run_backfill(session, SNAPSHOT_DATES, dry_run=False, workers=0)
+
+        assert (result.scanned, result.changed) == (2, 1)
+        rows = await session.execute(
+            select(
+                SectionSnapshot.snapshot_id,
+                SectionSnapshot.enacted_date,
+                SectionSnapshot.last_modified_date,
+            ).order_by(SectionSnapshot.snapshot_id)
+        )
+        assert rows.all() == [
+            (1, date(1976, 10, 19), date(1998, 10, 27)),
+            (2, None, None),
+        ]
+
+
+class TestUpdateStatement:
+    def test_postgres_update_joins_values_list(self) -> None:
+        stmt = update_statement(
+            BACKFILL,
+            [
+                RowChange(1, {"last_modified_date": date(2001, 1, 1)}),
+                RowChange(2, {"last_modified_date": date(2002, 1, 1)}),
+            ],
+        )
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "FROM (VALUES" in sql
+        assert "us_code_section.section_id = v.section_id" in sql
+
+    def test_notes_update_only_replaces_notes_key(self) -> None:
+        stmt = update_statement(BACKFILLS[1], [RowChange(1, {"notes": []})])
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "jsonb_set(us_code_section.normalized_notes, '{notes}', v.notes)" in sql
+
+
+class TestTransforms:
+    def test_unchanged_notes_are_skipped(self) -> None:
+        raw = (
+            "[NH]References in Text[/NH]\n\n"
+            "The act referred to in subsecs. (a) and (b) is Pub. L. 1–1."
+        )
+        change = _renormalize_row((1, raw, {"notes": []}))
+        assert change is not None
+        assert _renormalize_row((1, raw, {"notes": change.after})) is None
+
+    def test_original_framework_citations_are_ignored(self) -> None:
+        notes = {
+            "citations": [
+                {"relationship": "Framework", "law": {"date": "1990-01-01"}},
+            ],
+            "amendments": [{"year": 1975}],
+        }
+        assert derive_section_dates(notes) == (
+            date(1990, 1, 1),
+            date(1975, 1, 1),
+        )
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import hashlib
+from datetime import date
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -424,6 +425,25 @@ class TestSnapshotFieldMapping:
         assert snapshots[0]["full_citation"] == "17 U.S.C. § 101"
         assert snapshots[0]["is_deleted"] is False
 
+    @pytest.mark.asyncio
+    async def test_snapshot_dates_derived_from_notes(self) -> None:
+        """Verify enacted/last-modified dates are stored with the snapshot."""
+        notes = (
+            "(Pub. L. 94-553, title I, Oct. 19, 1976, 90 Stat. 2546; "
+            "Pub. L. 105-298, title I, § 102(a), Oct. 27, 1998, 112 Stat. 2827.)"
+        )
+        session = _make_mock_session()
+        sections = [_make_parsed_section(notes=notes)]
+        mock_parser = _make_parser_mock(_make_parse_result(sections=sections))
+        service = BootstrapService(session, _make_mock_downloader())
+
+        with patch("pipeline.olrc.bootstrap.USLMParser", return_value=mock_parser):
+            await service.create_initial_commit("113-21", titles=[17])
+
+        (snapshot,) = _get_snapshot_dicts(session)
+        assert snapshot["enacted_date"] == date(1976, 10, 19)
+        assert snapshot["last_modified_date"] == date(1998, 10, 27)
+
     @pytest.mark.asyncio
     async def test_download_failure_skips_title(self) -> None:
         """Download raising an exception should skip the title, not fail."""
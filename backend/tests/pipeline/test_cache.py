@@ -1,11 +1,19 @@
-"""Tests for PipelineCache (local + optional GCS backing)."""
+"""Tests for PipelineCache (local + optional remote backing)."""
 
+import gzip
+import os
+import zipfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from pipeline.cache import PipelineCache
+from pipeline.cache import (
+    CacheStats,
+    GCSRemoteStore,
+    LocalDirRemoteStore,
+    PipelineCache,
+)
 
 
 @pytest.fixture
@@ -14,8 +22,14 @@ def tmp_cache(tmp_path: Path) -> PipelineCache:
     return PipelineCache(local_root=tmp_path, bucket_name=None)
 
 
+class _NotFound(Exception):
+    """Stand-in for google.api_core.exceptions.NotFound."""
+
+    code = 404
+
+
 class TestLocalOnly:
-    """Tests for local-only caching (no GCS)."""
+    """Tests for local-only caching (no remote tier)."""
 
     def test_put_and_get_text(self, tmp_cache: PipelineCache) -> None:
         tmp_cache.put_text("foo/bar.json", '{"x": 1}')
@@ -41,138 +55,213 @@ class TestLocalOnly:
         path = tmp_cache.local_path("sub/dir/file.xml")
         assert path == tmp_cache.local_root / "sub" / "dir" / "file.xml"
 
-    def test_no_gcs_when_bucket_unset(self, tmp_cache: PipelineCache) -> None:
-        assert tmp_cache._init_gcs() is False
-        assert tmp_cache._gcs_available is False
+    def test_no_remote_when_bucket_unset(self, tmp_cache: PipelineCache) -> None:
+        assert tmp_cache.remote is None
+
+    def test_delete(self, tmp_cache: PipelineCache) -> None:
+        tmp_cache.put_text("gone.json", "x")
+        tmp_cache.delete("gone.json")
+        assert tmp_cache.get_text("gone.json") is None
+
+
+class TestEntryFormat:
+    """Entries are compressed, hashed and written atomically."""
+
+    def test_text_is_stored_compressed(self, tmp_cache: PipelineCache) -> None:
+        content = '{"text": "' + "section " * 2000 + '"}'
+        tmp_cache.put_text("big.json", content)
+        stored = tmp_cache.local_path("big.json").read_bytes()
+        assert len(stored) < len(content) // 10
+        assert tmp_cache.get_text("big.json") == content
+
+    def test_compressed_keys_are_not_recompressed(
+        self, tmp_cache: PipelineCache
+    ) -> None:
+        payload = gzip.compress(b"already compressed" * 100)
+        with patch("pipeline.cache.gzip.compress") as compress:
+            tmp_cache.put_bytes("result.json.gz", payload)
+            tmp_cache.put_bytes("title1.zip", b"PK\x03\x04zipdata")
+        compress.assert_not_called()
+        assert tmp_cache.get_bytes("result.json.gz") == payload
+
+    def test_legacy_raw_entries_are_readable(self, tmp_cache: PipelineCache) -> None:
+        legacy = tmp_cache.local_path("govinfo/plaw/old.json")
+        legacy.parent.mkdir(parents=True)
+        legacy.write_text('{"written": "before envelopes"}')
+        assert tmp_cache.get_text("govinfo/plaw/old.json") == (
+            '{"written": "before envelopes"}'
+        )
+
+    def test_corrupt_local_entry_is_a_miss(self, tmp_cache: PipelineCache) -> None:
+        tmp_cache.put_text("key.json", "content")
+        path = tmp_cache.local_path("key.json")
+        entry = bytearray(path.read_bytes())
+        entry[-1] ^= 0xFF
+        path.write_bytes(bytes(entry))
+
+        assert tmp_cache.get_text("key.json") is None
+        assert not path.exists()
+
+    def test_writes_leave_no_temporary_files(self, tmp_cache: PipelineCache) -> None:
+        tmp_cache.put_text("dir/a.json", "a")
+        tmp_cache.put_text("dir/a.json", "b")
+        assert [p.name for p in (tmp_cache.local_root / "dir").iterdir()] == ["a.json"]
+        assert tmp_cache.get_text("dir/a.json") == "b"
+
+    def test_failed_write_keeps_previous_entry(self, tmp_cache: PipelineCache) -> None:
+        tmp_cache.put_text("key.json", "old")
+        with (
+            patch("pipeline.cache.os.replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            tmp_cache.put_text("key.json", "new")
+        assert tmp_cache.get_text("key.json") == "old"
+        assert len(list(tmp_cache.local_root.iterdir())) == 1
+
+    def test_unknown_compression_rejected(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            PipelineCache(local_root=tmp_path, compression="lzma")
+
+
+class TestRemoteTier:
+    """Two-layer behaviour, with a local directory standing in for GCS."""
+
+    def _caches(self, tmp_path: Path) -> tuple[PipelineCache, PipelineCache]:
+        remote = LocalDirRemoteStore(tmp_path / "remote")
+        writer = PipelineCache(local_root=tmp_path / "a", remote=remote)
+        reader = PipelineCache(local_root=tmp_path / "b", remote=remote)
+        return writer, reader
+
+    def test_remote_hit_backfills_local(self, tmp_path: Path) -> None:
+        writer, reader = self._caches(tmp_path)
+        writer.put_text("govinfo/plaw/test.json", '{"from": "remote"}')
+
+        assert not reader.has_local("govinfo/plaw/test.json")
+        assert reader.get_text("govinfo/plaw/test.json") == '{"from": "remote"}'
+        assert reader.has_local("govinfo/plaw/test.json")
+
+    def test_corrupt_local_entry_recovered_from_remote(self, tmp_path: Path) -> None:
+        writer, _reader = self._caches(tmp_path)
+        writer.put_bytes("olrc/test.zip", b"PK\x03\x04data")
+        writer.local_path("olrc/test.zip").write_bytes(b"PCE1 truncated")
+
+        assert writer.get_bytes("olrc/test.zip") == b"PK\x03\x04data"
+
+    def test_corrupt_remote_entry_is_a_miss(self, tmp_path: Path) -> None:
+        writer, reader = self._caches(tmp_path)
+        writer.put_text("key.json", "content")
+        remote_file = tmp_path / "remote" / "key.json"
+        remote_file.write_bytes(remote_file.read_bytes()[:-2])
+
+        assert reader.get_text("key.json") is None
+        assert not reader.has_local("key.json")
+
+    def test_delete_removes_both_layers(self, tmp_path: Path) -> None:
+        writer, reader = self._caches(tmp_path)
+        writer.put_text("key.json", "content")
+        writer.delete("key.json")
+        assert reader.get_text("key.json") is None
+
+    @pytest.mark.asyncio
+    async def test_async_api(self, tmp_path: Path) -> None:
+        writer, reader = self._caches(tmp_path)
+        await writer.aput_text("key.json", "text")
+        await writer.aput_bytes("key.zip", b"PK\x03\x04")
+
+        assert await reader.aget_text("key.json") == "text"
+        assert await reader.aget_bytes("key.zip") == b"PK\x03\x04"
+        assert await reader.aget_text("missing.json") is None
+        await reader.adelete("key.json")
+        assert await writer.aget_bytes("key.json") is not None  # writer's local
+        assert (
+            await PipelineCache(
+                local_root=tmp_path / "c", remote=writer.remote
+            ).aget_text("key.json")
+            is None
+        )
 
 
-class TestGCSIntegration:
-    """Tests for GCS-backed caching with mocked google.cloud.storage."""
+class TestGCSRemoteStore:
+    """GCS tier with a mocked google.cloud.storage bucket."""
 
     def _make_cache_with_mock_gcs(
         self, tmp_path: Path
     ) -> tuple[PipelineCache, MagicMock]:
         """Create a PipelineCache with a mocked GCS bucket."""
         mock_bucket = MagicMock()
-        mock_client = MagicMock()
-        mock_client.bucket.return_value = mock_bucket
-
         cache = PipelineCache(local_root=tmp_path, bucket_name="test-bucket")
-
-        with patch("pipeline.cache.PipelineCache._init_gcs") as mock_init:
-            # Simulate successful GCS init
-            def init_gcs_side_effect() -> bool:
-                cache._gcs_available = True
-                cache._gcs_bucket = mock_bucket
-                return True
-
-            mock_init.side_effect = init_gcs_side_effect
-
-            # Force init
-            cache._init_gcs()
-
+        assert isinstance(cache.remote, GCSRemoteStore)
+        cache.remote._bucket = mock_bucket
+        cache.remote._available = True
         return cache, mock_bucket
 
-    def test_get_text_gcs_hit_backfills_local(self, tmp_path: Path) -> None:
-        cache, mock_bucket = self._make_cache_with_mock_gcs(tmp_path)
-
-        blob = MagicMock()
-        blob.exists.return_value = True
-        blob.download_as_text.return_value = '{"from": "gcs"}'
-        mock_bucket.blob.return_value = blob
-
-        result = cache.get_text("govinfo/plaw/test.json")
-
-        assert result == '{"from": "gcs"}'
-        # Verify local backfill
-        local = tmp_path / "govinfo" / "plaw" / "test.json"
-        assert local.exists()
-        assert local.read_text() == '{"from": "gcs"}'
-
-    def test_put_text_writes_both(self, tmp_path: Path) -> None:
+    def test_get_is_a_single_download(self, tmp_path: Path) -> None:
         cache, mock_bucket = self._make_cache_with_mock_gcs(tmp_path)
+        source = PipelineCache(local_root=tmp_path / "src")
+        source.put_text("govinfo/plaw/test.json", '{"from": "gcs"}')
 
         blob = MagicMock()
+        blob.download_as_bytes.return_value = source.local_path(
+            "govinfo/plaw/test.json"
+        ).read_bytes()
         mock_bucket.blob.return_value = blob
 
-        cache.put_text("key.json", "content")
-
-        # Local write
-        assert (tmp_path / "key.json").read_text() == "content"
-        # GCS write
-        blob.upload_from_string.assert_called_once_with(
-            "content", content_type="text/plain"
-        )
+        assert cache.get_text("govinfo/plaw/test.json") == '{"from": "gcs"}'
+        blob.exists.assert_not_called()
+        blob.download_as_bytes.assert_called_once()
+        assert cache.has_local("govinfo/plaw/test.json")
 
-    def test_get_bytes_gcs_hit_backfills_local(self, tmp_path: Path) -> None:
+    def test_legacy_raw_object_is_readable(self, tmp_path: Path) -> None:
         cache, mock_bucket = self._make_cache_with_mock_gcs(tmp_path)
-
         blob = MagicMock()
-        blob.exists.return_value = True
         blob.download_as_bytes.return_value = b"zipdata"
         mock_bucket.blob.return_value = blob
 
-        result = cache.get_bytes("olrc/test.zip")
-
-        assert result == b"zipdata"
-        local = tmp_path / "olrc" / "test.zip"
-        assert local.exists()
-        assert local.read_bytes() == b"zipdata"
+        assert cache.get_bytes("olrc/test.zip") == b"zipdata"
 
-    def test_put_bytes_writes_both(self, tmp_path: Path) -> None:
+    def test_put_uploads_envelope(self, tmp_path: Path) -> None:
         cache, mock_bucket = self._make_cache_with_mock_gcs(tmp_path)
-
         blob = MagicMock()
         mock_bucket.blob.return_value = blob
 
-        cache.put_bytes("data.zip", b"\x01\x02")
+        cache.put_text("key.json", "content")
 
-        assert (tmp_path / "data.zip").read_bytes() == b"\x01\x02"
-        blob.upload_from_string.assert_called_once_with(
-            b"\x01\x02", content_type="application/octet-stream"
-        )
+        uploaded = blob.upload_from_string.call_args.args[0]
+        assert uploaded == cache.local_path("key.json").read_bytes()
+        assert cache.get_text("key.json") == "content"
 
     def test_local_hit_skips_gcs(self, tmp_path: Path) -> None:
         cache, mock_bucket = self._make_cache_with_mock_gcs(tmp_path)
+        cache.local_path("cached.json").write_text("local-content")
 
-        # Pre-populate local
-        local = tmp_path / "cached.json"
-        local.write_text("local-content")
-
-        result = cache.get_text("cached.json")
-
-        assert result == "local-content"
-        # GCS should not be called
+        assert cache.get_text("cached.json") == "local-content"
         mock_bucket.blob.assert_not_called()
 
-    def test_gcs_miss_returns_none(self, tmp_path: Path) -> None:
+    def test_not_found_is_a_miss(self, tmp_path: Path) -> None:
         cache, mock_bucket = self._make_cache_with_mock_gcs(tmp_path)
-
         blob = MagicMock()
-        blob.exists.return_value = False
+        blob.download_as_bytes.side_effect = _NotFound("no such object")
+        blob.delete.side_effect = _NotFound("no such object")
         mock_bucket.blob.return_value = blob
 
         assert cache.get_text("missing.json") is None
+        cache.delete("missing.json")
 
     def test_graceful_gcs_failure_on_get(self, tmp_path: Path) -> None:
         cache, mock_bucket = self._make_cache_with_mock_gcs(tmp_path)
-
         mock_bucket.blob.side_effect = Exception("GCS connection error")
 
-        # Should not raise, just return None
-        result = cache.get_text("failing.json")
-        assert result is None
+        assert cache.get_text("failing.json") is None
 
     def test_graceful_gcs_failure_on_put(self, tmp_path: Path) -> None:
         cache, mock_bucket = self._make_cache_with_mock_gcs(tmp_path)
-
         blob = MagicMock()
         blob.upload_from_string.side_effect = Exception("GCS upload error")
         mock_bucket.blob.return_value = blob
 
         # Should not raise; local write still succeeds
         cache.put_text("key.json", "content")
-        assert (tmp_path / "key.json").read_text() == "content"
+        assert cache.get_text("key.json") == "content"
 
 
 class TestGCSInitFailure:
@@ -181,18 +270,158 @@ class TestGCSInitFailure:
     def test_import_error_falls_back_to_local(self, tmp_path: Path) -> None:
         cache = PipelineCache(local_root=tmp_path, bucket_name="test-bucket")
 
-        with (
-            patch.dict("sys.modules", {"google.cloud.storage": None}),
-            patch(
-                "builtins.__import__",
-                side_effect=ImportError("No module named 'google.cloud.storage'"),
-            ),
-        ):
-            result = cache._init_gcs()
-
-        assert result is False
-        assert cache._gcs_available is False
-
-        # Local caching still works
-        cache.put_text("key.txt", "value")
-        assert cache.get_text("key.txt") == "value"
+        with patch.dict("sys.modules", {"google.cloud.storage": None}):
+            cache.put_text("key.txt", "value")
+            assert cache.get_text("key.txt") == "value"
+            assert cache.get_text("other.txt") is None
+
+        assert isinstance(cache.remote, GCSRemoteStore)
+        assert cache.remote._available is False
+
+
+class TestLocalBudget:
+    """Size-bounded local tier: LRU eviction, pinning and usage stats."""
+
+    def _cache(self, tmp_path: Path, max_bytes: int) -> PipelineCache:
+        # ".gz" keys are stored uncompressed, so sizes are predictable
+        return PipelineCache(local_root=tmp_path, max_local_bytes=max_bytes)
+
+    def _put(self, cache: PipelineCache, key: str) -> None:
+        cache.put_bytes(key, b"x" * 1000)
+
+    def test_least_recently_used_entry_is_evicted(self, tmp_path: Path) -> None:
+        cache = self._cache(tmp_path, max_bytes=3500)
+        for key in ("a.gz", "b.gz", "c.gz"):
+            self._put(cache, key)
+        assert cache.get_bytes("a.gz") is not None
+
+        self._put(cache, "d.gz")
+
+        assert not cache.has_local("b.gz")
+        assert all(cache.has_local(k) for k in ("a.gz", "c.gz", "d.gz"))
+        assert cache.stats.evictions == 1
+        assert cache.local_usage()[1] == 3
+
+    def test_entry_larger_than_budget_is_kept(self, tmp_path: Path) -> None:
+        cache = self._cache(tmp_path, max_bytes=500)
+        self._put(cache, "a.gz")
+        self._put(cache, "b.gz")
+        assert not cache.has_local("a.gz")
+        assert cache.has_local("b.gz")
+
+    def test_pinned_entry_survives(self, tmp_path: Path) -> None:
+        cache = self._cache(tmp_path, max_bytes=2500)
+        self._put(cache, "a.gz")
+        self._put(cache, "b.gz")
+        with cache.pinned("a.gz"):
+            self._put(cache, "c.gz")
+        assert cache.has_local("a.gz")
+        assert not cache.has_local("b.gz")
+
+    def test_registered_directory_is_one_unit(self, tmp_path: Path) -> None:
+        cache = self._cache(tmp_path, max_bytes=2500)
+        extracted = tmp_path / "olrc" / "title17"
+        extracted.mkdir(parents=True)
+        (extracted / "usc17.xml").write_bytes(b"<x/>" * 250)
+        (extracted / "extra.xml").write_bytes(b"<x/>" * 100)
+        cache.register_directory(extracted)
+        self._put(cache, "a.gz")
+
+        with cache.pinned(extracted):
+            self._put(cache, "b.gz")
+        assert extracted.exists()
+        assert not cache.has_local("a.gz")
+
+        self._put(cache, "c.gz")
+        assert not extracted.exists()
+        assert cache.stats.evicted_bytes >= 2000
+
+    def test_initial_scan_orders_by_modification_time(self, tmp_path: Path) -> None:
+        seed = PipelineCache(local_root=tmp_path)
+        for i, key in enumerate(("new.gz", "old.gz")):
+            seed.put_bytes(key, b"x" * 1000)
+            os.utime(seed.local_path(key), (1000 + i * -500, 1000 + i * -500))
+
+        cache = self._cache(tmp_path, max_bytes=2500)
+        self._put(cache, "c.gz")
+        assert cache.has_local("new.gz")
+        assert not cache.has_local("old.gz")
+
+    def test_stats_accumulate_across_processes(self, tmp_path: Path) -> None:
+        remote = LocalDirRemoteStore(tmp_path / "remote")
+        PipelineCache(local_root=tmp_path / "w", remote=remote).put_text("r.json", "r")
+        cache = PipelineCache(local_root=tmp_path / "c", remote=remote)
+        cache.put_text("k.json", "v")
+        cache.get_text("k.json")
+        cache.get_text("r.json")
+        cache.get_text("missing.json")
+        assert cache.stats.hit_rate == pytest.approx(2 / 3)
+
+        assert cache.save_stats().hits == 1
+        cache.get_text("k.json")
+        totals = cache.save_stats()
+        assert (totals.hits, totals.remote_hits, totals.misses) == (2, 1, 1)
+
+        other = PipelineCache(local_root=tmp_path / "c")
+        other.get_text("missing.json")
+        assert other.save_stats().misses == 2
+
+        other.reset_stats()
+        assert other.saved_stats() == CacheStats()
+
+    def test_unbounded_cache_never_evicts(self, tmp_cache: PipelineCache) -> None:
+        for i in range(5):
+            tmp_cache.put_bytes(f"{i}.gz", b"x" * 1000)
+        used, units = tmp_cache.local_usage()
+        assert units == 5 and used > 5000
+        assert tmp_cache.stats.evictions == 0
+
+
+class TestFileEntries:
+    """put_file/local_file keep large archives out of memory."""
+
+    def _archive(self, tmp_path: Path) -> Path:
+        source = tmp_path / "download.part"
+        with zipfile.ZipFile(source, "w") as zf:
+            zf.writestr("usc17.xml", "<usc/>" * 1000)
+        return source
+
+    def test_zip_entry_is_readable_in_place(self, tmp_cache: PipelineCache) -> None:
+        source = self._archive(tmp_cache.local_root)
+        content = source.read_bytes()
+        tmp_cache.put_file("olrc/t17.zip", source)
+
+        assert not source.exists()
+        path = tmp_cache.local_file("olrc/t17.zip")
+        assert path == tmp_cache.local_path("olrc/t17.zip")
+        with zipfile.ZipFile(path) as zf:
+            assert zf.read("usc17.xml") == b"<usc/>" * 1000
+        assert tmp_cache.get_bytes("olrc/t17.zip") == content
+
+    def test_remote_backfill_and_corruption(self, tmp_path: Path) -> None:
+        remote = LocalDirRemoteStore(tmp_path / "remote")
+        writer = PipelineCache(local_root=tmp_path / "a", remote=remote)
+        writer.put_file("olrc/t17.zip", self._archive(tmp_path))
+
+        reader = PipelineCache(local_root=tmp_path / "b", remote=remote)
+        path = reader.local_file("olrc/t17.zip")
+        assert path is not None and zipfile.is_zipfile(path)
+        assert reader.stats.remote_hits == 1
+
+        entry = bytearray(path.read_bytes())
+        entry[-1] ^= 0xFF
+        path.write_bytes(bytes(entry))
+        assert reader.local_file("olrc/t17.zip") == path  # re-read from remote
+        assert zipfile.is_zipfile(path)
+
+        (tmp_path / "remote" / "olrc" / "t17.zip").write_bytes(bytes(entry))
+        path.unlink()
+        assert reader.local_file("olrc/t17.zip") is None
+        assert not list((tmp_path / "b" / "olrc").iterdir())
+
+    def test_text_keys_are_encoded(self, tmp_cache: PipelineCache) -> None:
+        source = tmp_cache.local_root / "page.tmp"
+        source.write_text("<html>" * 500)
+        tmp_cache.put_file("pages/index.html", source)
+        assert tmp_cache.get_text("pages/index.html") == "<html>" * 500
+        assert tmp_cache.local_file("missing.zip") is None
@@ -1,8 +1,11 @@
 """Tests for Congress.gov API client."""
 
+import asyncio
 from datetime import UTC, date, datetime
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from pipeline.congress.client import (
@@ -16,6 +19,7 @@ from pipeline.congress.client import (
     MemberInfo,
     MemberTerm,
     MemberVoteInfo,
+    RateLimiter,
     RelatedBill,
     SponsorInfo,
     _parse_cr_refs,
@@ -276,6 +280,45 @@ class TestCongressClient:
         assert client.max_retries == 3
         assert client.retry_delay == 2.0
 
+    def test_clients_share_rate_limiter_by_default(self) -> None:
+        """Clients draw from one per-process bucket unless given their own."""
+        own = RateLimiter(rate=1.0)
+        assert (
+            CongressClient(api_key="a").rate_limiter
+            is CongressClient(api_key="b").rate_limiter
+        )
+        assert CongressClient(api_key="c", rate_limiter=own).rate_limiter is own
+
+
+class TestRateLimiter:
+    """Tests for the token bucket in front of every request."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_waits_for_refill(self) -> None:
+        limiter = RateLimiter(rate=10.0, burst=2)
+        with (
+            patch("pipeline.congress.client.time.monotonic", return_value=100.0),
+            patch("pipeline.congress.client.asyncio.sleep", new=AsyncMock()) as sleep,
+        ):
+            limiter._updated = 100.0
+            for _ in range(4):
+                await limiter.acquire()
+
+        # Two tokens from the burst, then each reservation is 0.1s later
+        assert [c.args[0] for c in sleep.await_args_list] == pytest.approx([0.1, 0.2])
+
+    @pytest.mark.asyncio
+    async def test_request_waits_on_limiter(self) -> None:
+        limiter = RateLimiter(rate=1.0)
+        client = CongressClient(api_key="test-key", rate_limiter=limiter)
+        http = MagicMock()
+        http.request = AsyncMock(return_value=MagicMock())
+
+        with patch.object(limiter, "acquire", new=AsyncMock()) as acquire:
+            await client._request_with_retry(http, "GET", "https://example.test")
+
+        acquire.assert_awaited_once()
+
 
 class TestHouseVoteInfo:
     """Tests for HouseVoteInfo dataclass."""
@@ -955,3 +998,101 @@ class TestCongressClientPhase2:
             related = await client.get_related_bills(99, "hr", 9999)
 
         assert related == []
+
+
+_REAL_ASYNC_CLIENT = httpx.AsyncClient
+
+
+def _mock_api(handler: Any) -> Any:
+    """Route every Congress.gov request to ``handler``."""
+    return patch.object(
+        httpx,
+        "AsyncClient",
+        lambda **kw: _REAL_ASYNC_CLIENT(transport=httpx.MockTransport(handler), **kw),
+    )
+
+
+def _unlimited_client() -> CongressClient:
+    return CongressClient(
+        api_key="test-key", rate_limiter=RateLimiter(rate=1e6, burst=1000)
+    )
+
+
+class TestPaginate:
+    """Offset pagination fans out after the first page."""
+
+    @pytest.mark.asyncio
+    async def test_pages_are_fetched_concurrently_in_order(self) -> None:
+        offsets: list[int] = []
+        in_flight = peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            offset = int(request.url.params["offset"])
+            offsets.append(offset)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            actions = [
+                {"actionDate": "2013-01-03", "text": f"Action {n}"}
+                for n in range(offset, min(offset + 2, 23))
+            ]
+            return httpx.Response(
+                200, json={"actions": actions, "pagination": {"count": 23}}
+            )
+
+        client = _unlimited_client()
+        client.page_concurrency = 3
+        with _mock_api(handler):
+            actions = await client.get_bill_actions(113, "hr", 1, page_size=2)
+
+        assert [a.text for a in actions] == [f"Action {n}" for n in range(23)]
+        assert offsets[0] == 0
+        assert sorted(offsets) == list(range(0, 23, 2))
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_limit_stops_fetching_early(self) -> None:
+        offsets: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            offset = int(request.url.params["offset"])
+            offsets.append(offset)
+            votes = [
+                {"congress": 118, "sessionNumber": 1, "rollCallNumber": n}
+                for n in range(offset + 1, offset + 11)
+            ]
+            return httpx.Response(
+                200,
+                json={"houseRollCallVotes": votes, "pagination": {"count": 1000}},
+            )
+
+        with _mock_api(handler):
+            votes = await _unlimited_client().get_house_votes(
+                118, page_size=10, limit=25
+            )
+
+        assert [v.roll_number for v in votes] == list(range(1, 26))
+        assert sorted(offsets) == [0, 10, 20]
+
+    @pytest.mark.asyncio
+    async def test_missing_listing_is_empty(self) -> None:
+        with _mock_api(lambda _: httpx.Response(404)):
+            assert await _unlimited_client().get_related_bills(113, "hr", 1) == []
+
+    @pytest.mark.asyncio
+    async def test_failed_page_raises(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params["offset"] == "4":
+                return httpx.Response(400)
+            return httpx.Response(
+                200,
+                json={
+                    "actions": [{"text": "x"}, {"text": "y"}],
+                    "pagination": {"count": 10},
+                },
+            )
+
+        with _mock_api(handler), pytest.raises(httpx.HTTPStatusError):
+            await _unlimited_client().get_bill_actions(113, "hr", 1, page_size=2)
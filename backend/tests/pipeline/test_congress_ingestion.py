@@ -0,0 +1,252 @@
+"""Tests for concurrent legislator and vote ingestion with bulk upserts."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models import IndividualVote, Legislator, LegislatorTerm, Vote
+from app.models.enums import VoteType
+from pipeline.congress.client import (
+    HouseVoteDetail,
+    HouseVoteInfo,
+    MemberDetail,
+    MemberInfo,
+    MemberVoteInfo,
+)
+from pipeline.congress.ingestion import LegislatorIngestionService
+from pipeline.congress.vote_ingestion import VoteIngestionService
+
+
+@pytest_asyncio.fixture
+async def session() -> AsyncIterator[AsyncSession]:
+    from app.models.base import Base
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with maker() as session:
+        yield session
+    await engine.dispose()
+
+
+def _member(bioguide_id: str, last_name: str = "Smith", terms: int = 1) -> MemberDetail:
+    return MemberDetail.from_api_response(
+        {
+            "bioguideId": bioguide_id,
+            "firstName": "Pat",
+            "lastName": last_name,
+            "directOrderName": f"Pat {last_name}",
+            "invertedOrderName": f"{last_name}, Pat",
+            "partyName": "Independent",
+            "currentMember": True,
+            "terms": [
+                {
+                    "chamber": "House of Representatives",
+                    "congress": 117 + n,
+                    "stateCode": "OH",
+                    "district": 3,
+                    "startYear": 2021 + 2 * n,
+                }
+                for n in range(terms)
+            ],
+        }
+    )
+
+
+class _FakeMemberAPI:
+    """Stands in for the member endpoints, tracking concurrent requests."""
+
+    def __init__(self, details: dict[str, MemberDetail]):
+        self.details = details
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls: list[str] = []
+
+    async def get_member_detail(self, bioguide_id: str) -> MemberDetail:
+        self.calls.append(bioguide_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.005)
+            if bioguide_id not in self.details:
+                raise RuntimeError(f"404 for {bioguide_id}")
+            return self.details[bioguide_id]
+        finally:
+            self.in_flight -= 1
+
+    async def get_members_by_congress(self, *_: Any, **__: Any) -> list[Any]:
+        return [
+            MemberInfo(
+                bioguide_id=b, name=b, state=None, district=None, party_name=None
+            )
+            for b in [*self.details, "MISSING1"]
+        ]
+
+
+def _legislator_service(
+    session: AsyncSession, api: _FakeMemberAPI, concurrency: int = 8
+) -> LegislatorIngestionService:
+    service = LegislatorIngestionService(
+        session, api_key="test-key", concurrency=concurrency
+    )
+    service.client.get_member_detail = api.get_member_detail  # type: ignore[method-assign]
+    service.client.get_members_by_congress = api.get_members_by_congress  # type: ignore[method-assign]
+    return service
+
+
+class TestLegislatorIngestion:
+    @pytest.mark.asyncio
+    async def test_creates_then_skips_without_fetching(
+        self, session: AsyncSession
+    ) -> None:
+        api = _FakeMemberAPI({f"M{n:06d}": _member(f"M{n:06d}") for n in range(5)})
+        service = _legislator_service(session, api)
+
+        log = await service.ingest_congress(118)
+        assert log.status == "completed"
+        assert (log.records_created, log.records_updated) == (5, 0)
+        assert await session.scalar(select(func.count()).select_from(Legislator)) == 5
+        assert (
+            await session.scalar(select(func.count()).select_from(LegislatorTerm)) == 5
+        )
+
+        api.calls.clear()
+        log = await service.ingest_congress(118)
+        assert (log.records_created, log.records_updated) == (0, 0)
+        assert log.details == "Congress 118: 0 created, 0 updated, 5 skipped"
+        # Only the member that failed before is fetched again
+        assert api.calls == ["MISSING1"]
+
+    @pytest.mark.asyncio
+    async def test_force_updates_rows_and_replaces_terms(
+        self, session: AsyncSession
+    ) -> None:
+        api = _FakeMemberAPI({"M000001": _member("M000001", terms=1)})
+        service = _legislator_service(session, api)
+        await service.ingest_congress(118)
+        legislator_id = await session.scalar(select(Legislator.legislator_id))
+
+        api.details["M000001"] = _member("M000001", last_name="Jones", terms=3)
+        log = await service.ingest_congress(118, force=True)
+
+        assert (log.records_created, log.records_updated) == (0, 1)
+        legislator = (await session.execute(select(Legislator))).scalar_one()
+        await session.refresh(legislator)
+        assert legislator.legislator_id == legislator_id
+        assert legislator.full_name == "Pat Jones"
+        terms = (await session.execute(select(LegislatorTerm.congress))).scalars()
+        assert sorted(terms) == [117, 118, 119]
+
+    @pytest.mark.asyncio
+    async def test_fetches_are_concurrent_and_bounded(
+        self, session: AsyncSession
+    ) -> None:
+        api = _FakeMemberAPI({f"M{n:06d}": _member(f"M{n:06d}") for n in range(12)})
+        service = _legislator_service(session, api, concurrency=3)
+
+        await service.ingest_congress(118)
+
+        assert api.max_in_flight == 3
+
+
+def _roll_call(roll: int, yeas: int = 2) -> HouseVoteDetail:
+    return HouseVoteDetail(
+        congress=118,
+        session=1,
+        roll_number=roll,
+        vote_date="2023-03-15",
+        question="On Passage",
+        description=None,
+        result="Passed",
+        yea_total=yeas,
+        nay_total=1,
+        present_total=0,
+        not_voting_total=0,
+    )
+
+
+def _member_votes(cast: str = "Yea") -> list[MemberVoteInfo]:
+    return [
+        MemberVoteInfo("M000001", "Smith, Pat", "I", "OH", cast),
+        MemberVoteInfo("M000002", "Smith, Pat", "I", "OH", "Nay"),
+        MemberVoteInfo("X999999", "Unknown, Member", "R", "TX", "Yea"),
+    ]
+
+
+def _vote_service(session: AsyncSession, rolls: list[int]) -> VoteIngestionService:
+    service = VoteIngestionService(session, api_key="test-key")
+    service.client.get_house_votes = AsyncMock(  # type: ignore[method-assign]
+        return_value=[
+            HouseVoteInfo(118, 1, roll, "2023-03-15", "On Passage", "Passed")
+            for roll in rolls
+        ]
+    )
+    service.client.get_house_vote_detail = AsyncMock(  # type: ignore[method-assign]
+        side_effect=lambda *args: _roll_call(args[2])
+    )
+    service.client.get_house_vote_members = AsyncMock(  # type: ignore[method-assign]
+        return_value=_member_votes()
+    )
+    return service
+
+
+class TestVoteIngestion:
+    @pytest_asyncio.fixture(autouse=True)
+    async def legislators(self, session: AsyncSession) -> None:
+        service = _legislator_service(
+            session, _FakeMemberAPI({b: _member(b) for b in ("M000001", "M000002")})
+        )
+        await service.ingest_congress(118)
+
+    @pytest.mark.asyncio
+    async def test_bulk_upserts_votes_and_individual_votes(
+        self, session: AsyncSession
+    ) -> None:
+        service = _vote_service(session, [1, 2, 3])
+
+        log = await service.ingest_house_votes_for_congress(118)
+
+        assert log.status == "completed"
+        assert (log.records_created, log.records_updated) == (3, 0)
+        assert await session.scalar(select(func.count()).select_from(Vote)) == 3
+        # The member with no legislator row is left out
+        assert (
+            await session.scalar(select(func.count()).select_from(IndividualVote)) == 6
+        )
+
+    @pytest.mark.asyncio
+    async def test_existing_votes_are_skipped_without_fetching(
+        self, session: AsyncSession
+    ) -> None:
+        await _vote_service(session, [1, 2]).ingest_house_votes_for_congress(118)
+        service = _vote_service(session, [1, 2, 3])
+
+        log = await service.ingest_house_votes_for_congress(118)
+
+        assert log.details == "Congress 118: 1 created, 0 updated, 2 skipped"
+        service.client.get_house_vote_detail.assert_awaited_once_with(118, 1, 3)
+
+    @pytest.mark.asyncio
+    async def test_force_updates_in_place(self, session: AsyncSession) -> None:
+        await _vote_service(session, [1]).ingest_house_votes_for_congress(118)
+        vote_id = await session.scalar(select(Vote.vote_id))
+
+        service = _vote_service(session, [1])
+        service.client.get_house_vote_detail.side_effect = None
+        service.client.get_house_vote_detail.return_value = _roll_call(1, yeas=1)
+        service.client.get_house_vote_members.return_value = _member_votes("Nay")
+        log = await service.ingest_house_vote(118, 1, 1, force=True)
+
+        assert (log.records_created, log.records_updated) == (0, 1)
+        vote = (await session.execute(select(Vote))).scalar_one()
+        await session.refresh(vote)
+        assert (vote.vote_id, vote.yeas) == (vote_id, 1)
+        casts = (await session.execute(select(IndividualVote.vote_cast))).scalars()
+        assert list(casts) == [VoteType.NAY, VoteType.NAY]
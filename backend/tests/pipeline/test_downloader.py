@@ -1,11 +1,22 @@
 """Tests for OLRC downloader."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import io
+import threading
+import time
+import zipfile
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
+from pipeline.cache import PipelineCache
 from pipeline.olrc.downloader import OLRCDownloader
+from pipeline.olrc.parser import USLMParser
 
 
 class TestOLRCDownloader:
@@ -81,6 +92,41 @@ class TestOLRCDownloader:
         assert path is None
 
 
+def _title_zip() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("usc54.xml", _TITLE_XML)
+    return buffer.getvalue()
+
+
+_TITLE_XML = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<usc xmlns="http://xml.house.gov/schemas/uslm/1.0"><main>'
+    '<title identifier="/us/usc/t54" number="54"><heading>NATIONAL PARK SERVICE'
+    '</heading><chapter identifier="/us/usc/t54/ch1001" number="1001">'
+    "<heading>GENERAL PROVISIONS</heading>"
+    '<section identifier="/us/usc/t54/s100101" number="100101">'
+    "<heading>Purpose</heading><content><p>Text.</p></content></section>"
+    "</chapter></title></main></usc>"
+)
+
+
+def _serve(body: bytes) -> tuple[list[httpx.Request], Any]:
+    """Patch httpx.AsyncClient to answer every request with ``body``."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=body)
+
+    real_client = httpx.AsyncClient
+    return requests, patch.object(
+        httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+
+
 class TestDownloadTitleAtReleasePoint:
     """Tests for download_title_at_release_point's response validation."""
 
@@ -89,27 +135,240 @@ class TestDownloadTitleAtReleasePoint:
         """If the OLRC returns HTML (e.g., title not yet codified at this RP),
         treat it as 'not available' and skip — don't cache the bad bytes,
         otherwise every retry hits the cache and fails the same way."""
-        cache = MagicMock()
-        cache.get_bytes.return_value = None
-        cache.put_bytes = MagicMock()
-
-        downloader = OLRCDownloader(download_dir=tmp_path, cache=cache)
+        cache = PipelineCache(local_root=tmp_path)
+        downloader = OLRCDownloader(download_dir=tmp_path / "olrc", cache=cache)
 
         html_body = b"<!DOCTYPE html><html><body>Not Found</body></html>"
-
-        mock_response = MagicMock()
-        mock_response.content = html_body
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        with patch.object(httpx, "AsyncClient", return_value=mock_client):
+        _requests, serve = _serve(html_body)
+        with serve:
             result = await downloader.download_title_at_release_point(54, "113-21")
 
         assert result is None
         # Critical: HTML body must NOT be cached, otherwise subsequent runs
         # read the bogus bytes from GCS and fail the same way every time.
-        cache.put_bytes.assert_not_called()
+        assert not cache.has_local("olrc/downloads/title54@113-21.zip")
+        assert not [p for p in (tmp_path / "olrc").rglob("*") if p.is_file()]
+
+    @pytest.mark.asyncio
+    async def test_zip_mode_parses_cached_archive(self, tmp_path) -> None:
+        cache = PipelineCache(local_root=tmp_path)
+        downloader = OLRCDownloader(
+            download_dir=tmp_path / "olrc", cache=cache, extract=False
+        )
+        requests, serve = _serve(_title_zip())
+        with serve:
+            path = await downloader.download_title_at_release_point(54, "113-287")
+            again = await downloader.download_title_at_release_point(54, "113-287")
+
+        assert path == again == cache.local_path("olrc/downloads/title54@113-287.zip")
+        assert len(requests) == 1
+        assert not (tmp_path / "olrc" / "releases" / "113-287" / "title54").exists()
+        with downloader.pinned(path):
+            result = USLMParser().parse_file(path)
+        assert [s.section_number for s in result.sections] == ["100101"]
+
+    @pytest.mark.asyncio
+    async def test_extract_mode_without_cache(self, tmp_path) -> None:
+        downloader = OLRCDownloader(download_dir=tmp_path)
+        _requests, serve = _serve(_title_zip())
+        with serve:
+            path = await downloader.download_title_at_release_point(54, "113-287")
+
+        assert path == tmp_path / "releases" / "113-287" / "title54" / "usc54.xml"
+        assert path.read_text() == _TITLE_XML
+        assert [p.name for p in path.parent.parent.iterdir()] == ["title54"]
+
+
+class _TitleServer(ThreadingHTTPServer):
+    """Local OLRC stand-in that can drop connections mid-body."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _TitleHandler)
+        self.payload = _title_zip() * 20
+        self.etag = '"v1"'
+        self.ranges = True
+        self.drops = 0  # responses cut off after half their body
+        self.drop_at: int | None = None  # cut off after this many bytes instead
+        self.delay = 0.0
+        self.next_version: tuple[bytes, str] | None = None  # after a drop
+        self.requests: list[dict[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/title.zip"
+
+
+class _TitleHandler(BaseHTTPRequestHandler):
+    server: _TitleServer
+
+    def do_GET(self) -> None:
+        server = self.server
+        with server.lock:
+            server.requests.append(dict(self.headers))
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            start = 0
+            requested = self.headers.get("Range")
+            if server.ranges and requested and self.headers["If-Range"] == server.etag:
+                start = int(requested.removeprefix("bytes=").rstrip("-"))
+            body = server.payload[start:]
+
+            self.send_response(206 if start else 200)
+            self.send_header("Content-Length", str(len(body)))
+            if server.ranges:
+                self.send_header("Accept-Ranges", "bytes")
+                self.send_header("ETag", server.etag)
+            if start:
+                self.send_header(
+                    "Content-Range",
+                    f"bytes {start}-{len(server.payload) - 1}/{len(server.payload)}",
+                )
+            self.end_headers()
+
+            if server.drop_at is not None:
+                self.wfile.write(body[: server.drop_at])
+                self.close_connection = True
+            elif server.drops:
+                server.drops -= 1
+                self.wfile.write(body[: len(body) // 2])
+                self.close_connection = True
+                if server.next_version:
+                    server.payload, server.etag = server.next_version
+                    server.next_version = None
+            else:
+                self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class TestStreamedDownload:
+    """Streamed downloads against a local server that drops connections."""
+
+    @pytest.fixture
+    def server(self) -> Iterator[_TitleServer]:
+        server = _TitleServer()
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture(autouse=True)
+    def _no_backoff(self) -> Iterator[None]:
+        with patch("pipeline.olrc.downloader.asyncio.sleep", new_callable=AsyncMock):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_dropped_connection_resumes_with_range(
+        self, server: _TitleServer, tmp_path: Path
+    ) -> None:
+        server.drops = 2
+        dest = tmp_path / "title.zip"
+
+        assert await OLRCDownloader(tmp_path)._stream_to_file(server.url, dest, "T")
+
+        assert dest.read_bytes() == server.payload
+        half = len(server.payload) // 2
+        assert [r.get("Range") for r in server.requests] == [
+            None,
+            f"bytes={half}-",
+            f"bytes={half + (len(server.payload) - half) // 2}-",
+        ]
+        assert server.requests[1]["If-Range"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_restarts_without_range_support(
+        self, server: _TitleServer, tmp_path: Path
+    ) -> None:
+        server.ranges = False
+        server.drops = 1
+        dest = tmp_path / "title.zip"
+
+        assert await OLRCDownloader(tmp_path)._stream_to_file(server.url, dest, "T")
+
+        assert dest.read_bytes() == server.payload
+        assert [r.get("Range") for r in server.requests] == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_changed_file_is_downloaded_again(
+        self, server: _TitleServer, tmp_path: Path
+    ) -> None:
+        server.drops = 1
+        server.next_version = (server.payload[::-1], '"v2"')
+        dest = tmp_path / "title.zip"
+
+        assert await OLRCDownloader(tmp_path)._stream_to_file(server.url, dest, "T")
+
+        # If-Range no longer matches, so the server sends the new file whole
+        assert server.requests[1]["If-Range"] == '"v1"'
+        assert server.etag == '"v2"'
+        assert dest.read_bytes() == server.payload
+
+    @pytest.mark.asyncio
+    async def test_gives_up_without_progress(
+        self, server: _TitleServer, tmp_path: Path
+    ) -> None:
+        server.drop_at = 0
+        dest = tmp_path / "title.zip"
+
+        assert not await OLRCDownloader(tmp_path)._stream_to_file(server.url, dest, "T")
+        assert len(server.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_when_restarts_keep_dropping(
+        self, server: _TitleServer, tmp_path: Path
+    ) -> None:
+        # Each restart receives bytes, but without ranges none is a resume
+        server.ranges = False
+        server.drops = 100
+        dest = tmp_path / "title.zip"
+
+        assert not await OLRCDownloader(tmp_path)._stream_to_file(server.url, dest, "T")
+        assert len(server.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_downloads_capped_per_host(
+        self, server: _TitleServer, tmp_path: Path
+    ) -> None:
+        server.delay = 0.05
+        downloader = OLRCDownloader(tmp_path, max_connections_per_host=2)
+
+        results = await asyncio.gather(
+            *(
+                downloader._stream_to_file(server.url, tmp_path / f"{i}.zip", "T")
+                for i in range(5)
+            )
+        )
+
+        assert all(results)
+        assert server.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_release_point_download_survives_drop(
+        self, server: _TitleServer, tmp_path: Path
+    ) -> None:
+        server.payload = _title_zip()
+        server.drops = 1
+        cache = PipelineCache(local_root=tmp_path)
+        downloader = OLRCDownloader(tmp_path / "olrc", cache=cache, extract=False)
+
+        with patch(
+            "pipeline.olrc.downloader.TITLE_XML_URL_PATTERN",
+            server.url + "?title={title_number}&rp={congress}-{public_law}",
+        ):
+            path = await downloader.download_title_at_release_point(54, "113-287")
+
+        assert path is not None
+        assert cache.get_bytes("olrc/downloads/title54@113-287.zip") == server.payload
+        assert len(server.requests) == 2
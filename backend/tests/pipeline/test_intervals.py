@@ -0,0 +1,182 @@
+"""Tests for sorted-interval helpers and their use in the legal parser.
+
+The sweep-based implementations must reproduce the previous quadratic
+deduplication and per-call span merging exactly, so randomized spans are
+checked against reference copies of those implementations.
+"""
+
+import random
+
+import pytest
+
+from app.models.enums import ChangeType
+from pipeline.legal_parser.amendment_parser import AmendmentParser, ParsedAmendment
+from pipeline.legal_parser.intervals import SweepOverlapIndex, merge_intervals
+from pipeline.legal_parser.patterns import PatternType
+from pipeline.legal_parser.text_accounting import TextAccountant
+
+
+def _amendment(start: int, end: int, confidence: float, n: int) -> ParsedAmendment:
+    return ParsedAmendment(
+        pattern_name=f"p{n}",
+        pattern_type=PatternType.STRIKE,
+        change_type=ChangeType.MODIFY,
+        section_ref=None,
+        confidence=confidence,
+        start_pos=start,
+        end_pos=end,
+    )
+
+
+def _random_amendments(rng: random.Random, text_length: int) -> list[ParsedAmendment]:
+    amendments = []
+    for n in range(rng.randint(0, 300)):
+        start = rng.randrange(text_length)
+        # Mostly short matches, some long ones spanning many others
+        length = rng.choice([rng.randint(1, 40), rng.randint(1, 400)])
+        confidence = rng.choice([0.8, 0.85, 0.9, 0.95, 0.98])
+        amendments.append(
+            _amendment(start, min(text_length, start + length), confidence, n)
+        )
+    return amendments
+
+
+def _reference_deduplicate(amendments: list[ParsedAmendment]) -> list[ParsedAmendment]:
+    """The original pairwise implementation of AmendmentParser._deduplicate."""
+    if len(amendments) <= 1:
+        return amendments
+    result: list[ParsedAmendment] = []
+    for amendment in amendments:
+        overlaps = False
+        for i, existing in enumerate(result):
+            if not (
+                amendment.end_pos <= existing.start_pos
+                or existing.end_pos <= amendment.start_pos
+            ):
+                overlaps = True
+                if amendment.confidence > existing.confidence:
+                    result[i] = amendment
+                break
+        if not overlaps:
+            result.append(amendment)
+    return result
+
+
+def _reference_merge(spans: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    merged = [spans[0]] if spans else []
+    for start, end in spans[1:]:
+        if start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class TestMergeIntervals:
+    def test_merges_overlapping_and_touching(self) -> None:
+        assert merge_intervals([(0, 5), (3, 8), (8, 10), (12, 15)]) == [
+            (0, 10),
+            (12, 15),
+        ]
+
+    def test_empty(self) -> None:
+        assert merge_intervals([]) == []
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_reference(self, seed: int) -> None:
+        rng = random.Random(seed)
+        spans = sorted(
+            (s, s + rng.randint(1, 50))
+            for s in (rng.randrange(1000) for _ in range(rng.randint(1, 200)))
+        )
+        assert merge_intervals(spans) == _reference_merge(spans)
+
+
+class TestSweepOverlapIndex:
+    def test_first_overlapping_is_lowest_live_slot(self) -> None:
+        index = SweepOverlapIndex()
+        index.add(0, 10)
+        index.add(5, 20)
+        assert index.first_overlapping(6, 8) == 0
+        # Slot 0 ends at 10, so it is retired once queries start there
+        assert index.first_overlapping(10, 12) == 1
+        assert index.first_overlapping(25, 30) is None
+
+    def test_replace_extends_slot(self) -> None:
+        index = SweepOverlapIndex()
+        index.add(0, 10)
+        index.replace(0, 5, 30)
+        assert index.first_overlapping(20, 25) == 0
+
+
+class TestDeduplicateEquivalence:
+    @pytest.mark.parametrize("seed", range(50))
+    def test_sorted_input_matches_reference(self, seed: int) -> None:
+        rng = random.Random(seed)
+        amendments = sorted(_random_amendments(rng, 5000), key=lambda a: a.start_pos)
+        parser = AmendmentParser()
+        assert parser._deduplicate(list(amendments)) == _reference_deduplicate(
+            list(amendments)
+        )
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_unsorted_input_matches_reference(self, seed: int) -> None:
+        rng = random.Random(seed)
+        amendments = _random_amendments(rng, 5000)
+        parser = AmendmentParser()
+        assert parser._deduplicate(list(amendments)) == _reference_deduplicate(
+            list(amendments)
+        )
+
+    def test_empty_spans_match_reference(self) -> None:
+        amendments = [
+            _amendment(0, 10, 0.8, 0),
+            _amendment(5, 5, 0.9, 1),
+            _amendment(5, 12, 0.95, 2),
+            _amendment(10, 10, 0.99, 3),
+        ]
+        parser = AmendmentParser()
+        assert parser._deduplicate(list(amendments)) == _reference_deduplicate(
+            list(amendments)
+        )
+
+
+class TestTextAccountantEquivalence:
+    @pytest.mark.parametrize("seed", range(30))
+    def test_coverage_matches_reference(self, seed: int) -> None:
+        rng = random.Random(seed)
+        words = ["amended", "the", "Secretary", "shall", "report", "  ", "\n"]
+        text = " ".join(rng.choice(words) for _ in range(800))
+        accountant = TextAccountant(text)
+        spans = []
+        for n in range(rng.randint(0, 120)):
+            start = rng.randrange(len(text) - 1)
+            end = min(len(text), start + rng.randint(1, 200))
+            accountant.claim_span(start, end, n, "p")
+            spans.append((start, end))
+
+        merged = _reference_merge(sorted(spans, key=lambda s: s[0]))
+        expected_gaps = []
+        current = 0
+        for start, end in merged:
+            if start > current and len(text[current:start].strip()) >= 10:
+                expected_gaps.append((current, start))
+            current = max(current, end)
+        if current < len(text) and len(text[current:].strip()) >= 10:
+            expected_gaps.append((current, len(text)))
+        if not spans:
+            expected_gaps = [(0, len(text))]
+
+        report = accountant.generate_coverage_report()
+        assert report.claimed_length == sum(e - s for s, e in merged)
+        assert [(u.start_pos, u.end_pos) for u in report.unclaimed_spans] == (
+            expected_gaps
+        )
+
+    def test_claiming_after_report_updates_coverage(self) -> None:
+        text = "x" * 100
+        accountant = TextAccountant(text)
+        accountant.claim_span(0, 10, 1, "p")
+        assert accountant.generate_coverage_report().claimed_length == 10
+        accountant.claim_span(50, 60, 2, "p")
+        assert accountant.generate_coverage_report().claimed_length == 20
@@ -1,9 +1,18 @@
 """Tests for law change service orchestrator."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.models.public_law import LawChange, PublicLaw
+from pipeline.legal_parser import parse_cache
+from pipeline.legal_parser.diff_generator import DiffGenerator
 from pipeline.legal_parser.law_change_service import LawChangeResult, LawChangeService
 
 
@@ -60,3 +69,193 @@ class TestLawChangeService:
         assert result.amendments == []
         assert result.changes == []
         assert result.errors == []
+
+
+_LAW_TEXTS = {
+    1: (
+        "Section 512 of title 17, United States Code, is amended by striking "
+        '"120 days" and inserting "180 days".'
+    ),
+    2: (
+        "Section 106 of title 17, United States Code, is amended by striking "
+        '"copies" and inserting "copies or phonorecords".'
+    ),
+    3: (
+        "Section 108 of title 17, United States Code, is amended by striking "
+        '"archives" and inserting "archives or museums".'
+    ),
+    4: None,
+}
+
+
+@pytest_asyncio.fixture
+async def session_maker() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    from app.models.base import Base
+    from app.models.public_law import PublicLaw
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with maker() as session:
+        session.add_all(
+            PublicLaw(
+                law_id=100 + n,
+                congress=118,
+                law_number=str(n),
+                enacted_date=date(2024, 1, n),
+            )
+            for n in _LAW_TEXTS
+        )
+        await session.commit()
+    yield maker
+    await engine.dispose()
+
+
+def _govinfo() -> MagicMock:
+    client = MagicMock()
+    client.get_law_text = AsyncMock(
+        side_effect=lambda _congress, law_number: _LAW_TEXTS[law_number]
+    )
+    return client
+
+
+async def _stored_changes(
+    maker: async_sessionmaker[AsyncSession],
+) -> list[tuple[int, int, str, str | None, str | None]]:
+    from app.models.public_law import LawChange
+
+    async with maker() as session:
+        rows = await session.execute(
+            select(
+                LawChange.law_id,
+                LawChange.title_number,
+                LawChange.section_number,
+                LawChange.old_text,
+                LawChange.new_text,
+            ).order_by(LawChange.law_id, LawChange.change_id)
+        )
+        return [tuple(row) for row in rows.all()]
+
+
+class TestProcessCongress:
+    """Batch mode persists the same changes as per-law processing."""
+
+    @pytest.mark.asyncio
+    async def test_matches_process_law(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ) -> None:
+        async with session_maker() as session:
+            service = LawChangeService(session, govinfo_client=_govinfo())
+            batch = await service.process_congress(118, workers=0, commit_every=2)
+        batched = await _stored_changes(session_maker)
+
+        assert [r.law.law_number for r in batch.results] == ["1", "2", "3", "4"]
+        assert [bool(r.errors) for r in batch.results] == [False, False, False, True]
+        assert "Could not retrieve text for PL 118-4" in batch.results[3].errors[0]
+        assert batch.changes_created == len(batched) == 3
+        assert [c.law_id for c in batch.results[0].changes] == [101]
+
+        async with session_maker() as session:
+            await session.execute(delete(LawChange))
+            await session.commit()
+            service = LawChangeService(session, govinfo_client=_govinfo())
+            for n in (1, 2, 3):
+                await service.process_law(congress=118, law_number=n)
+        assert await _stored_changes(session_maker) == batched
+
+    @pytest.mark.asyncio
+    async def test_skips_processed_laws_in_one_query(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ) -> None:
+        async with session_maker() as session:
+            service = LawChangeService(session, govinfo_client=_govinfo())
+            await service.process_congress(118, law_numbers=[1], workers=0)
+
+        client = _govinfo()
+        async with session_maker() as session:
+            service = LawChangeService(session, govinfo_client=client)
+            batch = await service.process_congress(
+                118, law_numbers=[1, 2, 99], workers=0
+            )
+
+        assert batch.skipped == ["PL 118-1"]
+        assert [r.law.law_number for r in batch.results] == ["99", "2"]
+        assert "not in database" in batch.results[0].errors[0]
+        client.get_law_text.assert_awaited_once_with(118, 2)
+        assert len(await _stored_changes(session_maker)) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_law_does_not_block_its_chunk(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ) -> None:
+        original = DiffGenerator.law_change_rows
+
+        def _rows(diffs: list, law: PublicLaw) -> list[dict]:
+            rows = original(diffs, law)
+            if law.law_number == "2":
+                rows[0]["section_number"] = None  # violates NOT NULL
+            return rows
+
+        async with session_maker() as session:
+            service = LawChangeService(session, govinfo_client=_govinfo())
+            with patch.object(DiffGenerator, "law_change_rows", side_effect=_rows):
+                batch = await service.process_congress(
+                    118, law_numbers=[1, 2, 3], workers=0
+                )
+
+        assert [bool(r.errors) for r in batch.results] == [False, True, False]
+        assert batch.results[1].changes == []
+        assert [row[0] for row in await _stored_changes(session_maker)] == [101, 103]
+        async with session_maker() as session:
+            law = await session.get(PublicLaw, 101)
+            assert law is not None and law.sections_affected == 1
+
+    @pytest.mark.asyncio
+    async def test_parses_while_fetching(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """A fetched text is parsed without waiting for the other fetches."""
+        parsing = asyncio.Event()
+        load_cached = parse_cache.aload_cached
+
+        async def _load_cached(*args: object) -> object:
+            parsing.set()
+            return await load_cached(*args)
+
+        async def _get_law_text(_congress: int, law_number: int) -> str | None:
+            if law_number == 3:
+                await parsing.wait()
+            return _LAW_TEXTS[law_number]
+
+        client = MagicMock()
+        client.get_law_text = AsyncMock(side_effect=_get_law_text)
+        async with session_maker() as session:
+            service = LawChangeService(session, govinfo_client=client)
+            with patch.object(parse_cache, "aload_cached", side_effect=_load_cached):
+                batch = await asyncio.wait_for(
+                    service.process_congress(
+                        118,
+                        law_numbers=[1, 3],
+                        dry_run=True,
+                        fetch_concurrency=1,
+                        workers=0,
+                    ),
+                    timeout=5,
+                )
+
+        assert [len(r.diffs) for r in batch.results] == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_dry_run_in_worker_processes(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ) -> None:
+        async with session_maker() as session:
+            service = LawChangeService(session, govinfo_client=_govinfo())
+            batch = await service.process_congress(
+                118, law_numbers=[1, 3], dry_run=True, workers=1
+            )
+
+        assert [len(r.diffs) for r in batch.results] == [1, 1]
+        assert batch.changes_created == 0
+        assert await _stored_changes(session_maker) == []
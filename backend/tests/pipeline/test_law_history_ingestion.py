@@ -1,13 +1,24 @@
-"""Tests for LawHistoryIngestionService._resolve_bill_ref.
+"""Tests for LawHistoryIngestionService.
 
 Covers the Congress.gov /law/{congress}/{type}/{number} response structure,
-which returns {"bill": {"type": ..., "number": ...}} at the top level.
+which returns {"bill": {"type": ..., "number": ...}} at the top level, and
+concurrent seeding of a whole congress.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import date
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.models.public_law import LawBillAction, LawSponsor, PublicLaw
+from app.models.supporting import DataIngestionLog
+from pipeline.congress.client import BillAction, SponsorInfo
 from pipeline.congress.law_history_ingestion import LawHistoryIngestionService
 
 
@@ -107,3 +118,183 @@ class TestResolveBillRef:
         result = await service._resolve_bill_ref(law, client)
 
         assert result == ("s", 42)
+
+
+@pytest_asyncio.fixture
+async def session() -> AsyncIterator[AsyncSession]:
+    from app.models.base import Base
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with maker() as session:
+        session.add_all(
+            PublicLaw(
+                law_id=n,
+                congress=113,
+                law_number=str(n),
+                enacted_date=date(2014, 1, n),
+            )
+            for n in range(1, 6)
+        )
+        session.add(
+            LawBillAction(
+                law_id=1,
+                text="Introduced in House",
+                event_type="introduced",
+                event_title="Introduced",
+            )
+        )
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+class _FakeCongressAPI:
+    """Bill endpoints for laws 2-5; law 5 has no resolvable bill."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.bill_info_calls: list[int] = []
+
+    async def _request(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.005)
+        self.in_flight -= 1
+
+    async def get_law_bill_info(
+        self, _congress: int, law_number: int, *_: str
+    ) -> dict | None:
+        self.bill_info_calls.append(law_number)
+        await self._request()
+        if law_number == 5:
+            return None
+        return {"bill": {"type": "HR", "number": str(100 + law_number)}}
+
+    async def get_bill_actions(self, *_: object) -> list[BillAction]:
+        await self._request()
+        return [
+            BillAction(
+                date(2013, 1, 3), None, "IntroReferral", "Introduced.", "House", []
+            ),
+            BillAction(date(2013, 8, 9), "36000", "President", "Signed.", None, []),
+        ]
+
+    async def get_bill_sponsors(
+        self, *_: object
+    ) -> tuple[SponsorInfo | None, list[SponsorInfo]]:
+        await self._request()
+        sponsor = SponsorInfo(
+            "A000001", "Rep. Pat Smith", "Pat", None, "Smith", "D", "OH", 3
+        )
+        return sponsor, []
+
+
+class TestSeedCongress:
+    @pytest.mark.asyncio
+    async def test_seeds_unseeded_laws_concurrently(
+        self, session: AsyncSession
+    ) -> None:
+        api = _FakeCongressAPI()
+        service = LawHistoryIngestionService(session, concurrency=2)
+
+        with patch.object(service, "_make_client", return_value=api):
+            log = await service.seed_congress(113)
+
+        assert log.status == "completed"
+        assert log.details == ("5 laws processed, 1 skipped, 1 failed, 9 rows created")
+        # Law 1 was already seeded and is never fetched
+        assert sorted(api.bill_info_calls) == [2, 3, 4, 5]
+        # Two laws at once, each fetching actions and sponsors together
+        assert api.max_in_flight == 4
+
+        counts = dict(
+            (
+                await session.execute(
+                    select(LawBillAction.law_id, func.count()).group_by(
+                        LawBillAction.law_id
+                    )
+                )
+            ).all()
+        )
+        assert counts == {1: 1, 2: 2, 3: 2, 4: 2}
+        sponsors = await session.scalar(select(func.count()).select_from(LawSponsor))
+        assert sponsors == 3
+
+        child_logs = dict(
+            (
+                await session.execute(
+                    select(DataIngestionLog.operation, DataIngestionLog.status).where(
+                        DataIngestionLog.operation.like("seed-law-history-%")
+                    )
+                )
+            ).all()
+        )
+        assert child_logs == {
+            "seed-law-history-113-2": "completed",
+            "seed-law-history-113-3": "completed",
+            "seed-law-history-113-4": "completed",
+            "seed-law-history-113-5": "failed",
+        }
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_fails_only_the_offending_law(
+        self, session: AsyncSession
+    ) -> None:
+        service = LawHistoryIngestionService(session)
+        write_rows = service._write_rows
+
+        async def _write_rows(law_ids: list[int], *args: Any, **kwargs: Any) -> None:
+            if 3 in law_ids:
+                raise RuntimeError("constraint violated")
+            await write_rows(law_ids, *args, **kwargs)
+
+        with (
+            patch.object(service, "_make_client", return_value=_FakeCongressAPI()),
+            patch.object(service, "_write_rows", side_effect=_write_rows),
+        ):
+            log = await service.seed_congress(113)
+
+        assert log.status == "completed"
+        assert log.details == ("5 laws processed, 1 skipped, 2 failed, 6 rows created")
+        law_ids = (await session.scalars(select(LawBillAction.law_id).distinct())).all()
+        assert sorted(law_ids) == [1, 2, 4]
+        statuses = dict(
+            (
+                await session.execute(
+                    select(DataIngestionLog.operation, DataIngestionLog.status).where(
+                        DataIngestionLog.operation.like("seed-law-history-%")
+                    )
+                )
+            ).all()
+        )
+        assert statuses == {
+            "seed-law-history-113-2": "completed",
+            "seed-law-history-113-3": "failed",
+            "seed-law-history-113-4": "completed",
+            "seed-law-history-113-5": "failed",
+        }
+
+    @pytest.mark.asyncio
+    async def test_force_replaces_existing_rows(self, session: AsyncSession) -> None:
+        service = LawHistoryIngestionService(session)
+
+        with patch.object(service, "_make_client", return_value=_FakeCongressAPI()):
+            await service.seed_congress(113)
+            log = await service.seed_congress(113, force=True)
+
+        assert log.details == ("5 laws processed, 0 skipped, 1 failed, 12 rows created")
+        counts = dict(
+            (
+                await session.execute(
+                    select(LawBillAction.law_id, func.count()).group_by(
+                        LawBillAction.law_id
+                    )
+                )
+            ).all()
+        )
+        # Rows are replaced, not added to; law 1 loses its seeded row
+        assert counts == {1: 2, 2: 2, 3: 2, 4: 2}
@@ -0,0 +1,130 @@
+"""Tests for the persisted amendment parse-result cache."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pipeline.cache import PipelineCache
+from pipeline.legal_parser import parse_cache
+from pipeline.legal_parser.amendment_parser import AmendmentParser
+from pipeline.legal_parser.patterns import AMENDMENT_PATTERNS, AmendmentPattern
+from pipeline.legal_parser.xml_parser import XMLAmendmentParser
+
+_LAW_TEXT = (
+    "Section 512 of title 17, United States Code, is amended by striking "
+    '"120 days" and inserting "180 days". Section 106 is amended by '
+    "inserting after paragraph (2) the following: Section 107 is repealed."
+)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[PipelineCache]:
+    cache = PipelineCache(local_root=tmp_path, bucket_name=None)
+    parse_cache.set_pipeline_cache(cache)
+    yield cache
+    parse_cache.set_pipeline_cache(None)
+
+
+_LAW_XML = (
+    '<?xml version="1.0"?>'
+    '<pLaw xmlns="http://schemas.gpo.gov/xml/uslm">'
+    '<main><section role="instruction">'
+    "<num>1</num>"
+    "<content>Section 101 "
+    '<amendingAction type="amend">is amended</amendingAction> by '
+    '<amendingAction type="delete">striking</amendingAction> '
+    '"<quotedText>and</quotedText>" at the end.'
+    "</content></section></main></pLaw>"
+)
+
+
+class TestSerialization:
+    def test_round_trip_preserves_amendments(self) -> None:
+        text_amendments = AmendmentParser(default_title=17).parse(_LAW_TEXT)
+        xml_amendments = XMLAmendmentParser(default_title=18).parse(_LAW_XML)
+        assert text_amendments
+        assert xml_amendments[0].position_qualifier is not None
+        assert xml_amendments[0].metadata
+
+        for amendments in (text_amendments, xml_amendments):
+            data = parse_cache.serialize_amendments(amendments)
+            assert parse_cache.deserialize_amendments(data) == amendments
+
+
+class TestParseWithCache:
+    def test_hit_skips_parsing(self, cache: PipelineCache) -> None:
+        parser = AmendmentParser(default_title=17)
+        first = parse_cache.parse_with_cache(parser, _LAW_TEXT)
+        assert cache.has_local(parse_cache.cache_key(parser, _LAW_TEXT))
+
+        with patch.object(parser, "parse") as parse:
+            second = parse_cache.parse_with_cache(parser, _LAW_TEXT)
+        parse.assert_not_called()
+        assert second == first
+
+    def test_unreadable_entry_is_reparsed(self, cache: PipelineCache) -> None:
+        parser = AmendmentParser(default_title=17)
+        key = parse_cache.cache_key(parser, _LAW_TEXT)
+        cache.put_bytes(key, b"not gzip")
+
+        result = parse_cache.parse_with_cache(parser, _LAW_TEXT)
+        assert result == parser.parse(_LAW_TEXT)
+        assert parse_cache.deserialize_amendments(cache.get_bytes(key) or b"")
+
+    def test_without_cache_parses_directly(self) -> None:
+        parser = AmendmentParser(default_title=17)
+        assert parse_cache.parse_with_cache(parser, _LAW_TEXT) == parser.parse(
+            _LAW_TEXT
+        )
+
+
+class TestAsyncParseWithCache:
+    @pytest.mark.asyncio
+    async def test_reads_and_writes_through_async_cache_api(
+        self, cache: PipelineCache
+    ) -> None:
+        parser = AmendmentParser(default_title=17)
+        with (
+            patch.object(cache, "aget_bytes", wraps=cache.aget_bytes) as aget,
+            patch.object(cache, "aput_bytes", wraps=cache.aput_bytes) as aput,
+        ):
+            first = await parse_cache.aparse_with_cache(parser, _LAW_TEXT)
+            with patch.object(parser, "parse") as parse:
+                second = await parse_cache.aparse_with_cache(parser, _LAW_TEXT)
+
+        parse.assert_not_called()
+        assert second == first == parser.parse(_LAW_TEXT)
+        assert aget.await_count == 2
+        assert aput.await_count == 1
+
+
+class TestCacheKey:
+    def test_pattern_change_changes_key(self) -> None:
+        promoted = AmendmentPattern(
+            name="promoted_pattern",
+            pattern_type=AMENDMENT_PATTERNS[0].pattern_type,
+            regex=r"is hereby struck",
+            confidence=0.8,
+            description="Discovered pattern promoted to AMENDMENT_PATTERNS",
+        )
+        base = AmendmentParser(default_title=17)
+        extended = AmendmentParser(
+            default_title=17, patterns=[*AMENDMENT_PATTERNS, promoted]
+        )
+        assert parse_cache.cache_key(base, _LAW_TEXT) != parse_cache.cache_key(
+            extended, _LAW_TEXT
+        )
+
+    def test_settings_and_parser_kind_change_key(self) -> None:
+        keys = {
+            parse_cache.cache_key(AmendmentParser(default_title=17), _LAW_TEXT),
+            parse_cache.cache_key(AmendmentParser(default_title=26), _LAW_TEXT),
+            parse_cache.cache_key(
+                AmendmentParser(default_title=17, min_confidence=0.9), _LAW_TEXT
+            ),
+            parse_cache.cache_key(XMLAmendmentParser(default_title=17), _LAW_TEXT),
+            parse_cache.cache_key(AmendmentParser(default_title=17), _LAW_TEXT + " "),
+        }
+        assert len(keys) == 5
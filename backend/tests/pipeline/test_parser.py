@@ -1,5 +1,6 @@
 """Tests for USLM XML parser."""
 
+import zipfile
 from pathlib import Path
 
 import pytest
@@ -80,6 +81,19 @@ class TestUSLMParser:
         assert result.title.name == "Copyrights"
         assert result.title.is_positive_law is True  # Title 17 is positive law
 
+    def test_parse_file_from_zip(self, parser: USLMParser, sample_xml: Path) -> None:
+        """A title ZIP is parsed in place, with the same result as the XML."""
+        archive = sample_xml.with_suffix(".zip")
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.write(sample_xml, "usc17.xml")
+        # Data before the archive (the cache's entry header) is tolerated
+        prefixed = sample_xml.with_name("cached.zip")
+        prefixed.write_bytes(b"PCE1" + bytes(33) + archive.read_bytes())
+
+        expected = USLMParser().parse_file(sample_xml)
+        assert parser.parse_file(archive) == expected
+        assert USLMParser().parse_file(prefixed) == expected
+
     def test_parse_groups_chapters(self, parser: USLMParser, sample_xml: Path) -> None:
         """Test parsing of chapters as groups."""
         result = parser.parse_file(sample_xml)
@@ -0,0 +1,182 @@
+"""Tests for the anchored multi-pattern matcher.
+
+The matcher must return exactly what ``re.finditer`` returns for every
+amendment pattern, so these tests compare the two on hand-picked edge
+cases and on randomly assembled amendment language.
+"""
+
+import random
+import re
+
+import pytest
+
+from pipeline.legal_parser.amendment_parser import AmendmentParser
+from pipeline.legal_parser.pattern_matcher import AnchoredMatcher, leading_keywords
+from pipeline.legal_parser.patterns import AMENDMENT_PATTERNS, AmendmentPattern
+
+FRAGMENTS = [
+    "Section 106 of title 17, United States Code, is amended",
+    "section 512(c)(1) is hereby amended to read as follows:",
+    "subsection (b) is amended",
+    'by striking "120 days" and inserting "180 days"',
+    "By Striking out ``ten days'' and inserting in lieu thereof ``twenty days''",
+    'by striking "AFDC" each place such term appears and inserting "TANF"',
+    'striking "except that" and all that follows through the period',
+    "by striking paragraph (4)",
+    "by adding at the end the following new paragraph:",
+    "by inserting after section 411 the following new section",
+    'by inserting before "the date" the following:',
+    "by redesignating paragraphs (3) through (5) as paragraphs (4) through (6)",
+    "Section 6103(p)(4) is hereby repealed",
+    "clause (iv) is hereby stricken",
+    "Section 1148 is hereby transferred to section 234 of title 42",
+    "Title 42, United States Code, is amended by adding a new section 2323",
+    "Chapter 12 of title 17, United States Code, is amended by adding at the end the following new section",
+    'standby striking "x"',
+    'BY STRIKING "y"',
+    'ſtriking "z"',
+    "subparagraph (B)(ii) of such section 401 is amended",
+    "(1)",
+    "(A)",
+    ";",
+    ".",
+    "\n",
+    "and",
+    '"',
+    "``",
+    "''",
+]
+
+
+def _reference(pattern: AmendmentPattern, text: str) -> list[tuple]:
+    return [(m.span(), m.groups()) for m in pattern.compile().finditer(text)]
+
+
+def _anchored(
+    matcher: AnchoredMatcher, pattern: AmendmentPattern, text: str
+) -> list[tuple]:
+    return [(m.span(), m.groups()) for m in matcher.finditer(pattern.name, text)]
+
+
+class TestLeadingKeywords:
+    def test_all_builtin_patterns_are_anchored(self) -> None:
+        assert all(leading_keywords(p.regex) is not None for p in AMENDMENT_PATTERNS)
+
+    @pytest.mark.parametrize(
+        ("regex", "expected"),
+        [
+            (r"(?:by\s+)?striking\s+x", (True, frozenset({"striking"}))),
+            (r"[Ss]ection\s+(\d+)", (False, frozenset({"section"}))),
+            (r"(?:adding|inserting)\s+", (False, frozenset({"adding", "inserting"}))),
+        ],
+    )
+    def test_recognized(self, regex: str, expected: tuple) -> None:
+        assert leading_keywords(regex) == expected
+
+    @pytest.mark.parametrize(
+        "regex",
+        [
+            r"(?:by\s+)?strikings?\s+",
+            r"\d+\s+",
+            r"(?:paragraphs?|clause)",
+            r"striking\s+foo|inserting\s+bar",
+            r"[Ss]ection\s+\d+|\bby\s+adding",
+        ],
+    )
+    def test_unrecognized_falls_back(self, regex: str) -> None:
+        assert leading_keywords(regex) is None
+
+
+class TestAnchoredMatcherEquivalence:
+    @pytest.mark.parametrize("fragment", FRAGMENTS)
+    def test_single_fragments(self, fragment: str) -> None:
+        matcher = AnchoredMatcher(AMENDMENT_PATTERNS)
+        for pattern in AMENDMENT_PATTERNS:
+            assert _anchored(matcher, pattern, fragment) == _reference(
+                pattern, fragment
+            ), pattern.name
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_random_documents(self, seed: int) -> None:
+        rng = random.Random(seed)
+        text = "".join(
+            rng.choice(FRAGMENTS) + rng.choice([" ", "  ", "\n", "", ", "])
+            for _ in range(rng.randint(20, 200))
+        )
+        matcher = AnchoredMatcher(AMENDMENT_PATTERNS)
+        positions = matcher.scan(text)
+        for pattern in AMENDMENT_PATTERNS:
+            got = [
+                (m.span(), m.groups())
+                for m in matcher.finditer(pattern.name, text, positions)
+            ]
+            assert got == _reference(pattern, text), pattern.name
+
+    def test_ascii_and_unicode_scans_agree(self) -> None:
+        matcher = AnchoredMatcher(AMENDMENT_PATTERNS)
+        text = " ".join(FRAGMENTS[:17])
+        assert text.isascii()
+        # A trailing non-ASCII character forces the regex scan path
+        assert matcher.scan(text) == matcher.scan(text + " \u00e9")
+
+    def test_unanchored_pattern_uses_full_scan(self) -> None:
+        pattern = AmendmentPattern(
+            name="digits",
+            pattern_type=AMENDMENT_PATTERNS[0].pattern_type,
+            regex=r"\d+",
+            confidence=0.5,
+            description="",
+        )
+        matcher = AnchoredMatcher([pattern])
+        assert [m.group(0) for m in matcher.finditer("digits", "a 12 b 3")] == [
+            "12",
+            "3",
+        ]
+
+    def test_top_level_alternation_uses_full_scan(self) -> None:
+        """Later branches of a top-level "|" may start at any keyword."""
+        pattern = AmendmentPattern(
+            "alt",
+            AMENDMENT_PATTERNS[0].pattern_type,
+            r"striking\s+foo|inserting\s+bar",
+            1,
+            "",
+        )
+        matcher = AnchoredMatcher([pattern])
+        text = "by inserting bar and striking foo"
+        assert _anchored(matcher, pattern, text) == _reference(pattern, text)
+        assert [m.group(0) for m in matcher.finditer("alt", text)] == [
+            "inserting bar",
+            "striking foo",
+        ]
+
+    def test_prefix_keywords_fall_back(self) -> None:
+        """A keyword that prefixes another would be shadowed in the scan."""
+        patterns = [
+            AmendmentPattern("a", AMENDMENT_PATTERNS[0].pattern_type, "add", 1, ""),
+            AmendmentPattern("b", AMENDMENT_PATTERNS[0].pattern_type, "adding", 1, ""),
+        ]
+        matcher = AnchoredMatcher(patterns)
+        text = "adding add"
+        for pattern in patterns:
+            assert _anchored(matcher, pattern, text) == _reference(pattern, text)
+
+
+class TestParserOutputUnchanged:
+    def test_parse_matches_full_scan(self) -> None:
+        rng = random.Random(7)
+        text = " ".join(rng.choice(FRAGMENTS) for _ in range(400))
+        parser = AmendmentParser(default_title=17)
+
+        expected = []
+        for pattern in parser.patterns:
+            for match in re.compile(
+                pattern.regex, re.IGNORECASE | re.MULTILINE | re.DOTALL
+            ).finditer(text):
+                amendment = parser._process_match(match, pattern, text, 100)
+                if amendment:
+                    expected.append(amendment)
+        expected.sort(key=lambda a: a.start_pos)
+        expected = parser._deduplicate(expected)
+
+        assert parser.parse(text) == expected
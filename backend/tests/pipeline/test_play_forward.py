@@ -1,16 +1,21 @@
 """Tests for pipeline.chrono.play_forward — PlayForwardEngine."""
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import date
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.models.enums import RevisionStatus, RevisionType
+from pipeline.chrono.law_prefetcher import LawPrefetcher
 from pipeline.chrono.play_forward import AdvanceResult, PlayForwardEngine
 from pipeline.chrono.revision_builder import RevisionBuildResult
+from pipeline.legal_parser.law_change_service import LawChangeService
 from pipeline.olrc.rp_ingestor import RPIngestResult
 from pipeline.olrc.snapshot_service import SectionState
-from pipeline.timeline import TimelineEvent, TimelineEventType
+from pipeline.timeline import Timeline, TimelineEvent, TimelineEventType
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -173,7 +178,9 @@ class TestAdvanceSingleLaw:
 
         with (
             patch.object(engine, "_get_current_head", return_value=head),
-            patch.object(engine.timeline_builder, "build", return_value=events),
+            patch.object(
+                engine.timeline_builder, "build", return_value=Timeline(events)
+            ),
             patch.object(engine, "_find_law", return_value=law_mock),
             patch.object(
                 engine.law_change_service, "process_law", return_value=MagicMock()
@@ -223,7 +230,9 @@ class TestAdvanceSingleLaw:
 
         with (
             patch.object(engine, "_get_current_head", return_value=head),
-            patch.object(engine.timeline_builder, "build", return_value=events),
+            patch.object(
+                engine.timeline_builder, "build", return_value=Timeline(events)
+            ),
             patch.object(
                 engine.rp_ingestor,
                 "ingest_release_point",
@@ -285,7 +294,9 @@ class TestAdvanceToRP:
 
         with (
             patch.object(engine, "_get_current_head", return_value=head),
-            patch.object(engine.timeline_builder, "build", return_value=events),
+            patch.object(
+                engine.timeline_builder, "build", return_value=Timeline(events)
+            ),
             patch.object(engine, "_find_law", return_value=law_mock),
             patch.object(
                 engine.law_change_service, "process_law", return_value=MagicMock()
@@ -332,7 +343,9 @@ class TestDeferredLaws:
 
         with (
             patch.object(engine, "_get_current_head", return_value=head),
-            patch.object(engine.timeline_builder, "build", return_value=events),
+            patch.object(
+                engine.timeline_builder, "build", return_value=Timeline(events)
+            ),
         ):
             result = await engine.advance(count=1)
 
@@ -367,7 +380,9 @@ class TestEdgeCases:
 
         with (
             patch.object(engine, "_get_current_head", return_value=head),
-            patch.object(engine.timeline_builder, "build", return_value=events),
+            patch.object(
+                engine.timeline_builder, "build", return_value=Timeline(events)
+            ),
         ):
             result = await engine.advance()
 
@@ -388,7 +403,9 @@ class TestEdgeCases:
 
         with (
             patch.object(engine, "_get_current_head", return_value=head),
-            patch.object(engine.timeline_builder, "build", return_value=events),
+            patch.object(
+                engine.timeline_builder, "build", return_value=Timeline(events)
+            ),
             patch.object(engine, "_find_law", return_value=None),
         ):
             result = await engine.advance(count=1)
@@ -493,7 +510,9 @@ class TestAutoProcessLaw:
 
         with (
             patch.object(engine, "_get_current_head", return_value=head),
-            patch.object(engine.timeline_builder, "build", return_value=events),
+            patch.object(
+                engine.timeline_builder, "build", return_value=Timeline(events)
+            ),
             patch.object(engine, "_find_law", return_value=law_mock),
             patch.object(
                 engine.law_change_service,
@@ -511,3 +530,178 @@ class TestAutoProcessLaw:
         # Advance still succeeds (build_revision runs with whatever state exists)
         assert result.events_processed == 1
         assert result.laws_applied == 1
+
+
+class TestLookahead:
+    @staticmethod
+    def _make_lookahead_engine(lookahead: int) -> tuple[PlayForwardEngine, list]:
+        """Engine whose prefetch sessions are recorded in the returned list."""
+        opened: list[AsyncMock] = []
+
+        @asynccontextmanager
+        async def session_factory() -> AsyncIterator[AsyncMock]:
+            prep_session = AsyncMock()
+            opened.append(prep_session)
+            yield prep_session
+
+        engine = PlayForwardEngine(
+            AsyncMock(),
+            MagicMock(),
+            session_factory=session_factory,
+            lookahead=lookahead,
+        )
+        return engine, opened
+
+    @staticmethod
+    def _find_law(congress: int, law_number: int) -> MagicMock:
+        law = MagicMock()
+        law.law_id = law_number
+        law.congress = congress
+        law.law_number = str(law_number)
+        return law
+
+    @pytest.mark.asyncio
+    async def test_laws_prepared_ahead_of_apply(self) -> None:
+        """Upcoming laws are being prepared while the first one is applied."""
+        engine, opened = self._make_lookahead_engine(lookahead=2)
+        head = _make_revision(revision_id=1, sequence_number=1, release_point_id=10)
+        events = [_make_rp_event("113-21", 113, 21, date(2014, 1, 1))] + [
+            _make_law_event(113, n, law_id=n) for n in (22, 23, 24, 25)
+        ]
+
+        started: list[int] = []
+
+        async def process_law(*, law_number: int, **_: int) -> MagicMock:
+            started.append(law_number)
+            # Simulate a GovInfo round-trip
+            await asyncio.sleep(0)
+            return MagicMock()
+
+        prepared_at_apply: list[list[int]] = []
+
+        async def build_revision(
+            law: MagicMock, parent_revision_id: int, sequence_number: int
+        ) -> RevisionBuildResult:
+            prepared_at_apply.append(list(started))
+            return _make_build_result(
+                revision_id=parent_revision_id + 1,
+                law_id=law.law_id,
+                parent_revision_id=parent_revision_id,
+                sequence_number=sequence_number,
+            )
+
+        with (
+            patch.object(engine, "_get_current_head", return_value=head),
+            patch.object(
+                engine.timeline_builder, "build", return_value=Timeline(events)
+            ),
+            patch.object(engine, "_find_law", side_effect=self._find_law),
+            patch.object(
+                LawChangeService, "process_law", AsyncMock(side_effect=process_law)
+            ),
+            patch.object(
+                engine.revision_builder,
+                "build_revision",
+                side_effect=build_revision,
+            ),
+        ):
+            result = await engine.advance(count=4)
+
+        assert result.laws_applied == 4
+        assert result.revisions_created == [2, 3, 4, 5]
+        # While law 22 was applied, laws 23 and 24 were already in flight
+        assert prepared_at_apply[0] == [22, 23, 24]
+        assert sorted(started) == [22, 23, 24, 25]
+        # Every law was prepared in its own session, never the applier's
+        assert len(opened) == 4
+
+    @pytest.mark.asyncio
+    async def test_deferred_laws_not_prepared(self) -> None:
+        engine, opened = self._make_lookahead_engine(lookahead=4)
+        head = _make_revision(revision_id=1, sequence_number=1, release_point_id=10)
+        events = [
+            _make_rp_event("113-21", 113, 21, date(2014, 1, 1)),
+            _make_law_event(113, 22, law_id=22),
+            _make_law_event(113, 25, law_id=25),
+            _make_rp_event("113-37", 113, 37, date(2014, 7, 1), deferred_laws=[25]),
+        ]
+        process_law = AsyncMock()
+
+        with (
+            patch.object(engine, "_get_current_head", return_value=head),
+            patch.object(
+                engine.timeline_builder, "build", return_value=Timeline(events)
+            ),
+            patch.object(engine, "_find_law", side_effect=self._find_law),
+            patch.object(LawChangeService, "process_law", process_law),
+            patch.object(
+                engine.revision_builder,
+                "build_revision",
+                return_value=_make_build_result(revision_id=2, law_id=22),
+            ),
+        ):
+            result = await engine.advance(count=2)
+
+        assert result.laws_applied == 1
+        assert result.laws_skipped == 1
+        process_law.assert_awaited_once_with(congress=113, law_number=22)
+        assert len(opened) == 1
+
+    @pytest.mark.asyncio
+    async def test_preparation_failure_does_not_block_apply(self) -> None:
+        engine, _ = self._make_lookahead_engine(lookahead=2)
+        head = _make_revision(revision_id=1, sequence_number=1, release_point_id=10)
+        events = [
+            _make_rp_event("113-21", 113, 21, date(2014, 1, 1)),
+            _make_law_event(113, 22, law_id=22),
+        ]
+
+        with (
+            patch.object(engine, "_get_current_head", return_value=head),
+            patch.object(
+                engine.timeline_builder, "build", return_value=Timeline(events)
+            ),
+            patch.object(engine, "_find_law", side_effect=self._find_law),
+            patch.object(
+                LawChangeService,
+                "process_law",
+                AsyncMock(side_effect=RuntimeError("GovInfo unavailable")),
+            ),
+            patch.object(
+                engine.revision_builder,
+                "build_revision",
+                return_value=_make_build_result(revision_id=2, law_id=22),
+            ),
+        ):
+            result = await engine.advance(count=1)
+
+        assert result.laws_applied == 1
+        engine.session.rollback.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unconsumed_preparations_cancelled(self) -> None:
+        """Laws prefetched past the last applied event are cancelled."""
+        cancelled: list[int] = []
+
+        async def process_law(*, law_number: int, **_: int) -> None:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(law_number)
+                raise
+
+        @asynccontextmanager
+        async def session_factory() -> AsyncIterator[AsyncMock]:
+            yield AsyncMock()
+
+        prefetcher = LawPrefetcher(
+            session_factory, [(113, 22), (113, 23), (113, 24)], lookahead=2
+        )
+        with patch.object(
+            LawChangeService, "process_law", AsyncMock(side_effect=process_law)
+        ):
+            prefetcher._fill(2)
+            await asyncio.sleep(0)
+            await prefetcher.close()
+
+        assert sorted(cancelled) == [22, 23, 24]
@@ -0,0 +1,174 @@
+"""Tests for the copy-on-write provision document."""
+
+import copy
+import random
+import re
+from typing import Any
+
+from pipeline.chrono.provision_document import ProvisionDocument, provision_lines
+
+
+def _line(n: int, content: str, marker: str | None = None) -> dict[str, Any]:
+    return {
+        "line_number": n,
+        "content": content,
+        "indent_level": 0,
+        "marker": marker,
+        "is_header": False,
+        "start_char": 0,
+        "end_char": len(content),
+    }
+
+
+def _section() -> list[dict[str, Any]]:
+    return [
+        _line(1, "(a) In general.—The rate is 10 percent.", "(a)"),
+        _line(2, "(1) the first  paragraph;", "(1)"),
+        _line(3, "(2) the second paragraph.", "(2)"),
+        _line(4, "(b) Exception.—The Rate is 10 percent.", "(b)"),
+        _line(5, "(c) Definitions.—For purposes of this section—", "(c)"),
+        _line(6, "(A) the term “person” has its usual meaning.", "(A)"),
+    ]
+
+
+# Straightforward full-scan versions, the behaviour the index must keep
+def _naive_range(
+    lines: list[dict[str, Any]], markers: list[str]
+) -> tuple[int, int] | None:
+    marker_set = {f"({m})" for m in markers}
+    sample = markers[0]
+    if sample.isdigit():
+        boundary = re.compile(r"^\([0-9]+\)$")
+    elif sample.isupper():
+        boundary = re.compile(r"^\([A-Z]+\)$")
+    else:
+        boundary = re.compile(r"^\([a-z]+\)$")
+    start = end = None
+    for i, line in enumerate(lines):
+        marker = line.get("marker", "")
+        if marker in marker_set:
+            if start is None:
+                start = i
+            end = i
+        elif start is not None:
+            if marker and boundary.match(marker):
+                break
+            end = i
+    if start is None or end is None:
+        return None
+    return (start, end)
+
+
+def _naive_replace(lines: list[dict[str, Any]], old: str, new: str) -> list[str]:
+    out = []
+    ws = r"\s+".join(re.escape(p) for p in old.split())
+    for line in lines:
+        content = line["content"]
+        if old in content:
+            content = content.replace(old, new)
+        elif m := (re.search(ws, content) or re.search(ws, content, re.IGNORECASE)):
+            content = content[: m.start()] + new + content[m.end() :]
+        out.append(content)
+    return out
+
+
+class TestReplaceText:
+    def test_exact_match_replaces_every_occurrence(self) -> None:
+        doc = ProvisionDocument([_line(1, "10 days or 10 days")])
+        doc.replace_text("10 days", "30 days")
+        assert doc[0]["content"] == "30 days or 30 days"
+
+    def test_whitespace_and_case_fallbacks(self) -> None:
+        doc = ProvisionDocument(_section())
+        doc.replace_text("first paragraph", "initial paragraph")
+        doc.replace_text("the rate is", "the rate shall be")
+        assert doc[1]["content"] == "(1) the initial paragraph;"
+        assert doc[0]["content"] == "(a) In general.—the rate shall be 10 percent."
+        assert doc[3]["content"] == "(b) Exception.—the rate shall be 10 percent."
+
+    def test_match_never_spans_two_lines(self) -> None:
+        doc = ProvisionDocument([_line(1, "ends with tax"), _line(2, "credit begins")])
+        doc.replace_text("tax credit", "X")
+        assert [doc[0]["content"], doc[1]["content"]] == [
+            "ends with tax",
+            "credit begins",
+        ]
+
+    def test_matches_naive_scan(self) -> None:
+        rng = random.Random(7)
+        words = ["the", "The", "rate", "tax", "10", "percent", "days", "year"]
+        for _ in range(200):
+            lines = [
+                _line(i + 1, " ".join(rng.choices(words, k=rng.randint(0, 8))))
+                for i in range(rng.randint(1, 12))
+            ]
+            old = " ".join(rng.choices(words, k=rng.randint(1, 3)))
+            doc = ProvisionDocument(lines)
+            doc.replace_text(old, "X")
+            assert [doc[i]["content"] for i in range(len(doc))] == _naive_replace(
+                lines, old, "X"
+            )
+
+
+class TestSubsectionRange:
+    def test_includes_children_up_to_next_sibling(self) -> None:
+        doc = ProvisionDocument(_section())
+        assert doc.subsection_range(["a"]) == (0, 2)
+        assert doc.subsection_range(["b", "c"]) == (3, 5)
+        assert doc.subsection_range(["d"]) is None
+
+    def test_index_follows_edits(self) -> None:
+        doc = ProvisionDocument(_section())
+        doc.splice(3, 4, [])
+        assert doc.subsection_range(["a"]) == (0, 2)
+        assert doc.subsection_range(["c"]) == (3, 4)
+        doc.redesignate(3, "(b)")
+        assert doc.subsection_range(["b"]) == (3, 4)
+
+    def test_matches_naive_scan(self) -> None:
+        rng = random.Random(11)
+        markers = ["(a)", "(b)", "(c)", "(1)", "(2)", "(A)", "(B)", "(i)", None]
+        for _ in range(200):
+            lines = [
+                _line(i + 1, "text", rng.choice(markers))
+                for i in range(rng.randint(1, 15))
+            ]
+            struck = rng.sample(["a", "b", "c", "1", "2", "A", "B"], rng.randint(1, 2))
+            doc = ProvisionDocument(lines)
+            assert doc.subsection_range(struck) == _naive_range(lines, struck)
+
+
+class TestCopyOnWrite:
+    def test_parent_lines_are_never_modified(self) -> None:
+        parent = _section()
+        original = copy.deepcopy(parent)
+        doc = ProvisionDocument(parent)
+        doc.replace_text("10 percent", "12 percent")
+        doc.redesignate(4, "(d)")
+        doc.splice(1, 3, provision_lines("(1) new paragraph.", 2, 0))
+        result = doc.to_list()
+
+        assert parent == original
+        assert [line["line_number"] for line in result] == [1, 2, 3, 4, 5]
+        assert (
+            result[3]["content"] == "(d) (c) Definitions.—For purposes of this section—"
+        )
+
+    def test_unchanged_lines_are_shared(self) -> None:
+        parent = _section()
+        doc = ProvisionDocument(parent)
+        doc.replace_text("second paragraph", "last paragraph")
+        result = doc.to_list()
+        assert result[0] is parent[0]
+        assert result[2] is not parent[2]
+        assert all(a is b for a, b in zip(result[3:], parent[3:], strict=True))
+
+
+def test_provision_lines_detects_markers_and_offsets() -> None:
+    lines = provision_lines("(c) New rule.\n\n(1)(A) Detail.", 7, 100)
+    assert [(line["marker"], line["line_number"]) for line in lines] == [
+        ("(c)", 7),
+        ("(1)(A)", 8),
+    ]
+    assert (lines[0]["start_char"], lines[0]["end_char"]) == (100, 113)
+    assert lines[1]["start_char"] == 114
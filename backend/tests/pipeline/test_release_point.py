@@ -1,9 +1,14 @@
 """Tests for OLRC release point infrastructure."""
 
+from collections.abc import Iterator
 from datetime import date
+from pathlib import Path
+from unittest.mock import patch
 
+import httpx
 import pytest
 
+from pipeline.cache import PipelineCache
 from pipeline.olrc.downloader import OLRCDownloader
 from pipeline.olrc.release_point import (
     ReleasePointInfo,
@@ -500,3 +505,109 @@ class TestOLRCDownloaderReleasePoints:
         assert path_21 != path_30
         assert "113-21" in str(path_21)
         assert "113-30" in str(path_30)
+
+
+_PAGE = b"""<html><body><ul>
+<li><a href="releasepoints/us/pl/113/21/usc-rp@113-21.htm">Public Law 113-21
+(07/26/2013), affecting titles 2, 16.</a></li>
+<li><a href="releasepoints/us/pl/113/30/usc-rp@113-30.htm">Public Law 113-30
+(08/09/2013), affecting title 42.</a></li>
+</ul></body></html>"""
+
+
+class _OLRCPage:
+    """Stand-in for the prior release points page, honouring validators."""
+
+    def __init__(self) -> None:
+        self.page = _PAGE
+        self.etag = '"p1"'
+        self.fail = False
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.fail:
+            raise httpx.ConnectError("unreachable", request=request)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            content=self.page,
+            headers={
+                "ETag": self.etag,
+                "Last-Modified": "Fri, 09 Aug 2013 00:00:00 GMT",
+            },
+        )
+
+
+class TestRegistryCache:
+    """Persisted registry refreshed with conditional requests."""
+
+    @pytest.fixture
+    def olrc(self) -> Iterator[_OLRCPage]:
+        page = _OLRCPage()
+        real_client = httpx.AsyncClient
+        with patch.object(
+            httpx,
+            "AsyncClient",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(page), **kwargs),
+        ):
+            yield page
+
+    @pytest.mark.asyncio
+    async def test_fresh_list_needs_no_request(
+        self, olrc: _OLRCPage, tmp_path: Path
+    ) -> None:
+        cache = PipelineCache(local_root=tmp_path)
+        first = await ReleasePointRegistry(cache=cache).fetch_release_points()
+        second_registry = ReleasePointRegistry(cache=cache)
+        second = await second_registry.fetch_release_points()
+
+        assert [rp.full_identifier for rp in first] == ["113-21", "113-30"]
+        assert second == first
+        assert second[0].publication_date == date(2013, 7, 26)
+        assert second_registry.version is not None
+        assert len(olrc.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_list_is_revalidated(
+        self, olrc: _OLRCPage, tmp_path: Path
+    ) -> None:
+        cache = PipelineCache(local_root=tmp_path)
+        registry = ReleasePointRegistry(cache=cache, max_age=0)
+        first = await registry.fetch_release_points()
+        version = registry.version
+
+        with patch.object(
+            ReleasePointRegistry, "_parse_release_points_page"
+        ) as parse_page:
+            again = await ReleasePointRegistry(
+                cache=cache, max_age=0
+            ).fetch_release_points()
+        parse_page.assert_not_called()
+        assert again == first
+        assert olrc.requests[1].headers["If-None-Match"] == '"p1"'
+        assert "If-Modified-Since" in olrc.requests[1].headers
+
+        olrc.page = _PAGE.replace(
+            b"</ul>",
+            b'<li><a href="releasepoints/us/pl/113/40/usc-rp@113-40.htm">'
+            b"Public Law 113-40 (10/02/2013).</a></li></ul>",
+        )
+        olrc.etag = '"p2"'
+        updated = await registry.fetch_release_points()
+        assert [rp.full_identifier for rp in updated][-1] == "113-40"
+        assert registry.version != version
+
+    @pytest.mark.asyncio
+    async def test_unreachable_page_falls_back_to_stored_list(
+        self, olrc: _OLRCPage, tmp_path: Path
+    ) -> None:
+        cache = PipelineCache(local_root=tmp_path)
+        stored = await ReleasePointRegistry(cache=cache).fetch_release_points()
+        olrc.fail = True
+
+        registry = ReleasePointRegistry(cache=cache, max_age=0)
+        assert await registry.fetch_release_points() == stored
+        with pytest.raises(httpx.ConnectError):
+            await ReleasePointRegistry().fetch_release_points()
@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 from datetime import date
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy import Insert
 
 from app.models.enums import ChangeType
 from app.models.public_law import LawChange
 from app.models.revision import CodeRevision
 from app.models.snapshot import SectionSnapshot
 from pipeline.chrono.revision_builder import RevisionBuilder
+from pipeline.chrono.working_set import SectionWorkingSet
 from pipeline.olrc.snapshot_service import SectionState
 
 # ---------------------------------------------------------------------------
@@ -106,7 +109,7 @@ def _make_mock_session(
 
     call_count = 0
 
-    def fake_execute(_stmt):
+    def fake_execute(_stmt, _params=None):
         nonlocal call_count
         call_count += 1
         result = MagicMock()
@@ -127,6 +130,19 @@ def _make_mock_session(
     return session
 
 
+def _written_snapshots(session: AsyncMock) -> list[SimpleNamespace]:
+    """Snapshot rows passed to the bulk ``insert(SectionSnapshot)``."""
+    rows: list[SimpleNamespace] = []
+    for call in session.execute.call_args_list:
+        stmt = call.args[0]
+        if (
+            isinstance(stmt, Insert)
+            and stmt.table.name == SectionSnapshot.__tablename__
+        ):
+            rows.extend(SimpleNamespace(**row) for row in call.args[1])
+    return rows
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -160,8 +176,7 @@ class TestRevisionBuilder:
         assert result.sections_failed == 0
 
         # Check a snapshot was added
-        added_objects = [call.args[0] for call in session.add.call_args_list]
-        snapshots = [o for o in added_objects if isinstance(o, SectionSnapshot)]
+        snapshots = _written_snapshots(session)
         assert len(snapshots) == 1
         assert "10 percent" in snapshots[0].text_content
         assert snapshots[0].is_deleted is False
@@ -198,8 +213,7 @@ class TestRevisionBuilder:
 
         assert result.sections_applied == 2
 
-        added_objects = [call.args[0] for call in session.add.call_args_list]
-        snapshots = [o for o in added_objects if isinstance(o, SectionSnapshot)]
+        snapshots = _written_snapshots(session)
         assert len(snapshots) == 1
         assert "10 percent" in snapshots[0].text_content
         assert "the total" in snapshots[0].text_content
@@ -230,8 +244,7 @@ class TestRevisionBuilder:
 
         assert result.sections_added == 1
 
-        added_objects = [call.args[0] for call in session.add.call_args_list]
-        snapshots = [o for o in added_objects if isinstance(o, SectionSnapshot)]
+        snapshots = _written_snapshots(session)
         assert len(snapshots) == 1
         assert snapshots[0].text_content == "(a) New section text."
 
@@ -261,8 +274,7 @@ class TestRevisionBuilder:
 
         assert result.sections_repealed == 1
 
-        added_objects = [call.args[0] for call in session.add.call_args_list]
-        snapshots = [o for o in added_objects if isinstance(o, SectionSnapshot)]
+        snapshots = _written_snapshots(session)
         assert len(snapshots) == 1
         assert snapshots[0].is_deleted is True
 
@@ -296,8 +308,7 @@ class TestRevisionBuilder:
         assert result.sections_skipped == 0
 
         # A snapshot IS created for redesignations
-        added_objects = [call.args[0] for call in session.add.call_args_list]
-        snapshots = [o for o in added_objects if isinstance(o, SectionSnapshot)]
+        snapshots = _written_snapshots(session)
         assert len(snapshots) == 1
 
     @pytest.mark.asyncio
@@ -352,8 +363,7 @@ class TestRevisionBuilder:
         assert result.sections_applied == 1
 
         # Snapshot should still be created (partial application)
-        added_objects = [call.args[0] for call in session.add.call_args_list]
-        snapshots = [o for o in added_objects if isinstance(o, SectionSnapshot)]
+        snapshots = _written_snapshots(session)
         assert len(snapshots) == 1
         assert "10 percent" in snapshots[0].text_content
 
@@ -375,8 +385,7 @@ class TestRevisionBuilder:
         ):
             await builder.build_revision(law, parent_revision_id=1, sequence_number=2)
 
-        added_objects = [call.args[0] for call in session.add.call_args_list]
-        snapshots = [o for o in added_objects if isinstance(o, SectionSnapshot)]
+        snapshots = _written_snapshots(session)
         assert len(snapshots) == 1
         snapshot = snapshots[0]
 
@@ -414,9 +423,180 @@ class TestRevisionBuilder:
         assert result.sections_skipped == 0
 
         # A snapshot IS created for note additions
-        added_objects = [call.args[0] for call in session.add.call_args_list]
-        snapshots = [o for o in added_objects if isinstance(o, SectionSnapshot)]
+        snapshots = _written_snapshots(session)
         assert len(snapshots) == 1
         # Text content should be unchanged from parent
         assert snapshots[0].text_content == parent_state.text_content
         assert snapshots[0].is_deleted is False
+
+
+class TestBulkSnapshotWrites:
+    """Snapshots are written once per revision, not one INSERT per section."""
+
+    @pytest.mark.asyncio
+    async def test_all_sections_in_one_insert(self) -> None:
+        changes = [
+            _make_change(change_id=i, section_number=str(400 + i)) for i in range(5)
+        ]
+        session = _make_mock_session(changes=changes)
+        builder = RevisionBuilder(session)
+        parents = {
+            (26, str(400 + i)): _make_parent_state(section_number=str(400 + i))
+            for i in range(5)
+        }
+
+        with patch.object(
+            builder.snapshot_service,
+            "get_sections_at_revision",
+            new_callable=AsyncMock,
+            return_value=parents,
+        ):
+            await builder.build_revision(
+                _make_law(), parent_revision_id=1, sequence_number=2
+            )
+
+        inserts = [
+            c for c in session.execute.call_args_list if isinstance(c.args[0], Insert)
+        ]
+        assert len(inserts) == 1
+        assert [row["section_number"] for row in inserts[0].args[1]] == [
+            "400",
+            "401",
+            "402",
+            "403",
+            "404",
+        ]
+        assert all(row["revision_id"] == 100 for row in inserts[0].args[1])
+
+    @pytest.mark.asyncio
+    async def test_rows_carry_dates_from_updated_notes(self) -> None:
+        session = _make_mock_session(changes=[_make_change()])
+        builder = RevisionBuilder(session)
+
+        with patch.object(
+            builder.snapshot_service,
+            "get_sections_at_revision",
+            new_callable=AsyncMock,
+            return_value={(26, "401"): _make_parent_state()},
+        ):
+            await builder.build_revision(
+                _make_law(), parent_revision_id=1, sequence_number=2
+            )
+
+        (row,) = _written_snapshots(session)
+        assert row.enacted_date == date(2017, 12, 22)
+        assert row.last_modified_date == date(2017, 12, 22)
+
+    @pytest.mark.asyncio
+    async def test_copy_when_requested(self) -> None:
+        session = _make_mock_session(changes=[_make_change()])
+        builder = RevisionBuilder(session, use_copy=True)
+
+        with (
+            patch.object(
+                builder.snapshot_service,
+                "get_sections_at_revision",
+                new_callable=AsyncMock,
+                return_value={(26, "401"): _make_parent_state()},
+            ),
+            patch(
+                "pipeline.olrc.bootstrap._copy_snapshots_to_db",
+                new_callable=AsyncMock,
+            ) as copy,
+        ):
+            await builder.build_revision(
+                _make_law(), parent_revision_id=1, sequence_number=2
+            )
+
+        copy.assert_awaited_once()
+        (row,) = copy.await_args.args[1]
+        assert "10 percent" in row["text_content"]
+        assert _written_snapshots(session) == []
+
+
+class TestWorkingSet:
+    """RevisionBuilder with a SectionWorkingSet across consecutive laws."""
+
+    @staticmethod
+    def _session_for(revision_id: int, changes: list) -> AsyncMock:
+        session = _make_mock_session(changes=changes)
+
+        def assign_id(obj: object) -> None:
+            if isinstance(obj, CodeRevision):
+                obj.revision_id = revision_id
+
+        session.add = MagicMock(side_effect=assign_id)
+        return session
+
+    @pytest.mark.asyncio
+    async def test_consecutive_laws_served_from_memory(self) -> None:
+        working_set = SectionWorkingSet()
+        first = RevisionBuilder(
+            self._session_for(100, [_make_change()]), working_set=working_set
+        )
+        with patch.object(
+            first.snapshot_service,
+            "get_sections_at_revision",
+            new_callable=AsyncMock,
+            return_value={(26, "401"): _make_parent_state()},
+        ) as fetch:
+            await first.build_revision(
+                _make_law(), parent_revision_id=1, sequence_number=2
+            )
+        fetch.assert_awaited_once_with([(26, "401")], 1)
+
+        second_change = _make_change(
+            change_id=2, law_id=2, old_text="10 percent", new_text="15 percent"
+        )
+        second = RevisionBuilder(
+            self._session_for(
+                101,
+                [
+                    second_change,
+                    _make_change(change_id=3, law_id=2, section_number="402"),
+                ],
+            ),
+            working_set=working_set,
+        )
+        with patch.object(
+            second.snapshot_service,
+            "get_sections_at_revision",
+            new_callable=AsyncMock,
+            return_value={},
+        ) as fetch:
+            result = await second.build_revision(
+                _make_law(law_id=2, law_number="98"),
+                parent_revision_id=100,
+                sequence_number=3,
+            )
+
+        # Only the cold section is queried; 401 comes from the first build
+        fetch.assert_awaited_once_with([(26, "402")], 100)
+        assert result.sections_applied == 1
+        snapshots = _written_snapshots(second.session)
+        assert "15 percent" in snapshots[0].text_content
+        assert working_set.head_revision_id == 101
+        assert working_set.stats.hits == 1
+        assert working_set.stats.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_other_parent_resets_working_set(self) -> None:
+        working_set = SectionWorkingSet()
+        working_set.advance(100, {(26, "401"): _make_parent_state()})
+        builder = RevisionBuilder(
+            self._session_for(102, [_make_change()]), working_set=working_set
+        )
+        with patch.object(
+            builder.snapshot_service,
+            "get_sections_at_revision",
+            new_callable=AsyncMock,
+            return_value={(26, "401"): _make_parent_state()},
+        ) as fetch:
+            # Built on an RP revision the working set never saw
+            await builder.build_revision(
+                _make_law(), parent_revision_id=101, sequence_number=3
+            )
+
+        fetch.assert_awaited_once_with([(26, "401")], 101)
+        assert working_set.stats.resets == 1
+        assert working_set.head_revision_id == 102
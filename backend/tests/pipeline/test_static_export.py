@@ -0,0 +1,227 @@
+"""Tests for the static pre-rendered export."""
+
+import gzip
+import json
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.revision_cache import revision_cache
+from app.core.static_export import (
+    MANIFEST_NAME,
+    StaticExportStore,
+    object_relpath,
+    section_key,
+    title_structure_key,
+    titles_key,
+)
+from app.schemas.us_code import (
+    SectionViewerSchema,
+    TitleStructureSchema,
+    TitleSummarySchema,
+)
+from pipeline.static_export import StaticExporter
+
+
+def _viewer(section_number: str, heading: str) -> SectionViewerSchema:
+    return SectionViewerSchema(
+        title_number=17,
+        section_number=section_number,
+        heading=heading,
+        full_citation=f"17 USC {section_number}",
+        text_content="Text",
+        is_positive_law=True,
+        is_repealed=False,
+    )
+
+
+def _session_factory() -> MagicMock:
+    @asynccontextmanager
+    async def _factory() -> AsyncIterator[MagicMock]:
+        yield MagicMock()
+
+    return _factory  # type: ignore[return-value]
+
+
+@pytest.fixture
+def render_mocks() -> Iterator[dict[str, object]]:
+    """Patch the CRUD renderers and snapshot lookups used by the exporter."""
+    headings = {"106": "Exclusive rights", "107": "Fair use"}
+
+    async def _get_section(
+        _s: object, _title: int, section: str, *_: object, **__: object
+    ) -> object:
+        return _viewer(section, headings[section])
+
+    svc = MagicMock()
+    svc.get_head_revision_id = AsyncMock(return_value=7)
+    svc.get_revision_chain = AsyncMock(return_value=[7, 1])
+
+    patches = [
+        patch("pipeline.static_export.SnapshotService", return_value=svc),
+        patch(
+            "pipeline.static_export.get_all_titles",
+            new_callable=AsyncMock,
+            return_value=[
+                TitleSummarySchema(
+                    title_number=17,
+                    title_name="Copyrights",
+                    is_positive_law=True,
+                    positive_law_date=None,
+                    chapter_count=1,
+                    section_count=2,
+                )
+            ],
+        ),
+        patch(
+            "pipeline.static_export.get_title_structure",
+            new_callable=AsyncMock,
+            return_value=TitleStructureSchema(
+                title_number=17, title_name="Copyrights", is_positive_law=True
+            ),
+        ),
+        patch("pipeline.static_export.get_section", side_effect=_get_section),
+        patch.object(
+            StaticExporter,
+            "_list_sections",
+            new_callable=AsyncMock,
+            return_value=[(17, "106"), (17, "107")],
+        ),
+    ]
+    for p in patches:
+        p.start()
+    yield {"headings": headings}
+    for p in patches:
+        p.stop()
+
+
+class TestStaticExporter:
+    async def test_export_writes_manifest_and_objects(
+        self,
+        tmp_path: Path,
+        render_mocks: dict[str, object],  # noqa: ARG002
+    ) -> None:
+        exporter = StaticExporter(_session_factory(), tmp_path, concurrency=2)
+        result = await exporter.export()
+
+        assert result.revision_id == 7
+        assert result.titles_exported == 1
+        assert result.sections_exported == 2
+        assert result.objects_written == 4
+        assert result.failed_keys == []
+
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+        assert manifest["revision_id"] == 7
+        assert set(manifest["entries"]) == {
+            titles_key(),
+            title_structure_key(17),
+            section_key(17, "106"),
+            section_key(17, "107"),
+        }
+        entry = manifest["entries"][section_key(17, "107")]
+        payload = gzip.decompress(
+            (tmp_path / object_relpath(entry["hash"])).read_bytes()
+        )
+        assert json.loads(payload)["heading"] == "Fair use"
+
+    async def test_reexport_only_writes_changed_payloads(
+        self, tmp_path: Path, render_mocks: dict[str, object]
+    ) -> None:
+        exporter = StaticExporter(_session_factory(), tmp_path)
+        await exporter.export()
+
+        render_mocks["headings"]["107"] = "Limitations: fair use"  # type: ignore[index]
+        result = await exporter.export()
+
+        assert result.objects_written == 1
+        assert result.objects_unchanged == 3
+
+    async def test_render_failure_is_isolated(
+        self,
+        tmp_path: Path,
+        render_mocks: dict[str, object],  # noqa: ARG002
+    ) -> None:
+        with patch(
+            "pipeline.static_export.get_title_structure",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("boom"),
+        ):
+            result = await StaticExporter(_session_factory(), tmp_path).export()
+
+        assert result.failed_keys == [title_structure_key(17)]
+        assert result.sections_exported == 2
+
+
+class TestStaticExportStore:
+    async def test_get_respects_revision(
+        self,
+        tmp_path: Path,
+        render_mocks: dict[str, object],  # noqa: ARG002
+    ) -> None:
+        await StaticExporter(_session_factory(), tmp_path).export()
+        store = StaticExportStore(tmp_path)
+        revision_cache.invalidate()
+
+        assert store.get(section_key(17, "106")) is not None
+        assert store.get(section_key(17, "106"), revision_id=7) is not None
+        assert store.get(section_key(17, "106"), revision_id=8) is None
+        assert store.get(section_key(17, "999")) is None
+
+    async def test_head_request_skipped_when_head_moved(
+        self,
+        tmp_path: Path,
+        render_mocks: dict[str, object],  # noqa: ARG002
+    ) -> None:
+        await StaticExporter(_session_factory(), tmp_path).export()
+        store = StaticExportStore(tmp_path)
+        try:
+            revision_cache.set(8, [8, 7, 1])
+            assert store.get(section_key(17, "106")) is None
+            revision_cache.set(7, [7, 1])
+            assert store.get(section_key(17, "106")) is not None
+        finally:
+            revision_cache.invalidate()
+
+    def test_missing_export(self, tmp_path: Path) -> None:
+        store = StaticExportStore(tmp_path)
+        assert store.manifest() is None
+        assert store.get(titles_key()) is None
+
+    async def test_partial_export_keeps_other_titles(
+        self,
+        tmp_path: Path,
+        render_mocks: dict[str, object],  # noqa: ARG002
+    ) -> None:
+        manifest_path = tmp_path / MANIFEST_NAME
+        exporter = StaticExporter(_session_factory(), tmp_path)
+        await exporter.export()
+        manifest = json.loads(manifest_path.read_text())
+        manifest["entries"][title_structure_key(42)] = {"hash": "a" * 64, "bytes": 1}
+        manifest["entries"][section_key(42, "1983")] = {"hash": "b" * 64, "bytes": 1}
+        manifest_path.write_text(json.dumps(manifest))
+
+        await exporter.export(titles=[17])
+
+        entries = json.loads(manifest_path.read_text())["entries"]
+        assert set(entries) == {
+            titles_key(),
+            title_structure_key(17),
+            section_key(17, "106"),
+            section_key(17, "107"),
+            title_structure_key(42),
+            section_key(42, "1983"),
+        }
+
+    async def test_partial_export_refuses_other_revision(
+        self,
+        tmp_path: Path,
+        render_mocks: dict[str, object],  # noqa: ARG002
+    ) -> None:
+        exporter = StaticExporter(_session_factory(), tmp_path)
+        await exporter.export()
+
+        with pytest.raises(RuntimeError, match="mix revisions"):
+            await exporter.export(revision_id=8, titles=[17])
@@ -1,10 +1,14 @@
 """Tests for the consolidated timeline builder."""
 
+from collections.abc import AsyncIterator
 from datetime import date
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.models.public_law import PublicLaw
 from pipeline.olrc.release_point import ReleasePointInfo
 from pipeline.timeline import (
     TimelineBuilder,
@@ -180,3 +184,86 @@ class TestTimelineEventType:
     def test_values(self) -> None:
         assert TimelineEventType.RELEASE_POINT == "release_point"
         assert TimelineEventType.PUBLIC_LAW == "public_law"
+
+
+@pytest_asyncio.fixture
+async def session() -> AsyncIterator[AsyncSession]:
+    from app.models.base import Base
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with maker() as session:
+        session.add_all(
+            PublicLaw(
+                law_id=100 + n,
+                congress=113,
+                law_number=str(n),
+                enacted_date=date(2014, 1, n),
+            )
+            for n in range(1, 6)
+        )
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+class TestTimelineMemo:
+    """Built timelines are reused until the registry or laws change."""
+
+    @pytest.fixture
+    def registry(self) -> MagicMock:
+        registry = MagicMock()
+        registry.fetch_release_points = AsyncMock()
+        registry.get_release_points.return_value = [
+            ReleasePointInfo(
+                full_identifier="113-3",
+                congress=113,
+                law_identifier="3",
+                publication_date=date(2014, 1, 3),
+            ),
+        ]
+        registry.version = "v1"
+        return registry
+
+    @pytest.mark.asyncio
+    async def test_rebuilt_only_when_inputs_change(
+        self, session: AsyncSession, registry: MagicMock
+    ) -> None:
+        builder = TimelineBuilder(session, registry=registry)
+        first = await builder.build()
+        assert await builder.build() is first
+
+        session.add(
+            PublicLaw(
+                law_id=200, congress=113, law_number="6", enacted_date=date(2014, 1, 6)
+            )
+        )
+        await session.commit()
+        with_law = await builder.build()
+        assert with_law is not first
+        assert with_law.law_position(200) == len(with_law) - 1
+
+        registry.version = "v2"
+        assert await builder.build() is not with_law
+        assert await builder.build(start_congress=114) == []
+
+    @pytest.mark.asyncio
+    async def test_positions_are_indexed(
+        self, session: AsyncSession, registry: MagicMock
+    ) -> None:
+        timeline = await TimelineBuilder(session, registry=registry).build()
+
+        assert [str(e) for e in timeline][2:4] == [
+            "[LAW] PL 113-3 (2014-01-03)",
+            "[RP] 113-3 (2014-01-03)",
+        ]
+        for i, event in enumerate(timeline):
+            if event.event_type == TimelineEventType.PUBLIC_LAW:
+                assert timeline.law_position(event.law_id) == i
+            else:
+                assert timeline.release_point_position(event.identifier) == i
+        assert timeline.law_position(999) is None
+        assert timeline.law_position(None) is None
+        assert timeline.release_point_position("113-99") is None
@@ -0,0 +1,76 @@
+"""Tests for pipeline.chrono.working_set — SectionWorkingSet."""
+
+from pipeline.chrono.working_set import SectionWorkingSet, WorkingSetStats
+from pipeline.olrc.snapshot_service import SectionState
+
+
+def _state(section_number: str, revision_id: int = 1) -> SectionState:
+    return SectionState(
+        title_number=26,
+        section_number=section_number,
+        heading=None,
+        text_content=f"text of {section_number}",
+        text_hash=None,
+        normalized_provisions=None,
+        notes=None,
+        normalized_notes=None,
+        notes_hash=None,
+        full_citation=None,
+        snapshot_id=1,
+        revision_id=revision_id,
+        is_deleted=False,
+    )
+
+
+class TestSectionWorkingSet:
+    def test_lookup_splits_known_and_cold(self) -> None:
+        ws = SectionWorkingSet()
+        ws.lookup([], 1)
+        ws.remember([(26, "1"), (26, "2")], {(26, "1"): _state("1")})
+
+        states, cold = ws.lookup([(26, "1"), (26, "2"), (26, "3")], 1)
+
+        assert states == {(26, "1"): _state("1")}
+        # 26/2 is known to be absent: neither a state nor cold
+        assert cold == [(26, "3")]
+        assert (ws.stats.hits, ws.stats.misses) == (2, 1)
+
+    def test_advance_carries_unchanged_entries(self) -> None:
+        ws = SectionWorkingSet()
+        ws.lookup([], 1)
+        ws.remember(
+            [(26, "1"), (26, "2")], {k: _state(k[1]) for k in [(26, "1"), (26, "2")]}
+        )
+        ws.advance(2, {(26, "1"): _state("1", revision_id=2), (26, "2"): None})
+
+        states, cold = ws.lookup([(26, "1"), (26, "2")], 2)
+
+        assert states[(26, "1")].revision_id == 2
+        assert (26, "2") not in states
+        assert cold == []
+
+    def test_mismatched_revision_resets(self) -> None:
+        ws = SectionWorkingSet()
+        ws.advance(5, {(26, "1"): _state("1")})
+
+        states, cold = ws.lookup([(26, "1")], 4)
+
+        assert states == {}
+        assert cold == [(26, "1")]
+        assert len(ws) == 0
+        assert ws.stats.resets == 1
+
+    def test_lru_eviction(self) -> None:
+        ws = SectionWorkingSet(max_entries=2)
+        ws.advance(1, {(26, "1"): _state("1"), (26, "2"): _state("2")})
+        ws.lookup([(26, "1")], 1)  # 26/1 becomes most recently used
+        ws.advance(2, {(26, "3"): _state("3")})
+
+        _, cold = ws.lookup([(26, "1"), (26, "2"), (26, "3")], 2)
+
+        assert cold == [(26, "2")]
+        assert ws.stats.evictions == 1
+
+    def test_hit_rate(self) -> None:
+        assert WorkingSetStats().hit_rate == 0.0
+        assert WorkingSetStats(hits=3, misses=1).hit_rate == 0.75
@@ -1,7 +1,8 @@
 """Unit tests for last_modified_date derivation from amendment citations.
 
-These tests verify the logic in get_section() (app/crud/us_code.py) that
-derives last_modified_date from normalized_notes.  The correct value is the
+These tests verify the logic in derive_section_dates()
+(pipeline/olrc/section_dates.py) that derives last_modified_date from
+normalized_notes when a snapshot is written.  The correct value is the
 full enactment date of the most recent amending Public Law (from the
 ``citations`` list), NOT a Jan-1 approximation built from a year integer.
 
@@ -24,11 +25,13 @@ original are excluded (pre-1957 Acts providing structural context only).
 
 from datetime import date
 
+from app.crud.us_code import _build_section_viewer
 from pipeline.olrc.group_service import _parse_citation_date
+from pipeline.olrc.snapshot_service import SectionState
 
 
 def _compute_last_modified_date_from_citations(citations: list[dict]) -> date | None:
-    """Mirror of the citation-based derivation in get_section() for unit testing.
+    """Mirror of the citation-based derivation in derive_section_dates().
 
     Excludes only citations that are both relationship ``"Framework"`` AND
     original (is_original == true) — pre-1957 Acts providing structural
@@ -53,7 +56,7 @@ def _compute_last_modified_date_from_citations(citations: list[dict]) -> date |
 
 
 def _compute_last_modified_date_from_notes(normalized_notes: dict) -> date | None:
-    """Mirror of the full last_modified_date derivation in get_section().
+    """Mirror of the full last_modified_date derivation in derive_section_dates().
 
     Prefers the full enactment date from amendment citations; falls back to the
     year-only value from the ``amendments`` list when no citation dates exist.
@@ -406,3 +409,59 @@ class TestLastModifiedDateFromNotes:
         """Returns None for empty normalized_notes dict."""
         result = _compute_last_modified_date_from_notes({})
         assert result is None
+
+
+class TestSectionViewerDates:
+    """The viewer reads stored dates, deriving them for un-backfilled snapshots."""
+
+    _NOTES = {
+        "citations": [
+            {
+                "law": {"congress": 94, "law_number": 553, "date": "Oct. 19, 1976"},
+                "relationship": "Enactment",
+            },
+            {
+                "law": {"congress": 102, "law_number": 492, "date": "Oct. 24, 1992"},
+                "relationship": "Amendment",
+            },
+        ],
+    }
+
+    def _viewer_dates(
+        self, enacted: date | None, last_modified: date | None
+    ) -> tuple[date | None, date | None]:
+        state = SectionState(
+            title_number=17,
+            section_number="107",
+            heading="Fair use",
+            text_content=None,
+            text_hash=None,
+            normalized_provisions=None,
+            notes=None,
+            normalized_notes=self._NOTES,
+            notes_hash=None,
+            full_citation=None,
+            snapshot_id=1,
+            revision_id=1,
+            is_deleted=False,
+            enacted_date=enacted,
+            last_modified_date=last_modified,
+        )
+        viewer = _build_section_viewer(
+            state,
+            None,
+            is_positive_law=True,
+            last_revision=None,
+            group_ancestors=[],
+        )
+        return viewer.enacted_date, viewer.last_modified_date
+
+    def test_stored_dates_are_used(self) -> None:
+        stored = (date(1976, 10, 19), date(2000, 1, 1))
+        assert self._viewer_dates(*stored) == stored
+
+    def test_missing_dates_are_derived_from_notes(self) -> None:
+        assert self._viewer_dates(None, None) == (
+            date(1976, 10, 19),
+            date(1992, 10, 24),
+        )
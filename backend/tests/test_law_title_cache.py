@@ -0,0 +1,228 @@
+"""Tests for app/core/law_title_cache and its use in note enrichment."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.law_title_cache import ABSENT_SECONDS, REFRESH_SECONDS, law_title_cache
+from app.crud.us_code import _enrich_notes_with_titles
+from app.models.public_law import PublicLaw
+from app.schemas.public_law import PublicLawSchema, SourceLawSchema
+from app.schemas.us_code import SectionNotesSchema
+
+
+@pytest.fixture
+async def law_session() -> AsyncIterator[tuple[AsyncSession, list[str]]]:
+    """SQLite session with three laws, plus a log of executed statements."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(PublicLaw.__table__.create)
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda _c, _cur, stmt, *_: statements.append(stmt),
+    )
+    make_session = async_sessionmaker(engine, expire_on_commit=False)
+    async with make_session() as session:
+        for n in (1, 2, 3):
+            session.add(
+                PublicLaw(
+                    law_id=n,
+                    congress=116,
+                    law_number=str(n),
+                    law_type="Public",
+                    short_title=f"Act {n}",
+                    official_title=f"An Act {n}",
+                    enacted_date=date(2020, 1, n),
+                )
+            )
+        await session.commit()
+        law_title_cache.invalidate()
+        statements.clear()
+        yield session, statements
+    law_title_cache.invalidate()
+    await engine.dispose()
+
+
+def _notes(*law_numbers: int) -> SectionNotesSchema:
+    return SectionNotesSchema(
+        citations=[
+            SourceLawSchema(law=PublicLawSchema(congress=116, law_number=n))
+            for n in law_numbers
+        ]
+    )
+
+
+class TestLawTitleCache:
+    async def test_warm_then_lookups_cost_no_queries(
+        self, law_session: tuple[AsyncSession, list[str]]
+    ) -> None:
+        session, statements = law_session
+        assert await law_title_cache.warm(session) == 3
+        statements.clear()
+
+        found = await law_title_cache.get_many(session, [(116, "1"), (116, "3")])
+
+        assert found == {
+            (116, "1"): ("Act 1", "An Act 1"),
+            (116, "3"): ("Act 3", "An Act 3"),
+        }
+        assert statements == []
+
+    async def test_law_added_after_warm_is_found(
+        self, law_session: tuple[AsyncSession, list[str]]
+    ) -> None:
+        session, statements = law_session
+        await law_title_cache.warm(session)
+        # Written by another process, which cannot update this cache
+        async with async_sessionmaker(session.bind)() as other:
+            other.add(
+                PublicLaw(
+                    law_id=4,
+                    congress=116,
+                    law_number="4",
+                    law_type="Public",
+                    short_title="Act 4",
+                    enacted_date=date(2020, 1, 4),
+                )
+            )
+            await other.commit()
+        statements.clear()
+
+        found = await law_title_cache.get_many(session, [(116, "1"), (116, "4")])
+
+        assert found[(116, "4")] == ("Act 4", None)
+        assert len(statements) == 1
+
+    async def test_absent_laws_are_requeried_after_ttl(
+        self, law_session: tuple[AsyncSession, list[str]]
+    ) -> None:
+        session, statements = law_session
+        await law_title_cache.warm(session)
+        statements.clear()
+
+        assert await law_title_cache.get_many(session, [(116, "99")]) == {}
+        assert await law_title_cache.get_many(session, [(116, "99")]) == {}
+        assert len(statements) == 1
+
+        with patch(
+            "app.core.law_title_cache.time.monotonic",
+            return_value=time.monotonic() + ABSENT_SECONDS + 1,
+        ):
+            await law_title_cache.get_many(session, [(116, "99")])
+        assert len(statements) == 2
+
+    async def test_first_lookup_warms(
+        self, law_session: tuple[AsyncSession, list[str]]
+    ) -> None:
+        session, statements = law_session
+        await law_title_cache.get_many(session, [(116, "2")])
+        await law_title_cache.get_many(session, [(116, "3")])
+        assert len(statements) == 1
+
+    async def test_concurrent_cold_lookups_share_one_load(
+        self, law_session: tuple[AsyncSession, list[str]]
+    ) -> None:
+        session, statements = law_session
+        await asyncio.gather(
+            *[law_title_cache.get_many(session, [(116, "1")]) for _ in range(5)]
+        )
+        assert len(statements) == 1
+
+    async def test_expired_cache_refreshes_in_background(
+        self, law_session: tuple[AsyncSession, list[str]]
+    ) -> None:
+        session, statements = law_session
+        await law_title_cache.warm(session)
+        async with async_sessionmaker(session.bind)() as other:
+            other.add(
+                PublicLaw(
+                    law_id=4,
+                    congress=116,
+                    law_number="4",
+                    law_type="Public",
+                    short_title="Act 4",
+                    enacted_date=date(2020, 1, 4),
+                )
+            )
+            await other.commit()
+        statements.clear()
+
+        with (
+            patch.object(
+                law_title_cache, "_session_factory", async_sessionmaker(session.bind)
+            ),
+            patch(
+                "app.core.law_title_cache.time.monotonic",
+                return_value=time.monotonic() + REFRESH_SECONDS + 1,
+            ),
+        ):
+            # Served from the stale entries; the reload is not awaited
+            stale = await law_title_cache.get_many(session, [(116, "1")])
+            assert stale == {(116, "1"): ("Act 1", "An Act 1")}
+            assert statements == []
+            task = law_title_cache._refresh_task
+            assert task is not None
+            # A second expired lookup does not start another reload
+            await law_title_cache.get_many(session, [(116, "1")])
+            assert law_title_cache._refresh_task is task
+            await task
+
+        # The reload picked up the new law; looking it up costs no query
+        assert len(statements) == 1
+        found = await law_title_cache.get_many(session, [(116, "4")])
+        assert found == {(116, "4"): ("Act 4", None)}
+        assert len(statements) == 1
+
+    async def test_put_updates_titles(
+        self, law_session: tuple[AsyncSession, list[str]]
+    ) -> None:
+        session, _ = law_session
+        await law_title_cache.warm(session)
+        law_title_cache.put(116, 1, "Renamed Act", None)
+        law_title_cache.put(116, 4, "New Act", "A New Act")
+
+        found = await law_title_cache.get_many(session, [(116, "1"), (116, "4")])
+
+        assert found[(116, "1")] == ("Renamed Act", None)
+        assert found[(116, "4")] == ("New Act", "A New Act")
+
+    async def test_partial_cache_queries_misses(
+        self, law_session: tuple[AsyncSession, list[str]]
+    ) -> None:
+        session, statements = law_session
+        with patch("app.core.law_title_cache.MAX_ENTRIES", 2):
+            await law_title_cache.warm(session)
+            statements.clear()
+            found = await law_title_cache.get_many(
+                session, [(116, "1"), (116, "2"), (116, "3")]
+            )
+
+        assert set(found) == {(116, "1"), (116, "2"), (116, "3")}
+        assert len(statements) == 1
+
+
+class TestEnrichment:
+    async def test_enrichment_served_from_cache(
+        self, law_session: tuple[AsyncSession, list[str]]
+    ) -> None:
+        session, statements = law_session
+        await law_title_cache.warm(session)
+        statements.clear()
+
+        notes = _notes(1, 2)
+        await _enrich_notes_with_titles(session, notes)
+
+        assert [c.law.short_title for c in notes.citations] == ["Act 1", "Act 2"]
+        assert [c.law.official_title for c in notes.citations] == [
+            "An Act 1",
+            "An Act 2",
+        ]
+        assert statements == []
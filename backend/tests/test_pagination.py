@@ -0,0 +1,152 @@
+"""Tests for app/core/pagination and keyset pagination of the laws list."""
+
+from collections.abc import AsyncIterator
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.pagination import (
+    InvalidCursorError,
+    count_cache,
+    decode_cursor,
+    encode_cursor,
+    estimate_count,
+)
+from app.crud.public_law import get_laws_list
+from app.models.public_law import PublicLaw
+
+
+class TestCursorTokens:
+    def test_round_trip(self) -> None:
+        token = encode_cursor(date(2013, 1, 2), 42)
+        assert decode_cursor(token, date, int) == [date(2013, 1, 2), 42]
+
+    def test_token_is_url_safe(self) -> None:
+        token = encode_cursor("§ 1/2+", 7)
+        assert all(c not in token for c in "+/=")
+
+    @pytest.mark.parametrize("token", ["not-base64!", "", encode_cursor(1)])
+    def test_malformed_token(self, token: str) -> None:
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token, date, int)
+
+    def test_wrong_types(self) -> None:
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(encode_cursor("x", "y"), int, int)
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(encode_cursor(True, 1), int, int)
+
+
+@pytest.fixture
+async def law_session() -> AsyncIterator[AsyncSession]:
+    """In-memory SQLite session with 25 laws, several sharing an enacted date."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(PublicLaw.__table__.create)
+    make_session = async_sessionmaker(engine, expire_on_commit=False)
+    async with make_session() as session:
+        base = date(2013, 1, 1)
+        for i in range(1, 26):
+            session.add(
+                PublicLaw(
+                    law_id=i,
+                    congress=113,
+                    law_number=str(i),
+                    law_type="Public",
+                    # Groups of three laws share a date to exercise the tiebreaker
+                    enacted_date=base + timedelta(days=i // 3),
+                )
+            )
+        await session.commit()
+        count_cache.invalidate()
+        yield session
+    await engine.dispose()
+
+
+class TestLawsKeyset:
+    async def test_cursor_pages_cover_all_rows_once(
+        self, law_session: AsyncSession
+    ) -> None:
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = await get_laws_list(law_session, limit=7, cursor=cursor)
+            seen.extend(item.law_number for item in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert len(seen) == 25
+        assert len(set(seen)) == 25
+
+    async def test_cursor_matches_offset_order(self, law_session: AsyncSession) -> None:
+        first = await get_laws_list(law_session, limit=10)
+        by_offset = await get_laws_list(law_session, limit=10, offset=10)
+        by_cursor = await get_laws_list(law_session, limit=10, cursor=first.next_cursor)
+        assert [i.law_number for i in by_cursor.items] == [
+            i.law_number for i in by_offset.items
+        ]
+
+    async def test_last_page_has_no_cursor(self, law_session: AsyncSession) -> None:
+        page = await get_laws_list(law_session, limit=25)
+        assert len(page.items) == 25
+        assert page.next_cursor is None
+
+    async def test_total_modes(self, law_session: AsyncSession) -> None:
+        exact = await get_laws_list(law_session, limit=5)
+        assert exact.total == 25
+        assert exact.total_is_estimate is False
+
+        none = await get_laws_list(law_session, limit=5, total_mode="none")
+        assert none.total is None
+
+        # No planner estimates on SQLite: falls back to the exact count
+        estimate = await get_laws_list(law_session, limit=5, total_mode="estimate")
+        assert estimate.total == 25
+        assert estimate.total_is_estimate is False
+
+    async def test_exact_total_is_cached(self, law_session: AsyncSession) -> None:
+        await get_laws_list(law_session, limit=5)
+        law_session.add(
+            PublicLaw(
+                law_id=99,
+                congress=113,
+                law_number="99",
+                law_type="Public",
+                enacted_date=date(2014, 1, 1),
+            )
+        )
+        await law_session.commit()
+
+        cached = await get_laws_list(law_session, limit=5)
+        assert cached.total == 25
+
+        count_cache.invalidate()
+        fresh = await get_laws_list(law_session, limit=5)
+        assert fresh.total == 26
+
+
+class TestEstimateCount:
+    async def test_filter_values_stay_bound(self) -> None:
+        """User search text is passed as a parameter, never spliced into SQL."""
+        conn = MagicMock()
+        conn.exec_driver_sql = AsyncMock(
+            return_value=MagicMock(scalar_one=lambda: [{"Plan": {"Plan Rows": 42}}])
+        )
+        session = MagicMock()
+        session.get_bind.return_value = MagicMock(dialect=asyncpg.dialect())
+        session.connection = AsyncMock(return_value=conn)
+        q = "%x'); DROP TABLE public_law; --%"
+        stmt = select(PublicLaw.law_id).where(
+            PublicLaw.short_title.ilike(q), PublicLaw.congress == 113
+        )
+
+        assert await estimate_count(session, stmt) == 42
+        sql, params = conn.exec_driver_sql.await_args.args
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert "DROP" not in sql
+        assert params == (q, 113)